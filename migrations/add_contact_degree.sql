@@ -0,0 +1,59 @@
+-- Contact degree summary for relationship analytics
+-- Stores how many relationships each contact takes part in, in either
+-- direction, so "most connected" and "isolated contacts" read a small indexed
+-- table instead of OR-joining contacts to contact_relationships.
+-- Only contacts with at least one relationship have a row.
+
+CREATE TABLE IF NOT EXISTS contact_degree (
+    contact_id INTEGER PRIMARY KEY,
+    degree INTEGER NOT NULL
+);
+
+-- Serves ORDER BY degree DESC, contact_id LIMIT n without sorting
+CREATE INDEX IF NOT EXISTS idx_contact_degree_degree ON contact_degree(degree DESC, contact_id);
+
+-- Backfill from existing relationships. A relationship from a contact to
+-- itself counts once.
+DELETE FROM contact_degree;
+INSERT INTO contact_degree (contact_id, degree)
+SELECT contact_id, COUNT(*)
+FROM (
+    SELECT from_contact_id AS contact_id FROM contact_relationships
+    UNION ALL
+    SELECT to_contact_id FROM contact_relationships WHERE to_contact_id != from_contact_id
+)
+WHERE contact_id IN (SELECT id FROM contacts)
+GROUP BY contact_id;
+
+-- Keep the summary current on every write, ORM or raw SQL
+CREATE TRIGGER IF NOT EXISTS contact_degree_ai AFTER INSERT ON contact_relationships BEGIN
+    INSERT INTO contact_degree (contact_id, degree) VALUES (new.from_contact_id, 1)
+        ON CONFLICT(contact_id) DO UPDATE SET degree = degree + 1;
+    INSERT INTO contact_degree (contact_id, degree)
+        SELECT new.to_contact_id, 1 WHERE new.to_contact_id != new.from_contact_id
+        ON CONFLICT(contact_id) DO UPDATE SET degree = degree + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS contact_degree_ad AFTER DELETE ON contact_relationships BEGIN
+    UPDATE contact_degree SET degree = degree - 1
+        WHERE contact_id IN (old.from_contact_id, old.to_contact_id);
+    DELETE FROM contact_degree
+        WHERE contact_id IN (old.from_contact_id, old.to_contact_id) AND degree <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS contact_degree_au
+AFTER UPDATE OF from_contact_id, to_contact_id ON contact_relationships BEGIN
+    UPDATE contact_degree SET degree = degree - 1
+        WHERE contact_id IN (old.from_contact_id, old.to_contact_id);
+    DELETE FROM contact_degree
+        WHERE contact_id IN (old.from_contact_id, old.to_contact_id) AND degree <= 0;
+    INSERT INTO contact_degree (contact_id, degree) VALUES (new.from_contact_id, 1)
+        ON CONFLICT(contact_id) DO UPDATE SET degree = degree + 1;
+    INSERT INTO contact_degree (contact_id, degree)
+        SELECT new.to_contact_id, 1 WHERE new.to_contact_id != new.from_contact_id
+        ON CONFLICT(contact_id) DO UPDATE SET degree = degree + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS contact_degree_contact_ad AFTER DELETE ON contacts BEGIN
+    DELETE FROM contact_degree WHERE contact_id = old.id;
+END;
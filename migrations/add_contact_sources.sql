@@ -0,0 +1,22 @@
+-- Import source fingerprints for incremental re-imports
+-- One row per contact per import source (Google Takeout, Google Contacts),
+-- keyed by the source's own key for the contact. The hashes of the last
+-- imported content and profile image let a re-import skip unchanged contacts
+-- without comparing, or even reading, their data.
+
+CREATE TABLE IF NOT EXISTS contact_sources (
+    source TEXT NOT NULL,
+    external_key TEXT NOT NULL,
+    contact_id INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    image_hash TEXT,
+    synced_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (source, external_key)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_contact_sources_contact ON contact_sources(contact_id);
+
+-- A deleted contact is imported again on the next sync
+CREATE TRIGGER IF NOT EXISTS contact_sources_contact_ad AFTER DELETE ON contacts BEGIN
+    DELETE FROM contact_sources WHERE contact_id = old.id;
+END;
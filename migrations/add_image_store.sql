@@ -0,0 +1,45 @@
+-- Content-addressed profile image store
+-- Each distinct image is stored once in images, keyed by the SHA-256 of its
+-- bytes, with downscaled JPEG thumbnails in image_thumbnails. Contacts point
+-- at their image through contacts.profile_image_hash (added by the schema
+-- manager, since the ORM may have created it already).
+
+CREATE TABLE IF NOT EXISTS images (
+    hash VARCHAR(64) NOT NULL PRIMARY KEY,
+    mime_type VARCHAR(50),
+    width INTEGER,
+    height INTEGER,
+    byte_size INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    created_at DATETIME
+);
+
+CREATE TABLE IF NOT EXISTS image_thumbnails (
+    image_hash VARCHAR(64) NOT NULL REFERENCES images(hash),
+    size INTEGER NOT NULL,
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    byte_size INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (image_hash, size)
+);
+
+CREATE INDEX IF NOT EXISTS ix_contacts_profile_image_hash ON contacts(profile_image_hash);
+
+-- Drop an image, with its thumbnails, once no contact uses it any more
+CREATE TRIGGER IF NOT EXISTS images_contact_ad AFTER DELETE ON contacts
+WHEN old.profile_image_hash IS NOT NULL
+    AND NOT EXISTS (SELECT 1 FROM contacts WHERE profile_image_hash = old.profile_image_hash)
+BEGIN
+    DELETE FROM image_thumbnails WHERE image_hash = old.profile_image_hash;
+    DELETE FROM images WHERE hash = old.profile_image_hash;
+END;
+
+CREATE TRIGGER IF NOT EXISTS images_contact_au AFTER UPDATE OF profile_image_hash ON contacts
+WHEN old.profile_image_hash IS NOT NULL
+    AND old.profile_image_hash IS NOT new.profile_image_hash
+    AND NOT EXISTS (SELECT 1 FROM contacts WHERE profile_image_hash = old.profile_image_hash)
+BEGIN
+    DELETE FROM image_thumbnails WHERE image_hash = old.profile_image_hash;
+    DELETE FROM images WHERE hash = old.profile_image_hash;
+END;
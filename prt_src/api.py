@@ -6,7 +6,12 @@ the CLI interface and AI chat mode. It abstracts database operations and
 provides a consistent interface for all PRT functionality.
 """
 
+import base64
+import json
 import re
+import threading
+from collections.abc import Callable
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -15,13 +20,32 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from .config import data_dir
 from .config import load_config
+from .db import PROFILE_IMAGE_CHUNK_SIZE
 from .db import Database
+from .db import SQLiteSettings
+from .import_sync import SyncSummary
+from .import_sync import sync_contacts
 from .logging_config import get_logger
 from .schema_info import get_schema_for_llm
 from .schema_info import validate_sql_schema
 from .schema_manager import SchemaManager
 
 
+def _encode_contact_cursor(name: str, contact_id: int) -> str:
+    """Encode a (name, id) keyset position as an opaque URL-safe cursor."""
+    payload = json.dumps([name, contact_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii")
+
+
+def _decode_contact_cursor(cursor: str) -> tuple[str, int]:
+    """Decode a cursor produced by _encode_contact_cursor."""
+    try:
+        name, contact_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return str(name), int(contact_id)
+    except (ValueError, TypeError, UnicodeError) as e:
+        raise ValueError(f"Invalid contact cursor: {cursor!r}") from e
+
+
 class PRTAPI:
     """Main API class for PRT operations."""
 
@@ -38,7 +62,8 @@ class PRTAPI:
             raise RuntimeError(f"Failed to initialize configuration: {e}") from e
 
         # Create database instance
-        self.db = Database(db_path)
+        self.db = Database(db_path, SQLiteSettings.from_config(config))
+        self.db.dedup_auto_backups = bool(config.get("dedup_auto_backups", False))
         try:
             self.db.connect()
         except Exception as e:
@@ -64,6 +89,11 @@ class PRTAPI:
         else:
             self.logger.debug("[PRTAPI] Test environment detected - skipping auto-migration")
 
+        # Long-lived unified search engine, created on first use
+        self._search_api = None
+        self._search_api_lock = threading.Lock()
+        self._search_warmup_thread: threading.Thread | None = None
+
     def _is_test_environment(self) -> bool:
         """Detect if we're running in a test environment.
 
@@ -229,6 +259,7 @@ class PRTAPI:
                 result["rowcount"] = res.rowcount
             if is_write:
                 self.db.session.commit()
+                self.db.invalidate_caches()
         except SQLAlchemyError as e:
             self.db.session.rollback()
 
@@ -336,19 +367,7 @@ class PRTAPI:
             .all()
         )
 
-        return [
-            {
-                "id": c.id,
-                "name": c.name,
-                "email": c.email,
-                "phone": c.phone,
-                "profile_image": c.profile_image,
-                "profile_image_filename": c.profile_image_filename,
-                "profile_image_mime_type": c.profile_image_mime_type,
-                "relationship_info": self.get_relationship_info(c.id),
-            }
-            for c in contacts
-        ]
+        return self._hydrate_contacts(contacts)
 
     def search_tags(self, query: str) -> list[dict[str, Any]]:
         """Search tags by name (case-insensitive partial match)."""
@@ -514,60 +533,143 @@ class PRTAPI:
 
     def get_contacts_by_tag(self, tag_name: str) -> list[dict[str, Any]]:
         """Get all contacts that have a specific tag."""
+        from .models import Contact
+        from .models import ContactMetadata
         from .models import Tag
+        from .models import metadata_tags
 
-        tag = self.db.session.query(Tag).filter(Tag.name == tag_name).first()
-        if not tag:
-            return []
-
-        contacts = []
-        for relationship in tag.relationships:
-            contact = relationship.contact
-            contacts.append(
-                {
-                    "id": contact.id,
-                    "name": contact.name,
-                    "email": contact.email,
-                    "phone": contact.phone,
-                    "profile_image": contact.profile_image,
-                    "profile_image_filename": contact.profile_image_filename,
-                    "profile_image_mime_type": contact.profile_image_mime_type,
-                    "relationship_info": self.get_relationship_info(contact.id),
-                }
-            )
+        contacts = (
+            self.db.session.query(Contact)
+            .join(ContactMetadata, ContactMetadata.contact_id == Contact.id)
+            .join(metadata_tags, metadata_tags.c.metadata_id == ContactMetadata.id)
+            .join(Tag, Tag.id == metadata_tags.c.tag_id)
+            .filter(Tag.name == tag_name)
+            .distinct()
+            .order_by(Contact.name)
+            .all()
+        )
 
-        return sorted(contacts, key=lambda c: c["name"])
+        return self._hydrate_contacts(contacts)
 
     def get_contacts_by_note(self, note_title: str) -> list[dict[str, Any]]:
         """Get all contacts that have a specific note."""
+        from .models import Contact
+        from .models import ContactMetadata
         from .models import Note
+        from .models import metadata_notes
 
-        note = self.db.session.query(Note).filter(Note.title == note_title).first()
-        if not note:
-            return []
+        contacts = (
+            self.db.session.query(Contact)
+            .join(ContactMetadata, ContactMetadata.contact_id == Contact.id)
+            .join(metadata_notes, metadata_notes.c.metadata_id == ContactMetadata.id)
+            .join(Note, Note.id == metadata_notes.c.note_id)
+            .filter(Note.title == note_title)
+            .distinct()
+            .order_by(Contact.name)
+            .all()
+        )
 
-        contacts = []
-        for relationship in note.relationships:
-            contact = relationship.contact
-            contacts.append(
-                {
-                    "id": contact.id,
-                    "name": contact.name,
-                    "email": contact.email,
-                    "phone": contact.phone,
-                    "profile_image": contact.profile_image,
-                    "profile_image_filename": contact.profile_image_filename,
-                    "profile_image_mime_type": contact.profile_image_mime_type,
-                    "relationship_info": self.get_relationship_info(contact.id),
-                }
-            )
+        return self._hydrate_contacts(contacts)
+
+    def get_contacts_grouped_by_tag(self, tag_ids: list[int]) -> dict[int, list[dict[str, Any]]]:
+        """Get contact summaries for several tags in one pass.
+
+        Args:
+            tag_ids: Tag IDs to look up
+
+        Returns:
+            Mapping of tag ID to ``{"id", "name", "email", "phone"}`` dicts
+            ordered by contact name
+        """
+        grouped = self.db.get_contacts_grouped_by_tag(tag_ids)
+        return {tag_id: self._contact_summaries(contacts) for tag_id, contacts in grouped.items()}
+
+    def get_contacts_grouped_by_note(self, note_ids: list[int]) -> dict[int, list[dict[str, Any]]]:
+        """Get contact summaries for several notes in one pass.
+
+        Args:
+            note_ids: Note IDs to look up
+
+        Returns:
+            Mapping of note ID to ``{"id", "name", "email", "phone"}`` dicts
+            ordered by contact name
+        """
+        grouped = self.db.get_contacts_grouped_by_note(note_ids)
+        return {note_id: self._contact_summaries(contacts) for note_id, contacts in grouped.items()}
 
-        return sorted(contacts, key=lambda c: c["name"])
+    @staticmethod
+    def _contact_summaries(contacts) -> list[dict[str, Any]]:
+        return [{"id": c.id, "name": c.name, "email": c.email, "phone": c.phone} for c in contacts]
 
     def get_relationship_info(self, contact_id: int) -> dict[str, Any]:
         """Get relationship information for a contact."""
         return self.db.get_relationship_info(contact_id)
 
+    def _contact_to_dict(self, contact, relationship_info: dict[str, Any]) -> dict[str, Any]:
+        """Build the standard contact dictionary returned by the API.
+
+        Image bytes are never included; use get_profile_image() or
+        iter_profile_image() when the image actually needs to be rendered.
+        """
+        return {
+            "id": contact.id,
+            "name": contact.name,
+            "email": contact.email,
+            "phone": contact.phone,
+            "has_profile_image": bool(contact.profile_image_size),
+            "profile_image_size": contact.profile_image_size,
+            "profile_image_filename": contact.profile_image_filename,
+            "profile_image_mime_type": contact.profile_image_mime_type,
+            "relationship_info": relationship_info,
+        }
+
+    def get_profile_image(self, contact_id: int, size: int | None = None) -> bytes | None:
+        """Get a contact's profile image bytes on demand.
+
+        Args:
+            contact_id: Contact ID
+            size: Pixels the image will be displayed at along its longest
+                edge; the smallest stored thumbnail that covers it is
+                returned. None for the original.
+
+        Returns:
+            Image bytes, or None if the contact has no image
+        """
+        return self.db.get_profile_image(contact_id, size)
+
+    def iter_profile_image(
+        self,
+        contact_id: int,
+        chunk_size: int = PROFILE_IMAGE_CHUNK_SIZE,
+        size: int | None = None,
+    ) -> Iterator[bytes]:
+        """Stream a contact's profile image in chunks.
+
+        Args:
+            contact_id: Contact ID
+            chunk_size: Maximum chunk size in bytes
+            size: Display size in pixels; see get_profile_image()
+
+        Returns:
+            Iterator of byte chunks (empty if the contact has no image)
+        """
+        return self.db.iter_profile_image(contact_id, chunk_size, size)
+
+    def _hydrate_contacts(self, contacts: list) -> list[dict[str, Any]]:
+        """Convert Contact rows to dictionaries with tags and notes attached.
+
+        Relationship info for the whole result set is loaded with a fixed
+        number of set-based queries rather than one lookup per contact.
+
+        Args:
+            contacts: Contact model instances, in the order they should be returned
+
+        Returns:
+            List of contact dictionaries in the same order
+        """
+        info_by_id = self.db.get_relationship_info_bulk([c.id for c in contacts])
+        return [self._contact_to_dict(c, info_by_id[c.id]) for c in contacts]
+
     # CRUD operations for relationships
     def add_tag_to_contact(self, contact_id: int, tag_name: str) -> bool:
         """Add a tag to a contact's relationship."""
@@ -804,35 +906,14 @@ class PRTAPI:
         if not contact:
             return None
 
-        return {
-            "id": contact.id,
-            "name": contact.name,
-            "email": contact.email,
-            "phone": contact.phone,
-            "profile_image": contact.profile_image,
-            "profile_image_filename": contact.profile_image_filename,
-            "profile_image_mime_type": contact.profile_image_mime_type,
-            "relationship_info": self.get_relationship_info(contact.id),
-        }
+        return self._hydrate_contacts([contact])[0]
 
     def list_all_contacts(self) -> list[dict[str, Any]]:
         """List all contacts with basic relationship info."""
         from .models import Contact
 
         contacts = self.db.session.query(Contact).order_by(Contact.name).all()
-        return [
-            {
-                "id": c.id,
-                "name": c.name,
-                "email": c.email,
-                "phone": c.phone,
-                "profile_image": c.profile_image,
-                "profile_image_filename": c.profile_image_filename,
-                "profile_image_mime_type": c.profile_image_mime_type,
-                "relationship_info": self.get_relationship_info(c.id),
-            }
-            for c in contacts
-        ]
+        return self._hydrate_contacts(contacts)
 
     def get_contacts_paginated(self, page: int, limit: int) -> list[dict[str, Any]]:
         """Get contacts with pagination.
@@ -847,14 +928,63 @@ class PRTAPI:
         try:
             # Calculate offset (convert 1-based page to 0-based offset)
             offset = (page - 1) * limit
-
-            # Get all contacts using existing method, then slice
-            all_contacts = self.list_all_contacts()
-            return all_contacts[offset : offset + limit]
+            return self.get_contacts_page(limit, offset=offset)["contacts"]
         except Exception as e:
             self.logger.error(f"Error getting paginated contacts: {e}", exc_info=True)
             return []
 
+    def get_contacts_page(
+        self, limit: int, cursor: str | None = None, offset: int = 0
+    ) -> dict[str, Any]:
+        """Get one page of contacts ordered by name using keyset pagination.
+
+        Pass the ``next_cursor`` from the previous page to continue; each page
+        is then a single indexed range scan no matter how deep it is. ``offset``
+        is only used when no cursor is given (e.g. jumping to page N).
+
+        Args:
+            limit: Number of contacts per page
+            cursor: Opaque cursor returned by a previous call
+            offset: Rows to skip when starting without a cursor
+
+        Returns:
+            Dict with ``contacts``, ``next_cursor`` (None on the last page),
+            ``has_next`` and ``total``
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        after = _decode_contact_cursor(cursor) if cursor else None
+
+        # Fetch one extra row to learn whether another page exists
+        rows = self.db.list_contacts_page(limit + 1, after=after, offset=max(offset, 0))
+        has_next = len(rows) > limit
+        rows = rows[:limit]
+
+        next_cursor = None
+        if has_next and rows:
+            next_cursor = _encode_contact_cursor(rows[-1].name, rows[-1].id)
+
+        return {
+            "contacts": self._hydrate_contacts(rows),
+            "next_cursor": next_cursor,
+            "has_next": has_next,
+            "total": self.db.count_contacts(),
+        }
+
+    def create_contact_paginator(self, page_size: int = 20):
+        """Create a PaginationSystem that lazily loads contact pages from the database.
+
+        Args:
+            page_size: Number of contacts per page
+
+        Returns:
+            PaginationSystem with a keyset-backed data provider
+        """
+        from .core.contacts import ContactOperations
+
+        return ContactOperations(self).create_paginator(page_size=page_size)
+
     def get_contacts_with_images(self) -> list[dict[str, Any]]:
         """Get all contacts that have profile images.
 
@@ -888,25 +1018,15 @@ class PRTAPI:
             query_time = time.time() - start_time
 
             # Convert to dict format and analyze
-            result = []
+            result = self._hydrate_contacts(contacts)
             total_size = 0
             corrupted_count = 0
 
             for contact in contacts:
-                contact_dict = {
-                    "id": contact.id,
-                    "name": contact.name,
-                    "email": contact.email,
-                    "phone": contact.phone,
-                    "profile_image": contact.profile_image,
-                    "profile_image_filename": contact.profile_image_filename,
-                    "profile_image_mime_type": contact.profile_image_mime_type,
-                    "relationship_info": self.get_relationship_info(contact.id),
-                }
 
-                # Image validation
-                if contact.profile_image:
-                    image_size = len(contact.profile_image)
+                # Image validation (size comes from SQL, the BLOB stays deferred)
+                if contact.profile_image_size:
+                    image_size = contact.profile_image_size
                     total_size += image_size
 
                     # Check for suspicious data
@@ -930,8 +1050,6 @@ class PRTAPI:
                         )
                         corrupted_count += 1
 
-                result.append(contact_dict)
-
             self.logger.info(
                 f"[API_QUERY_SUCCESS] Retrieved {len(result)} contacts in {query_time:.3f}s"
             )
@@ -970,6 +1088,30 @@ class PRTAPI:
             self.logger.error(f"Error inserting contacts: {e}", exc_info=True)
             return False
 
+    def sync_contacts(
+        self,
+        source: str,
+        contacts: list[dict[str, Any]],
+        load_images: Callable[[list[dict[str, Any]]], None] | None = None,
+        progress: Callable[[str, int, int], None] | None = None,
+    ) -> SyncSummary | None:
+        """Import contacts from a source, writing only what changed since its last import.
+
+        Args:
+            source: Source name, e.g. ``import_sync.SOURCE_GOOGLE_TAKEOUT``
+            contacts: Parsed, de-duplicated contacts
+            load_images: Loads profile image bytes for a batch of contacts
+            progress: Optional callback, called with ("sync", written, to write)
+
+        Returns:
+            Summary of the changes, or None if the import failed
+        """
+        try:
+            return sync_contacts(self.db, source, contacts, load_images, progress)
+        except Exception as e:
+            self.logger.error(f"Error syncing contacts from {source}: {e}", exc_info=True)
+            return None
+
     def parse_csv_contacts(self, csv_path: str) -> list[dict[str, Any]]:
         """Parse CSV file and return contacts data."""
         try:
@@ -1400,6 +1542,57 @@ class PRTAPI:
             self.logger.error(f"Error getting note {note_id}: {e}", exc_info=True)
             return None
 
+    @property
+    def search_engine(self):
+        """The UnifiedSearchAPI instance shared by every unified search.
+
+        It is created on first use and kept coherent with the database through
+        a change listener that marks written contacts as stale.
+        """
+        with self._search_api_lock:
+            if self._search_api is None:
+                from .core.search_unified import UnifiedSearchAPI
+
+                self._search_api = UnifiedSearchAPI(self.db)
+                self.db.add_change_listener(self._search_api.invalidate_contacts)
+            return self._search_api
+
+    def start_search_warmup(self) -> threading.Thread:
+        """Warm the unified search contact cache on a background thread.
+
+        The loader uses its own session, so it can run alongside normal API
+        calls. Calling this again while a warm-up is running is a no-op.
+
+        Returns:
+            The warm-up thread
+        """
+        if self._search_warmup_thread and self._search_warmup_thread.is_alive():
+            return self._search_warmup_thread
+
+        engine = self.search_engine
+
+        def warm() -> None:
+            try:
+                with self.db.read_session() as session:
+                    count = engine.warm_from_database(session=session)
+                self.logger.info(f"Unified search cache warmed with {count} contacts")
+            except Exception as e:
+                self.logger.warning(f"Unified search cache warm-up failed: {e}", exc_info=True)
+
+        self._search_warmup_thread = threading.Thread(
+            target=warm, name="prt-search-warmup", daemon=True
+        )
+        self._search_warmup_thread.start()
+        return self._search_warmup_thread
+
+    def get_search_stats(self) -> dict[str, Any]:
+        """Get unified search metrics (cache hits, average search time, cache stats).
+
+        Returns:
+            Statistics dictionary from UnifiedSearchAPI.get_stats()
+        """
+        return self.search_engine.get_stats()
+
     def unified_search(
         self, query: str, entity_types: list[str] | None = None, limit: int = 100
     ) -> dict[str, Any]:
@@ -1418,7 +1611,6 @@ class PRTAPI:
         """
         try:
             from .core.search_unified import EntityType
-            from .core.search_unified import UnifiedSearchAPI
 
             # Map string types to EntityType enum
             type_mapping = {
@@ -1434,11 +1626,8 @@ class PRTAPI:
                 enum_types = [type_mapping.get(t) for t in entity_types if t in type_mapping]
                 enum_types = [t for t in enum_types if t is not None]
 
-            # Initialize unified search API
-            search_api = UnifiedSearchAPI(self.db, max_results=limit)
-
-            # Perform search
-            results = search_api.search(query=query, entity_types=enum_types, limit=limit)
+            # Perform search with the long-lived engine so its caches stay warm
+            results = self.search_engine.search(query=query, entity_types=enum_types, limit=limit)
 
             return results
 
@@ -1477,8 +1666,6 @@ class PRTAPI:
                     "notes": self.list_all_notes(),
                     "relationships": self.get_all_relationships(),
                 }
-                import json
-
                 return json.dumps(export_data, indent=2, default=str)
         except Exception as e:
             self.logger.error(f"Error exporting relationships: {e}", exc_info=True)
@@ -1564,16 +1751,7 @@ class PRTAPI:
             self.db.session.add(contact)
             self.db.session.commit()
 
-            return {
-                "id": contact.id,
-                "name": contact.name,
-                "email": contact.email,
-                "phone": contact.phone,
-                "profile_image": contact.profile_image,
-                "profile_image_filename": contact.profile_image_filename,
-                "profile_image_mime_type": contact.profile_image_mime_type,
-                "relationship_info": self.get_relationship_info(contact.id),
-            }
+            return self._hydrate_contacts([contact])[0]
         except Exception as e:
             self.logger.error(f"Error adding contact: {e}", exc_info=True)
             self.db.session.rollback()
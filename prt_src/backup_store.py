@@ -0,0 +1,184 @@
+"""
+Deduplicated, compressed storage for database snapshots
+
+A snapshot file is split into fixed-size chunks aligned to SQLite pages. Each
+chunk is stored once under its SHA-256 digest, zlib-compressed unless it looks
+incompressible, and a snapshot itself is a small JSON manifest listing its
+chunk digests. Repeated snapshots of a database whose pages did not change
+(for example the profile image BLOBs) only add a manifest and the few chunks
+that differ.
+"""
+
+import hashlib
+import json
+import os
+import zlib
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+MANIFEST_SUFFIX = ".manifest"
+
+# 16 SQLite pages at the default 4 KiB page size; small enough that one
+# changed row rewrites little, large enough to keep the object count low
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Image BLOBs barely compress, so favour speed over ratio
+COMPRESSION_LEVEL = 1
+
+# A chunk is only compressed if a probe of its first bytes shrinks below this
+# ratio; compressing incompressible image data costs far more than hashing it
+COMPRESSION_PROBE_SIZE = 4096
+COMPRESSION_MIN_RATIO = 0.9
+
+# First byte of a stored object: how the rest of it is encoded
+RAW_CHUNK = b"r"
+ZLIB_CHUNK = b"z"
+
+
+def _encode_chunk(chunk: bytes) -> bytes:
+    probe = chunk[:COMPRESSION_PROBE_SIZE]
+    if len(zlib.compress(probe, COMPRESSION_LEVEL)) < len(probe) * COMPRESSION_MIN_RATIO:
+        compressed = zlib.compress(chunk, COMPRESSION_LEVEL)
+        if len(compressed) < len(chunk):
+            return ZLIB_CHUNK + compressed
+    return RAW_CHUNK + chunk
+
+
+def _decode_chunk(data: bytes) -> bytes:
+    if data[:1] == ZLIB_CHUNK:
+        return zlib.decompress(data[1:])
+    return data[1:]
+
+
+class BackupStore:
+    """Content-addressed chunk store for database snapshots."""
+
+    def __init__(self, objects_dir: Path, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """Initialize the store.
+
+        Args:
+            objects_dir: Directory holding the chunk objects (created on first write)
+            chunk_size: Bytes per chunk; a multiple of the database page size
+        """
+        self.objects_dir = Path(objects_dir)
+        self.chunk_size = chunk_size
+
+    @staticmethod
+    def is_manifest(path: Path) -> bool:
+        """Return True if ``path`` names a snapshot manifest rather than a database file."""
+        return Path(path).suffix == MANIFEST_SUFFIX
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest
+
+    def _write_private(self, path: Path, data: bytes) -> None:
+        """Write a file readable only by the owner, atomically."""
+        tmp_path = path.with_name(path.name + ".tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        tmp_path.replace(path)
+
+    def put(self, snapshot: Path, manifest_path: Path) -> dict[str, Any]:
+        """Store a snapshot file and write its manifest.
+
+        Args:
+            snapshot: Consistent database snapshot to store
+            manifest_path: Where to write the manifest
+
+        Returns:
+            Dict with the snapshot ``size``, ``stored_size`` (bytes newly written,
+            manifest included), ``chunks`` and ``new_chunks``
+        """
+        digests: list[str] = []
+        stored_size = 0
+        new_chunks = 0
+        size = 0
+
+        with open(snapshot, "rb") as f:
+            while chunk := f.read(self.chunk_size):
+                size += len(chunk)
+                digest = hashlib.sha256(chunk).hexdigest()
+                digests.append(digest)
+                object_path = self._object_path(digest)
+                if object_path.exists():
+                    continue
+                object_path.parent.mkdir(parents=True, exist_ok=True)
+                data = _encode_chunk(chunk)
+                self._write_private(object_path, data)
+                stored_size += len(data)
+                new_chunks += 1
+
+        manifest = json.dumps(
+            {"size": size, "chunk_size": self.chunk_size, "chunks": digests}
+        ).encode("utf-8")
+        self._write_private(manifest_path, manifest)
+        stored_size += len(manifest)
+
+        logger.info(
+            f"[BACKUP_STORE] Stored {manifest_path.name}: {new_chunks}/{len(digests)} new chunks,"
+            f" {stored_size / 1024 / 1024:.1f}MB written for {size / 1024 / 1024:.1f}MB"
+        )
+        return {
+            "size": size,
+            "stored_size": stored_size,
+            "chunks": len(digests),
+            "new_chunks": new_chunks,
+        }
+
+    def restore(self, manifest_path: Path, dest: Path) -> None:
+        """Reassemble the snapshot described by a manifest.
+
+        Args:
+            manifest_path: Manifest written by ``put``
+            dest: File to write the snapshot to
+
+        Raises:
+            FileNotFoundError: If a chunk is missing from the store
+            ValueError: If a chunk does not match its digest
+        """
+        manifest = json.loads(Path(manifest_path).read_text(encoding="utf-8"))
+
+        fd = os.open(dest, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as out:
+            for digest in manifest["chunks"]:
+                chunk = _decode_chunk(self._object_path(digest).read_bytes())
+                if hashlib.sha256(chunk).hexdigest() != digest:
+                    raise ValueError(f"Corrupt backup chunk {digest} in {manifest_path}")
+                out.write(chunk)
+
+        if Path(dest).stat().st_size != manifest["size"]:
+            raise ValueError(f"Restored size does not match manifest {manifest_path}")
+
+    def collect_garbage(self, manifests: Iterable[Path]) -> int:
+        """Delete chunks no longer referenced by any of the given manifests.
+
+        Args:
+            manifests: Every manifest still in use
+
+        Returns:
+            Number of chunks deleted
+        """
+        if not self.objects_dir.exists():
+            return 0
+
+        referenced: set[str] = set()
+        for manifest_path in manifests:
+            if Path(manifest_path).exists():
+                manifest = json.loads(Path(manifest_path).read_text(encoding="utf-8"))
+                referenced.update(manifest["chunks"])
+
+        deleted = 0
+        for object_path in self.objects_dir.glob("*/*"):
+            if object_path.name not in referenced:
+                object_path.unlink()
+                deleted += 1
+
+        if deleted:
+            logger.info(f"[BACKUP_STORE] Removed {deleted} unreferenced chunks")
+        return deleted
@@ -7,6 +7,7 @@ This module creates the Typer app and registers all commands.
 import typer
 
 from .commands.database import db_status_command
+from .commands.database import index_advisor_command
 from .commands.database import test_db_command
 from .commands.debug import prt_debug_info_command
 from .commands.main import main_command
@@ -27,3 +28,4 @@ app.command(name="test-db")(test_db_command)
 app.command(name="list-models")(list_models_command)
 app.command(name="prt-debug-info")(prt_debug_info_command)
 app.command(name="db-status")(db_status_command)
+app.command(name="index-advisor")(index_advisor_command)
@@ -1,7 +1,8 @@
 """
 Database commands for PRT CLI.
 
-This module contains commands for testing database connectivity and checking status.
+This module contains commands for testing database connectivity, checking status,
+and checking the query plans of the hot queries.
 """
 
 from pathlib import Path
@@ -11,6 +12,7 @@ from rich.console import Console
 
 from ...config import load_config
 from ...db import create_database
+from ...index_advisor import advise
 from ..bootstrap.setup import check_setup_status
 
 console = Console()
@@ -74,3 +76,38 @@ def db_status_command():
             console.print(f"Database status: [red]ERROR[/red] - {e}")
     else:
         console.print("Database status: [yellow]NOT FOUND[/yellow]")
+
+
+def index_advisor_command(
+    show_plans: bool = typer.Option(False, "--plans", help="Print every query plan"),
+):
+    """Check the hot queries' plans for full table scans."""
+    config = load_config()
+    if not config:
+        console.print("No configuration found. Run 'setup' first.", style="red")
+        raise typer.Exit(1) from None
+
+    db_path = Path(config.get("db_path", "prt_data/prt.db"))
+    if not db_path.exists():
+        console.print("Database file not found.", style="red")
+        raise typer.Exit(1) from None
+
+    db = create_database(db_path)
+    with db.read_session() as session:
+        reports = advise(session)
+
+    for report in reports:
+        if report.flagged:
+            scans = ", ".join(report.full_scans)
+            console.print(f"✗ {report.name}: full scan of {scans}", style="red")
+        else:
+            console.print(f"✓ {report.name}", style="green")
+        if show_plans or report.flagged:
+            for step in report.plan:
+                console.print(f"    {step}", style="dim")
+
+    flagged = sum(report.flagged for report in reports)
+    if flagged:
+        console.print(f"{flagged} of {len(reports)} queries do a full table scan", style="yellow")
+        raise typer.Exit(1) from None
+    console.print(f"All {len(reports)} queries use indexes", style="green")
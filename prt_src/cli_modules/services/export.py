@@ -54,7 +54,7 @@ def export_search_results(
     # Export profile images for contacts
     from .images import export_profile_images_from_results
 
-    images_exported = export_profile_images_from_results(results, export_dir, timestamp)
+    images_exported = export_profile_images_from_results(results, export_dir, timestamp, api=api)
     if images_exported > 0:
         console.print(f"🖼️  Exported {images_exported} profile images", style="green")
 
@@ -75,7 +75,11 @@ def export_search_results(
 
 
 def clean_results_for_json(results: list) -> list:
-    """Clean results for JSON serialization by removing binary data."""
+    """Clean results for JSON serialization by removing binary data.
+
+    Handles both API contact dicts (``has_profile_image`` flag, no bytes) and
+    legacy dicts that embed ``profile_image`` bytes.
+    """
     clean_results = copy.deepcopy(results)
 
     def clean_item(item):
@@ -87,6 +91,8 @@ def clean_results_for_json(results: list) -> list:
                     # Add relative path to exported image
                     item["exported_image_path"] = f"profile_images/{item['id']}.jpg"
                 del item["profile_image"]  # Remove binary data
+            elif item.get("has_profile_image") and "id" in item:
+                item["exported_image_path"] = f"profile_images/{item['id']}.jpg"
 
             # Recursively clean nested dictionaries and lists
             for key, value in item.items():
@@ -9,9 +9,20 @@ from pathlib import Path
 
 from rich.console import Console
 
+# Directory cards show photos at 100 CSS pixels; twice that covers high-DPI screens
+EXPORT_IMAGE_SIZE = 200
 
-def export_profile_images_from_results(results: list, export_dir: Path, timestamp: str) -> int:
-    """Export profile images from any result structure (contacts, tags with contacts, notes with contacts)."""
+
+def export_profile_images_from_results(
+    results: list, export_dir: Path, timestamp: str, api=None
+) -> int:
+    """Export profile images from any result structure (contacts, tags with contacts, notes with contacts).
+
+    Contact dicts from the API only carry ``has_profile_image``; the image bytes
+    are streamed from the database through ``api.iter_profile_image`` while
+    writing, as the smallest stored size that covers ``EXPORT_IMAGE_SIZE``.
+    Dicts that still embed ``profile_image`` bytes are written directly.
+    """
     console = Console()
 
     images_dir = export_dir / "profile_images"
@@ -31,7 +42,8 @@ def export_profile_images_from_results(results: list, export_dir: Path, timestam
 
     # Export images for all found contacts
     for contact in contacts_to_process:
-        if contact.get("profile_image"):
+        embedded_image = contact.get("profile_image")
+        if embedded_image or (api is not None and contact.get("has_profile_image")):
             try:
                 # Generate filename: contact_id.jpg
                 contact_id = contact["id"]
@@ -40,7 +52,11 @@ def export_profile_images_from_results(results: list, export_dir: Path, timestam
                 # Save image data
                 image_path = images_dir / filename
                 with open(image_path, "wb") as f:
-                    f.write(contact["profile_image"])
+                    if embedded_image:
+                        f.write(embedded_image)
+                    else:
+                        for chunk in api.iter_profile_image(contact_id, size=EXPORT_IMAGE_SIZE):
+                            f.write(chunk)
                 images_exported += 1
 
             except Exception as e:
@@ -54,4 +70,4 @@ def export_profile_images_from_results(results: list, export_dir: Path, timestam
 
 def export_contact_profile_images(api, contacts: list, export_dir: Path, timestamp: str) -> int:
     """Export profile images for contacts. (Deprecated - use export_profile_images_from_results)"""
-    return export_profile_images_from_results(contacts, export_dir, timestamp)
+    return export_profile_images_from_results(contacts, export_dir, timestamp, api=api)
@@ -15,8 +15,11 @@ from ...config import data_dir
 from ...google_contacts import fetch_contacts
 
 # Import required functions from other modules
+from ...google_takeout import GoogleTakeoutParser
 from ...google_takeout import find_takeout_files
 from ...google_takeout import parse_takeout_contacts
+from ...import_sync import SOURCE_GOOGLE_CONTACTS
+from ...import_sync import SOURCE_GOOGLE_TAKEOUT
 
 
 def handle_import_google_takeout(api, config: dict) -> None:
@@ -102,12 +105,18 @@ def handle_import_google_takeout(api, config: dict) -> None:
             console.print("Import cancelled", style="yellow")
             return
 
-        # Import contacts
+        # Import contacts, writing only what changed since the last import of this source
         console.print("💾 Importing contacts...", style="blue")
-        success = api.insert_contacts(contacts)
+        summary = api.sync_contacts(
+            SOURCE_GOOGLE_TAKEOUT,
+            contacts,
+            GoogleTakeoutParser(takeout_path).load_profile_images,
+            lambda _stage, done, total: console.print(f"   {done:,}/{total:,}", style="dim"),
+        )
 
-        if success:
+        if summary is not None:
             console.print(f"✅ Successfully imported {len(contacts)} contacts!", style="bold green")
+            console.print(f"🔄 {summary.describe()}", style="green")
             console.print(
                 f"🖼️  {info['contacts_with_images']} contacts include profile images", style="green"
             )
@@ -133,13 +142,14 @@ def handle_import_google_contacts(api, config: dict) -> None:
 
     console.print("Fetching contacts from Google...", style="blue")
     try:
-        contacts = fetch_contacts(config)
+        contacts = [_contact_from_google(name, email) for name, email in fetch_contacts(config)]
         if contacts:
-            # Insert contacts into database
-            success = api.insert_contacts(contacts)
-            if success:
+            summary = api.sync_contacts(SOURCE_GOOGLE_CONTACTS, contacts)
+            if summary is not None:
                 console.print(
-                    f"Successfully imported {len(contacts)} contacts from Google", style="green"
+                    f"Successfully imported {len(contacts)} contacts from Google"
+                    f" ({summary.describe()})",
+                    style="green",
                 )
             else:
                 console.print("Failed to import contacts to database", style="red")
@@ -147,3 +157,9 @@ def handle_import_google_contacts(api, config: dict) -> None:
             console.print("No contacts found in Google account", style="yellow")
     except Exception as e:
         console.print(f"Failed to fetch contacts: {e}", style="red")
+
+
+def _contact_from_google(name: str, email: str) -> dict:
+    """Turn a (name, email) pair from the People API into a parsed contact."""
+    first, _, last = (name or "").partition(" ")
+    return {"first": first, "last": last, "emails": [email] if email else [], "phones": []}
@@ -237,6 +237,11 @@ class LLMConfig:
     timeout: int = 300  # Increased from 120s to handle large datasets (1800+ contacts)
     temperature: float = 0.1
 
+    # HTTP transport (pooled keep-alive connections to the provider)
+    pool_size: int = 4
+    max_retries: int = 2
+    connect_timeout: float = 5.0
+
 
 @dataclass
 class LLMPermissions:
@@ -326,6 +331,10 @@ class LLMConfigManager:
                 "timeout", 300
             ),  # Increased from 120s to handle large datasets (1800+ contacts)
             temperature=llm_dict.get("temperature", 0.1),
+            # HTTP transport
+            pool_size=llm_dict.get("pool_size", 4),
+            max_retries=llm_dict.get("max_retries", 2),
+            connect_timeout=llm_dict.get("connect_timeout", 5.0),
         )
 
     def _load_permissions_config(self, perm_dict: dict[str, Any]) -> LLMPermissions:
@@ -502,6 +511,10 @@ class LLMConfigManager:
                 # Common settings
                 "timeout": self.llm.timeout,
                 "temperature": self.llm.temperature,
+                # HTTP transport
+                "pool_size": self.llm.pool_size,
+                "max_retries": self.llm.max_retries,
+                "connect_timeout": self.llm.connect_timeout,
             },
             "llm_permissions": {
                 "allow_create": self.permissions.allow_create,
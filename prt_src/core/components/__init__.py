@@ -3,6 +3,8 @@
 These components provide reusable functionality for Textual and future Flet UIs.
 """
 
+from .dedup import ContactClusterer
+from .dedup import MergePlan
 from .pagination import AlphabeticalIndex
 from .pagination import Page
 from .pagination import PaginationConfig
@@ -35,4 +37,7 @@ __all__ = [
     "RelationshipValidator",
     "DuplicateDetector",
     "DataSanitizer",
+    # Deduplication
+    "ContactClusterer",
+    "MergePlan",
 ]
@@ -6,10 +6,12 @@ fuzzy matching, and integration with search infrastructure.
 
 from dataclasses import dataclass
 from dataclasses import field
-from difflib import SequenceMatcher
 from enum import Enum
 from typing import Any
 
+from prt_src.core.components.fuzzy_index import FUZZY_SHORTLIST_SIZE
+from prt_src.core.components.fuzzy_index import TrigramIndex
+from prt_src.core.components.fuzzy_index import fuzzy_score
 from prt_src.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -111,16 +113,75 @@ class AutocompleteEngine:
 
         self.search_api = search_api
         self.contact_cache = contact_cache
-        self._items: list[dict[str, Any]] = []
+        self._items: dict[int, dict[str, Any]] = {}
+        self._next_slot = 0
+        self._indexes: dict[str, TrigramIndex] = {}
         self._last_query_time = 0
 
     def set_items(self, items: list[dict[str, Any]]):
         """Set items for autocomplete.
 
+        Builds the trigram index for the default ``name`` field up front;
+        indexes for other fields are built on first use.
+
         Args:
             items: List of items to autocomplete from
         """
-        self._items = items
+        self._items = dict(enumerate(items))
+        self._next_slot = len(items)
+        self._indexes = {}
+        self._index_for("name")
+
+    def add_item(self, item: dict[str, Any]) -> None:
+        """Add one item and index it incrementally.
+
+        Args:
+            item: Item to autocomplete from
+        """
+        slot = self._next_slot
+        self._next_slot += 1
+        self._items[slot] = item
+        for field_name, index in self._indexes.items():
+            index.add(slot, self._field_value(item, field_name).lower())
+
+    def update_item(self, item: dict[str, Any]) -> None:
+        """Replace the item with the same ``id``, or add it if it's new.
+
+        Args:
+            item: Updated item
+        """
+        for slot, existing in self._items.items():
+            if existing.get("id") == item.get("id"):
+                self._items[slot] = item
+                for field_name, index in self._indexes.items():
+                    index.add(slot, self._field_value(item, field_name).lower())
+                return
+        self.add_item(item)
+
+    def remove_item(self, item_id: int) -> None:
+        """Remove every item with the given ``id``.
+
+        Args:
+            item_id: ID of the item to remove
+        """
+        for slot in [s for s, item in self._items.items() if item.get("id") == item_id]:
+            del self._items[slot]
+            for index in self._indexes.values():
+                index.remove(slot)
+
+    @staticmethod
+    def _field_value(item: dict[str, Any], field_name: str) -> str:
+        return str(item.get(field_name, ""))
+
+    def _index_for(self, field_name: str) -> TrigramIndex:
+        """Return the trigram index for a field, building it on first use."""
+        index = self._indexes.get(field_name)
+        if index is None:
+            index = TrigramIndex()
+            for slot, item in self._items.items():
+                index.add(slot, self._field_value(item, field_name).lower())
+            self._indexes[field_name] = index
+        return index
 
     def get_suggestions(
         self, query: str, context: AutocompleteContext | None = None
@@ -261,6 +322,8 @@ class AutocompleteEngine:
     ) -> list[Suggestion]:
         """Get suggestions from stored items.
 
+        Candidates come from the trigram index; only the shortlist is scored.
+
         Args:
             query: Query string
             context: Optional context
@@ -268,59 +331,47 @@ class AutocompleteEngine:
         Returns:
             List of suggestions from items
         """
-        suggestions = []
-        query_lower = query.lower()
-
-        for item in self._items:
-            # Determine which field to search
-            if context and context.current_field:
-                field_value = str(item.get(context.current_field, ""))
-            else:
-                # Default to name field
-                field_value = str(item.get("name", ""))
+        if not self._items:
+            return []
 
-            field_value_lower = field_value.lower()
+        # Determine which field to search (default to name field)
+        field_name = context.current_field if context and context.current_field else "name"
+        index = self._index_for(field_name)
+        query_lower = query.lower()
 
-            # Check for match
-            if self.enable_fuzzy:
-                # Fuzzy matching
-                similarity = self._fuzzy_match(query_lower, field_value_lower)
+        scored = []
+        if self.enable_fuzzy:
+            # Fuzzy matching: every substring match plus the closest trigram matches
+            candidates = index.containing(query_lower)
+            candidates.update(index.similar(query_lower, FUZZY_SHORTLIST_SIZE))
+            for slot in sorted(candidates):
+                similarity = self._fuzzy_match(query_lower, index.text(slot))
                 if similarity >= self.fuzzy_threshold:
-                    suggestions.append(
-                        Suggestion(
-                            text=field_value,
-                            source=SuggestionSource.DATABASE,
-                            entity_id=item.get("id"),
-                            score=similarity,
-                            metadata={"email": item.get("email"), "tags": item.get("tags", [])},
-                        )
-                    )
-            else:
-                # Prefix matching and substring matching
+                    scored.append((slot, similarity))
+        else:
+            # Prefix matching and substring matching
+            for slot in sorted(index.containing(query_lower)):
+                field_value_lower = index.text(slot)
                 if field_value_lower.startswith(query_lower):
                     # Exact match gets highest score
                     score = 1.0 if field_value_lower == query_lower else 0.9
-                    suggestions.append(
-                        Suggestion(
-                            text=field_value,
-                            source=SuggestionSource.DATABASE,
-                            entity_id=item.get("id"),
-                            score=score,
-                            metadata={"email": item.get("email"), "tags": item.get("tags", [])},
-                        )
-                    )
-                elif query_lower in field_value_lower:
+                else:
                     # Substring match gets lower score
-                    suggestions.append(
-                        Suggestion(
-                            text=field_value,
-                            source=SuggestionSource.DATABASE,
-                            entity_id=item.get("id"),
-                            score=0.7,
-                            metadata={"email": item.get("email"), "tags": item.get("tags", [])},
-                        )
-                    )
+                    score = 0.7
+                scored.append((slot, score))
 
+        suggestions = []
+        for slot, score in scored:
+            item = self._items[slot]
+            suggestions.append(
+                Suggestion(
+                    text=self._field_value(item, field_name),
+                    source=SuggestionSource.DATABASE,
+                    entity_id=item.get("id"),
+                    score=score,
+                    metadata={"email": item.get("email"), "tags": item.get("tags", [])},
+                )
+            )
         return suggestions
 
     def _fuzzy_match(self, query: str, text: str) -> float:
@@ -333,53 +384,7 @@ class AutocompleteEngine:
         Returns:
             Similarity score (0-1)
         """
-        # Check for exact match
-        if query == text:
-            return 1.0
-
-        # Check if query is a substring
-        if query in text:
-            # Prefix match is better than substring
-            if text.startswith(query):
-                return 0.95
-            return 0.85
-
-        # Check for transposed characters (e.g., "jhon" vs "john")
-        if len(query) <= len(text):
-            # Check if it's likely a typo by comparing sorted characters
-            query_sorted = sorted(query)
-            for i in range(len(text) - len(query) + 1):
-                substring = text[i : i + len(query)]
-                if sorted(substring) == query_sorted:
-                    # Found a substring with same characters
-                    return 0.75
-
-        # Use SequenceMatcher for general similarity
-        matcher = SequenceMatcher(None, query, text)
-        ratio = matcher.ratio()
-
-        # Check for close substring matches (e.g., "xris" matching "hris" in "christopher")
-        if len(query) >= 3:
-            best_substring_ratio = 0
-            for i in range(len(text) - len(query) + 1):
-                substring = text[i : i + len(query)]
-                sub_matcher = SequenceMatcher(None, query, substring)
-                sub_ratio = sub_matcher.ratio()
-                best_substring_ratio = max(best_substring_ratio, sub_ratio)
-
-            # If we found a good substring match, use it
-            if best_substring_ratio >= 0.75:
-                return max(
-                    ratio, best_substring_ratio * 0.8
-                )  # Scale down slightly since it's not exact
-
-        # Boost score if query appears at start of any word in text
-        words = text.split()
-        for word in words:
-            if word.lower().startswith(query):
-                return max(ratio, 0.8)
-
-        return ratio
+        return fuzzy_score(query, text)
 
     def filter_suggestions(
         self, suggestions: list[Suggestion], context: AutocompleteContext
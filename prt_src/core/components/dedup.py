@@ -0,0 +1,305 @@
+"""Transitive de-duplication of imported contacts.
+
+``ContactClusterer`` puts every imported contact into a union-find structure
+and joins contacts that share a match key: a normalized email, a normalized
+phone number or, optionally, a normalized name. A contact that shares one key
+with a first cluster and another key with a second cluster joins both, so the
+clusters are the same whatever order the import lists its contacts in. Each
+contact is visited once and every union is near constant time.
+
+Existing contacts are found through indexed lookups on the same keys and join
+the clusters as well. The result is a ``MergePlan`` that can be reviewed
+before anything is written: every cluster lists its imported members, the
+existing contacts it matched and the keys that linked them.
+"""
+
+import re
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+
+from sqlalchemy import bindparam
+from sqlalchemy import text
+
+from ...models import IN_CLAUSE_BATCH_SIZE
+from .validation import DataSanitizer
+
+# SQL forms of the match keys. The v9 schema migration indexes these exact
+# expressions, so lookups don't scan the contacts table.
+EMAIL_KEY_SQL = "lower(trim(email))"
+NAME_KEY_SQL = "lower(trim(name))"
+PHONE_DIGITS_SQL = (
+    "replace(replace(replace(replace(replace(replace("
+    "phone, ' ', ''), '-', ''), '(', ''), ')', ''), '.', ''), '+', '')"
+)
+
+# Fields that belong to one profile image and are taken together
+IMAGE_FIELDS = (
+    "profile_image",
+    "profile_image_member",
+    "profile_image_filename",
+    "profile_image_mime_type",
+    "profile_image_fingerprint",
+)
+
+
+class UnionFind:
+    """Disjoint sets over the integers 0..n-1, grown with ``add``."""
+
+    def __init__(self):
+        self.parent: list[int] = []
+        self.size: list[int] = []
+
+    def add(self) -> int:
+        """Add a singleton set and return its element."""
+        self.parent.append(len(self.parent))
+        self.size.append(1)
+        return len(self.parent) - 1
+
+    def find(self, item: int) -> int:
+        """Return the representative of ``item``'s set, compressing the path."""
+        root = item
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[item] != root:
+            self.parent[item], item = root, self.parent[item]
+        return root
+
+    def union(self, a: int, b: int) -> int:
+        """Join the sets of ``a`` and ``b`` and return the new representative."""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return root_a
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+        return root_a
+
+
+@dataclass
+class MergeGroup:
+    """One cluster of the merge plan."""
+
+    # Positions of the imported contacts in the input, ascending
+    members: list[int]
+    # IDs of matching contacts already in the database, ascending
+    existing_ids: list[int] = field(default_factory=list)
+    # Match keys shared by at least two contacts of the cluster, sorted
+    keys: list[str] = field(default_factory=list)
+    # The members merged into one contact
+    merged: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def target_id(self) -> int | None:
+        """Existing contact the members merge into, or None to insert a new one."""
+        return self.existing_ids[0] if self.existing_ids else None
+
+
+@dataclass
+class MergePlan:
+    """Clusters of an import, ordered by their first imported member."""
+
+    groups: list[MergeGroup]
+
+    @property
+    def contacts(self) -> list[dict[str, Any]]:
+        """One merged contact per cluster, in plan order."""
+        return [group.merged for group in self.groups]
+
+    @property
+    def new_contacts(self) -> list[dict[str, Any]]:
+        """Merged contacts that match nothing in the database."""
+        return [group.merged for group in self.groups if group.target_id is None]
+
+    @property
+    def duplicates_removed(self) -> int:
+        """Imported contacts folded into another imported contact."""
+        return sum(len(group.members) - 1 for group in self.groups)
+
+    def describe(self) -> list[str]:
+        """One line per cluster that merges anything, for review before importing."""
+        lines = []
+        for group in self.groups:
+            if len(group.members) == 1 and group.target_id is None:
+                continue
+            target = f"existing #{group.target_id}" if group.target_id else "new contact"
+            lines.append(f"{len(group.members)} imported -> {target} ({', '.join(group.keys)})")
+        return lines
+
+
+def merge_cluster(contacts: list[dict[str, Any]]) -> dict[str, Any]:
+    """Merge contacts into one new dict without copying per step.
+
+    Emails and phones are combined in first-seen order; every other field
+    takes the first non-empty value, and the profile image fields all come
+    from the first contact that has an image.
+
+    Args:
+        contacts: Contacts in priority order
+
+    Returns:
+        The merged contact
+    """
+    if len(contacts) == 1:
+        return contacts[0]
+
+    merged: dict[str, Any] = {}
+    emails: dict[str, None] = {}
+    phones: dict[str, None] = {}
+    for contact in contacts:
+        emails.update(dict.fromkeys(e for e in contact.get("emails", []) if e))
+        phones.update(dict.fromkeys(p for p in contact.get("phones", []) if p))
+        for name, value in contact.items():
+            if name in IMAGE_FIELDS or name in ("emails", "phones"):
+                continue
+            current = merged.get(name)
+            if current is None or (isinstance(current, str) and not current.strip()):
+                merged[name] = value
+
+    image_source = next(
+        (c for c in contacts if c.get("profile_image_filename") or c.get("profile_image")),
+        contacts[0],
+    )
+    for name in IMAGE_FIELDS:
+        if name in image_source:
+            merged[name] = image_source[name]
+    merged["emails"] = list(emails)
+    merged["phones"] = list(phones)
+    return merged
+
+
+class ContactClusterer:
+    """Cluster contacts that share an email, phone number or (optionally) name."""
+
+    def __init__(self, match_names: bool = False):
+        """Initialize the clusterer.
+
+        Args:
+            match_names: Also join contacts whose normalized full names are
+                equal. Off by default, since different people share names.
+        """
+        self.match_names = match_names
+        self.sanitizer = DataSanitizer()
+
+    @staticmethod
+    def normalize_name(name: str) -> str:
+        """Lowercase a name and collapse its whitespace."""
+        return " ".join(name.lower().split())
+
+    def normalize_phone(self, phone: str) -> str | None:
+        """Normalize a phone number, keeping the bare digits of numbers it can't place."""
+        normalized = self.sanitizer.normalize_phone(phone)
+        if normalized:
+            return normalized
+        digits = re.sub(r"\D", "", phone or "")
+        return f"+{digits}" if len(digits) >= 7 else None
+
+    def match_keys(self, contact: dict[str, Any]) -> list[str]:
+        """Return the match keys of a parsed contact (``first``/``last``/``emails``/``phones``)."""
+        keys = []
+        for email in contact.get("emails", []):
+            normalized = self.sanitizer.normalize_email(email)
+            if normalized:
+                keys.append(f"email:{normalized}")
+        for phone in contact.get("phones", []):
+            normalized = self.normalize_phone(phone)
+            if normalized:
+                keys.append(f"phone:{normalized}")
+        if self.match_names:
+            name = self.normalize_name(f"{contact.get('first', '')} {contact.get('last', '')}")
+            if name:
+                keys.append(f"name:{name}")
+        return keys
+
+    def plan(self, contacts: list[dict[str, Any]], session=None) -> MergePlan:
+        """Cluster an import and, given a session, match it against the database.
+
+        Args:
+            contacts: Parsed contacts to import
+            session: Optional SQLAlchemy session or connection on the database
+
+        Returns:
+            The merge plan; merging the same contacts again gives the same plan
+        """
+        sets = UnionFind()
+        for _ in contacts:
+            sets.add()
+
+        key_nodes: dict[str, list[int]] = defaultdict(list)
+        for position, contact in enumerate(contacts):
+            for key in dict.fromkeys(self.match_keys(contact)):
+                key_nodes[key].append(position)
+
+        existing_nodes: dict[int, int] = {}
+        if session is not None:
+            for key, contact_id in self.find_existing(session, key_nodes):
+                if contact_id not in existing_nodes:
+                    existing_nodes[contact_id] = sets.add()
+                key_nodes[key].append(existing_nodes[contact_id])
+
+        for nodes in key_nodes.values():
+            for node in nodes[1:]:
+                sets.union(nodes[0], node)
+
+        groups: dict[int, MergeGroup] = {}
+        for position in range(len(contacts)):
+            groups.setdefault(sets.find(position), MergeGroup(members=[])).members.append(position)
+        for contact_id, node in sorted(existing_nodes.items()):
+            groups[sets.find(node)].existing_ids.append(contact_id)
+        for key, nodes in sorted(key_nodes.items()):
+            if len(nodes) > 1:
+                groups[sets.find(nodes[0])].keys.append(key)
+
+        for group in groups.values():
+            group.merged = merge_cluster([contacts[i] for i in group.members])
+        return MergePlan(groups=sorted(groups.values(), key=lambda g: g.members[0]))
+
+    def find_existing(self, session, keys: Iterable[str]) -> list[tuple[str, int]]:
+        """Find database contacts that have any of the given match keys.
+
+        Candidates come from indexed lookups on the SQL key expressions and
+        are confirmed with the same normalization as imported contacts.
+
+        Args:
+            session: SQLAlchemy session or connection
+            keys: Match keys from ``match_keys``
+
+        Returns:
+            Sorted ``(key, contact_id)`` pairs
+        """
+        wanted = set(keys)
+        emails = sorted(k.split(":", 1)[1] for k in wanted if k.startswith("email:"))
+        phone_digits = set()
+        for key in wanted:
+            if key.startswith("phone:+"):
+                digits = key[len("phone:+") :]
+                phone_digits.add(digits)
+                if digits.startswith("1") and len(digits) == 11:
+                    phone_digits.add(digits[1:])  # Stored without the country code
+        names = sorted(k.split(":", 1)[1] for k in wanted if k.startswith("name:"))
+
+        candidates = set()
+        lookups = (
+            (f"SELECT id, email, phone, name FROM contacts WHERE {EMAIL_KEY_SQL} IN :keys", emails),
+            (
+                f"SELECT id, email, phone, name FROM contacts WHERE {PHONE_DIGITS_SQL} IN :keys",
+                sorted(phone_digits),
+            ),
+            (f"SELECT id, email, phone, name FROM contacts WHERE {NAME_KEY_SQL} IN :keys", names),
+        )
+        for sql, values in lookups:
+            statement = text(sql).bindparams(bindparam("keys", expanding=True))
+            for start in range(0, len(values), IN_CLAUSE_BATCH_SIZE):
+                batch = values[start : start + IN_CLAUSE_BATCH_SIZE]
+                candidates.update(tuple(row) for row in session.execute(statement, {"keys": batch}))
+
+        matches = set()
+        for contact_id, email, phone, name in candidates:
+            first, _, last = (name or "").partition(" ")
+            stored = {"emails": [email] if email else [], "phones": [phone] if phone else []}
+            stored.update(first=first, last=last)
+            matches.update((key, contact_id) for key in self.match_keys(stored) if key in wanted)
+        return sorted(matches)
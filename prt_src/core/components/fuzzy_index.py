@@ -0,0 +1,221 @@
+"""Trigram index for typo-tolerant autocomplete.
+
+Autocomplete used to score every item with ``difflib.SequenceMatcher`` on
+every keystroke. ``TrigramIndex`` keeps a posting list per trigram so a query
+only looks at items that share trigrams with it, and ``fuzzy_score`` runs the
+edit-distance scoring on that shortlist.
+
+Trigrams are indexed by their sorted characters ("ohn" and "hon" share the
+key "hno"), so adjacent transpositions such as "jhon" still share keys with
+"john".
+"""
+
+from collections import Counter
+from collections import defaultdict
+
+# Fuzzy candidates scored per query, best trigram overlap first
+FUZZY_SHORTLIST_SIZE = 200
+
+
+def _keys(text: str, pad: bool) -> set[str]:
+    """Return the sorted-character trigram keys of ``text``.
+
+    Args:
+        text: Lowercased text
+        pad: Whether to pad the text so word starts get their own keys
+
+    Returns:
+        Set of trigram keys
+    """
+    if pad:
+        text = f"  {text} "
+    return {"".join(sorted(text[i : i + 3])) for i in range(len(text) - 2)}
+
+
+def _query_keys(query: str) -> set[str]:
+    """Return the keys a query shares with matching texts.
+
+    The query may start mid-word, so only its leading word boundary is padded.
+    """
+    keys = _keys(query, pad=False)
+    if len(query) >= 2:
+        keys.add("".join(sorted(f" {query[:2]}")))
+    return keys
+
+
+def levenshtein(a: str, b: str) -> int:
+    """Edit distance between two strings.
+
+    Args:
+        a: First string
+        b: Second string
+
+    Returns:
+        Minimum number of insertions, deletions and substitutions
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(
+                min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b))
+            )
+        previous = current
+    return previous[-1]
+
+
+def substring_distance(query: str, text: str) -> int:
+    """Smallest edit distance between ``query`` and any substring of ``text``.
+
+    Args:
+        query: Query string
+        text: Text to search in
+
+    Returns:
+        Edit distance of the closest substring
+    """
+    # Sellers' algorithm: a match may start anywhere, so the first row is zero
+    previous = [0] * (len(text) + 1)
+    for i, char_q in enumerate(query, 1):
+        current = [i]
+        for j, char_t in enumerate(text, 1):
+            current.append(
+                min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_q != char_t))
+            )
+        previous = current
+    return min(previous)
+
+
+def _has_anagram_window(query: str, text: str) -> bool:
+    """Check whether some window of ``text`` is a permutation of ``query``."""
+    size = len(query)
+    wanted = Counter(query)
+    window = Counter(text[:size])
+    if window == wanted:
+        return True
+    for i in range(size, len(text)):
+        window[text[i]] += 1
+        window[text[i - size]] -= 1
+        if window[text[i - size]] == 0:
+            del window[text[i - size]]
+        if window == wanted:
+            return True
+    return False
+
+
+def fuzzy_score(query: str, text: str) -> float:
+    """Score how well ``text`` matches a typed ``query``.
+
+    Args:
+        query: Lowercased query
+        text: Lowercased text to match against
+
+    Returns:
+        1.0 for an exact match, 0.95 for a prefix, 0.85 for a substring, 0.75
+        for a transposed substring, otherwise an edit-distance similarity
+    """
+    if query == text:
+        return 1.0
+
+    # Prefix match is better than substring
+    if query in text:
+        return 0.95 if text.startswith(query) else 0.85
+
+    # Transposed characters (e.g., "jhon" vs "john")
+    if len(query) <= len(text) and _has_anagram_window(query, text):
+        return 0.75
+
+    ratio = 1.0 - levenshtein(query, text) / max(len(query), len(text))
+
+    # Close substring matches (e.g., "xris" matching "hris" in "christopher")
+    if len(query) >= 3:
+        substring_ratio = 1.0 - substring_distance(query, text) / len(query)
+        if substring_ratio >= 0.75:
+            # Scale down slightly since it's not exact
+            return max(ratio, substring_ratio * 0.8)
+
+    return ratio
+
+
+class TrigramIndex:
+    """Inverted trigram index over lowercased strings, keyed by document ID."""
+
+    def __init__(self):
+        self._postings: dict[str, set[int]] = defaultdict(set)
+        self._texts: dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def add(self, doc_id: int, text: str) -> None:
+        """Index ``text`` under ``doc_id``, replacing any previous text.
+
+        Args:
+            doc_id: Document ID
+            text: Text to index (lowercased by the caller)
+        """
+        if doc_id in self._texts:
+            self.remove(doc_id)
+        self._texts[doc_id] = text
+        for key in _keys(text, pad=True):
+            self._postings[key].add(doc_id)
+
+    def remove(self, doc_id: int) -> None:
+        """Drop a document from the index.
+
+        Args:
+            doc_id: Document ID
+        """
+        text = self._texts.pop(doc_id, None)
+        if text is None:
+            return
+        for key in _keys(text, pad=True):
+            posting = self._postings.get(key)
+            if posting is not None:
+                posting.discard(doc_id)
+                if not posting:
+                    del self._postings[key]
+
+    def text(self, doc_id: int) -> str:
+        """Return the indexed text of a document."""
+        return self._texts[doc_id]
+
+    def containing(self, query: str) -> set[int]:
+        """Return the documents whose text contains ``query``.
+
+        Args:
+            query: Lowercased query
+
+        Returns:
+            Set of document IDs
+        """
+        if len(query) < 3:
+            # Too short for trigrams; a plain substring scan is cheap enough
+            return {doc_id for doc_id, text in self._texts.items() if query in text}
+
+        postings = sorted(
+            (self._postings.get(key, set()) for key in _keys(query, pad=False)), key=len
+        )
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                break
+        return {doc_id for doc_id in candidates if query in self._texts[doc_id]}
+
+    def similar(self, query: str, limit: int = FUZZY_SHORTLIST_SIZE) -> list[int]:
+        """Return the documents sharing the most trigrams with ``query``.
+
+        Args:
+            query: Lowercased query
+            limit: Maximum number of documents to return
+
+        Returns:
+            Document IDs, most shared trigrams first
+        """
+        shared: Counter[int] = Counter()
+        for key in _query_keys(query):
+            shared.update(self._postings.get(key, ()))
+        return [doc_id for doc_id, _count in shared.most_common(limit)]
@@ -2,6 +2,42 @@
 
 from typing import Any
 
+from .components.pagination import PaginationSystem
+
+
+class ContactPageLoader:
+    """Lazy ``(offset, limit)`` data provider for PaginationSystem.
+
+    Pages are loaded from the database with keyset queries. The cursor at the
+    end of each loaded page is remembered, so stepping forward through the list
+    never re-scans earlier rows; jumping to an unseen page falls back to OFFSET.
+    """
+
+    def __init__(self, api):
+        """Initialize with API instance.
+
+        Args:
+            api: PRTAPI instance for database access
+        """
+        self.api = api
+        self._cursors: dict[int, str | None] = {0: None}
+
+    def __call__(self, offset: int, limit: int) -> list[dict[str, Any]]:
+        """Load ``limit`` contacts starting at ``offset``."""
+        if offset in self._cursors:
+            page = self.api.get_contacts_page(limit, cursor=self._cursors[offset])
+        else:
+            page = self.api.get_contacts_page(limit, offset=offset)
+
+        contacts = page["contacts"]
+        if page["next_cursor"]:
+            self._cursors[offset + len(contacts)] = page["next_cursor"]
+        return contacts
+
+    def reset(self) -> None:
+        """Forget remembered cursors (call after contacts change)."""
+        self._cursors = {0: None}
+
 
 class ContactOperations:
     """Handles all contact-related business logic."""
@@ -25,29 +61,36 @@ class ContactOperations:
             Dict containing contacts, pagination info, and total count
         """
         try:
-            all_contacts = self.api.list_all_contacts()
-            total = len(all_contacts)
-
-            # Calculate pagination
-            start_idx = page * page_size
-            end_idx = min(start_idx + page_size, total)
-
-            # Get page of contacts
-            contacts = all_contacts[start_idx:end_idx] if start_idx < total else []
+            result = self.api.get_contacts_page(page_size, offset=page * page_size)
+            total = result["total"]
 
             return {
                 "success": True,
-                "contacts": contacts,
+                "contacts": result["contacts"],
                 "page": page,
                 "page_size": page_size,
                 "total": total,
                 "total_pages": (total + page_size - 1) // page_size if page_size > 0 else 0,
-                "has_next": end_idx < total,
+                "has_next": result["has_next"],
                 "has_prev": page > 0,
             }
         except Exception as e:
             return {"success": False, "error": str(e), "contacts": [], "total": 0}
 
+    def create_paginator(self, page_size: int = 20, cache_pages: bool = True) -> PaginationSystem:
+        """Create a PaginationSystem that lazily pages contacts from the database.
+
+        Args:
+            page_size: Number of contacts per page
+            cache_pages: Whether to keep already loaded pages in memory
+
+        Returns:
+            PaginationSystem wired to a ContactPageLoader
+        """
+        paginator = PaginationSystem(page_size=page_size, lazy_load=True, cache_pages=cache_pages)
+        paginator.set_data_provider(ContactPageLoader(self.api), self.api.db.count_contacts())
+        return paginator
+
     def get_contact_details(self, contact_id: int) -> dict[str, Any] | None:
         """Returns full contact info including relationships, tags, notes.
 
@@ -2,17 +2,22 @@
 
 from typing import Any
 
+from .search_cache import ContactSearchCache
+
 
 class SearchOperations:
     """Handles all search-related business logic."""
 
-    def __init__(self, api):
+    def __init__(self, api, cache: ContactSearchCache | None = None):
         """Initialize with API instance.
 
         Args:
             api: PRTAPI instance for database access
+            cache: Search cache holding the reverse tag index; a private one
+                is created when omitted
         """
         self.api = api
+        self.cache = cache if cache is not None else ContactSearchCache()
 
     def unified_search(self, query: str) -> dict[str, Any]:
         """Searches contacts, tags, notes simultaneously.
@@ -50,6 +55,9 @@ class SearchOperations:
     def search_by_tag(self, tag_name: str) -> list[dict[str, Any]]:
         """Returns contacts associated with tag.
 
+        Repeated lookups of the same tag are answered from the cache's reverse
+        tag index until contacts, tags or notes change.
+
         Args:
             tag_name: Name of the tag to search for
 
@@ -57,6 +65,21 @@ class SearchOperations:
             List of contacts with the tag
         """
         try:
+            version = self.api.db.data_version
+            cached = self.cache.get_tag_members(tag_name, version)
+            if cached is not None:
+                _tag_id, cached_name, members = cached
+                return [
+                    {
+                        "id": c.id,
+                        "name": c.name,
+                        "email": c.email,
+                        "phone": c.phone,
+                        "tag": cached_name,
+                    }
+                    for c in members
+                ]
+
             # First find the tag
             tags = self.api.search_tags(tag_name)
             if not tags:
@@ -65,29 +88,10 @@ class SearchOperations:
             # Get exact match if possible
             tag = next((t for t in tags if t["name"].lower() == tag_name.lower()), tags[0])
 
-            # Get contacts for this tag
-            contacts_with_tag = []
-            all_contacts = self.api.list_all_contacts()
+            contacts = self.api.get_contacts_grouped_by_tag([tag["id"]])[tag["id"]]
+            self.cache.set_tag_members(tag["id"], tag["name"], contacts, version)
 
-            for contact in all_contacts:
-                # Check if contact has this tag via metadata
-                metadata = self.api.db.get_contact_metadata(contact["id"])
-                if (
-                    metadata
-                    and metadata.get("tags")
-                    and any(t["id"] == tag["id"] for t in metadata["tags"])
-                ):
-                    contacts_with_tag.append(
-                        {
-                            "id": contact["id"],
-                            "name": contact["name"],
-                            "email": contact.get("email"),
-                            "phone": contact.get("phone"),
-                            "tag": tag["name"],
-                        }
-                    )
-
-            return contacts_with_tag
+            return [{**contact, "tag": tag["name"]} for contact in contacts]
 
         except Exception:
             return []
@@ -105,28 +109,15 @@ class SearchOperations:
             # Search notes
             notes = self.api.search_notes(query)
 
-            # Enhance with associated contacts
+            # Load the contacts of every matching note in one pass
+            contacts_by_note = self.api.get_contacts_grouped_by_note([n["id"] for n in notes])
+
             results = []
             for note in notes:
-                # Get contacts associated with this note
-                associated_contacts = []
-                all_contacts = self.api.list_all_contacts()
-
-                for contact in all_contacts:
-                    metadata = self.api.db.get_contact_metadata(contact["id"])
-                    if (
-                        metadata
-                        and metadata.get("notes")
-                        and any(n["id"] == note["id"] for n in metadata["notes"])
-                    ):
-                        associated_contacts.append(
-                            {
-                                "id": contact["id"],
-                                "name": contact["name"],
-                                "email": contact.get("email"),
-                            }
-                        )
-
+                associated_contacts = [
+                    {"id": c["id"], "name": c["name"], "email": c.get("email")}
+                    for c in contacts_by_note.get(note["id"], [])
+                ]
                 results.append(
                     {
                         "note": note,
@@ -102,12 +102,20 @@ class ContactSearchCache:
         # All contacts for full search
         self._all_contacts: dict[int, CachedContact] = {}
 
+        # Reverse tag index (tag id -> member contact ids), valid for one data version
+        self._tag_members: dict[int, tuple[int, ...]] = {}
+        self._tag_names: dict[int, str] = {}
+        self._tag_ids_by_name: dict[str, int] = {}
+        self._tag_index_version: Any = None
+
         # Cache statistics
         self._stats = {
             "hits": 0,
             "misses": 0,
             "autocomplete_queries": 0,
             "cache_evictions": 0,
+            "tag_index_hits": 0,
+            "tag_index_misses": 0,
             "last_warm": None,
         }
 
@@ -322,6 +330,73 @@ class ContactSearchCache:
 
         return unique_suggestions[: self.max_autocomplete_results]
 
+    def set_tag_members(
+        self,
+        tag_id: int,
+        tag_name: str,
+        contacts: list[dict[str, Any]],
+        version: Any = None,
+    ) -> None:
+        """Record which contacts carry a tag in the reverse tag index.
+
+        Args:
+            tag_id: ID of the tag
+            tag_name: Name of the tag, used for lookups
+            contacts: Contact dictionaries (id, name, email, phone) carrying the tag
+            version: Data version the membership was read at; a lookup with a
+                different version discards the whole index
+        """
+        if version != self._tag_index_version:
+            self.invalidate_tag_index()
+            self._tag_index_version = version
+
+        for contact_data in contacts:
+            fields = {
+                "name": contact_data.get("name", ""),
+                "email": contact_data.get("email"),
+                "phone": contact_data.get("phone"),
+            }
+            cached = self._all_contacts.get(contact_data["id"])
+            if cached is None:
+                self.add_contact(CachedContact(id=contact_data["id"], **fields))
+            elif any(getattr(cached, name) != value for name, value in fields.items()):
+                self.update_contact(contact_data["id"], **fields)
+
+        self._tag_members[tag_id] = tuple(c["id"] for c in contacts)
+        self._tag_names[tag_id] = tag_name
+        self._tag_ids_by_name[tag_name.lower()] = tag_id
+
+    def get_tag_members(
+        self, tag_name: str, version: Any = None
+    ) -> tuple[int, str, list[CachedContact]] | None:
+        """Answer a tag filter from the reverse tag index.
+
+        Args:
+            tag_name: Tag name (case-insensitive)
+            version: Current data version; stale entries are discarded
+
+        Returns:
+            ``(tag_id, tag_name, contacts)`` when the tag is indexed, otherwise None
+        """
+        if version != self._tag_index_version:
+            self.invalidate_tag_index()
+
+        tag_id = self._tag_ids_by_name.get(tag_name.lower())
+        member_ids = self._tag_members.get(tag_id) if tag_id is not None else None
+        if member_ids is None or any(cid not in self._all_contacts for cid in member_ids):
+            self._stats["tag_index_misses"] += 1
+            return None
+
+        self._stats["tag_index_hits"] += 1
+        return tag_id, self._tag_names[tag_id], [self._all_contacts[cid] for cid in member_ids]
+
+    def invalidate_tag_index(self) -> None:
+        """Drop every entry of the reverse tag index."""
+        self._tag_members.clear()
+        self._tag_names.clear()
+        self._tag_ids_by_name.clear()
+        self._tag_index_version = None
+
     def warm_cache(self, contacts: list[dict[str, Any]]) -> None:
         """Warm the cache with initial contact data.
 
@@ -352,6 +427,7 @@ class ContactSearchCache:
         self._email_trie.clear()
         self._phone_trie.clear()
         self._all_contacts.clear()
+        self.invalidate_tag_index()
 
         # Reset stats except for historical counts
         hits = self._stats["hits"]
@@ -363,6 +439,8 @@ class ContactSearchCache:
             "misses": misses,
             "autocomplete_queries": queries,
             "cache_evictions": 0,
+            "tag_index_hits": self._stats["tag_index_hits"],
+            "tag_index_misses": self._stats["tag_index_misses"],
             "last_warm": None,
         }
 
@@ -383,6 +461,9 @@ class ContactSearchCache:
             "hit_rate": hit_rate,
             "autocomplete_queries": self._stats["autocomplete_queries"],
             "cache_evictions": self._stats["cache_evictions"],
+            "tag_index_hits": self._stats["tag_index_hits"],
+            "tag_index_misses": self._stats["tag_index_misses"],
+            "indexed_tags": len(self._tag_members),
             "last_warm": self._stats["last_warm"],
             "name_trie_size": len(self._name_trie),
             "email_trie_size": len(self._email_trie),
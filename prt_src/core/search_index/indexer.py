@@ -4,15 +4,23 @@ This module provides a high-level interface to the FTS5 search capabilities,
 including incremental updates, result ranking, and search optimization.
 """
 
+import base64
+import hashlib
+import json
 import re
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
+from sqlalchemy import bindparam
 from sqlalchemy import text
 from sqlalchemy.exc import OperationalError
 
+from prt_src.fts_index import check_fts_consistency
+from prt_src.fts_index import rebuild_fts
+from prt_src.fts_index import refresh_fts_rows
+from prt_src.fts_index import repair_fts
 from prt_src.logging_config import get_logger
 
 
@@ -46,6 +54,57 @@ class SearchResult:
             self.metadata = {}
 
 
+# Entity types in ranked search; the index doubles as the tie-break order
+# between results with equal scores.
+_RANKED_ENTITY_TYPES = [EntityType.CONTACT, EntityType.NOTE, EntityType.TAG]
+
+# One arm of the ranked UNION ALL per entity type. Joining the base table
+# drops orphaned FTS rows before they are counted towards a page.
+_MATCH_ARMS = {
+    EntityType.CONTACT: """
+        SELECT 0 AS type_rank, c.id AS entity_id, bm25(contacts_fts) AS rank
+        FROM contacts_fts JOIN contacts c ON c.id = contacts_fts.contact_id
+        WHERE contacts_fts MATCH :query
+    """,
+    EntityType.NOTE: """
+        SELECT 1, n.id, bm25(notes_fts)
+        FROM notes_fts JOIN notes n ON n.id = notes_fts.note_id
+        WHERE notes_fts MATCH :query
+    """,
+    EntityType.TAG: """
+        SELECT 2, t.id, bm25(tags_fts)
+        FROM tags_fts JOIN tags t ON t.id = tags_fts.tag_id
+        WHERE tags_fts MATCH :query
+    """,
+}
+
+
+def _search_key(fts_query: str, entity_types: list[EntityType]) -> str:
+    """Fingerprint a search so cursors can't be replayed against another query."""
+    material = "\x1f".join([fts_query, *(t.value for t in entity_types)])
+    return hashlib.sha1(material.encode("utf-8")).hexdigest()[:12]
+
+
+def _encode_search_cursor(search_key: str, score: float, type_rank: int, entity_id: int) -> str:
+    """Encode the last ranked result of a page as an opaque URL-safe cursor."""
+    payload = json.dumps([search_key, score, type_rank, entity_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def _decode_search_cursor(cursor: str, search_key: str) -> tuple[float, int, int]:
+    """Decode a cursor produced by _encode_search_cursor for the same search."""
+    try:
+        key, score, type_rank, entity_id = json.loads(
+            base64.urlsafe_b64decode(cursor.encode("ascii"))
+        )
+        position = float(score), int(type_rank), int(entity_id)
+    except (ValueError, TypeError, UnicodeError) as e:
+        raise ValueError(f"Invalid search cursor: {cursor!r}") from e
+    if key != search_key:
+        raise ValueError("Search cursor belongs to a different query")
+    return position
+
+
 class SearchIndexer:
     """Manages FTS5 search indexing and querying."""
 
@@ -95,16 +154,52 @@ class SearchIndexer:
             entity_types: List of entity types to search (None = all)
             limit: Maximum number of results to return
             offset: Number of results to skip
-            rank_by_relevance: Whether to sort by relevance score
+            rank_by_relevance: Whether to sort by relevance score. Results
+                are always ranked in SQL; kept for API compatibility.
 
         Returns:
             List of SearchResult objects
         """
+        return self.search_page(query, entity_types, limit=limit, offset=offset)["results"]
+
+    def search_page(
+        self,
+        query: str,
+        entity_types: list[EntityType] | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+        offset: int = 0,
+    ) -> dict[str, Any]:
+        """Search contacts, notes and tags as one globally ranked result list.
+
+        All entity types are matched and ranked in a single ``UNION ALL``
+        statement. Each table's BM25 scores are divided by that table's best
+        score, so every result scores in (0, 1] and results from different
+        tables are comparable. Only the requested page is fetched and
+        hydrated.
+
+        Args:
+            query: Search query string (supports FTS5 syntax)
+            entity_types: List of entity types to search (None = all)
+            limit: Maximum number of results to return
+            cursor: ``next_cursor`` from the previous page of the same search
+            offset: Results to skip; only used when no cursor is given
+
+        Returns:
+            Dict with ``results`` (list of SearchResult) and ``next_cursor``
+            (None on the last page)
+
+        Raises:
+            ValueError: If the cursor is malformed or belongs to another search
+        """
         if not self.check_fts_available():
-            return self._fallback_search(query, entity_types, limit, offset)
+            return {
+                "results": self._fallback_search(query, entity_types, limit, offset),
+                "next_cursor": None,
+            }
 
-        if not query or not query.strip():
-            return []
+        if not query or not query.strip() or limit <= 0:
+            return {"results": [], "next_cursor": None}
 
         # Prepare query for FTS5
         fts_query = self._prepare_fts_query(query)
@@ -112,25 +207,56 @@ class SearchIndexer:
         # Determine which entity types to search
         if entity_types is None:
             entity_types = [EntityType.CONTACT, EntityType.NOTE, EntityType.TAG]
+        searched = [t for t in _RANKED_ENTITY_TYPES if t in entity_types]
+        if not searched:
+            return {"results": [], "next_cursor": None}
+
+        search_key = _search_key(fts_query, searched)
+        params: dict[str, Any] = {"query": fts_query, "limit": limit + 1, "offset": offset}
+        keyset = ""
+        if cursor:
+            score, type_rank, entity_id = _decode_search_cursor(cursor, search_key)
+            keyset = """
+                WHERE score < :after_score
+                   OR (score = :after_score AND type_rank > :after_type)
+                   OR (score = :after_score AND type_rank = :after_type AND entity_id > :after_id)
+            """
+            params.update(
+                {"after_score": score, "after_type": type_rank, "after_id": entity_id, "offset": 0}
+            )
 
-        results = []
-
-        # Search each entity type
-        if EntityType.CONTACT in entity_types:
-            results.extend(self._search_contacts(fts_query, limit))
-
-        if EntityType.NOTE in entity_types:
-            results.extend(self._search_notes(fts_query, limit))
+        arms = " UNION ALL ".join(_MATCH_ARMS[t] for t in searched)
+        sql = f"""
+            WITH matches AS ({arms}),
+            scored AS (
+                SELECT
+                    type_rank,
+                    entity_id,
+                    COALESCE(rank / NULLIF(MIN(rank) OVER (PARTITION BY type_rank), 0), 1.0)
+                        AS score
+                FROM matches
+            )
+            SELECT type_rank, entity_id, score
+            FROM scored
+            {keyset}
+            ORDER BY score DESC, type_rank, entity_id
+            LIMIT :limit OFFSET :offset
+        """
 
-        if EntityType.TAG in entity_types:
-            results.extend(self._search_tags(fts_query, limit))
+        try:
+            rows = self.db.session.execute(text(sql), params).fetchall()
+        except Exception as e:
+            # Log error but don't crash
+            self.logger.error(f"Error searching FTS index: {e}", exc_info=True)
+            return {"results": [], "next_cursor": None}
 
-        # Rank results if requested
-        if rank_by_relevance:
-            results.sort(key=lambda r: r.relevance_score, reverse=True)
+        page = rows[:limit]
+        next_cursor = None
+        if len(rows) > limit:
+            last = page[-1]
+            next_cursor = _encode_search_cursor(search_key, last[2], last[0], last[1])
 
-        # Apply pagination
-        return results[offset : offset + limit]
+        return {"results": self._hydrate_page(fts_query, page), "next_cursor": next_cursor}
 
     def _prepare_fts_query(self, query: str) -> str:
         """Prepare a query string for FTS5.
@@ -155,177 +281,177 @@ class SearchIndexer:
             # Multiple terms - search for any of them
             return " OR ".join(f"{term}*" for term in terms)
 
-    def _search_contacts(self, fts_query: str, limit: int) -> list[SearchResult]:
-        """Search contacts using FTS5.
+    def _hydrate_page(self, fts_query: str, page: list) -> list[SearchResult]:
+        """Load display fields and snippets for one page of ranked matches.
 
         Args:
             fts_query: FTS5-formatted query
-            limit: Maximum results
+            page: ``(type_rank, entity_id, score)`` rows in rank order
 
         Returns:
-            List of contact search results
+            SearchResult objects in the same order as ``page``
         """
+        ids_by_type: dict[EntityType, list[int]] = {}
+        for type_rank, entity_id, _score in page:
+            ids_by_type.setdefault(_RANKED_ENTITY_TYPES[type_rank], []).append(entity_id)
+
+        hydrators = {
+            EntityType.CONTACT: self._hydrate_contacts,
+            EntityType.NOTE: self._hydrate_notes,
+            EntityType.TAG: self._hydrate_tags,
+        }
+        hydrated: dict[tuple[EntityType, int], SearchResult] = {}
+        for entity_type, ids in ids_by_type.items():
+            try:
+                for result in hydrators[entity_type](fts_query, ids):
+                    hydrated[(entity_type, result.entity_id)] = result
+            except Exception as e:
+                self.logger.error(f"Error loading {entity_type.value} results: {e}", exc_info=True)
+
         results = []
+        for type_rank, entity_id, score in page:
+            result = hydrated.get((_RANKED_ENTITY_TYPES[type_rank], entity_id))
+            if result is not None:
+                result.relevance_score = score
+                results.append(result)
+        return results
 
-        try:
-            # Search contacts with ranking
-            sql = """
-                SELECT
-                    c.id,
-                    c.name,
-                    c.email,
-                    c.phone,
-                    bm25(contacts_fts) as rank,
-                    snippet(contacts_fts, 1, '<b>', '</b>', '...', 32) as name_snippet,
-                    snippet(contacts_fts, 2, '<b>', '</b>', '...', 32) as email_snippet
-                FROM contacts_fts
-                JOIN contacts c ON contacts_fts.contact_id = c.id
-                WHERE contacts_fts MATCH :query
-                ORDER BY rank
-                LIMIT :limit
-            """
+    def _hydrate_contacts(self, fts_query: str, contact_ids: list[int]) -> list[SearchResult]:
+        """Load contact results with name and email snippets.
 
-            rows = self.db.session.execute(
-                text(sql), {"query": fts_query, "limit": limit}
-            ).fetchall()
+        Args:
+            fts_query: FTS5-formatted query
+            contact_ids: Contact IDs on the current page
 
-            for row in rows:
-                # Determine which fields matched
-                matched_fields = []
-                if "<b>" in (row[5] or ""):
-                    matched_fields.append("name")
-                if "<b>" in (row[6] or ""):
-                    matched_fields.append("email")
+        Returns:
+            List of contact search results (unordered)
+        """
+        sql = text(
+            """
+            SELECT
+                c.id,
+                c.name,
+                c.email,
+                c.phone,
+                snippet(contacts_fts, 1, '<b>', '</b>', '...', 32) as name_snippet,
+                snippet(contacts_fts, 2, '<b>', '</b>', '...', 32) as email_snippet
+            FROM contacts_fts
+            JOIN contacts c ON contacts_fts.contact_id = c.id
+            WHERE contacts_fts MATCH :query AND contacts_fts.contact_id IN :ids
+            """
+        ).bindparams(bindparam("ids", expanding=True))
+        rows = self.db.session.execute(sql, {"query": fts_query, "ids": contact_ids}).fetchall()
 
-                # Create search result
-                result = SearchResult(
+        results = []
+        for row in rows:
+            # Determine which fields matched
+            matched_fields = []
+            if "<b>" in (row[4] or ""):
+                matched_fields.append("name")
+            if "<b>" in (row[5] or ""):
+                matched_fields.append("email")
+
+            results.append(
+                SearchResult(
                     entity_type=EntityType.CONTACT,
                     entity_id=row[0],
                     title=row[1] or "Unnamed Contact",
                     subtitle=row[2],  # email
-                    snippet=row[5] or row[6],  # Use name snippet if available, else email
-                    relevance_score=abs(row[4]),  # bm25 returns negative scores
+                    snippet=row[4] or row[5],  # Use name snippet if available, else email
                     matched_fields=matched_fields,
                     metadata={"phone": row[3]},
                 )
-                results.append(result)
-
-        except Exception as e:
-            # Log error but don't crash
-            self.logger.error(f"Error searching contacts: {e}", exc_info=True)
-
+            )
         return results
 
-    def _search_notes(self, fts_query: str, limit: int) -> list[SearchResult]:
-        """Search notes using FTS5.
+    def _hydrate_notes(self, fts_query: str, note_ids: list[int]) -> list[SearchResult]:
+        """Load note results with title and content snippets.
 
         Args:
             fts_query: FTS5-formatted query
-            limit: Maximum results
+            note_ids: Note IDs on the current page
 
         Returns:
-            List of note search results
+            List of note search results (unordered)
         """
-        results = []
-
-        try:
-            # Search notes with ranking
-            sql = """
-                SELECT
-                    n.id,
-                    n.title,
-                    n.content,
-                    bm25(notes_fts) as rank,
-                    snippet(notes_fts, 1, '<b>', '</b>', '...', 32) as title_snippet,
-                    snippet(notes_fts, 2, '<b>', '</b>', '...', 64) as content_snippet
-                FROM notes_fts
-                JOIN notes n ON notes_fts.note_id = n.id
-                WHERE notes_fts MATCH :query
-                ORDER BY rank
-                LIMIT :limit
+        sql = text(
             """
+            SELECT
+                n.id,
+                n.title,
+                n.content,
+                snippet(notes_fts, 1, '<b>', '</b>', '...', 32) as title_snippet,
+                snippet(notes_fts, 2, '<b>', '</b>', '...', 64) as content_snippet
+            FROM notes_fts
+            JOIN notes n ON notes_fts.note_id = n.id
+            WHERE notes_fts MATCH :query AND notes_fts.note_id IN :ids
+            """
+        ).bindparams(bindparam("ids", expanding=True))
+        rows = self.db.session.execute(sql, {"query": fts_query, "ids": note_ids}).fetchall()
 
-            rows = self.db.session.execute(
-                text(sql), {"query": fts_query, "limit": limit}
-            ).fetchall()
-
-            for row in rows:
-                # Determine which fields matched
-                matched_fields = []
-                if "<b>" in (row[4] or ""):
-                    matched_fields.append("title")
-                if "<b>" in (row[5] or ""):
-                    matched_fields.append("content")
-
-                # Create search result
-                result = SearchResult(
+        results = []
+        for row in rows:
+            # Determine which fields matched
+            matched_fields = []
+            if "<b>" in (row[3] or ""):
+                matched_fields.append("title")
+            if "<b>" in (row[4] or ""):
+                matched_fields.append("content")
+
+            results.append(
+                SearchResult(
                     entity_type=EntityType.NOTE,
                     entity_id=row[0],
                     title=row[1] or "Untitled Note",
                     subtitle=None,
-                    snippet=row[5] or row[4],  # Prefer content snippet
-                    relevance_score=abs(row[3]),
+                    snippet=row[4] or row[3],  # Prefer content snippet
                     matched_fields=matched_fields,
                     metadata={"content_preview": (row[2] or "")[:100]},
                 )
-                results.append(result)
-
-        except Exception as e:
-            self.logger.error(f"Error searching notes: {e}", exc_info=True)
-
+            )
         return results
 
-    def _search_tags(self, fts_query: str, limit: int) -> list[SearchResult]:
-        """Search tags using FTS5.
+    def _hydrate_tags(self, fts_query: str, tag_ids: list[int]) -> list[SearchResult]:
+        """Load tag results with name snippets and contact counts.
 
         Args:
             fts_query: FTS5-formatted query
-            limit: Maximum results
+            tag_ids: Tag IDs on the current page
 
         Returns:
-            List of tag search results
+            List of tag search results (unordered)
         """
-        results = []
-
-        try:
-            # Search tags with ranking
-            sql = """
-                SELECT
-                    t.id,
-                    t.name,
-                    t.description,
-                    bm25(tags_fts) as rank,
-                    snippet(tags_fts, 1, '<b>', '</b>', '...', 32) as name_snippet,
-                    (SELECT COUNT(*) FROM contact_tags WHERE tag_id = t.id) as contact_count
-                FROM tags_fts
-                JOIN tags t ON tags_fts.tag_id = t.id
-                WHERE tags_fts MATCH :query
-                ORDER BY rank
-                LIMIT :limit
+        sql = text(
             """
-
-            rows = self.db.session.execute(
-                text(sql), {"query": fts_query, "limit": limit}
-            ).fetchall()
-
-            for row in rows:
-                # Create search result
-                result = SearchResult(
-                    entity_type=EntityType.TAG,
-                    entity_id=row[0],
-                    title=row[1] or "Unnamed Tag",
-                    subtitle=f"{row[5]} contacts",
-                    snippet=row[4],
-                    relevance_score=abs(row[3]),
-                    matched_fields=["name"] if "<b>" in (row[4] or "") else [],
-                    metadata={"description": row[2], "contact_count": row[5]},
-                )
-                results.append(result)
-
-        except Exception as e:
-            self.logger.error(f"Error searching tags: {e}", exc_info=True)
-
-        return results
+            SELECT
+                t.id,
+                t.name,
+                snippet(tags_fts, 1, '<b>', '</b>', '...', 32) as name_snippet,
+                (
+                    SELECT COUNT(DISTINCT cm.contact_id)
+                    FROM metadata_tags mt
+                    JOIN contact_metadata cm ON cm.id = mt.metadata_id
+                    WHERE mt.tag_id = t.id
+                ) as contact_count
+            FROM tags_fts
+            JOIN tags t ON tags_fts.tag_id = t.id
+            WHERE tags_fts MATCH :query AND tags_fts.tag_id IN :ids
+            """
+        ).bindparams(bindparam("ids", expanding=True))
+        rows = self.db.session.execute(sql, {"query": fts_query, "ids": tag_ids}).fetchall()
+
+        return [
+            SearchResult(
+                entity_type=EntityType.TAG,
+                entity_id=row[0],
+                title=row[1] or "Unnamed Tag",
+                subtitle=f"{row[3]} contacts",
+                snippet=row[2],
+                matched_fields=["name"] if "<b>" in (row[2] or "") else [],
+                metadata={"contact_count": row[3]},
+            )
+            for row in rows
+        ]
 
     def _fallback_search(
         self,
@@ -389,7 +515,9 @@ class SearchIndexer:
     def update_index(self, entity_type: EntityType, entity_id: int) -> bool:
         """Update the search index for a specific entity.
 
-        This triggers re-indexing of a single entity after changes.
+        Writes made through the ORM are re-indexed automatically when their
+        transaction commits; this is for callers that changed rows with raw
+        SQL.
 
         Args:
             entity_type: Type of entity to update
@@ -403,69 +531,11 @@ class SearchIndexer:
 
         try:
             if entity_type == EntityType.CONTACT:
-                # Delete and re-insert contact in FTS
-                self.db.session.execute(
-                    text("DELETE FROM contacts_fts WHERE contact_id = :id"), {"id": entity_id}
-                )
-
-                # Re-insert with current data
-                sql = """
-                    INSERT INTO contacts_fts (contact_id, name, email, phone, address, notes)
-                    SELECT
-                        c.id,
-                        COALESCE(c.name, ''),
-                        COALESCE(c.email, ''),
-                        COALESCE(c.phone, ''),
-                        COALESCE(c.address, ''),
-                        COALESCE(GROUP_CONCAT(n.content, ' '), '')
-                    FROM contacts c
-                    LEFT JOIN contact_notes cn ON c.id = cn.contact_id
-                    LEFT JOIN notes n ON cn.note_id = n.id
-                    WHERE c.id = :id
-                    GROUP BY c.id
-                """
-                self.db.session.execute(text(sql), {"id": entity_id})
-
+                refresh_fts_rows(self.db.session, contact_ids=[entity_id])
             elif entity_type == EntityType.NOTE:
-                # Delete and re-insert note in FTS
-                self.db.session.execute(
-                    text("DELETE FROM notes_fts WHERE note_id = :id"), {"id": entity_id}
-                )
-
-                sql = """
-                    INSERT INTO notes_fts (note_id, title, content, contact_names)
-                    SELECT
-                        n.id,
-                        COALESCE(n.title, ''),
-                        COALESCE(n.content, ''),
-                        COALESCE(GROUP_CONCAT(c.name, ', '), '')
-                    FROM notes n
-                    LEFT JOIN contact_notes cn ON n.id = cn.note_id
-                    LEFT JOIN contacts c ON cn.contact_id = c.id
-                    WHERE n.id = :id
-                    GROUP BY n.id
-                """
-                self.db.session.execute(text(sql), {"id": entity_id})
-
+                refresh_fts_rows(self.db.session, note_ids=[entity_id])
             elif entity_type == EntityType.TAG:
-                # Delete and re-insert tag in FTS
-                self.db.session.execute(
-                    text("DELETE FROM tags_fts WHERE tag_id = :id"), {"id": entity_id}
-                )
-
-                sql = """
-                    INSERT INTO tags_fts (tag_id, name, description, contact_count)
-                    SELECT
-                        t.id,
-                        COALESCE(t.name, ''),
-                        COALESCE(t.description, ''),
-                        COUNT(DISTINCT ct.contact_id)
-                    FROM tags t
-                    LEFT JOIN contact_tags ct ON t.id = ct.tag_id
-                    WHERE t.id = :id
-                    GROUP BY t.id
-                """
-                self.db.session.execute(text(sql), {"id": entity_id})
+                refresh_fts_rows(self.db.session, tag_ids=[entity_id])
 
             self.db.session.commit()
             self._last_index_update = datetime.now()
@@ -481,7 +551,8 @@ class SearchIndexer:
     def rebuild_index(self) -> bool:
         """Rebuild the entire search index.
 
-        This should be called after bulk imports or if the index gets corrupted.
+        Only needed if the index is missing or badly corrupted; use
+        ``check_consistency(repair=True)`` to fix individual drifted rows.
 
         Returns:
             True if successful, False otherwise
@@ -490,57 +561,7 @@ class SearchIndexer:
             return False
 
         try:
-            # Clear existing FTS data
-            self.db.session.execute(text("DELETE FROM contacts_fts"))
-            self.db.session.execute(text("DELETE FROM notes_fts"))
-            self.db.session.execute(text("DELETE FROM tags_fts"))
-
-            # Re-populate contacts_fts
-            sql = """
-                INSERT INTO contacts_fts (contact_id, name, email, phone, address, notes)
-                SELECT
-                    c.id,
-                    COALESCE(c.name, ''),
-                    COALESCE(c.email, ''),
-                    COALESCE(c.phone, ''),
-                    COALESCE(c.address, ''),
-                    COALESCE(GROUP_CONCAT(n.content, ' '), '')
-                FROM contacts c
-                LEFT JOIN contact_notes cn ON c.id = cn.contact_id
-                LEFT JOIN notes n ON cn.note_id = n.id
-                GROUP BY c.id
-            """
-            self.db.session.execute(text(sql))
-
-            # Re-populate notes_fts
-            sql = """
-                INSERT INTO notes_fts (note_id, title, content, contact_names)
-                SELECT
-                    n.id,
-                    COALESCE(n.title, ''),
-                    COALESCE(n.content, ''),
-                    COALESCE(GROUP_CONCAT(c.name, ', '), '')
-                FROM notes n
-                LEFT JOIN contact_notes cn ON n.id = cn.note_id
-                LEFT JOIN contacts c ON cn.contact_id = c.id
-                GROUP BY n.id
-            """
-            self.db.session.execute(text(sql))
-
-            # Re-populate tags_fts
-            sql = """
-                INSERT INTO tags_fts (tag_id, name, description, contact_count)
-                SELECT
-                    t.id,
-                    COALESCE(t.name, ''),
-                    COALESCE(t.description, ''),
-                    COUNT(DISTINCT ct.contact_id)
-                FROM tags t
-                LEFT JOIN contact_tags ct ON t.id = ct.tag_id
-                GROUP BY t.id
-            """
-            self.db.session.execute(text(sql))
-
+            rebuild_fts(self.db.session)
             self.db.session.commit()
             self._last_index_update = datetime.now()
             return True
@@ -550,6 +571,37 @@ class SearchIndexer:
             self.logger.error(f"Error rebuilding index: {e}", exc_info=True)
             return False
 
+    def check_consistency(self, repair: bool = False) -> dict[str, Any]:
+        """Compare the FTS tables with their base tables.
+
+        Row counts and per-row content hashes are compared for contacts,
+        notes and tags.
+
+        Args:
+            repair: Re-index the missing, orphaned and stale rows that were found
+
+        Returns:
+            Consistency report with ``fts_available``, ``consistent`` and a
+            per-entity breakdown; ``repaired`` holds the number of re-indexed
+            rows when ``repair`` is set
+        """
+        if not self.check_fts_available():
+            return {"fts_available": False, "consistent": False}
+
+        try:
+            report = check_fts_consistency(self.db.session)
+            report["fts_available"] = True
+            if repair and not report["consistent"]:
+                report["repaired"] = repair_fts(self.db.session, report)
+                self.db.session.commit()
+                self._last_index_update = datetime.now()
+            return report
+
+        except Exception as e:
+            self.db.session.rollback()
+            self.logger.error(f"Error checking index consistency: {e}", exc_info=True)
+            return {"fts_available": True, "consistent": False, "error": str(e)}
+
     def get_index_stats(self) -> dict[str, Any]:
         """Get statistics about the search index.
 
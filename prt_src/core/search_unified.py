@@ -4,11 +4,13 @@ This module provides a unified interface for searching across all entities,
 integrating FTS5, the search indexer, and contact cache for optimal performance.
 """
 
+import threading
 import time
 from dataclasses import dataclass
 from enum import IntEnum
 from typing import Any
 
+from prt_src.core.search_cache.contact_cache import CachedContact
 from prt_src.core.search_cache.contact_cache import ContactSearchCache
 from prt_src.core.search_index.indexer import EntityType
 from prt_src.core.search_index.indexer import SearchIndexer
@@ -110,6 +112,13 @@ class UnifiedSearchAPI:
             "fts_searches": 0,
         }
 
+        # Cache coherence: contacts changed since the cache was filled
+        self._state_lock = threading.Lock()
+        self._cache_warm = False
+        self._warming = False
+        self._stale_contact_ids: set[int] = set()
+        self._cache_stale = False
+
     def search(
         self,
         query: str,
@@ -139,6 +148,8 @@ class UnifiedSearchAPI:
         if not query or not query.strip():
             return self._empty_result()
 
+        self.refresh_stale_contacts()
+
         # Track search for suggestions
         self._add_to_history(query)
 
@@ -295,6 +306,94 @@ class UnifiedSearchAPI:
         """
         if self.contact_cache:
             self.contact_cache.warm_cache(contacts)
+            with self._state_lock:
+                self._cache_warm = True
+
+    def warm_from_database(self, session=None) -> int:
+        """Fill the contact cache from one bulk query.
+
+        The cache is built off to the side and swapped in, so this can run on a
+        background thread (with its own ``session``) while searches continue
+        against the old cache.
+
+        Args:
+            session: Session to load with; defaults to the database's session
+
+        Returns:
+            Number of contacts loaded
+        """
+        if not self.contact_cache:
+            return 0
+
+        with self._state_lock:
+            self._warming = True
+            self._stale_contact_ids.clear()
+            self._cache_stale = False
+        try:
+            rows = self.db.list_contact_search_rows(session=session)
+            cache = ContactSearchCache(
+                max_cache_size=self.contact_cache.max_cache_size,
+                max_autocomplete_results=self.contact_cache.max_autocomplete_results,
+            )
+            cache.warm_cache(rows)
+            with self._state_lock:
+                self.contact_cache = cache
+                self._cache_warm = True
+            return len(rows)
+        finally:
+            with self._state_lock:
+                self._warming = False
+
+    def invalidate_contacts(self, contact_ids: set[int] | None) -> None:
+        """Mark cached contacts as stale after a committed write.
+
+        Safe to call from any thread; the refresh happens on the next search.
+
+        Args:
+            contact_ids: Changed contact IDs, or None to reload every contact
+        """
+        with self._state_lock:
+            if contact_ids is None:
+                self._cache_stale = True
+                self._stale_contact_ids.clear()
+            elif not self._cache_stale:
+                self._stale_contact_ids.update(contact_ids)
+
+    def refresh_stale_contacts(self) -> None:
+        """Bring invalidated contacts in the cache up to date."""
+        if not self.contact_cache:
+            return
+
+        with self._state_lock:
+            if self._warming or not self._cache_warm:
+                # A running warm-up picks the changes up; a cold cache has nothing stale
+                if not self._warming:
+                    self._stale_contact_ids.clear()
+                    self._cache_stale = False
+                return
+            reload_all = self._cache_stale
+            stale_ids = list(self._stale_contact_ids)
+            self._stale_contact_ids.clear()
+            self._cache_stale = False
+
+        if reload_all:
+            self.warm_from_database()
+            return
+        if not stale_ids:
+            return
+
+        for contact_id in stale_ids:
+            self.contact_cache.remove_contact(contact_id)
+        for row in self.db.list_contact_search_rows(stale_ids):
+            self.contact_cache.add_contact(
+                CachedContact(
+                    id=row["id"],
+                    name=row["name"] or "",
+                    email=row["email"],
+                    phone=row["phone"],
+                    tags=row["tags"],
+                )
+            )
 
     def rebuild_index(self) -> bool:
         """Rebuild the FTS5 search index.
@@ -312,6 +411,17 @@ class UnifiedSearchAPI:
         """
         return self.indexer.optimize_index()
 
+    def check_index_consistency(self, repair: bool = False) -> dict[str, Any]:
+        """Check the FTS5 search index against the base tables.
+
+        Args:
+            repair: Re-index rows that are missing, orphaned or stale
+
+        Returns:
+            Consistency report from the indexer
+        """
+        return self.indexer.check_consistency(repair=repair)
+
     def get_stats(self) -> dict[str, Any]:
         """Get search statistics and metrics.
 
@@ -1,32 +1,222 @@
 import json
-import shutil
+import os
+import sqlite3
+import threading
+from collections import deque
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from sqlalchemy import and_
 from sqlalchemy import case
 from sqlalchemy import create_engine
+from sqlalchemy import event
 from sqlalchemy import func
+from sqlalchemy import insert
+from sqlalchemy import inspect
 from sqlalchemy import or_
 from sqlalchemy import text
+from sqlalchemy import tuple_
+from sqlalchemy import update
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
 from sqlalchemy.orm import aliased
 from sqlalchemy.orm import sessionmaker
 
+from .backup_store import MANIFEST_SUFFIX
+from .backup_store import BackupStore
+from .fts_index import fts_tables_exist
+from .fts_index import refresh_fts_rows
+from .image_store import IMAGE_IN_STORE
+from .image_store import ImageStore
+from .image_store import iter_blob_chunks
 from .logging_config import get_logger
+from .models import IN_CLAUSE_BATCH_SIZE
 from .models import Contact
+from .models import ContactMetadata
 from .models import ContactRelationship
+from .models import Note
 from .models import RelationshipType
+from .models import Tag
+from .relationship_graph import RelationshipGraph
+
+# Chunk size used when streaming profile image BLOBs out of SQLite.
+PROFILE_IMAGE_CHUNK_SIZE = 64 * 1024
+
+# Contact columns a content-only update leaves alone
+PROFILE_IMAGE_COLUMNS = (
+    "profile_image",
+    "profile_image_hash",
+    "profile_image_filename",
+    "profile_image_mime_type",
+)
+
+# Separator for tag names aggregated with group_concat (ASCII unit separator).
+SEARCH_TAG_SEPARATOR = "\x1f"
+
+# Imports of at least this many contacts use the bulk insert path; smaller
+# ones go through the ORM a contact at a time.
+BULK_INSERT_THRESHOLD = 200
+
+# Contacts per bulk insert statement. SQLAlchemy splits each statement into
+# multi-row VALUES batches that fit SQLite's host parameter limit.
+BULK_INSERT_CHUNK_SIZE = 1000
+
+# Per-row FTS trigger that bulk inserts suspend until the end of the batch
+CONTACTS_FTS_INSERT_TRIGGER = "contacts_fts_insert"
+
+# Relationships per contact, counting both ends of every relationship once
+# (a relationship from a contact to itself counts once). Used when the schema
+# has no contact_degree summary table yet; same shape as that table.
+CONTACT_DEGREE_SQL = """
+    SELECT contact_id, COUNT(*) AS degree
+    FROM (
+        SELECT from_contact_id AS contact_id FROM contact_relationships
+        UNION ALL
+        SELECT to_contact_id FROM contact_relationships WHERE to_contact_id != from_contact_id
+    )
+    WHERE contact_id IN (SELECT id FROM contacts)
+    GROUP BY contact_id
+"""
+
+# Pages copied per online-backup step (4 MiB at the default page size). The
+# source is only locked while a step runs, so the app keeps working in between.
+BACKUP_PAGES_PER_STEP = 1024
+
+
+def snapshot_database(
+    source: Path,
+    dest: Path,
+    pages: int = BACKUP_PAGES_PER_STEP,
+    progress: Callable[[int, int, int], None] | None = None,
+) -> None:
+    """Copy a transactionally consistent snapshot of a SQLite database.
+
+    Uses SQLite's online backup API, so the copy never contains a half-written
+    transaction, unlike a plain file copy of a live database.
+
+    Args:
+        source: Database file to copy
+        dest: Destination file; replaced if it exists
+        pages: Pages to copy per step
+        progress: Optional ``(status, remaining, total)`` callback run after each step
+    """
+    dest = Path(dest)
+    if dest.exists():
+        dest.unlink()
+
+    src_conn = sqlite3.connect(f"file:{Path(source)}?mode=ro", uri=True)
+    try:
+        dest_conn = sqlite3.connect(dest)
+        try:
+            src_conn.backup(dest_conn, pages=pages, progress=progress, sleep=0)
+        finally:
+            dest_conn.close()
+    finally:
+        src_conn.close()
+
+
+@dataclass(frozen=True)
+class SQLiteSettings:
+    """Pragmas applied to every SQLite connection the engine opens.
+
+    WAL lets readers run alongside the single writer instead of waiting on
+    its lock; ``synchronous=NORMAL`` is durable across application crashes in
+    WAL mode and only skips the fsync per commit.
+    """
+
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    mmap_size: int = 256 * 1024 * 1024
+    # Negative values are KiB, so this is 64 MiB of page cache per connection
+    cache_size: int = -64 * 1024
+    temp_store: str = "MEMORY"
+    # Set explicitly on every connection, but off by default: relationship
+    # types name their inverse before it exists, and existing databases carry
+    # that reference as an immediate foreign key
+    foreign_keys: bool = False
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> "SQLiteSettings":
+        """Build settings from the ``sqlite`` section of the PRT config.
+
+        Args:
+            config: PRT configuration dictionary
+
+        Returns:
+            Settings with any configured overrides applied
+        """
+        overrides = config.get("sqlite") or {}
+        return cls(**{key: value for key, value in overrides.items() if key in cls.__annotations__})
+
+    def pragmas(self) -> list[str]:
+        """Return the PRAGMA statements for a new connection."""
+        return [
+            f"PRAGMA journal_mode = {self.journal_mode}",
+            f"PRAGMA synchronous = {self.synchronous}",
+            f"PRAGMA mmap_size = {int(self.mmap_size)}",
+            f"PRAGMA cache_size = {int(self.cache_size)}",
+            f"PRAGMA temp_store = {self.temp_store}",
+            f"PRAGMA foreign_keys = {'ON' if self.foreign_keys else 'OFF'}",
+        ]
 
 
 class Database:
-    def __init__(self, path: Path):
+    def __init__(self, path: Path, settings: SQLiteSettings | None = None):
         self.path = Path(path)
+        self.settings = settings or SQLiteSettings()
         self.engine = None
         self.SessionLocal = None
+        self._thread_sessions = threading.local()
         self.session = None
+        self.query_count = 0
+        self._contact_count: int | None = None
+        self.relationship_graph = RelationshipGraph()
+        self.data_version = 0
+        self._change_listeners: list[Callable[[set[int] | None], None]] = []
+        self._fts_available: bool | None = None
+        self._degree_table_available: bool | None = None
+        # Automatic backups go to a deduplicated chunk store when enabled
+        self.dedup_auto_backups = False
+        self.backup_store = BackupStore(self.path.parent / f"{self.path.stem}_backup_objects")
         self.logger = get_logger(__name__)
 
+    @property
+    def session(self) -> Session | None:
+        """Session for the current thread: its ``read_session`` if one is open, else the main one."""
+        return getattr(self._thread_sessions, "session", None) or self._session
+
+    @session.setter
+    def session(self, value: Session | None) -> None:
+        self._session = value
+
+    @contextmanager
+    def read_session(self) -> Iterator[Session]:
+        """Give the current thread its own session for the duration of the block.
+
+        Code that goes through ``self.session`` (including PRTAPI methods) uses
+        this session on the calling thread, so read-only work can run on worker
+        threads without sharing the main session. In WAL mode these readers
+        see the last committed data and never wait on the writer. Anything
+        left uncommitted is rolled back on exit.
+
+        Yields:
+            The thread's session
+        """
+        session = self.SessionLocal()
+        previous = getattr(self._thread_sessions, "session", None)
+        self._thread_sessions.session = session
+        try:
+            yield session
+        finally:
+            self._thread_sessions.session = previous
+            session.rollback()
+            session.close()
+
     def connect(self) -> None:
         """Connect to the database using SQLAlchemy."""
         # Create SQLite URL
@@ -35,11 +225,230 @@ class Database:
         # Standard SQLite connection
         try:
             self.engine = create_engine(db_url, echo=False)
+            event.listen(self.engine, "connect", self._configure_connection)
+            event.listen(self.engine, "before_cursor_execute", self._count_query)
             self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+            event.listen(self.SessionLocal, "after_flush", self._track_contact_changes)
+            event.listen(self.SessionLocal, "after_flush", self._track_data_changes)
+            event.listen(self.SessionLocal, "after_flush", self._track_relationship_changes)
+            event.listen(self.SessionLocal, "after_flush", self._track_search_index_changes)
+            event.listen(self.SessionLocal, "before_commit", self._refresh_search_index)
+            event.listen(self.SessionLocal, "after_commit", self._apply_relationship_changes)
+            event.listen(self.SessionLocal, "after_commit", self._dispatch_data_changes)
+            event.listen(
+                self.SessionLocal, "after_soft_rollback", self._discard_relationship_changes
+            )
+            event.listen(self.SessionLocal, "after_soft_rollback", self._discard_data_changes)
+            event.listen(
+                self.SessionLocal, "after_soft_rollback", self._discard_search_index_changes
+            )
             self.session = self.SessionLocal()
+            self._contact_count = None
+            self._fts_available = None
+            self._degree_table_available = None
+            self.relationship_graph.invalidate()
+            self.data_version += 1
+            self._notify_change_listeners(None)
         except SQLAlchemyError as e:
             raise RuntimeError(f"Failed to connect to database: {e}") from e
 
+    def _configure_connection(self, dbapi_connection, connection_record) -> None:
+        """Apply the configured pragmas to a newly opened connection."""
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in self.settings.pragmas():
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    def _track_contact_changes(self, session, flush_context) -> None:
+        """Session event hook that drops the cached contact count on inserts/deletes."""
+        if any(isinstance(obj, Contact) for obj in (*session.new, *session.deleted)):
+            self._contact_count = None
+
+    def invalidate_contact_count(self) -> None:
+        """Drop the cached contact count after writes that bypass the ORM."""
+        self._contact_count = None
+
+    def _track_data_changes(self, session, flush_context) -> None:
+        """Session event hook that records contact, tag and note writes.
+
+        Bumps ``data_version`` immediately and queues the affected contact IDs
+        for the change listeners, which are notified once the transaction
+        commits.
+        """
+        changes = session.info.setdefault("data_changes", {"contact_ids": set(), "all": False})
+        relevant = False
+        for obj in (*session.new, *session.dirty, *session.deleted):
+            if isinstance(obj, Contact):
+                changes["contact_ids"].add(obj.id)
+            elif isinstance(obj, ContactMetadata):
+                changes["contact_ids"].add(obj.contact_id)
+            elif isinstance(obj, Tag):
+                # Renaming or deleting a tag touches every contact carrying it
+                if obj in session.deleted or session.is_modified(obj, include_collections=False):
+                    changes["all"] = True
+            elif not isinstance(obj, Note):
+                continue
+            relevant = True
+        if relevant:
+            self.data_version += 1
+
+    def _dispatch_data_changes(self, session) -> None:
+        """Session event hook that notifies change listeners after a commit."""
+        changes = session.info.pop("data_changes", None)
+        if changes is None:
+            return
+        if changes["all"]:
+            self._notify_change_listeners(None)
+        elif changes["contact_ids"]:
+            self._notify_change_listeners(changes["contact_ids"])
+
+    def _discard_data_changes(self, session, previous_transaction) -> None:
+        """Session event hook that drops queued data changes on rollback."""
+        session.info.pop("data_changes", None)
+
+    def add_change_listener(self, listener: Callable[[set[int] | None], None]) -> None:
+        """Register a callback for committed contact, tag and note writes.
+
+        Args:
+            listener: Called with the set of affected contact IDs, or None when
+                any contact may have changed (raw SQL writes, tag renames,
+                reconnects). It runs inside the session's commit hook, so it
+                must not use the session itself.
+        """
+        self._change_listeners.append(listener)
+
+    def _notify_change_listeners(self, contact_ids: set[int] | None) -> None:
+        for listener in self._change_listeners:
+            try:
+                listener(contact_ids)
+            except Exception as e:
+                self.logger.warning(f"Data change listener failed: {e}", exc_info=True)
+
+    def invalidate_caches(self) -> None:
+        """Drop every cached view of the database after writes that bypass the ORM."""
+        self.invalidate_contact_count()
+        self.invalidate_relationship_graph()
+        self._fts_available = None
+        self._degree_table_available = None
+        self.data_version += 1
+        self._notify_change_listeners(None)
+
+    def _track_relationship_changes(self, session, flush_context) -> None:
+        """Session event hook that queues relationship edges for the in-memory graph."""
+        for obj in session.new:
+            if isinstance(obj, ContactRelationship):
+                self._queue_relationship_change(session, obj.from_contact_id, obj.to_contact_id, 1)
+        for obj in session.deleted:
+            if isinstance(obj, ContactRelationship):
+                self._queue_relationship_change(session, obj.from_contact_id, obj.to_contact_id, -1)
+
+    def _queue_relationship_change(
+        self, session, from_contact_id: int, to_contact_id: int, change: int
+    ) -> None:
+        """Hold a relationship edge change until the surrounding transaction commits."""
+        session.info.setdefault("relationship_graph_changes", []).append(
+            (from_contact_id, to_contact_id, change)
+        )
+
+    def _apply_relationship_changes(self, session) -> None:
+        """Session event hook that applies committed edge changes to the graph."""
+        for from_id, to_id, change in session.info.pop("relationship_graph_changes", []):
+            if change > 0:
+                self.relationship_graph.add_edge(from_id, to_id)
+            else:
+                self.relationship_graph.remove_edge(from_id, to_id)
+
+    def _discard_relationship_changes(self, session, previous_transaction) -> None:
+        """Session event hook that drops queued edge changes on rollback."""
+        session.info.pop("relationship_graph_changes", None)
+
+    def _track_search_index_changes(self, session, flush_context) -> None:
+        """Session event hook that queues the FTS rows touched by a flush.
+
+        Collects contact, note and tag IDs, including both ends of tag and
+        note links added or removed through ``ContactMetadata``, so the commit
+        hook can re-index just those rows.
+        """
+        queued = session.info.setdefault(
+            "search_index_changes", {"contacts": set(), "notes": set(), "tags": set()}
+        )
+        for obj in (*session.new, *session.dirty, *session.deleted):
+            if isinstance(obj, Contact):
+                queued["contacts"].add(obj.id)
+            elif isinstance(obj, Note):
+                queued["notes"].add(obj.id)
+                # A deleted note's links are gone by commit time
+                for entry in self._changed_links(obj, "metadata_entries", session):
+                    queued["contacts"].add(entry.contact_id)
+            elif isinstance(obj, Tag):
+                queued["tags"].add(obj.id)
+            elif isinstance(obj, ContactMetadata):
+                queued["contacts"].add(obj.contact_id)
+                queued["tags"].update(t.id for t in self._changed_links(obj, "tags", session))
+                queued["notes"].update(n.id for n in self._changed_links(obj, "notes", session))
+
+    @staticmethod
+    def _changed_links(obj, collection: str, session) -> list:
+        """Return the related objects whose link to ``obj`` changed in this flush."""
+        history = inspect(obj).attrs[collection].history
+        if obj in session.deleted:
+            return [*history.added, *history.unchanged, *history.deleted]
+        return [*history.added, *history.deleted]
+
+    def _refresh_search_index(self, session) -> None:
+        """Session event hook that re-indexes queued FTS rows inside the committing transaction."""
+        session.flush()
+        queued = session.info.pop("search_index_changes", None)
+        if not queued or not any(queued.values()):
+            return
+        try:
+            if self._fts_available is None:
+                self._fts_available = fts_tables_exist(session)
+            if self._fts_available:
+                refresh_fts_rows(session, queued["contacts"], queued["notes"], queued["tags"])
+        except SQLAlchemyError as e:
+            self.logger.warning(f"Incremental FTS refresh failed: {e}", exc_info=True)
+
+    def _discard_search_index_changes(self, session, previous_transaction) -> None:
+        """Session event hook that drops queued FTS refreshes on rollback."""
+        session.info.pop("search_index_changes", None)
+
+    def invalidate_relationship_graph(self) -> None:
+        """Drop the in-memory relationship graph after writes that bypass the ORM."""
+        self.relationship_graph.invalidate()
+
+    def _loaded_relationship_graph(self) -> RelationshipGraph | None:
+        """Return the relationship graph, loading it on first use.
+
+        Returns None when the graph can't be loaded so callers fall back to SQL.
+        """
+        if not self.relationship_graph.loaded:
+            if self.session.info.get("relationship_graph_changes"):
+                # Flushed but uncommitted edges would be counted twice
+                return None
+            try:
+                self.relationship_graph.load(self.session)
+            except SQLAlchemyError as e:
+                self.logger.warning(f"Relationship graph unavailable, using SQL: {e}")
+                return None
+        return self.relationship_graph
+
+    def _count_query(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        """Engine event hook that counts every statement sent to SQLite."""
+        self.query_count += 1
+
+    def reset_query_count(self) -> int:
+        """Reset the statement counter and return the previous value.
+
+        Used by tests and diagnostics to assert that list views run a fixed
+        number of queries regardless of result size.
+        """
+        previous = self.query_count
+        self.query_count = 0
+        return previous
+
     def is_valid(self) -> bool:
         """Check if the database is valid using SQLite integrity check."""
         if self.engine is None:
@@ -77,8 +486,8 @@ class Database:
         backup_path = self.path.with_name(self.path.name + suffix)
         if self.path.exists():
             try:
-                shutil.copy(self.path, backup_path)
-            except OSError as e:
+                snapshot_database(self.path, backup_path)
+            except (OSError, sqlite3.Error) as e:
                 raise RuntimeError(f"Failed to backup database: {e}") from e
         return backup_path
 
@@ -98,15 +507,17 @@ class Database:
         -------
         Dict containing backup details
         """
-        import os
         from datetime import datetime
 
         from .models import BackupMetadata
         from .schema_manager import SchemaManager
 
+        use_store = is_auto and self.dedup_auto_backups
+
         # Generate unique backup filename with microseconds to avoid collisions
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        backup_filename = f"{self.path.stem}_backup_{timestamp}.db"
+        extension = MANIFEST_SUFFIX if use_store else ".db"
+        backup_filename = f"{self.path.stem}_backup_{timestamp}{extension}"
         backup_path = self.path.parent / backup_filename
 
         # Security: Validate backup path is within expected directory
@@ -115,15 +526,20 @@ class Database:
         if not str(backup_path).startswith(str(expected_dir)):
             raise ValueError(f"Invalid backup path: {backup_path}")
 
-        # Copy database file
+        # Snapshot the database
         if self.path.exists():
             try:
-                shutil.copy2(self.path, backup_path)
-                # Security: Set restrictive permissions on backup file
-                os.chmod(backup_path, 0o600)
-                # Get file size
-                file_size = os.path.getsize(backup_path)
-            except OSError as e:
+                if use_store:
+                    stored = self._store_snapshot(backup_path)
+                    file_size = stored["size"]
+                    stored_size = stored["stored_size"]
+                else:
+                    snapshot_database(self.path, backup_path)
+                    # Security: Set restrictive permissions on backup file
+                    os.chmod(backup_path, 0o600)
+                    # Get file size
+                    file_size = stored_size = os.path.getsize(backup_path)
+            except (OSError, sqlite3.Error) as e:
                 if backup_path.exists():
                     backup_path.unlink()
                 raise RuntimeError(f"Failed to create backup: {e}") from e
@@ -157,12 +573,30 @@ class Database:
                 "comment": comment,
                 "is_auto": is_auto,
                 "size": file_size,
+                "stored_size": stored_size,
                 "schema_version": current_version,
                 "created_at": metadata.created_at,
             }
         else:
             raise FileNotFoundError(f"Database file not found: {self.path}")
 
+    def _store_snapshot(self, manifest_path: Path) -> dict[str, Any]:
+        """Snapshot the database into the deduplicated backup store.
+
+        Args:
+            manifest_path: Where to write the snapshot's manifest
+
+        Returns:
+            Storage details from ``BackupStore.put``
+        """
+        snapshot_path = manifest_path.with_suffix(".snapshot.tmp")
+        try:
+            snapshot_database(self.path, snapshot_path)
+            return self.backup_store.put(snapshot_path, manifest_path)
+        finally:
+            if snapshot_path.exists():
+                snapshot_path.unlink()
+
     def list_backups(self) -> list[dict[str, Any]]:
         """List all tracked backups with metadata.
 
@@ -230,19 +664,26 @@ class Database:
         # Create a safety backup of current database before restore
         safety_backup = self.path.with_suffix(".pre_restore.bak")
         if self.path.exists():
-            shutil.copy2(self.path, safety_backup)
-            import os
-
+            snapshot_database(self.path, safety_backup)
             os.chmod(safety_backup, 0o600)  # Secure the safety backup too
 
         # Transaction-safe restore using atomic rename
         temp_restore = self.path.with_suffix(".restore.tmp")
         try:
             # Copy to temp file first
-            shutil.copy2(backup_path, temp_restore)
+            if BackupStore.is_manifest(backup_path):
+                self.backup_store.restore(backup_path, temp_restore)
+            else:
+                snapshot_database(backup_path, temp_restore)
 
-            # Close current database connection before replacing file
+            # Close current database connections before replacing file
             self.session.close()
+            self.engine.dispose()
+            # A leftover write-ahead log belongs to the old file, not the restored one
+            for sidecar in ("-wal", "-shm"):
+                sidecar_path = self.path.with_name(self.path.name + sidecar)
+                if sidecar_path.exists():
+                    sidecar_path.unlink()
 
             # Atomic rename - this is the actual "transaction"
             # Either succeeds completely or fails completely
@@ -269,8 +710,6 @@ class Database:
         keep_count: int
             Number of automatic backups to keep
         """
-        import os
-
         from .models import BackupMetadata
 
         # Get automatic backups ordered by date
@@ -292,10 +731,49 @@ class Database:
 
         self.session.commit()
 
+        # Drop store chunks that only the deleted backups referenced
+        manifests = [
+            Path(path)
+            for (path,) in self.session.query(BackupMetadata.backup_path)
+            if BackupStore.is_manifest(path)
+        ]
+        self.backup_store.collect_garbage(manifests)
+
     def count_contacts(self) -> int:
-        from .models import Contact
+        """Count contacts, caching the result until contacts are added or removed."""
+        if self._contact_count is None:
+            self._contact_count = self.session.query(func.count(Contact.id)).scalar() or 0
+        return self._contact_count
+
+    def list_contacts_page(
+        self,
+        limit: int,
+        after: tuple[str, int] | None = None,
+        offset: int = 0,
+    ) -> list[Contact]:
+        """Load one page of contacts ordered by (name, id).
 
-        return self.session.query(Contact).count()
+        With ``after`` the page starts strictly after that (name, id) key, which
+        lets SQLite seek directly into ``idx_contacts_name`` (the index carries
+        the rowid, so it already covers ``(name, id)``). ``offset`` is only used
+        when no key is known, e.g. for jumping straight to page N.
+
+        Args:
+            limit: Maximum number of contacts to return
+            after: Optional (name, id) keyset position to continue from
+            offset: Number of rows to skip when ``after`` is not given
+
+        Returns:
+            List of Contact model instances
+        """
+        query = self.session.query(Contact)
+        if after is not None:
+            after_name, after_id = after
+            query = query.filter(tuple_(Contact.name, Contact.id) > tuple_(after_name, after_id))
+        query = query.order_by(Contact.name, Contact.id)
+        if after is None and offset:
+            query = query.offset(offset)
+        return query.limit(limit).all()
 
     def count_relationships(self) -> int:
         from .models import Relationship
@@ -312,43 +790,207 @@ class Database:
 
         return self.session.query(Note).count()
 
-    def insert_contacts(self, contacts: list[dict[str, str]]):
-        """Insert contacts from parsed data (CSV or Google Takeout)."""
-        from .models import Contact
+    @staticmethod
+    def _store_profile_images(session, contacts: list[dict[str, Any]]) -> list[str | None]:
+        """Put the contacts' image bytes in the image store.
 
-        for contact_data in contacts:
-            name = f"{contact_data.get('first', '')} {contact_data.get('last', '')}".strip()
-            if not name:
-                name = "(No name)"
-
-            # Get first email and phone
-            emails = contact_data.get("emails", [])
-            phones = contact_data.get("phones", [])
-
-            # Handle profile image data
-            profile_image = contact_data.get("profile_image")
-            profile_image_filename = contact_data.get("profile_image_filename")
-            profile_image_mime_type = contact_data.get("profile_image_mime_type")
-
-            contact = Contact(
-                name=name,
-                email=emails[0] if emails else None,
-                phone=phones[0] if phones else None,
-                profile_image=profile_image,
-                profile_image_filename=profile_image_filename,
-                profile_image_mime_type=profile_image_mime_type,
-            )
+        Returns:
+            Each contact's image hash, or None for contacts without an image
+        """
+        images = [
+            (c["profile_image"], c.get("profile_image_mime_type"))
+            for c in contacts
+            if c.get("profile_image")
+        ]
+        hashes = iter(ImageStore(session).put_many(images))
+        return [next(hashes) if c.get("profile_image") else None for c in contacts]
+
+    @staticmethod
+    def _contact_values(
+        contact_data: dict[str, Any], image_hash: str | None = None
+    ) -> dict[str, Any]:
+        """Column values for a contact parsed from CSV or Google Takeout.
+
+        Args:
+            contact_data: Parsed contact dict
+            image_hash: Store hash of its profile image, from ``_store_profile_images``
+        """
+        name = f"{contact_data.get('first', '')} {contact_data.get('last', '')}".strip()
+        if not name:
+            name = "(No name)"
+
+        # Get first email and phone
+        emails = contact_data.get("emails", [])
+        phones = contact_data.get("phones", [])
+
+        return {
+            "name": name,
+            "email": emails[0] if emails else None,
+            "phone": phones[0] if phones else None,
+            "profile_image": IMAGE_IN_STORE if image_hash else None,
+            "profile_image_hash": image_hash,
+            "profile_image_filename": contact_data.get("profile_image_filename"),
+            "profile_image_mime_type": contact_data.get("profile_image_mime_type"),
+        }
+
+    def insert_contacts(self, contacts: list[dict[str, str]], defer_search_index: bool = False):
+        """Insert contacts from parsed data (CSV or Google Takeout).
+
+        Small imports go through the ORM one contact at a time. From
+        ``BULK_INSERT_THRESHOLD`` contacts on, rows are written with
+        multi-row inserts in chunks instead; see ``bulk_insert_contacts``.
+
+        Args:
+            contacts: Parsed contact dicts
+            defer_search_index: For bulk inserts, index the new contacts for
+                full-text search once at the end instead of per row
+        """
+        if len(contacts) >= BULK_INSERT_THRESHOLD and self.engine.dialect.insert_returning:
+            self.bulk_insert_contacts(contacts, defer_search_index=defer_search_index)
+            return
+
+        image_hashes = self._store_profile_images(self.session, contacts)
+        for contact_data, image_hash in zip(contacts, image_hashes, strict=True):
+            contact = Contact(**self._contact_values(contact_data, image_hash))
             self.session.add(contact)
             self.session.flush()  # Get the contact ID
 
             # Create metadata entry for this contact (formerly called relationship)
-            from .models import ContactMetadata
-
             metadata = ContactMetadata(contact_id=contact.id)
             self.session.add(metadata)
 
         self.session.commit()
 
+    def bulk_insert_contacts(
+        self,
+        contacts: list[dict[str, str]],
+        chunk_size: int = BULK_INSERT_CHUNK_SIZE,
+        defer_search_index: bool = False,
+        commit: bool = True,
+    ) -> list[int]:
+        """Insert contacts and their metadata rows in one transaction.
+
+        Each chunk is one multi-row ``INSERT ... RETURNING id`` for the
+        contacts and one executemany for their ``contact_metadata`` rows, so
+        no ORM objects are built and no per-contact flush happens. Session
+        hooks don't see these rows; the contact count, data version and change
+        listeners are updated here instead.
+
+        Args:
+            contacts: Parsed contact dicts
+            chunk_size: Contacts per insert statement
+            defer_search_index: Suspend the per-row ``contacts_fts`` insert
+                trigger after the first chunk and index the new contacts with
+                one refresh before committing
+            commit: Commit when done; pass False to add more writes to the
+                transaction and commit them together. It is rolled back on
+                failure either way.
+
+        Returns:
+            IDs of the new contacts, in input order
+        """
+        session = self.session
+        insert_contact = insert(Contact).returning(Contact.id, sort_by_parameter_order=True)
+        fts_trigger = None
+        contact_ids: list[int] = []
+        try:
+            for start in range(0, len(contacts), chunk_size):
+                chunk = contacts[start : start + chunk_size]
+                image_hashes = self._store_profile_images(session, chunk)
+                chunk = [
+                    self._contact_values(c, h) for c, h in zip(chunk, image_hashes, strict=True)
+                ]
+                ids = list(session.scalars(insert_contact, chunk))
+                session.execute(insert(ContactMetadata), [{"contact_id": i} for i in ids])
+                contact_ids.extend(ids)
+                if defer_search_index and start == 0:
+                    # Only now: pysqlite runs DDL outside a transaction until
+                    # an INSERT has opened one, and the drop must roll back
+                    fts_trigger = self._suspend_fts_insert_trigger(session)
+
+            if fts_trigger:
+                refresh_fts_rows(session, contact_ids)
+                session.execute(text(fts_trigger))
+
+            self._queue_contact_changes(session, contact_ids)
+            if commit:
+                session.commit()
+        except Exception:
+            # Rolls back the trigger drop along with the rows
+            session.rollback()
+            raise
+
+        self.invalidate_contact_count()
+        return contact_ids
+
+    def bulk_update_contacts(
+        self,
+        contacts: dict[int, dict[str, Any]],
+        update_images: bool = True,
+        commit: bool = True,
+    ) -> None:
+        """Overwrite existing contacts with parsed data, one executemany per call.
+
+        Like ``bulk_insert_contacts`` this bypasses the session hooks; the
+        FTS update trigger keeps the search index current.
+
+        Args:
+            contacts: Parsed contact dicts by the ID of the contact they replace
+            update_images: Also replace the profile image columns
+            commit: Commit when done; see ``bulk_insert_contacts``
+        """
+        if not contacts:
+            return
+        session = self.session
+        try:
+            image_hashes = (
+                self._store_profile_images(session, list(contacts.values()))
+                if update_images
+                else [None] * len(contacts)
+            )
+            rows = []
+            for (contact_id, contact_data), image_hash in zip(
+                contacts.items(), image_hashes, strict=True
+            ):
+                values = self._contact_values(contact_data, image_hash)
+                if not update_images:
+                    for column in PROFILE_IMAGE_COLUMNS:
+                        del values[column]
+                rows.append({"id": contact_id, **values})
+
+            session.execute(update(Contact), rows)
+            self._queue_contact_changes(session, contacts)
+            if commit:
+                session.commit()
+        except Exception:
+            session.rollback()
+            raise
+
+    def _queue_contact_changes(self, session, contact_ids: Iterable[int]) -> None:
+        """Record contact writes made outside the ORM unit of work.
+
+        Bumps ``data_version`` and queues the IDs for the change listeners,
+        which are notified when the transaction commits, as for ORM writes.
+        """
+        changes = session.info.setdefault("data_changes", {"contact_ids": set(), "all": False})
+        changes["contact_ids"].update(contact_ids)
+        self.data_version += 1
+
+    @staticmethod
+    def _suspend_fts_insert_trigger(session) -> str | None:
+        """Drop the ``contacts_fts`` insert trigger inside the current transaction.
+
+        Returns:
+            The trigger's SQL for recreating it, or None if it doesn't exist
+        """
+        trigger_sql = session.execute(
+            text("SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = :name"),
+            {"name": CONTACTS_FTS_INSERT_TRIGGER},
+        ).scalar()
+        if trigger_sql:
+            session.execute(text(f"DROP TRIGGER {CONTACTS_FTS_INSERT_TRIGGER}"))
+        return trigger_sql
+
     def insert_people(self, people: list[dict[str, Any]]):
         """Insert list of people dictionaries into the people table."""
         from .models import Person
@@ -435,19 +1077,220 @@ class Database:
 
     def get_relationship_info(self, contact_id: int) -> dict[str, Any]:
         """Get all relationship information for a contact."""
-        from .models import Contact
+        return self.get_relationship_info_bulk([contact_id])[contact_id]
 
-        contact = self.session.query(Contact).filter(Contact.id == contact_id).first()
-        if not contact or not contact.relationship:
-            return {"tags": [], "notes": []}
+    def get_relationship_info_bulk(self, contact_ids: list[int]) -> dict[int, dict[str, Any]]:
+        """Get tags and notes for many contacts using set-based queries.
 
-        return {
-            "tags": [tag.name for tag in contact.relationship.tags],
-            "notes": [
-                {"title": note.title, "content": note.content}
-                for note in contact.relationship.notes
-            ],
-        }
+        Runs one tag query and one note query per batch of
+        ``IN_CLAUSE_BATCH_SIZE`` contact IDs, instead of loading each
+        contact's metadata relationships individually.
+
+        Args:
+            contact_ids: Contact IDs to load relationship information for
+
+        Returns:
+            Mapping of contact ID to ``{"tags": [...], "notes": [...]}``. Every
+            requested ID is present, with empty lists when it has no metadata.
+        """
+        from .models import ContactMetadata
+        from .models import Note
+        from .models import Tag
+        from .models import metadata_notes
+        from .models import metadata_tags
+
+        unique_ids = list(dict.fromkeys(contact_ids))
+        info: dict[int, dict[str, Any]] = {cid: {"tags": [], "notes": []} for cid in unique_ids}
+
+        for start in range(0, len(unique_ids), IN_CLAUSE_BATCH_SIZE):
+            batch = unique_ids[start : start + IN_CLAUSE_BATCH_SIZE]
+
+            tag_rows = (
+                self.session.query(ContactMetadata.contact_id, Tag.name)
+                .join(metadata_tags, metadata_tags.c.metadata_id == ContactMetadata.id)
+                .join(Tag, Tag.id == metadata_tags.c.tag_id)
+                .filter(ContactMetadata.contact_id.in_(batch))
+                .order_by(ContactMetadata.contact_id, Tag.id)
+                .all()
+            )
+            for contact_id, tag_name in tag_rows:
+                info[contact_id]["tags"].append(tag_name)
+
+            note_rows = (
+                self.session.query(ContactMetadata.contact_id, Note.title, Note.content)
+                .join(metadata_notes, metadata_notes.c.metadata_id == ContactMetadata.id)
+                .join(Note, Note.id == metadata_notes.c.note_id)
+                .filter(ContactMetadata.contact_id.in_(batch))
+                .order_by(ContactMetadata.contact_id, Note.id)
+                .all()
+            )
+            for contact_id, title, content in note_rows:
+                info[contact_id]["notes"].append({"title": title, "content": content})
+
+        return info
+
+    def list_contact_search_rows(
+        self, contact_ids: list[int] | None = None, session=None
+    ) -> list[dict[str, Any]]:
+        """Load the contact fields the search cache indexes with one grouped query.
+
+        Args:
+            contact_ids: Limit the result to these contacts (all contacts if None)
+            session: Session to query with; background loaders pass their own
+                because the shared session isn't thread-safe
+
+        Returns:
+            ``{"id", "name", "email", "phone", "tags"}`` dicts ordered by name
+        """
+        from .models import metadata_tags
+
+        session = session or self.session
+        query = (
+            session.query(
+                Contact.id,
+                Contact.name,
+                Contact.email,
+                Contact.phone,
+                func.group_concat(Tag.name, SEARCH_TAG_SEPARATOR),
+            )
+            .outerjoin(ContactMetadata, ContactMetadata.contact_id == Contact.id)
+            .outerjoin(metadata_tags, metadata_tags.c.metadata_id == ContactMetadata.id)
+            .outerjoin(Tag, Tag.id == metadata_tags.c.tag_id)
+            .group_by(Contact.id)
+            .order_by(Contact.name, Contact.id)
+        )
+
+        if contact_ids is None:
+            batches = [query]
+        else:
+            unique_ids = list(dict.fromkeys(contact_ids))
+            batches = [
+                query.filter(Contact.id.in_(unique_ids[start : start + IN_CLAUSE_BATCH_SIZE]))
+                for start in range(0, len(unique_ids), IN_CLAUSE_BATCH_SIZE)
+            ]
+
+        return [
+            {
+                "id": contact_id,
+                "name": name,
+                "email": email,
+                "phone": phone,
+                "tags": tags.split(SEARCH_TAG_SEPARATOR) if tags else [],
+            }
+            for batch in batches
+            for contact_id, name, email, phone, tags in batch.all()
+        ]
+
+    def get_contacts_grouped_by_tag(self, tag_ids: list[int]) -> dict[int, list[Contact]]:
+        """Get the contacts carrying each tag with one joined query per ID batch.
+
+        Args:
+            tag_ids: Tag IDs to look up
+
+        Returns:
+            Mapping of tag ID to its contacts ordered by name. Every requested
+            ID is present, with an empty list when no contact has the tag.
+        """
+        from .models import metadata_tags
+
+        return self._contacts_grouped_by(metadata_tags, metadata_tags.c.tag_id, tag_ids)
+
+    def get_contacts_grouped_by_note(self, note_ids: list[int]) -> dict[int, list[Contact]]:
+        """Get the contacts attached to each note with one joined query per ID batch.
+
+        Args:
+            note_ids: Note IDs to look up
+
+        Returns:
+            Mapping of note ID to its contacts ordered by name. Every requested
+            ID is present, with an empty list when no contact has the note.
+        """
+        from .models import metadata_notes
+
+        return self._contacts_grouped_by(metadata_notes, metadata_notes.c.note_id, note_ids)
+
+    def _contacts_grouped_by(
+        self, association_table, key_column, keys: list[int]
+    ) -> dict[int, list[Contact]]:
+        """Group contacts by a key column of a metadata association table."""
+        from .models import ContactMetadata
+
+        unique_keys = list(dict.fromkeys(keys))
+        grouped: dict[int, list[Contact]] = {key: [] for key in unique_keys}
+
+        for start in range(0, len(unique_keys), IN_CLAUSE_BATCH_SIZE):
+            batch = unique_keys[start : start + IN_CLAUSE_BATCH_SIZE]
+            rows = (
+                self.session.query(key_column, Contact)
+                .join(ContactMetadata, ContactMetadata.id == association_table.c.metadata_id)
+                .join(Contact, Contact.id == ContactMetadata.contact_id)
+                .filter(key_column.in_(batch))
+                .distinct()
+                .order_by(key_column, Contact.name, Contact.id)
+                .all()
+            )
+            for key, contact in rows:
+                grouped[key].append(contact)
+
+        return grouped
+
+    def get_profile_image(self, contact_id: int, size: int | None = None) -> bytes | None:
+        """Load a contact's profile image bytes.
+
+        Images in the image store come back as the smallest variant that
+        covers ``size``; inline images from before the store are returned as
+        they are.
+
+        Args:
+            contact_id: Contact to load the image for
+            size: Pixels the caller will display along the longest edge;
+                None for the original
+
+        Returns:
+            Image bytes, or None if the contact doesn't exist or has no image
+        """
+        image_hash = (
+            self.session.query(Contact.profile_image_hash).filter(Contact.id == contact_id).scalar()
+        )
+        if image_hash:
+            return ImageStore(self.session).get(image_hash, size)
+
+        # Contact.profile_image is deferred; this is the only place it is read whole
+        image = self.session.query(Contact.profile_image).filter(Contact.id == contact_id).scalar()
+        return image or None
+
+    def iter_profile_image(
+        self,
+        contact_id: int,
+        chunk_size: int = PROFILE_IMAGE_CHUNK_SIZE,
+        size: int | None = None,
+    ) -> Iterator[bytes]:
+        """Stream a contact's profile image in chunks without loading it whole.
+
+        Args:
+            contact_id: Contact to stream the image for
+            chunk_size: Maximum number of bytes per yielded chunk
+            size: Pixels the caller will display; see ``get_profile_image``
+
+        Yields:
+            Consecutive byte chunks of the image; nothing if there is no image
+        """
+        image_hash, inline_size = (
+            self.session.query(Contact.profile_image_hash, func.length(Contact.profile_image))
+            .filter(Contact.id == contact_id)
+            .one_or_none()
+        ) or (None, None)
+        if image_hash:
+            yield from ImageStore(self.session).iter_chunks(image_hash, chunk_size, size)
+            return
+        if inline_size:
+            yield from iter_blob_chunks(
+                self.session,
+                Contact.profile_image,
+                (Contact.id == contact_id,),
+                inline_size,
+                chunk_size,
+            )
 
     def list_tags(self) -> list[tuple[int, str]]:
         """List all available tags."""
@@ -830,11 +1673,17 @@ class Database:
             raise ValueError(f"Relationship type '{type_key}' not found")
 
         # Delete the primary relationship
-        self.session.query(ContactRelationship).filter(
-            ContactRelationship.from_contact_id == from_contact_id,
-            ContactRelationship.to_contact_id == to_contact_id,
-            ContactRelationship.type_id == rel_type.id,
-        ).delete()
+        deleted = (
+            self.session.query(ContactRelationship)
+            .filter(
+                ContactRelationship.from_contact_id == from_contact_id,
+                ContactRelationship.to_contact_id == to_contact_id,
+                ContactRelationship.type_id == rel_type.id,
+            )
+            .delete()
+        )
+        for _ in range(deleted):
+            self._queue_relationship_change(self.session, from_contact_id, to_contact_id, -1)
 
         # For non-symmetrical relationships, also delete the inverse
         if not rel_type.is_symmetrical and rel_type.inverse_type_key:
@@ -844,19 +1693,33 @@ class Database:
                 .first()
             )
             if inverse_type:
-                self.session.query(ContactRelationship).filter(
-                    ContactRelationship.from_contact_id == to_contact_id,
-                    ContactRelationship.to_contact_id == from_contact_id,
-                    ContactRelationship.type_id == inverse_type.id,
-                ).delete()
+                deleted = (
+                    self.session.query(ContactRelationship)
+                    .filter(
+                        ContactRelationship.from_contact_id == to_contact_id,
+                        ContactRelationship.to_contact_id == from_contact_id,
+                        ContactRelationship.type_id == inverse_type.id,
+                    )
+                    .delete()
+                )
+                for _ in range(deleted):
+                    self._queue_relationship_change(
+                        self.session, to_contact_id, from_contact_id, -1
+                    )
 
         # For symmetrical relationships, delete both directions
         if rel_type.is_symmetrical:
-            self.session.query(ContactRelationship).filter(
-                ContactRelationship.from_contact_id == to_contact_id,
-                ContactRelationship.to_contact_id == from_contact_id,
-                ContactRelationship.type_id == rel_type.id,
-            ).delete()
+            deleted = (
+                self.session.query(ContactRelationship)
+                .filter(
+                    ContactRelationship.from_contact_id == to_contact_id,
+                    ContactRelationship.to_contact_id == from_contact_id,
+                    ContactRelationship.type_id == rel_type.id,
+                )
+                .delete()
+            )
+            for _ in range(deleted):
+                self._queue_relationship_change(self.session, to_contact_id, from_contact_id, -1)
 
         self.session.commit()
 
@@ -901,33 +1764,69 @@ class Database:
 
     # Advanced Relationship Analytics and Queries (Issue #64 Part 3)
 
-    def get_relationship_analytics(self) -> dict[str, Any]:
-        """Get comprehensive relationship analytics for the database."""
-        try:
-            # Total relationships
-            total_relationships = self.session.query(ContactRelationship).count()
+    def _has_contact_degree_table(self) -> bool:
+        """Check (once per connection) whether the contact_degree summary table exists."""
+        if self._degree_table_available is None:
+            self._degree_table_available = bool(
+                self.session.execute(
+                    text(
+                        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'contact_degree'"
+                    )
+                ).scalar()
+            )
+        return self._degree_table_available
 
-            # Most connected contacts (by relationship count)
-            most_connected = (
-                self.session.query(
-                    Contact.id,
-                    Contact.name,
-                    Contact.email,
-                    func.count(ContactRelationship.id).label("relationship_count"),
-                )
-                .outerjoin(
-                    ContactRelationship,
-                    or_(
-                        Contact.id == ContactRelationship.from_contact_id,
-                        Contact.id == ContactRelationship.to_contact_id,
-                    ),
-                )
-                .group_by(Contact.id)
-                .order_by(func.count(ContactRelationship.id).desc())
-                .limit(10)
-                .all()
+    def get_relationship_analytics(self, top_n: int = 10) -> dict[str, Any]:
+        """Get comprehensive relationship analytics for the database.
+
+        Per-contact relationship counts come from the ``contact_degree``
+        summary table, which triggers keep current, so the most connected
+        contacts are an index range read. Databases without the table compute
+        the same counts in one aggregate over both ends of every relationship.
+
+        Args:
+            top_n: Number of most connected contacts to return
+
+        Returns:
+            Dict with totals, isolated contact count, most connected contacts
+            and relationship type distribution; empty on error
+        """
+        try:
+            # Databases without the summary table get an equivalent CTE of the same name
+            degrees = (
+                ""
+                if self._has_contact_degree_table()
+                else f"WITH contact_degree AS ({CONTACT_DEGREE_SQL}) "
             )
 
+            total_relationships = self.session.query(func.count(ContactRelationship.id)).scalar()
+            total_contacts = self.count_contacts()
+            connected_count = self.session.execute(
+                text(f"{degrees}SELECT COUNT(*) FROM contact_degree")
+            ).scalar()
+
+            most_connected = self.session.execute(
+                text(f"""
+                    {degrees}SELECT c.id, c.name, c.email, d.degree AS relationship_count
+                    FROM contact_degree d JOIN contacts c ON c.id = d.contact_id
+                    ORDER BY d.degree DESC, d.contact_id
+                    LIMIT :limit
+                """),
+                {"limit": top_n},
+            ).all()
+            if len(most_connected) < top_n and connected_count < total_contacts:
+                # Fewer connected contacts than requested: fill up with isolated ones
+                most_connected += self.session.execute(
+                    text(f"""
+                        {degrees}SELECT c.id, c.name, c.email, 0 AS relationship_count
+                        FROM contacts c
+                        WHERE c.id NOT IN (SELECT contact_id FROM contact_degree)
+                        ORDER BY c.id
+                        LIMIT :limit
+                    """),
+                    {"limit": top_n - len(most_connected)},
+                ).all()
+
             # Relationship type distribution
             type_distribution = (
                 self.session.query(
@@ -940,22 +1839,7 @@ class Database:
                 .all()
             )
 
-            # Isolated contacts (no relationships)
-            isolated_count = (
-                self.session.query(Contact)
-                .outerjoin(
-                    ContactRelationship,
-                    or_(
-                        Contact.id == ContactRelationship.from_contact_id,
-                        Contact.id == ContactRelationship.to_contact_id,
-                    ),
-                )
-                .filter(ContactRelationship.id.is_(None))
-                .count()
-            )
-
             # Average relationships per contact
-            total_contacts = self.session.query(Contact).count()
             avg_relationships = (
                 (total_relationships * 2) / total_contacts if total_contacts > 0 else 0
             )
@@ -964,7 +1848,7 @@ class Database:
                 "total_relationships": total_relationships,
                 "total_contacts": total_contacts,
                 "average_relationships_per_contact": round(avg_relationships, 2),
-                "isolated_contacts": isolated_count,
+                "isolated_contacts": total_contacts - connected_count,
                 "most_connected": [
                     {
                         "id": c.id,
@@ -983,110 +1867,158 @@ class Database:
             self.logger.error(f"Error getting relationship analytics: {e}", exc_info=True)
             return {}
 
+    def _contacts_by_id(self, contact_ids: list[int]) -> dict[int, Contact]:
+        """Load contacts for a list of IDs with batched IN queries."""
+        contacts = {}
+        unique_ids = list(dict.fromkeys(contact_ids))
+        for start in range(0, len(unique_ids), IN_CLAUSE_BATCH_SIZE):
+            batch = unique_ids[start : start + IN_CLAUSE_BATCH_SIZE]
+            for contact in self.session.query(Contact).filter(Contact.id.in_(batch)):
+                contacts[contact.id] = contact
+        return contacts
+
     def find_mutual_connections(self, contact1_id: int, contact2_id: int) -> list[dict[str, Any]]:
         """Find mutual connections between two contacts."""
         try:
-            # Get all connections for contact1
-            contact1_connections = (
-                self.session.query(Contact.id)
-                .join(
-                    ContactRelationship,
-                    or_(
-                        and_(
-                            ContactRelationship.from_contact_id == contact1_id,
-                            ContactRelationship.to_contact_id == Contact.id,
-                        ),
-                        and_(
-                            ContactRelationship.to_contact_id == contact1_id,
-                            ContactRelationship.from_contact_id == Contact.id,
-                        ),
+            graph = self._loaded_relationship_graph()
+            if graph is None:
+                return self._find_mutual_connections_sql(contact1_id, contact2_id)
+
+            mutual_ids = graph.mutual_connections(contact1_id, contact2_id)
+            contacts = self._contacts_by_id(mutual_ids)
+            return [
+                {"id": c.id, "name": c.name, "email": c.email, "phone": c.phone}
+                for c in (contacts[i] for i in mutual_ids if i in contacts)
+            ]
+        except Exception as e:
+            self.logger.error(f"Error finding mutual connections: {e}", exc_info=True)
+            return []
+
+    def _find_mutual_connections_sql(
+        self, contact1_id: int, contact2_id: int
+    ) -> list[dict[str, Any]]:
+        """SQL implementation of find_mutual_connections for when the graph isn't loaded."""
+        # Get all connections for contact1
+        contact1_connections = (
+            self.session.query(Contact.id)
+            .join(
+                ContactRelationship,
+                or_(
+                    and_(
+                        ContactRelationship.from_contact_id == contact1_id,
+                        ContactRelationship.to_contact_id == Contact.id,
                     ),
-                )
-                .distinct()
+                    and_(
+                        ContactRelationship.to_contact_id == contact1_id,
+                        ContactRelationship.from_contact_id == Contact.id,
+                    ),
+                ),
             )
+            .distinct()
+        )
 
-            # Get all connections for contact2
-            contact2_connections = (
-                self.session.query(Contact.id)
-                .join(
-                    ContactRelationship,
-                    or_(
-                        and_(
-                            ContactRelationship.from_contact_id == contact2_id,
-                            ContactRelationship.to_contact_id == Contact.id,
-                        ),
-                        and_(
-                            ContactRelationship.to_contact_id == contact2_id,
-                            ContactRelationship.from_contact_id == Contact.id,
-                        ),
+        # Get all connections for contact2
+        contact2_connections = (
+            self.session.query(Contact.id)
+            .join(
+                ContactRelationship,
+                or_(
+                    and_(
+                        ContactRelationship.from_contact_id == contact2_id,
+                        ContactRelationship.to_contact_id == Contact.id,
                     ),
-                )
-                .distinct()
+                    and_(
+                        ContactRelationship.to_contact_id == contact2_id,
+                        ContactRelationship.from_contact_id == Contact.id,
+                    ),
+                ),
             )
+            .distinct()
+        )
 
-            # Find intersection
-            mutual = (
-                self.session.query(Contact)
-                .filter(Contact.id.in_(contact1_connections), Contact.id.in_(contact2_connections))
-                .all()
-            )
+        # Find intersection
+        mutual = (
+            self.session.query(Contact)
+            .filter(Contact.id.in_(contact1_connections), Contact.id.in_(contact2_connections))
+            .order_by(Contact.id)
+            .all()
+        )
 
-            return [
-                {"id": c.id, "name": c.name, "email": c.email, "phone": c.phone} for c in mutual
-            ]
-        except Exception as e:
-            self.logger.error(f"Error finding mutual connections: {e}", exc_info=True)
-            return []
+        return [{"id": c.id, "name": c.name, "email": c.email, "phone": c.phone} for c in mutual]
 
     def find_relationship_path(self, from_id: int, to_id: int, max_depth: int = 6) -> list[int]:
         """Find the shortest relationship path between two contacts (BFS)."""
         try:
-            if from_id == to_id:
-                return [from_id]
+            graph = self._loaded_relationship_graph()
+            if graph is None:
+                return self._find_relationship_path_sql(from_id, to_id, max_depth)
+            return graph.shortest_path(from_id, to_id, max_depth)
+        except Exception as e:
+            self.logger.error(f"Error finding relationship path: {e}", exc_info=True)
+            return []
 
-            visited = set()
-            queue = [(from_id, [from_id])]
+    def _find_relationship_path_sql(self, from_id: int, to_id: int, max_depth: int) -> list[int]:
+        """SQL implementation of find_relationship_path for when the graph isn't loaded."""
+        if from_id == to_id:
+            return [from_id]
 
-            while queue and len(visited) < max_depth * 100:  # Safety limit
-                current_id, path = queue.pop(0)
+        visited = set()
+        queue = deque([(from_id, [from_id])])
 
-                if current_id in visited:
-                    continue
+        while queue and len(visited) < max_depth * 100:  # Safety limit
+            current_id, path = queue.popleft()
 
-                visited.add(current_id)
+            if current_id in visited:
+                continue
 
-                # Get all connections for current contact
-                connections = (
-                    self.session.query(
-                        case(
-                            (
-                                ContactRelationship.from_contact_id == current_id,
-                                ContactRelationship.to_contact_id,
-                            ),
-                            else_=ContactRelationship.from_contact_id,
-                        ).label("connected_id")
-                    )
-                    .filter(
-                        or_(
+            visited.add(current_id)
+
+            # Get all connections for current contact
+            connections = (
+                self.session.query(
+                    case(
+                        (
                             ContactRelationship.from_contact_id == current_id,
-                            ContactRelationship.to_contact_id == current_id,
-                        )
+                            ContactRelationship.to_contact_id,
+                        ),
+                        else_=ContactRelationship.from_contact_id,
+                    ).label("connected_id")
+                )
+                .filter(
+                    or_(
+                        ContactRelationship.from_contact_id == current_id,
+                        ContactRelationship.to_contact_id == current_id,
                     )
-                    .all()
                 )
+                .all()
+            )
 
-                for conn in connections:
-                    next_id = conn.connected_id
+            for conn in connections:
+                next_id = conn.connected_id
+
+                if next_id == to_id:
+                    return path + [next_id]
+
+                if next_id not in visited and len(path) < max_depth:
+                    queue.append((next_id, path + [next_id]))
 
-                    if next_id == to_id:
-                        return path + [next_id]
+        return []  # No path found
 
-                    if next_id not in visited and len(path) < max_depth:
-                        queue.append((next_id, path + [next_id]))
+    def get_connected_components(self) -> list[list[int]]:
+        """Group related contacts into connected components.
 
-            return []  # No path found
+        Returns:
+            Lists of contact IDs, largest component first. Contacts without any
+            relationship are not included.
+        """
+        try:
+            graph = self._loaded_relationship_graph()
+            if graph is None:
+                graph = RelationshipGraph()
+                graph.load(self.session)
+            return graph.connected_components()
         except Exception as e:
-            self.logger.error(f"Error finding relationship path: {e}", exc_info=True)
+            self.logger.error(f"Error finding connected components: {e}", exc_info=True)
             return []
 
     def bulk_create_relationships(self, relationships: list[dict[str, Any]]) -> dict[str, Any]:
@@ -1241,62 +2173,85 @@ class Database:
     def get_network_degrees(self, contact_id: int, degrees: int = 2) -> dict[str, list[dict]]:
         """Get network connections up to N degrees of separation."""
         try:
+            graph = self._loaded_relationship_graph()
+            if graph is None:
+                return self._get_network_degrees_sql(contact_id, degrees)
+
+            levels = graph.degrees(contact_id, degrees)
+            contacts = self._contacts_by_id(
+                [other for level in levels.values() for other, _through in level]
+            )
             result = {}
-            visited = set()
-            current_level = [contact_id]
+            for degree, level in levels.items():
+                result[f"degree_{degree}"] = [
+                    {
+                        "id": other,
+                        "name": contacts[other].name,
+                        "email": contacts[other].email,
+                        "connected_through": through,
+                    }
+                    for other, through in level
+                    if other in contacts
+                ]
+            return result
+        except Exception as e:
+            self.logger.error(f"Error getting network degrees: {e}", exc_info=True)
+            return {}
 
-            for degree in range(1, degrees + 1):
-                next_level = set()
-                degree_contacts = []
+    def _get_network_degrees_sql(self, contact_id: int, degrees: int) -> dict[str, list[dict]]:
+        """SQL implementation of get_network_degrees for when the graph isn't loaded."""
+        result = {}
+        visited = {contact_id}
+        current_level = [contact_id]
 
-                for current_id in current_level:
-                    if current_id in visited:
-                        continue
-                    visited.add(current_id)
-
-                    # Get connections
-                    connections = (
-                        self.session.query(Contact)
-                        .join(
-                            ContactRelationship,
-                            or_(
-                                and_(
-                                    ContactRelationship.from_contact_id == current_id,
-                                    ContactRelationship.to_contact_id == Contact.id,
-                                ),
-                                and_(
-                                    ContactRelationship.to_contact_id == current_id,
-                                    ContactRelationship.from_contact_id == Contact.id,
-                                ),
+        for degree in range(1, degrees + 1):
+            next_level = []
+            degree_contacts = []
+
+            for current_id in current_level:
+                # Get connections
+                connections = (
+                    self.session.query(Contact)
+                    .join(
+                        ContactRelationship,
+                        or_(
+                            and_(
+                                ContactRelationship.from_contact_id == current_id,
+                                ContactRelationship.to_contact_id == Contact.id,
                             ),
-                        )
-                        .filter(Contact.id.notin_(visited))
-                        .distinct()
-                        .all()
+                            and_(
+                                ContactRelationship.to_contact_id == current_id,
+                                ContactRelationship.from_contact_id == Contact.id,
+                            ),
+                        ),
                     )
+                    .distinct()
+                    .order_by(Contact.id)
+                    .all()
+                )
 
-                    for conn in connections:
-                        next_level.add(conn.id)
-                        degree_contacts.append(
-                            {
-                                "id": conn.id,
-                                "name": conn.name,
-                                "email": conn.email,
-                                "connected_through": current_id,
-                            }
-                        )
+                for conn in connections:
+                    if conn.id in visited:
+                        continue
+                    visited.add(conn.id)
+                    next_level.append(conn.id)
+                    degree_contacts.append(
+                        {
+                            "id": conn.id,
+                            "name": conn.name,
+                            "email": conn.email,
+                            "connected_through": current_id,
+                        }
+                    )
 
-                if degree_contacts:
-                    result[f"degree_{degree}"] = degree_contacts
-                current_level = list(next_level)
+            if degree_contacts:
+                result[f"degree_{degree}"] = degree_contacts
+            current_level = next_level
 
-                if not current_level:
-                    break
+            if not current_level:
+                break
 
-            return result
-        except Exception as e:
-            self.logger.error(f"Error getting network degrees: {e}", exc_info=True)
-            return {}
+        return result
 
 
 def create_database(path: Path) -> Database:
@@ -269,6 +269,15 @@ def collect_system_prompt() -> dict[str, Any]:
     return prompt_info
 
 
+def collect_llm_session_info(llm) -> dict[str, Any]:
+    """Collect runtime metrics from a live LLM session (tool latency, streaming)."""
+    try:
+        return {"status": "available", **llm.get_debug_info()}
+    except Exception as e:
+        logger.warning(f"Failed to collect LLM session info: {e}")
+        return {"status": "error", "error": str(e)}
+
+
 def collect_config_info() -> dict[str, Any]:
     """Collect configuration information using existing config functions."""
     config_info = {
@@ -429,6 +438,26 @@ def format_debug_output(debug_data: dict[str, Any]) -> str:
 
     lines.append("")
 
+    # LLM Session (only when collected from a running chat)
+    session = debug_data.get("llm_session")
+    if session:
+        lines.append("⏱️  LLM SESSION")
+        lines.append("-" * 30)
+        if session["status"] == "available":
+            lines.append(f"Model: {session['model']} ({session['provider']})")
+            stream = session.get("stream_metrics") or {}
+            if stream:
+                lines.append(f"Time to First Token: {stream['time_to_first_token']:.2f}s")
+            lines.append(f"Tool Result Tokens Saved: {session['tool_tokens_saved']}")
+            if session["tool_timings"]:
+                lines.append("Last Turn Tool Latency:")
+                for timing in session["tool_timings"]:
+                    mode = "parallel" if timing["parallel"] else "serial"
+                    lines.append(f"  - {timing['name']}: {timing['seconds'] * 1000:.1f}ms ({mode})")
+        else:
+            lines.append(f"❌ LLM Session: {session.get('error', 'Not available')}")
+        lines.append("")
+
     # Summary
     lines.append("📊 SUMMARY")
     lines.append("-" * 30)
@@ -461,8 +490,12 @@ def format_debug_output(debug_data: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
-def collect_debug_info() -> dict[str, Any]:
-    """Main orchestration function to collect all debug information."""
+def collect_debug_info(llm=None) -> dict[str, Any]:
+    """Main orchestration function to collect all debug information.
+
+    Args:
+        llm: Optional live LLM session whose runtime metrics are included
+    """
     logger.info("Starting debug info collection")
 
     debug_data = {
@@ -472,15 +505,17 @@ def collect_debug_info() -> dict[str, Any]:
         "llm": collect_llm_info(),
         "system_prompt": collect_system_prompt(),
     }
+    if llm is not None:
+        debug_data["llm_session"] = collect_llm_session_info(llm)
 
     logger.info("Debug info collection completed")
     return debug_data
 
 
-def generate_debug_report() -> str:
+def generate_debug_report(llm=None) -> str:
     """Generate a complete debug report as formatted string."""
     try:
-        debug_data = collect_debug_info()
+        debug_data = collect_debug_info(llm)
         return format_debug_output(debug_data)
     except Exception as e:
         logger.error(f"Failed to generate debug report: {e}")
@@ -0,0 +1,241 @@
+"""
+Incremental maintenance for the FTS5 search tables
+
+The ``contacts_fts``, ``notes_fts`` and ``tags_fts`` virtual tables hold
+denormalized copies of their base rows: a contact row carries the text of its
+notes and a note row carries the names of its contacts. The SQL triggers from
+the FTS5 migration only cover direct inserts, updates and deletes, so the
+Database queues the contact, note and tag IDs touched by each transaction and
+refreshes just those FTS rows before the transaction commits. The helpers here
+take any SQLAlchemy connection or session, so the same statements back
+incremental refreshes, full rebuilds and the consistency check.
+"""
+
+import hashlib
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import bindparam
+from sqlalchemy import text
+
+from .models import IN_CLAUSE_BATCH_SIZE
+
+FTS_TABLES = ("contacts_fts", "notes_fts", "tags_fts")
+
+# The denormalized text for each FTS table, one row per base row. Both the
+# refresh and the consistency check use these, so aggregated columns come out
+# in the same order.
+_CONTACT_ROWS = """
+    SELECT
+        c.id,
+        COALESCE(c.name, ''),
+        COALESCE(c.email, ''),
+        COALESCE(c.phone, ''),
+        COALESCE((
+            SELECT GROUP_CONCAT(n.content, ' ')
+            FROM contact_metadata cm
+            JOIN metadata_notes mn ON mn.metadata_id = cm.id
+            JOIN notes n ON n.id = mn.note_id
+            WHERE cm.contact_id = c.id
+        ), '')
+    FROM contacts c
+"""
+
+_NOTE_ROWS = """
+    SELECT
+        n.id,
+        COALESCE(n.title, ''),
+        COALESCE(n.content, ''),
+        COALESCE((
+            SELECT GROUP_CONCAT(c.name, ', ')
+            FROM metadata_notes mn
+            JOIN contact_metadata cm ON cm.id = mn.metadata_id
+            JOIN contacts c ON c.id = cm.contact_id
+            WHERE mn.note_id = n.id
+        ), '')
+    FROM notes n
+"""
+
+_TAG_ROWS = """
+    SELECT
+        t.id,
+        COALESCE(t.name, ''),
+        (
+            SELECT COUNT(DISTINCT cm.contact_id)
+            FROM metadata_tags mt
+            JOIN contact_metadata cm ON cm.id = mt.metadata_id
+            WHERE mt.tag_id = t.id
+        )
+    FROM tags t
+"""
+
+# entity -> (FTS table, id column, FTS columns, base row query, base alias)
+_ENTITIES = {
+    "contacts": ("contacts_fts", "contact_id", "name, email, phone, notes", _CONTACT_ROWS, "c"),
+    "notes": ("notes_fts", "note_id", "title, content, contact_names", _NOTE_ROWS, "n"),
+    "tags": ("tags_fts", "tag_id", "name, contact_count", _TAG_ROWS, "t"),
+}
+
+# Contacts whose ``notes`` column depends on the given notes, and vice versa
+_CONTACTS_FOR_NOTES = """
+    SELECT DISTINCT cm.contact_id
+    FROM metadata_notes mn
+    JOIN contact_metadata cm ON cm.id = mn.metadata_id
+    WHERE mn.note_id IN :ids
+"""
+
+_NOTES_FOR_CONTACTS = """
+    SELECT DISTINCT mn.note_id
+    FROM contact_metadata cm
+    JOIN metadata_notes mn ON mn.metadata_id = cm.id
+    WHERE cm.contact_id IN :ids
+"""
+
+
+def fts_tables_exist(conn) -> bool:
+    """Check whether all three FTS5 tables exist.
+
+    Args:
+        conn: SQLAlchemy connection or session
+
+    Returns:
+        True if the FTS5 migration has been applied
+    """
+    placeholders = ", ".join(f"'{name}'" for name in FTS_TABLES)
+    found = conn.execute(
+        text(f"SELECT COUNT(*) FROM sqlite_master WHERE name IN ({placeholders})")
+    ).scalar()
+    return found == len(FTS_TABLES)
+
+
+def _batches(ids: Iterable[int]) -> Iterable[list[int]]:
+    ordered = sorted(i for i in set(ids) if i is not None)
+    for start in range(0, len(ordered), IN_CLAUSE_BATCH_SIZE):
+        yield ordered[start : start + IN_CLAUSE_BATCH_SIZE]
+
+
+def _select_ids(conn, sql: str, ids: Iterable[int]) -> set[int]:
+    statement = text(sql).bindparams(bindparam("ids", expanding=True))
+    found = set()
+    for batch in _batches(ids):
+        found.update(row[0] for row in conn.execute(statement, {"ids": batch}))
+    return found
+
+
+def _refresh_rows(conn, entity: str, ids: Iterable[int]) -> None:
+    table, id_column, columns, rows_sql, alias = _ENTITIES[entity]
+    delete = text(f"DELETE FROM {table} WHERE {id_column} IN :ids").bindparams(
+        bindparam("ids", expanding=True)
+    )
+    insert = text(
+        f"INSERT INTO {table} ({id_column}, {columns}) {rows_sql} WHERE {alias}.id IN :ids"
+    ).bindparams(bindparam("ids", expanding=True))
+    for batch in _batches(ids):
+        conn.execute(delete, {"ids": batch})
+        conn.execute(insert, {"ids": batch})
+
+
+def refresh_fts_rows(
+    conn,
+    contact_ids: Iterable[int] = (),
+    note_ids: Iterable[int] = (),
+    tag_ids: Iterable[int] = (),
+) -> None:
+    """Re-index the FTS rows for the given contacts, notes and tags.
+
+    Each row is deleted and re-inserted from its base table, so deleted
+    entities simply drop out of the index. Contacts linked to a changed note
+    and notes linked to a changed contact are refreshed as well, since their
+    denormalized columns embed each other's text.
+
+    Args:
+        conn: SQLAlchemy connection or session inside the writing transaction
+        contact_ids: Contact IDs to refresh
+        note_ids: Note IDs to refresh
+        tag_ids: Tag IDs to refresh
+    """
+    contact_ids = set(contact_ids)
+    note_ids = set(note_ids)
+    linked_contacts = _select_ids(conn, _CONTACTS_FOR_NOTES, note_ids)
+    linked_notes = _select_ids(conn, _NOTES_FOR_CONTACTS, contact_ids)
+
+    _refresh_rows(conn, "contacts", contact_ids | linked_contacts)
+    _refresh_rows(conn, "notes", note_ids | linked_notes)
+    _refresh_rows(conn, "tags", tag_ids)
+
+
+def rebuild_fts(conn) -> None:
+    """Repopulate all three FTS tables from scratch.
+
+    Args:
+        conn: SQLAlchemy connection or session
+    """
+    for table, id_column, columns, rows_sql, _alias in _ENTITIES.values():
+        conn.execute(text(f"DELETE FROM {table}"))
+        conn.execute(text(f"INSERT INTO {table} ({id_column}, {columns}) {rows_sql}"))
+
+
+def _row_hashes(rows) -> dict[int, str]:
+    hashes: dict[int, str] = {}
+    for row in rows:
+        content = "\x1f".join(str(value) for value in row[1:])
+        digest = hashlib.sha1(content.encode("utf-8")).hexdigest()
+        entity_id = int(row[0])
+        # A duplicated FTS row never matches, so it shows up as stale
+        hashes[entity_id] = digest if entity_id not in hashes else ""
+    return hashes
+
+
+def check_fts_consistency(conn) -> dict[str, Any]:
+    """Compare every FTS table against the rows it should contain.
+
+    Args:
+        conn: SQLAlchemy connection or session
+
+    Returns:
+        Dictionary with a per-entity report (``base_rows``, ``indexed_rows``
+        and the sorted ``missing``, ``orphaned`` and ``stale`` IDs) plus an
+        overall ``consistent`` flag
+    """
+    report: dict[str, Any] = {"consistent": True}
+    for entity, (table, id_column, columns, rows_sql, _alias) in _ENTITIES.items():
+        expected = _row_hashes(conn.execute(text(rows_sql)))
+        indexed_rows = conn.execute(text(f"SELECT {id_column}, {columns} FROM {table}")).fetchall()
+        indexed = _row_hashes(indexed_rows)
+
+        missing = sorted(expected.keys() - indexed.keys())
+        orphaned = sorted(indexed.keys() - expected.keys())
+        stale = sorted(
+            entity_id
+            for entity_id in expected.keys() & indexed.keys()
+            if expected[entity_id] != indexed[entity_id]
+        )
+        report[entity] = {
+            "base_rows": len(expected),
+            "indexed_rows": len(indexed_rows),
+            "missing": missing,
+            "orphaned": orphaned,
+            "stale": stale,
+        }
+        if missing or orphaned or stale:
+            report["consistent"] = False
+    return report
+
+
+def repair_fts(conn, report: dict[str, Any]) -> int:
+    """Refresh only the rows a consistency report flagged.
+
+    Args:
+        conn: SQLAlchemy connection or session
+        report: Result of ``check_fts_consistency``
+
+    Returns:
+        Number of entity IDs refreshed
+    """
+    repaired = 0
+    for entity in _ENTITIES:
+        details = report.get(entity, {})
+        ids = {*details.get("missing", ()), *details.get("orphaned", ()), *details.get("stale", ())}
+        _refresh_rows(conn, entity, ids)
+        repaired += len(ids)
+    return repaired
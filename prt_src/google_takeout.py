@@ -3,27 +3,186 @@ Google Takeout Contact Import
 
 This module handles importing contacts from Google Takeout zip files,
 including VCard parsing and profile image extraction.
+
+Large takeouts are processed as a stream: cards are read from the zip lazily
+and parsed on a process pool in chunks, and profile images are matched by
+filename only. Image bytes are read from the zip batch by batch while the
+contacts are inserted, so memory stays bounded by one batch rather than the
+whole archive.
 """
 
+import io
 import mimetypes
+import multiprocessing
+import os
 import zipfile
+from collections import deque
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
 import vobject
 
+from .core.components.dedup import ContactClusterer
 from .logging_config import get_logger
 
+logger = get_logger(__name__)
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".gif")
+
+# Cards handed to a worker process per task
+PARSE_CHUNK_SIZE = 500
+
+# Parser processes; vobject parsing is CPU-bound and holds the GIL
+DEFAULT_PARSE_WORKERS = min(4, os.cpu_count() or 1)
+
+# Contacts, and their image bytes, inserted per database call
+IMPORT_BATCH_SIZE = 500
+
+# Called with (stage, done, total); stage is "parse" or "insert", and total is
+# 0 while it is not known yet
+ProgressCallback = Callable[[str, int, int], None]
+
+
+def parse_vcard(vcf_data: str) -> dict[str, Any] | None:
+    """Parse a VCard string and extract contact information.
+
+    Args:
+        vcf_data: Text of a single VCard
+
+    Returns:
+        Contact dict, or None if the card has no name, email or phone
+    """
+    try:
+        vcard = vobject.readOne(vcf_data)
+
+        contact = {
+            "first": "",
+            "last": "",
+            "emails": [],
+            "phones": [],
+            "profile_image": None,
+            "profile_image_filename": None,
+            "profile_image_mime_type": None,
+        }
+
+        # Extract name
+        if hasattr(vcard, "fn"):
+            full_name = vcard.fn.value.strip()
+            # Try to split into first/last
+            name_parts = full_name.split(" ", 1)
+            contact["first"] = name_parts[0] if name_parts else ""
+            contact["last"] = name_parts[1] if len(name_parts) > 1 else ""
+
+        if hasattr(vcard, "n"):
+            # More structured name info
+            name = vcard.n.value
+            if hasattr(name, "given"):
+                contact["first"] = name.given or contact["first"]
+            if hasattr(name, "family"):
+                contact["last"] = name.family or contact["last"]
+
+        # Extract emails - handle various email field formats
+        emails_found = {}  # Dict keys drop duplicates and keep source order
+
+        # Standard email fields
+        if hasattr(vcard, "email_list"):
+            for email in vcard.email_list:
+                email_value = email.value.strip()
+                if email_value and "@" in email_value:
+                    emails_found[email_value] = None
+        elif hasattr(vcard, "email"):
+            email_value = vcard.email.value.strip()
+            if email_value and "@" in email_value:
+                emails_found[email_value] = None
+
+        # Check for emails in item fields (common in Google contacts)
+        for attr_name in dir(vcard):
+            if attr_name.startswith("item") and hasattr(getattr(vcard, attr_name), "value"):
+                try:
+                    item_value = getattr(vcard, attr_name).value.strip()
+                    if "@" in item_value and "." in item_value:
+                        emails_found[item_value] = None
+                except (AttributeError, ValueError):
+                    continue
+
+        contact["emails"] = list(emails_found)
+
+        # Extract phone numbers
+        phones_found = {}  # Dict keys drop duplicates and keep source order
+
+        if hasattr(vcard, "tel_list"):
+            for tel in vcard.tel_list:
+                phone_value = tel.value.strip()
+                if phone_value:
+                    phones_found[phone_value] = None
+        elif hasattr(vcard, "tel"):
+            phone_value = vcard.tel.value.strip()
+            if phone_value:
+                phones_found[phone_value] = None
+
+        contact["phones"] = list(phones_found)
+
+        # Skip contacts with no useful information
+        has_name = bool(contact["first"].strip() or contact["last"].strip())
+        has_email = bool(contact["emails"])
+        has_phone = bool(contact["phones"])
+
+        if not (has_name or has_email or has_phone):
+            return None
+
+        # Stable ID for incremental re-imports, when the export has one
+        if hasattr(vcard, "uid") and vcard.uid.value.strip():
+            contact["uid"] = vcard.uid.value.strip()
+
+        # Extract photo if present
+        if hasattr(vcard, "photo"):
+            # VCard photos can be embedded or referenced
+            photo = vcard.photo
+            if hasattr(photo, "value"):
+                # This might be base64 encoded data
+                contact["embedded_photo"] = photo.value
+
+        return contact
+
+    except Exception as e:
+        if str(e).strip():  # Only log non-empty errors
+            logger.warning(f"Error parsing VCard: {e}")
+        return None
+
+
+def _parse_vcard_chunk(cards: list[str]) -> list[dict[str, Any]]:
+    """Parse a chunk of VCards; runs in a worker process."""
+    return [contact for contact in map(parse_vcard, cards) if contact]
+
+
+def _chunked(items: Iterable, size: int) -> Iterator[list]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
 
 class GoogleTakeoutParser:
     """Parser for Google Takeout contact exports."""
 
-    def __init__(self, zip_path: Path):
-        """Initialize parser with path to Google Takeout zip file."""
+    def __init__(self, zip_path: Path, workers: int = DEFAULT_PARSE_WORKERS):
+        """Initialize parser with path to Google Takeout zip file.
+
+        Args:
+            zip_path: Google Takeout zip file
+            workers: Parser processes; 1 parses in this process
+        """
         self.zip_path = zip_path
+        self.workers = workers
         self.logger = get_logger(__name__)
-        self.contacts = []
-        self.images = {}  # filename -> binary data mapping
 
     def validate_takeout_file(self) -> tuple[bool, str]:
         """Validate that this is a Google Takeout file with contacts."""
@@ -42,11 +201,7 @@ class GoogleTakeoutParser:
                 vcf_files = [f for f in file_list if f.endswith(".vcf")]
 
                 # Count potential profile images
-                image_files = [
-                    f
-                    for f in file_list
-                    if any(f.lower().endswith(ext) for ext in [".jpg", ".jpeg", ".png", ".gif"])
-                ]
+                image_files = [f for f in file_list if f.lower().endswith(IMAGE_EXTENSIONS)]
 
                 contact_count = len(vcf_files)
                 image_count = len(image_files)
@@ -58,182 +213,109 @@ class GoogleTakeoutParser:
         except Exception as e:
             return False, f"Error reading zip file: {e}"
 
-    def extract_contacts_and_images(self) -> tuple[list[dict[str, Any]], dict[str, bytes]]:
-        """Extract contacts and images from the Google Takeout zip file."""
+    def extract_contacts_and_images(
+        self, progress: ProgressCallback | None = None
+    ) -> tuple[list[dict[str, Any]], dict[str, str]]:
+        """Extract contacts from the Google Takeout zip file and match their images.
+
+        Image bytes are not read here: matched contacts carry the zip member
+        name in ``profile_image_member`` for ``load_profile_images``, and a
+        ``profile_image_fingerprint`` built from the member's CRC-32 and size.
+
+        Args:
+            progress: Optional callback, called with ("parse", contacts parsed, 0)
+
+        Returns:
+            Tuple of (contacts, image index mapping image filename to zip member)
+        """
         contacts = []
         images = {}
 
         try:
             with zipfile.ZipFile(self.zip_path, "r") as zip_ref:
-                file_list = zip_ref.namelist()
-
-                # Extract VCard files
-                vcf_files = [f for f in file_list if f.endswith(".vcf")]
-
-                for vcf_file in vcf_files:
-                    try:
-                        vcf_data = zip_ref.read(vcf_file).decode("utf-8")
-                        file_contacts = self._parse_vcard_file(vcf_data, vcf_file)
-                        contacts.extend(file_contacts)
-                    except Exception as e:
-                        self.logger.error(
-                            f"Error parsing VCard file {vcf_file}: {e}", exc_info=True
-                        )
-                        continue
-
-                # Extract image files
-                image_files = [
-                    f
-                    for f in file_list
-                    if any(f.lower().endswith(ext) for ext in [".jpg", ".jpeg", ".png", ".gif"])
-                ]
-
-                for image_file in image_files:
-                    try:
-                        image_data = zip_ref.read(image_file)
-                        # Extract just the filename for mapping
-                        filename = Path(image_file).name
-                        images[filename] = image_data
-                    except Exception as e:
-                        self.logger.error(
-                            f"Error extracting image {image_file}: {e}", exc_info=True
-                        )
-                        continue
+                images = self._image_index(zip_ref)
+                for chunk in self._parse_cards(self._iter_vcards(zip_ref)):
+                    contacts.extend(chunk)
+                    if progress:
+                        progress("parse", len(contacts), 0)
 
                 # Match images to contacts
                 self._match_images_to_contacts(contacts, images)
 
+                # Fingerprint matched images from the zip directory, without reading them
+                for contact in contacts:
+                    if contact.get("profile_image_member"):
+                        info = zip_ref.getinfo(contact["profile_image_member"])
+                        contact["profile_image_fingerprint"] = (
+                            f"zip-crc32:{info.CRC:08x}:{info.file_size}"
+                        )
+
         except Exception as e:
             self.logger.error(f"Error processing zip file: {e}", exc_info=True)
 
         return contacts, images
 
-    def _parse_vcard_file(self, vcf_data: str, filename: str) -> list[dict[str, Any]]:
-        """Parse a VCard file that may contain multiple contacts."""
-        contacts = []
-
-        try:
-            # Split on BEGIN:VCARD to handle multiple contacts
-            vcard_blocks = vcf_data.split("BEGIN:VCARD")
-
-            for i, block in enumerate(vcard_blocks):
-                if not block.strip():
-                    continue
-
-                # Reconstruct the complete VCard
-                vcard_text = "BEGIN:VCARD" + block
-
-                try:
-                    contact_data = self._parse_single_vcard(vcard_text)
-                    if contact_data:
-                        contacts.append(contact_data)
-                except Exception as e:
-                    # Log specific contact parsing errors but continue
-                    if str(e).strip():  # Only log non-empty errors
-                        self.logger.warning(f"Error parsing contact {i+1} in {filename}: {e}")
-                    continue
-
-        except Exception as e:
-            self.logger.error(f"Error parsing VCard file {filename}: {e}", exc_info=True)
-
-        return contacts
-
-    def _parse_single_vcard(self, vcf_data: str) -> dict[str, Any] | None:
-        """Parse a VCard string and extract contact information."""
-        try:
-            vcard = vobject.readOne(vcf_data)
-
-            contact = {
-                "first": "",
-                "last": "",
-                "emails": [],
-                "phones": [],
-                "profile_image": None,
-                "profile_image_filename": None,
-                "profile_image_mime_type": None,
-            }
-
-            # Extract name
-            if hasattr(vcard, "fn"):
-                full_name = vcard.fn.value.strip()
-                # Try to split into first/last
-                name_parts = full_name.split(" ", 1)
-                contact["first"] = name_parts[0] if name_parts else ""
-                contact["last"] = name_parts[1] if len(name_parts) > 1 else ""
-
-            if hasattr(vcard, "n"):
-                # More structured name info
-                name = vcard.n.value
-                if hasattr(name, "given"):
-                    contact["first"] = name.given or contact["first"]
-                if hasattr(name, "family"):
-                    contact["last"] = name.family or contact["last"]
-
-            # Extract emails - handle various email field formats
-            emails_found = set()  # Use set to avoid duplicates
-
-            # Standard email fields
-            if hasattr(vcard, "email_list"):
-                for email in vcard.email_list:
-                    email_value = email.value.strip()
-                    if email_value and "@" in email_value:
-                        emails_found.add(email_value)
-            elif hasattr(vcard, "email"):
-                email_value = vcard.email.value.strip()
-                if email_value and "@" in email_value:
-                    emails_found.add(email_value)
-
-            # Check for emails in item fields (common in Google contacts)
-            for attr_name in dir(vcard):
-                if attr_name.startswith("item") and hasattr(getattr(vcard, attr_name), "value"):
-                    try:
-                        item_value = getattr(vcard, attr_name).value.strip()
-                        if "@" in item_value and "." in item_value:
-                            emails_found.add(item_value)
-                    except (AttributeError, ValueError):
-                        continue
-
-            contact["emails"] = list(emails_found)
-
-            # Extract phone numbers
-            phones_found = set()  # Use set to avoid duplicates
-
-            if hasattr(vcard, "tel_list"):
-                for tel in vcard.tel_list:
-                    phone_value = tel.value.strip()
-                    if phone_value:
-                        phones_found.add(phone_value)
-            elif hasattr(vcard, "tel"):
-                phone_value = vcard.tel.value.strip()
-                if phone_value:
-                    phones_found.add(phone_value)
-
-            contact["phones"] = list(phones_found)
-
-            # Skip contacts with no useful information
-            has_name = bool(contact["first"].strip() or contact["last"].strip())
-            has_email = bool(contact["emails"])
-            has_phone = bool(contact["phones"])
-
-            if not (has_name or has_email or has_phone):
-                return None
-
-            # Extract photo if present
-            if hasattr(vcard, "photo"):
-                # VCard photos can be embedded or referenced
-                photo = vcard.photo
-                if hasattr(photo, "value"):
-                    # This might be base64 encoded data
-                    contact["embedded_photo"] = photo.value
-
-            return contact
-
-        except Exception as e:
-            self.logger.error(f"Error parsing VCard: {e}", exc_info=True)
-            return None
+    def _image_index(self, zip_ref: zipfile.ZipFile) -> dict[str, str]:
+        """Map each image's filename to its zip member name, without reading it."""
+        return {
+            Path(name).name: name
+            for name in zip_ref.namelist()
+            if name.lower().endswith(IMAGE_EXTENSIONS)
+        }
 
-    def _match_images_to_contacts(self, contacts: list[dict[str, Any]], images: dict[str, bytes]):
-        """Match profile images to contacts based on naming patterns."""
+    def _iter_vcards(self, zip_ref: zipfile.ZipFile) -> Iterator[str]:
+        """Yield the text of each VCard in the zip, reading the files line by line."""
+        for vcf_file in (f for f in zip_ref.namelist() if f.endswith(".vcf")):
+            try:
+                with zip_ref.open(vcf_file) as raw:
+                    lines: list[str] = []
+                    for line in io.TextIOWrapper(raw, encoding="utf-8", errors="replace"):
+                        if line.startswith("BEGIN:VCARD") and lines:
+                            yield "".join(lines)
+                            lines = []
+                        if lines or line.startswith("BEGIN:VCARD"):
+                            lines.append(line)
+                    if lines:
+                        yield "".join(lines)
+            except Exception as e:
+                self.logger.error(f"Error reading VCard file {vcf_file}: {e}", exc_info=True)
+
+    def _parse_cards(self, cards: Iterator[str]) -> Iterator[list[dict[str, Any]]]:
+        """Parse cards in chunks, on worker processes when there is more than one chunk.
+
+        At most two chunks per worker are in flight, so reading never runs far
+        ahead of parsing. Chunks come back in input order.
+        """
+        chunks = _chunked(cards, PARSE_CHUNK_SIZE)
+        first = next(chunks, None)
+        if first is None:
+            return
+        second = next(chunks, None)
+        if second is None or self.workers <= 1:
+            # Too small to be worth starting processes
+            for chunk in (first, second, *chunks):
+                if chunk:
+                    yield _parse_vcard_chunk(chunk)
+            return
+
+        # Spawned workers are safe to start from the threaded TUI
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=context) as executor:
+            pending = deque(executor.submit(_parse_vcard_chunk, c) for c in (first, second))
+            for chunk in chunks:
+                if len(pending) >= self.workers * 2:
+                    yield pending.popleft().result()
+                pending.append(executor.submit(_parse_vcard_chunk, chunk))
+            while pending:
+                yield pending.popleft().result()
+
+    def _match_images_to_contacts(self, contacts: list[dict[str, Any]], images: dict[str, str]):
+        """Match profile images to contacts based on naming patterns.
+
+        Args:
+            contacts: Parsed contacts
+            images: Image index from ``_image_index``
+        """
         # Google Takeout typically names profile images based on contact names
         # This is a heuristic approach since exact matching rules may vary
 
@@ -273,13 +355,36 @@ class GoogleTakeoutParser:
             # Look for matching image
             for name in possible_names:
                 if name in images:
-                    contact["profile_image"] = images[name]
+                    contact["profile_image_member"] = images[name]
                     contact["profile_image_filename"] = name
                     contact["profile_image_mime_type"] = (
                         mimetypes.guess_type(name)[0] or "image/jpeg"
                     )
                     break
 
+    def load_profile_images(self, contacts: list[dict[str, Any]]) -> None:
+        """Read the image bytes for contacts matched to an image, in place.
+
+        Args:
+            contacts: Contacts from ``extract_contacts_and_images``; the
+                ``profile_image_member`` reference is replaced by
+                ``profile_image`` bytes
+        """
+        members = [c for c in contacts if c.get("profile_image_member")]
+        if not members:
+            return
+
+        with zipfile.ZipFile(self.zip_path, "r") as zip_ref:
+            for contact in members:
+                member = contact.pop("profile_image_member")
+                try:
+                    contact["profile_image"] = zip_ref.read(member)
+                except Exception as e:
+                    self.logger.error(f"Error extracting image {member}: {e}", exc_info=True)
+                    contact["profile_image_filename"] = None
+                    contact["profile_image_mime_type"] = None
+                    contact["profile_image_fingerprint"] = None
+
     def get_preview_info(self) -> dict[str, Any]:
         """Get preview information about the takeout file."""
         is_valid, message = self.validate_takeout_file()
@@ -302,14 +407,14 @@ class GoogleTakeoutParser:
             first = contact.get("first", "")
             last = contact.get("last", "")
             name = f"{first} {last}".strip() or "(No name)"
-            has_image = contact.get("profile_image") is not None
+            has_image = contact.get("profile_image_filename") is not None
             sample_contacts.append({"name": name, "has_image": has_image})
 
         return {
             "valid": True,
             "contact_count": len(contacts),
             "image_count": len(images),
-            "contacts_with_images": len([c for c in contacts if c.get("profile_image")]),
+            "contacts_with_images": len([c for c in contacts if c.get("profile_image_filename")]),
             "sample_contacts": sample_contacts,
             "message": message,
         }
@@ -335,8 +440,21 @@ def find_takeout_files(data_dir: Path) -> list[Path]:
     return takeout_files
 
 
-def parse_takeout_contacts(zip_path: Path) -> tuple[list[dict[str, Any]], dict[str, Any]]:
-    """Parse contacts from a Google Takeout zip file."""
+def parse_takeout_contacts(
+    zip_path: Path, progress: ProgressCallback | None = None
+) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    """Parse contacts from a Google Takeout zip file.
+
+    Contacts matched to a profile image reference it by zip member; pass them
+    to ``insert_takeout_contacts`` to load the bytes while inserting.
+
+    Args:
+        zip_path: Google Takeout zip file
+        progress: Optional callback, called with ("parse", contacts parsed, 0)
+
+    Returns:
+        Tuple of (de-duplicated contacts, summary info)
+    """
     parser = GoogleTakeoutParser(zip_path)
 
     # Validate first
@@ -344,8 +462,8 @@ def parse_takeout_contacts(zip_path: Path) -> tuple[list[dict[str, Any]], dict[s
     if not is_valid:
         return [], {"error": message}
 
-    # Extract contacts and images
-    raw_contacts, images = parser.extract_contacts_and_images()
+    # Extract contacts and match images
+    raw_contacts, images = parser.extract_contacts_and_images(progress)
 
     # Apply naive de-duplication
     deduplicated_contacts = deduplicate_contacts(raw_contacts)
@@ -356,103 +474,59 @@ def parse_takeout_contacts(zip_path: Path) -> tuple[list[dict[str, Any]], dict[s
         "raw_contact_count": len(raw_contacts),
         "duplicates_removed": len(raw_contacts) - len(deduplicated_contacts),
         "image_count": len(images),
-        "contacts_with_images": len([c for c in deduplicated_contacts if c.get("profile_image")]),
+        "contacts_with_images": len(
+            [c for c in deduplicated_contacts if c.get("profile_image_filename")]
+        ),
         "message": message,
     }
 
     return deduplicated_contacts, info
 
 
-def deduplicate_contacts(contacts: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    """
-    Naive de-duplication algorithm:
-    If contacts have the same email or phone, merge them instead of creating duplicates.
+def insert_takeout_contacts(
+    zip_path: Path,
+    contacts: list[dict[str, Any]],
+    insert: Callable[[list[dict[str, Any]]], bool],
+    progress: ProgressCallback | None = None,
+    batch_size: int = IMPORT_BATCH_SIZE,
+) -> bool:
+    """Insert parsed takeout contacts in batches, loading each batch's images.
+
+    Args:
+        zip_path: Google Takeout zip file the contacts were parsed from
+        contacts: Contacts from ``parse_takeout_contacts``
+        insert: Inserts one batch and returns True on success, e.g.
+            ``PRTAPI.insert_contacts``
+        progress: Optional callback, called with ("insert", inserted, total)
+        batch_size: Contacts per ``insert`` call
+
+    Returns:
+        True if every batch was inserted; stops at the first failed batch
     """
-    # Tracking structures
-    email_to_contact = {}  # email -> contact_index in deduplicated list
-    phone_to_contact = {}  # phone -> contact_index in deduplicated list
-    deduplicated = []
-
-    for contact in contacts:
-        emails = contact.get("emails", [])
-        phones = contact.get("phones", [])
-
-        # Check if this contact is a duplicate based on email or phone
-        existing_contact_idx = None
-
-        # Check emails first
-        for email in emails:
-            if email and email in email_to_contact:
-                existing_contact_idx = email_to_contact[email]
-                break
-
-        # If no email match, check phones
-        if existing_contact_idx is None:
-            for phone in phones:
-                if phone and phone in phone_to_contact:
-                    existing_contact_idx = phone_to_contact[phone]
-                    break
+    parser = GoogleTakeoutParser(zip_path)
+    for start in range(0, len(contacts), batch_size):
+        batch = contacts[start : start + batch_size]
+        parser.load_profile_images(batch)
+        if not insert(batch):
+            return False
+        # Drop the image bytes once they are in the database
+        for contact in batch:
+            contact["profile_image"] = None
+        if progress:
+            progress("insert", start + len(batch), len(contacts))
+    return True
 
-        if existing_contact_idx is not None:
-            # Merge with existing contact
-            existing_contact = deduplicated[existing_contact_idx]
-            merged_contact = merge_contacts(existing_contact, contact)
-            deduplicated[existing_contact_idx] = merged_contact
-
-            # Update tracking for new emails/phones
-            for email in emails:
-                if email:
-                    email_to_contact[email] = existing_contact_idx
-            for phone in phones:
-                if phone:
-                    phone_to_contact[phone] = existing_contact_idx
-        else:
-            # New unique contact
-            new_idx = len(deduplicated)
-            deduplicated.append(contact)
 
-            # Track this contact's emails and phones
-            for email in emails:
-                if email:
-                    email_to_contact[email] = new_idx
-            for phone in phones:
-                if phone:
-                    phone_to_contact[phone] = new_idx
+def deduplicate_contacts(contacts: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Merge contacts that share a normalized email or phone number.
 
-    return deduplicated
+    Matching is transitive: a contact that shares an email with one contact
+    and a phone with another merges all three, whatever the input order.
 
+    Args:
+        contacts: Parsed contacts
 
-def merge_contacts(existing: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
-    """
-    Merge two contacts, preserving all useful information.
-    Priority: take non-empty values from either contact.
+    Returns:
+        One merged contact per cluster, ordered by each cluster's first contact
     """
-    merged = existing.copy()
-
-    # Merge names - prefer non-empty values
-    if not merged.get("first", "").strip() and new.get("first", "").strip():
-        merged["first"] = new["first"]
-    if not merged.get("last", "").strip() and new.get("last", "").strip():
-        merged["last"] = new["last"]
-
-    # Merge emails - combine and deduplicate
-    existing_emails = set(merged.get("emails", []))
-    new_emails = set(new.get("emails", []))
-    merged["emails"] = list(existing_emails | new_emails)
-
-    # Merge phones - combine and deduplicate
-    existing_phones = set(merged.get("phones", []))
-    new_phones = set(new.get("phones", []))
-    merged["phones"] = list(existing_phones | new_phones)
-
-    # Merge profile image - prefer contact with image
-    if not merged.get("profile_image") and new.get("profile_image"):
-        merged["profile_image"] = new["profile_image"]
-        merged["profile_image_filename"] = new.get("profile_image_filename")
-        merged["profile_image_mime_type"] = new.get("profile_image_mime_type")
-
-    # Merge embedded photo URL if available
-    if not merged.get("embedded_photo") and new.get("embedded_photo"):
-        merged["embedded_photo"] = new["embedded_photo"]
-
-    return merged
+    return ContactClusterer().plan(contacts).contacts
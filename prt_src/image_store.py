@@ -0,0 +1,239 @@
+"""
+Content-addressed profile image store
+
+Profile images are stored once per distinct content in the ``images`` table,
+keyed by the SHA-256 of their bytes, and contacts reference them through
+``contacts.profile_image_hash``. Contact rows stay small, and contacts merged
+from the same photo share one copy.
+
+Downscaled JPEG thumbnails are generated with Pillow when an image is stored
+and kept in ``image_thumbnails``. Readers ask for the size they are going to
+display and get the smallest stored variant that covers it: a thumbnail, or
+the original when no thumbnail is large enough.
+"""
+
+import hashlib
+import io
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+from PIL import Image as PILImage
+from sqlalchemy import func
+from sqlalchemy import insert
+from sqlalchemy import select
+
+from .logging_config import get_logger
+from .models import IN_CLAUSE_BATCH_SIZE
+from .models import Image
+from .models import ImageThumbnail
+
+logger = get_logger(__name__)
+
+# Bounding box edges, in pixels, of the thumbnails made for every image:
+# 64 for the TUI contact detail, 256 for directory export cards at 2x
+THUMBNAIL_SIZES = (64, 256)
+THUMBNAIL_QUALITY = 85
+
+# Left in contacts.profile_image for contacts whose image is in the store, so
+# "profile_image IS NOT NULL" and its partial indexes keep meaning "has a photo"
+IMAGE_IN_STORE = b""
+
+
+@dataclass
+class Thumbnail:
+    """One generated thumbnail."""
+
+    size: int
+    width: int
+    height: int
+    data: bytes
+
+
+def content_hash(data: bytes) -> str:
+    """Return the store key of an image: the SHA-256 hex digest of its bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def make_thumbnails(
+    data: bytes, sizes: tuple[int, ...] = THUMBNAIL_SIZES
+) -> tuple[tuple[int, int] | None, list[Thumbnail]]:
+    """Decode an image and downscale it to each thumbnail size it exceeds.
+
+    Images are never upscaled: sizes at or above the original's longest edge
+    get no thumbnail, since the original already covers them.
+
+    Args:
+        data: Encoded image bytes
+        sizes: Bounding box edges in pixels
+
+    Returns:
+        Tuple of ((width, height) of the original, thumbnails by ascending
+        size), or (None, []) if Pillow can't decode the image
+    """
+    try:
+        with PILImage.open(io.BytesIO(data)) as image:
+            dimensions = image.size
+            # JPEG decoding can scale by 1/2 to 1/8 on the fly; ask for just
+            # enough resolution for the largest thumbnail
+            image.draft("RGB", (max(sizes), max(sizes)))
+            source = _to_rgb(image)
+    except (OSError, ValueError, PILImage.DecompressionBombError) as e:
+        logger.warning(f"Could not decode image for thumbnails: {e}")
+        return None, []
+
+    thumbnails = []
+    for size in sorted(sizes):
+        if max(dimensions) <= size:
+            break
+        thumbnail = source.copy()
+        thumbnail.thumbnail((size, size), PILImage.Resampling.LANCZOS)
+        buffer = io.BytesIO()
+        thumbnail.save(buffer, "JPEG", quality=THUMBNAIL_QUALITY, optimize=True)
+        thumbnails.append(Thumbnail(size, thumbnail.width, thumbnail.height, buffer.getvalue()))
+    return dimensions, thumbnails
+
+
+def iter_blob_chunks(
+    session, column, conditions: tuple, total: int, chunk_size: int
+) -> Iterator[bytes]:
+    """Stream a BLOB column of one row in chunks with substr().
+
+    Args:
+        session: SQLAlchemy session or connection
+        column: BLOB column to read
+        conditions: WHERE conditions selecting the row
+        total: Length of the BLOB in bytes
+        chunk_size: Maximum number of bytes per yielded chunk
+
+    Yields:
+        Consecutive byte chunks of the BLOB
+    """
+    # SQLite's substr() is 1-based and works on bytes for BLOB values
+    for offset in range(1, total + 1, chunk_size):
+        yield session.scalar(select(func.substr(column, offset, chunk_size)).where(*conditions))
+
+
+def _to_rgb(image: PILImage.Image) -> PILImage.Image:
+    """Convert to RGB for JPEG, putting transparent images on white."""
+    if image.mode in ("RGBA", "LA", "P"):
+        image = image.convert("RGBA")
+        background = PILImage.new("RGB", image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel("A"))
+        return background
+    return image.convert("RGB")
+
+
+class ImageStore:
+    """Reads and writes the image tables through a session or connection."""
+
+    def __init__(self, session):
+        """Initialize the store.
+
+        Args:
+            session: SQLAlchemy session; writes join its current transaction
+        """
+        self.session = session
+
+    def put(self, data: bytes, mime_type: str | None = None) -> str:
+        """Store an image unless it is already stored and return its hash."""
+        return self.put_many([(data, mime_type)])[0]
+
+    def put_many(self, images: list[tuple[bytes, str | None]]) -> list[str]:
+        """Store images and their thumbnails, skipping content already stored.
+
+        Thumbnails are only generated for images new to the store.
+
+        Args:
+            images: (bytes, MIME type) pairs
+
+        Returns:
+            Content hash of each image, in input order
+        """
+        hashes = [content_hash(data) for data, _mime_type in images]
+        new: dict[str, tuple[bytes, str | None]] = {}
+        for image_hash, image in zip(hashes, images, strict=True):
+            new.setdefault(image_hash, image)
+
+        candidates = list(new)
+        for start in range(0, len(candidates), IN_CLAUSE_BATCH_SIZE):
+            batch = candidates[start : start + IN_CLAUSE_BATCH_SIZE]
+            for stored in self.session.scalars(select(Image.hash).where(Image.hash.in_(batch))):
+                del new[stored]
+
+        image_rows = []
+        thumbnail_rows = []
+        for image_hash, (data, mime_type) in new.items():
+            dimensions, thumbnails = make_thumbnails(data)
+            width, height = dimensions or (None, None)
+            image_rows.append(
+                {
+                    "hash": image_hash,
+                    "mime_type": mime_type,
+                    "width": width,
+                    "height": height,
+                    "byte_size": len(data),
+                    "data": data,
+                }
+            )
+            thumbnail_rows.extend(
+                {
+                    "image_hash": image_hash,
+                    "size": thumbnail.size,
+                    "width": thumbnail.width,
+                    "height": thumbnail.height,
+                    "byte_size": len(thumbnail.data),
+                    "data": thumbnail.data,
+                }
+                for thumbnail in thumbnails
+            )
+        if image_rows:
+            self.session.execute(insert(Image), image_rows)
+        if thumbnail_rows:
+            self.session.execute(insert(ImageThumbnail), thumbnail_rows)
+        return hashes
+
+    def thumbnail_size(self, image_hash: str, size: int | None) -> int | None:
+        """Return the smallest thumbnail size covering ``size``, or None for the original."""
+        if size is None:
+            return None
+        return self.session.scalar(
+            select(ImageThumbnail.size)
+            .where(ImageThumbnail.image_hash == image_hash, ImageThumbnail.size >= size)
+            .order_by(ImageThumbnail.size)
+            .limit(1)
+        )
+
+    def get(self, image_hash: str, size: int | None = None) -> bytes | None:
+        """Load an image, or the smallest variant of it that is at least ``size`` pixels.
+
+        Args:
+            image_hash: Content hash of the image
+            size: Pixels the caller will display along the longest edge;
+                None for the original
+
+        Returns:
+            Image bytes, or None if the hash isn't stored
+        """
+        column, condition, _byte_size = self._variant(image_hash, size)
+        return self.session.scalar(select(column).where(*condition))
+
+    def iter_chunks(
+        self, image_hash: str, chunk_size: int, size: int | None = None
+    ) -> Iterator[bytes]:
+        """Stream an image variant, chosen as in ``get``, without loading it whole.
+
+        Yields:
+            Consecutive byte chunks; nothing if the hash isn't stored
+        """
+        column, condition, byte_size = self._variant(image_hash, size)
+        total = self.session.scalar(select(byte_size).where(*condition))
+        if total:
+            yield from iter_blob_chunks(self.session, column, condition, total, chunk_size)
+
+    def _variant(self, image_hash: str, size: int | None):
+        """Column, WHERE condition and size column of the variant to read."""
+        thumbnail_size = self.thumbnail_size(image_hash, size)
+        if thumbnail_size is None:
+            return Image.data, (Image.hash == image_hash,), Image.byte_size
+        condition = (ImageThumbnail.image_hash == image_hash, ImageThumbnail.size == thumbnail_size)
+        return ImageThumbnail.data, condition, ImageThumbnail.byte_size
@@ -0,0 +1,238 @@
+"""
+Index advisor for the database's hot queries
+
+Runs ``EXPLAIN QUERY PLAN`` over a catalogue of the queries the TUI, CLI and
+LLM tools issue most, and flags any plan step that reads a whole table
+(``SCAN <table>``, with or without an index). The catalogue mirrors the SQL
+the ORM generates for each query, with placeholder parameters; the plan does
+not depend on the values.
+
+Some queries scan by design, e.g. a join that visits every relationship
+type, or the first page of contacts read in index order until ``LIMIT`` is
+reached. Their catalogue entries list those tables in ``allowed_scans``,
+optionally with the index the scan has to go through, so only unexpected
+scans are reported.
+"""
+
+import re
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+
+from sqlalchemy import text
+
+# Plan details look like "SCAN contacts", "SCAN c USING INDEX idx_contacts_name",
+# "SEARCH r USING INDEX ..." or "SCAN CONSTANT ROW"
+_SCAN_PATTERN = re.compile(r"^SCAN (?:TABLE )?(\w+)(.*)$")
+_INDEX_PATTERN = re.compile(r"USING (?:COVERING )?INDEX (\w+)")
+
+
+@dataclass(frozen=True)
+class HotQuery:
+    """One catalogued query."""
+
+    name: str
+    sql: str
+    params: dict[str, Any] = field(default_factory=dict)
+    # Table -> index the scan must use, or None if any full scan is expected
+    allowed_scans: dict[str, str | None] = field(default_factory=dict)
+
+
+@dataclass
+class QueryPlanReport:
+    """Query plan of one catalogued query and the full table scans it does."""
+
+    name: str
+    plan: list[str]
+    full_scans: list[str]
+
+    @property
+    def flagged(self) -> bool:
+        return bool(self.full_scans)
+
+
+HOT_QUERIES: list[HotQuery] = [
+    HotQuery(
+        "relationships_from_contact",
+        """
+        SELECT r.id, t.type_key, c.id, c.name FROM contact_relationships r
+        JOIN relationship_types t ON r.type_id = t.id
+        JOIN contacts c ON r.to_contact_id = c.id
+        WHERE r.from_contact_id = :contact_id
+        """,
+        {"contact_id": 1},
+    ),
+    HotQuery(
+        "relationships_to_contact",
+        """
+        SELECT r.id, t.type_key, c.id, c.name FROM contact_relationships r
+        JOIN relationship_types t ON r.type_id = t.id
+        JOIN contacts c ON r.from_contact_id = c.id
+        WHERE r.to_contact_id = :contact_id AND t.is_symmetrical = 1
+        """,
+        {"contact_id": 1},
+    ),
+    HotQuery(
+        "relationships_of_type",
+        "SELECT from_contact_id, to_contact_id FROM contact_relationships WHERE type_id = :type_id",
+        {"type_id": 1},
+    ),
+    HotQuery(
+        "mutual_connection_candidates",
+        """
+        SELECT DISTINCT c.id FROM contacts c
+        JOIN contact_relationships r
+          ON (r.from_contact_id = :contact_id AND r.to_contact_id = c.id)
+          OR (r.to_contact_id = :contact_id AND r.from_contact_id = c.id)
+        """,
+        {"contact_id": 1},
+        # The OR join is driven from contacts; each contact probes both indexes
+        {"contacts": None},
+    ),
+    HotQuery(
+        "contacts_by_tag",
+        """
+        SELECT DISTINCT c.id, c.name FROM contacts c
+        JOIN contact_metadata m ON m.contact_id = c.id
+        JOIN metadata_tags mt ON mt.metadata_id = m.id
+        JOIN tags t ON t.id = mt.tag_id
+        WHERE t.name = :tag_name
+        ORDER BY c.name
+        """,
+        {"tag_name": "friend"},
+    ),
+    HotQuery(
+        "contacts_grouped_by_tag_ids",
+        """
+        SELECT DISTINCT mt.tag_id, c.id, c.name FROM metadata_tags mt
+        JOIN contact_metadata m ON m.id = mt.metadata_id
+        JOIN contacts c ON c.id = m.contact_id
+        WHERE mt.tag_id IN (:tag_a, :tag_b)
+        ORDER BY mt.tag_id, c.name, c.id
+        """,
+        {"tag_a": 1, "tag_b": 2},
+    ),
+    HotQuery(
+        "contacts_by_note",
+        """
+        SELECT DISTINCT c.id, c.name FROM contacts c
+        JOIN contact_metadata m ON m.contact_id = c.id
+        JOIN metadata_notes mn ON mn.metadata_id = m.id
+        JOIN notes n ON n.id = mn.note_id
+        WHERE n.title = :note_title
+        ORDER BY c.name
+        """,
+        {"note_title": "Met at conference"},
+    ),
+    HotQuery(
+        "contacts_grouped_by_note_ids",
+        """
+        SELECT DISTINCT mn.note_id, c.id, c.name FROM metadata_notes mn
+        JOIN contact_metadata m ON m.id = mn.metadata_id
+        JOIN contacts c ON c.id = m.contact_id
+        WHERE mn.note_id IN (:note_a, :note_b)
+        ORDER BY mn.note_id, c.name, c.id
+        """,
+        {"note_a": 1, "note_b": 2},
+    ),
+    HotQuery(
+        "contacts_page_first",
+        "SELECT id, name FROM contacts ORDER BY name, id LIMIT :limit",
+        {"limit": 50},
+        # Reading the name index in order stops after one page
+        {"contacts": "idx_contacts_name"},
+    ),
+    HotQuery(
+        "contacts_page_after",
+        """
+        SELECT id, name FROM contacts WHERE (name, id) > (:after_name, :after_id)
+        ORDER BY name, id LIMIT :limit
+        """,
+        {"after_name": "M", "after_id": 1, "limit": 50},
+    ),
+    HotQuery(
+        "contacts_with_images",
+        "SELECT id, name FROM contacts WHERE profile_image IS NOT NULL ORDER BY name",
+        # The partial index only holds contacts that have an image
+        allowed_scans={"contacts": "idx_contacts_profile_image_not_null"},
+    ),
+    HotQuery(
+        "relationship_type_distribution",
+        """
+        SELECT t.type_key, COUNT(r.id) FROM relationship_types t
+        JOIN contact_relationships r ON r.type_id = t.id
+        GROUP BY t.id
+        """,
+        # One row per type, so visiting every type is the point
+        allowed_scans={"relationship_types": None},
+    ),
+]
+
+
+def explain(session, sql: str, params: dict[str, Any] | None = None) -> list[str]:
+    """Return the ``EXPLAIN QUERY PLAN`` details of a query.
+
+    Args:
+        session: SQLAlchemy session or connection
+        sql: Query to explain
+        params: Bound parameters for the query
+
+    Returns:
+        One plan detail string per plan step, in plan order
+    """
+    rows = session.execute(text(f"EXPLAIN QUERY PLAN {sql}"), params or {}).fetchall()
+    # Rows are (id, parent, notused, detail)
+    return [row[3] for row in rows]
+
+
+def full_table_scans(
+    plan: list[str], aliases: dict[str, str] | None = None
+) -> list[tuple[str, str | None]]:
+    """Find plan steps that read a whole table or a whole index.
+
+    Args:
+        plan: Plan details from ``explain``
+        aliases: Optional alias-to-table mapping used to name the scanned table
+
+    Returns:
+        ``(table, index)`` pairs in plan order; ``index`` is None when the
+        table itself is scanned
+    """
+    aliases = aliases or {}
+    scans = []
+    for detail in plan:
+        match = _SCAN_PATTERN.match(detail)
+        if not match or match.group(1) == "CONSTANT":
+            continue
+        index = _INDEX_PATTERN.search(match.group(2))
+        name = match.group(1)
+        scans.append((aliases.get(name, name), index.group(1) if index else None))
+    return scans
+
+
+def _table_aliases(sql: str) -> dict[str, str]:
+    """Map the aliases in a catalogued query's FROM/JOIN clauses to their tables."""
+    pairs = re.findall(r"\b(?:FROM|JOIN)\s+(\w+)\s+(?:AS\s+)?(\w+)", sql, re.IGNORECASE)
+    return {alias: table for table, alias in pairs if alias.upper() not in ("ON", "WHERE")}
+
+
+def advise(session, queries: list[HotQuery] | None = None) -> list[QueryPlanReport]:
+    """Explain each catalogued query and report its unexpected full table scans.
+
+    Args:
+        session: SQLAlchemy session or connection on the database to check
+        queries: Queries to check; defaults to ``HOT_QUERIES``
+
+    Returns:
+        One report per query, in catalogue order
+    """
+    reports = []
+    for query in queries if queries is not None else HOT_QUERIES:
+        plan = explain(session, query.sql, query.params)
+        full_scans = []
+        for table, index in full_table_scans(plan, _table_aliases(query.sql)):
+            if table in query.allowed_scans and query.allowed_scans[table] in (None, index):
+                continue
+            full_scans.append(f"{table} (via {index})" if index else table)
+        reports.append(QueryPlanReport(name=query.name, plan=plan, full_scans=full_scans))
+    return reports
@@ -1,23 +1,40 @@
 """Enhanced base classes for LLM implementations with shared functionality."""
 
-import json
+import asyncio
+import threading
+import time
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+from collections.abc import Generator
+from collections.abc import Iterator
 from typing import Any
 
 from .api import PRTAPI
 from .config import LLMConfigManager
+from .db import Database
 from .llm_prompts import LLMPromptGenerator
+from .llm_tool_results import ToolResultSerializer
+from .llm_tool_scheduler import ToolScheduler
 from .llm_tools import LLMToolRegistry
 from .llm_tools import Tool
 from .logging_config import get_logger
+from .schema_manager import SchemaManager
 
 logger = get_logger(__name__)
 
+EMPTY_RESPONSE_MESSAGE = (
+    "I received your message but didn't generate a response. Please try rephrasing your question."
+)
+
 
 class BaseLLM(ABC):
     """Enhanced base class with shared functionality and protocol abstraction."""
 
+    # Providers that implement _stream_message_with_tools set this to True
+    supports_streaming = False
+
     def __init__(self, api: PRTAPI, config_manager: LLMConfigManager):
         """Initialize base LLM with API and config manager.
 
@@ -34,8 +51,27 @@ class BaseLLM(ABC):
         self.tool_registry = LLMToolRegistry(api, disabled_tools_set)
         self.tools = self.tool_registry.get_all_tools()
         self.prompt_generator = LLMPromptGenerator(self.tools)
+        self.result_serializer = ToolResultSerializer(
+            self.tool_registry.get_result_shapes(), default=self._json_serializer
+        )
+
+        db = getattr(api, "db", None)
+        self.tool_scheduler = ToolScheduler(
+            lambda name, arguments: self._call_tool(name, arguments),
+            self.tool_registry.get_read_tool_names(),
+            read_session=db.read_session if isinstance(db, Database) else None,
+        )
 
         self.conversation_history = []
+        self.tool_token_savings: list[dict[str, int]] = []
+        self.tool_timings: list[dict[str, Any]] = []
+        # Backup shared by every write tool of the current turn
+        self._turn_backup: dict[str, Any] | None = None
+        self.last_stream_metrics: dict[str, float] = {}
+
+        # Rendered system prompt and tool schemas, reused until the cache key changes
+        self._prompt_cache: dict[str, Any] = {}
+        self._prompt_cache_key: tuple | None = None
 
     @abstractmethod
     def _send_message_with_tools(self, messages: list[dict], tools: list[Tool]) -> Any:
@@ -73,12 +109,8 @@ class BaseLLM(ABC):
         self.conversation_history.append({"role": "user", "content": message})
 
         try:
-            # Create system prompt using shared generator
-            system_prompt = self.prompt_generator.create_system_prompt(
-                provider=self._get_provider_name(),
-                schema_detail="essential",
-                model=self._get_model_name(),
-            )
+            # Cached system prompt keeps the message prefix identical across turns
+            system_prompt = self._system_prompt()
 
             # Prepare messages for provider
             messages = [{"role": "system", "content": system_prompt}] + self.conversation_history
@@ -101,16 +133,7 @@ class BaseLLM(ABC):
 
             # Execute tool calls using shared logic
             if tool_calls:
-                tool_results = []
-                for tool_call in tool_calls:
-                    result = self._call_tool(tool_call["name"], tool_call.get("arguments", {}))
-                    tool_results.append(
-                        {
-                            "tool_call_id": tool_call.get("id", ""),
-                            "name": tool_call["name"],
-                            "result": result,
-                        }
-                    )
+                tool_results = self._execute_tool_calls(tool_calls)
 
                 # Add tool results to conversation
                 self._add_tool_results_to_history(tool_calls, tool_results)
@@ -133,7 +156,7 @@ class BaseLLM(ABC):
             else:
                 # Handle empty response
                 logger.warning("[LLM] Received empty response content")
-                assistant_message = "I received your message but didn't generate a response. Please try rephrasing your question."
+                assistant_message = EMPTY_RESPONSE_MESSAGE
                 self.conversation_history.append(
                     {"role": "assistant", "content": assistant_message}
                 )
@@ -144,6 +167,317 @@ class BaseLLM(ABC):
             logger.error(f"[LLM] Error in chat: {e}")
             return f"Error: {e}"
 
+    def chat_stream(self, message: str) -> Iterator[str]:
+        """Chat like ``chat`` but yield the response text as it is generated.
+
+        Providers without streaming support yield the whole ``chat`` response
+        as a single chunk. Time to first token is logged and kept in
+        ``last_stream_metrics``.
+
+        Args:
+            message: User message
+
+        Yields:
+            Response text chunks; joined they form the assistant message
+        """
+        started = time.perf_counter()
+        first_token_at = None
+
+        for chunk in self._generate_stream(message):
+            if first_token_at is None and chunk:
+                first_token_at = time.perf_counter()
+                logger.info(f"[LLM] Time to first token: {first_token_at - started:.2f}s")
+            yield chunk
+
+        total = time.perf_counter() - started
+        self.last_stream_metrics = {
+            "time_to_first_token": (first_token_at or time.perf_counter()) - started,
+            "total_time": total,
+        }
+        logger.info(f"[LLM] Streamed response in {total:.2f}s")
+
+    async def stream_chat(self, message: str) -> AsyncIterator[str]:
+        """Async generator over ``chat_stream`` for event-loop callers such as the TUI.
+
+        The blocking provider calls run in a worker thread and chunks are handed
+        to the event loop as they arrive. Closing the generator early stops the
+        worker after its current chunk.
+
+        Args:
+            message: User message
+
+        Yields:
+            Response text chunks
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        cancelled = threading.Event()
+        finished = object()
+
+        def produce() -> None:
+            stream = self.chat_stream(message)
+            try:
+                for chunk in stream:
+                    if cancelled.is_set():
+                        break
+                    loop.call_soon_threadsafe(queue.put_nowait, chunk)
+            finally:
+                stream.close()
+                loop.call_soon_threadsafe(queue.put_nowait, finished)
+
+        worker = loop.run_in_executor(None, produce)
+        try:
+            while True:
+                chunk = await queue.get()
+                if chunk is finished:
+                    break
+                yield chunk
+        finally:
+            cancelled.set()
+            await worker
+
+    def _generate_stream(self, message: str) -> Iterator[str]:
+        """Run one chat turn, yielding response text as the provider streams it."""
+        if not self.supports_streaming:
+            yield self.chat(message)
+            return
+
+        self.conversation_history.append({"role": "user", "content": message})
+        # The fallback may discard the first answer in favour of suggested tools,
+        # so only stream it straight through when there is nothing to fall back to
+        suggested_tools = self._detect_tool_suggestions(message)
+
+        try:
+            system_prompt = self._system_prompt()
+            messages = [{"role": "system", "content": system_prompt}] + self.conversation_history
+
+            if suggested_tools:
+                response = self._drain(self._stream_message_with_tools(messages, self.tools))
+                streamed = ""
+            else:
+                streamed, response = yield from self._relay(
+                    self._stream_message_with_tools(messages, self.tools)
+                )
+
+            tool_calls = self._extract_tool_calls(response)
+            if not tool_calls and suggested_tools:
+                logger.info(
+                    f"[LLM] Detected {len(suggested_tools)} tool suggestions in user message, executing them"
+                )
+                tool_calls = suggested_tools
+
+            if tool_calls:
+                tool_results = self._execute_tool_calls(tool_calls)
+                self._add_tool_results_to_history(tool_calls, tool_results)
+
+                final_messages = [
+                    {"role": "system", "content": system_prompt}
+                ] + self.conversation_history
+                streamed, response = yield from self._relay(
+                    self._stream_message_with_tools(final_messages, self.tools)
+                )
+
+            if streamed.strip():
+                assistant_message = streamed
+            else:
+                assistant_message = self._extract_assistant_message(response)
+                if not assistant_message:
+                    logger.warning("[LLM] Received empty response content")
+                    assistant_message = EMPTY_RESPONSE_MESSAGE
+                yield assistant_message
+
+            self.conversation_history.append({"role": "assistant", "content": assistant_message})
+
+        except Exception as e:
+            logger.error(f"[LLM] Error in chat: {e}")
+            yield f"Error: {e}"
+
+    @staticmethod
+    def _relay(stream: Generator[str, None, Any]) -> Generator[str, None, tuple[str, Any]]:
+        """Pass a provider stream through, returning its text and final response."""
+        parts = []
+        try:
+            while True:
+                try:
+                    chunk = next(stream)
+                except StopIteration as stop:
+                    return "".join(parts), stop.value
+                parts.append(chunk)
+                yield chunk
+        finally:
+            stream.close()
+
+    @staticmethod
+    def _drain(stream: Generator[str, None, Any]) -> Any:
+        """Consume a provider stream without yielding, returning its final response."""
+        while True:
+            try:
+                next(stream)
+            except StopIteration as stop:
+                return stop.value
+
+    def _stream_message_with_tools(
+        self, messages: list[dict], tools: list[Tool]
+    ) -> Generator[str, None, Any]:
+        """Stream a message with tools to the provider.
+
+        Providers that set ``supports_streaming`` implement this as a generator
+        that yields content deltas and returns the complete response, in the
+        same shape ``_send_message_with_tools`` returns.
+
+        Args:
+            messages: Message history in provider format
+            tools: Available tools
+
+        Returns:
+            Generator of content deltas whose return value is the full response
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support streaming")
+
+    def _current_prompt_cache_key(self) -> tuple:
+        """Everything the rendered system prompt and tool schemas depend on."""
+        return (
+            self._get_provider_name(),
+            self._get_model_name(),
+            SchemaManager.CURRENT_VERSION,
+            tuple(sorted(self.tool_registry.disabled_tools)),
+        )
+
+    def _cached_prompt_part(self, name: str, build: Callable[[], Any]) -> Any:
+        """Return a cached prompt part, rebuilding every part when the cache key changes.
+
+        Ollama reuses its KV cache for the longest unchanged prefix of the
+        prompt, so the system prompt and tool list are rendered once and sent
+        byte-identically on every turn until the key changes.
+
+        Args:
+            name: Cache slot
+            build: Builds the part on a cache miss
+
+        Returns:
+            The cached part
+        """
+        key = self._current_prompt_cache_key()
+        if key != self._prompt_cache_key:
+            if self._prompt_cache_key is not None:
+                logger.info(f"[LLM] Prompt cache invalidated: {self._prompt_cache_key} -> {key}")
+            self._prompt_cache = {}
+            self._prompt_cache_key = key
+        if name not in self._prompt_cache:
+            self._prompt_cache[name] = build()
+        return self._prompt_cache[name]
+
+    def _system_prompt(self) -> str:
+        """Return the rendered system prompt for the current provider and model."""
+        return self._cached_prompt_part(
+            "system_prompt",
+            lambda: self.prompt_generator.create_system_prompt(
+                provider=self._get_provider_name(),
+                schema_detail="essential",
+                model=self._get_model_name(),
+            ),
+        )
+
+    def _tool_schemas(self) -> list[dict[str, Any]]:
+        """Return the tool schemas sent with each request."""
+        return self._cached_prompt_part("tool_schemas", self._format_tool_calls)
+
+    def _format_tool_calls(self) -> list[dict[str, Any]]:
+        """Format tools as function-calling schemas.
+
+        Returns:
+            One ``{"type": "function", "function": {...}}`` entry per tool
+        """
+        return [
+            {
+                "type": "function",
+                "function": {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "parameters": tool.parameters,
+                },
+            }
+            for tool in self.tools
+        ]
+
+    def set_disabled_tools(self, disabled_tools: set[str]) -> None:
+        """Change which tools are offered to the model.
+
+        Args:
+            disabled_tools: Names of tools to withhold
+        """
+        self.tool_registry.disabled_tools = set(disabled_tools)
+        self.tools = self.tool_registry.get_all_tools()
+        self.prompt_generator.tools = self.tools
+
+    def _execute_tool_calls(self, tool_calls: list[dict]) -> list[dict]:
+        """Run the tool calls of one turn.
+
+        Consecutive read-only calls run concurrently, each in its own read
+        session; write calls run one at a time in call order. When a turn has
+        several writes they share one auto-backup taken before the first.
+
+        Args:
+            tool_calls: Standardized tool calls with ``name``, ``arguments`` and ``id``
+
+        Returns:
+            Tool results in call order
+        """
+        writes = [
+            call["name"]
+            for call in tool_calls
+            if self._is_write_operation(call["name"])
+            and call["name"] != "create_backup_with_comment"
+        ]
+        if len(writes) > 1:
+            self._turn_backup = self._create_turn_backup(writes)
+        try:
+            results, timings = self.tool_scheduler.run(tool_calls)
+        finally:
+            self._turn_backup = None
+
+        self.tool_timings = [timing.to_dict() for timing in timings]
+        logger.info(
+            "[LLM] Tool latency: "
+            + ", ".join(f"{t.name}={t.seconds * 1000:.0f}ms" for t in timings)
+        )
+        return [
+            {"tool_call_id": call.get("id", ""), "name": call["name"], "result": result}
+            for call, result in zip(tool_calls, results, strict=True)
+        ]
+
+    def _create_turn_backup(self, write_tools: list[str]) -> dict[str, Any] | None:
+        """Take the single auto-backup for a turn with several write tools.
+
+        Args:
+            write_tools: Names of the turn's write tools, in call order
+
+        Returns:
+            Backup details, or None to fall back to one backup per write
+        """
+        try:
+            backup = self.api.auto_backup_before_operation(", ".join(write_tools))
+            logger.info(f"[LLM] Auto-backup for {len(write_tools)} writes: {backup}")
+            return backup
+        except Exception as e:
+            logger.warning(f"[LLM] Turn backup failed, backing up per write: {e}")
+            return None
+
+    def get_debug_info(self) -> dict[str, Any]:
+        """Runtime metrics of this session for debug reports.
+
+        Returns:
+            Provider, model, the last turn's per-tool latency, the last
+            stream's timing and the tool-result tokens saved so far
+        """
+        return {
+            "provider": self._get_provider_name(),
+            "model": self._get_model_name(),
+            "tool_timings": list(self.tool_timings),
+            "stream_metrics": dict(self.last_stream_metrics),
+            "tool_tokens_saved": sum(t["saved_tokens"] for t in self.tool_token_savings),
+        }
+
     @abstractmethod
     def _get_provider_name(self) -> str:
         """Get provider name for prompt generation.
@@ -182,15 +516,38 @@ class BaseLLM(ABC):
         self.conversation_history.append({"role": "assistant", "tool_calls": tool_calls})
 
         # Add tool results
-        for tool_result in tool_results:
+        contents = self._serialize_tool_results(tool_results)
+        for tool_result, content in zip(tool_results, contents, strict=True):
             self.conversation_history.append(
                 {
                     "role": "tool",
                     "tool_call_id": tool_result["tool_call_id"],
-                    "content": json.dumps(tool_result["result"], default=self._json_serializer),
+                    "content": content,
                 }
             )
 
+    def _serialize_tool_results(self, tool_results: list[dict]) -> list[str]:
+        """Shape one turn's tool results for the history and record the tokens saved.
+
+        Args:
+            tool_results: Tool execution results with ``name`` and ``result``
+
+        Returns:
+            Serialized content for each result, in order
+        """
+        shaped = [self.result_serializer.serialize(r["name"], r["result"]) for r in tool_results]
+        usage = {
+            "raw_tokens": sum(s.raw_tokens for s in shaped),
+            "sent_tokens": sum(s.sent_tokens for s in shaped),
+            "saved_tokens": sum(s.saved_tokens for s in shaped),
+        }
+        self.tool_token_savings.append(usage)
+        logger.info(
+            f"[LLM] Tool results: {usage['sent_tokens']} tokens sent, "
+            f"{usage['saved_tokens']} saved of {usage['raw_tokens']} (estimated)"
+        )
+        return [s.content for s in shaped]
+
     def _json_serializer(self, obj: Any) -> Any:
         """Shared JSON serializer for tool arguments.
 
@@ -213,6 +570,8 @@ class BaseLLM(ABC):
     def clear_history(self) -> None:
         """Clear conversation history."""
         self.conversation_history = []
+        self.tool_token_savings = []
+        self.tool_timings = []
         logger.info("[LLM] Conversation history cleared")
 
     def _get_tool_by_name(self, tool_name: str) -> Tool:
@@ -251,7 +610,7 @@ class BaseLLM(ABC):
         try:
             # Auto-backup before write operations (except manual backups)
             if tool_name != "create_backup_with_comment":
-                backup_result = self.api.create_backup_with_comment(
+                backup_result = self._turn_backup or self.api.create_backup_with_comment(
                     f"Auto-backup before {tool_name}"
                 )
                 logger.info(f"[LLM] Auto-backup created: {backup_result}")
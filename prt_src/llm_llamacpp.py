@@ -596,21 +596,11 @@ Remember: PRT is a "safe space" for relationship data. Be helpful, be safe, resp
 
             if tool_calls:
                 logger.info(f"[LLM] Found {len(tool_calls)} tool calls")
-                tool_results = []
+                named_calls = [call for call in tool_calls if call.get("name")]
+                if len(named_calls) < len(tool_calls):
+                    logger.warning("[LLM] Tool call missing name field")
 
-                for tool_call in tool_calls:
-                    tool_name = tool_call.get("name", "")
-                    arguments = tool_call.get("arguments", {})
-
-                    if not tool_name:
-                        logger.warning("[LLM] Tool call missing name field")
-                        continue
-
-                    logger.info(f"[LLM] Executing tool: {tool_name}")
-                    tool_result = self._call_tool(tool_name, arguments)
-                    logger.debug(f"[LLM] Tool {tool_name} result: {str(tool_result)[:200]}")
-
-                    tool_results.append({"name": tool_name, "result": tool_result})
+                tool_results = self._execute_tool_calls(named_calls)
 
                 # Add assistant message with tool calls to history
                 self.conversation_history.append(
@@ -618,15 +608,8 @@ Remember: PRT is a "safe space" for relationship data. Be helpful, be safe, resp
                 )
 
                 # Add tool results to history
-                for tool_result in tool_results:
-                    self.conversation_history.append(
-                        {
-                            "role": "tool",
-                            "content": json.dumps(
-                                tool_result["result"], default=self._json_serializer
-                            ),
-                        }
-                    )
+                for content in self._serialize_tool_results(tool_results):
+                    self.conversation_history.append({"role": "tool", "content": content})
 
                 # Get final response after tool execution
                 logger.info(f"[LLM] Requesting final response after {len(tool_results)} tool calls")
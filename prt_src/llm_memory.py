@@ -5,15 +5,20 @@ This module provides a simple persistent storage system that allows LLM tools
 to save query results and reference them in subsequent operations.
 
 Design principles:
-- Simple file-based storage in temp directory
-- JSON serialization for compatibility
-- Automatic cleanup of old results
+- Single SQLite file in temp directory
+- Metadata table, so listing and stats never touch payloads
+- zlib-compressed JSON payloads; bytes (e.g. profile images) kept as raw BLOBs
+- Index-driven cleanup of old results
 - Human-readable result IDs for LLM use
 """
 
 import json
+import sqlite3
 import tempfile
+import threading
+import time
 import uuid
+import zlib
 from datetime import datetime
 from datetime import timedelta
 from pathlib import Path
@@ -23,6 +28,75 @@ from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
+STORE_FILE = "memory.db"
+
+# Key of the JSON placeholder that stands in for a bytes value
+BLOB_MARKER = "__llm_memory_blob__"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    description TEXT,
+    created_at TEXT NOT NULL,
+    created_ts REAL NOT NULL,
+    data_count INTEGER NOT NULL,
+    payload BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_created_ts ON results(created_ts);
+CREATE INDEX IF NOT EXISTS idx_results_type ON results(type, created_ts);
+CREATE TABLE IF NOT EXISTS result_blobs (
+    result_id TEXT NOT NULL REFERENCES results(id) ON DELETE CASCADE,
+    blob_index INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (result_id, blob_index)
+);
+"""
+
+
+def _encode_payload(data: Any) -> tuple[bytes, list[bytes]]:
+    """Serialize data to compressed JSON, moving bytes values out as BLOBs.
+
+    Args:
+        data: The data to serialize
+
+    Returns:
+        Compressed JSON payload and the extracted bytes values in placeholder order
+    """
+    blobs: list[bytes] = []
+
+    def extract(value: Any) -> Any:
+        if isinstance(value, bytes | bytearray | memoryview):
+            blobs.append(bytes(value))
+            return {BLOB_MARKER: len(blobs) - 1}
+        if isinstance(value, dict):
+            return {key: extract(item) for key, item in value.items()}
+        if isinstance(value, list | tuple):
+            return [extract(item) for item in value]
+        return value
+
+    text = json.dumps(extract(data), separators=(",", ":"), default=str)
+    return zlib.compress(text.encode("utf-8"), 1), blobs
+
+
+def _decode_payload(payload: bytes, blobs: list[bytes]) -> Any:
+    """Reverse of ``_encode_payload``.
+
+    Args:
+        payload: Compressed JSON payload
+        blobs: Bytes values referenced by the payload's placeholders
+
+    Returns:
+        The original data, with bytes values restored
+    """
+
+    def restore(obj: dict) -> Any:
+        if len(obj) == 1 and BLOB_MARKER in obj:
+            return blobs[obj[BLOB_MARKER]]
+        return obj
+
+    return json.loads(zlib.decompress(payload).decode("utf-8"), object_hook=restore)
+
 
 class LLMMemory:
     """Manages persistent storage of query results for LLM tool chaining."""
@@ -36,8 +110,15 @@ class LLMMemory:
         """
         self.base_dir = base_dir or Path(tempfile.gettempdir()) / "prt_llm_memory"
         self.base_dir.mkdir(exist_ok=True)
+        self.db_path = self.base_dir / STORE_FILE
         self.max_age = timedelta(hours=max_age_hours)
 
+        # One connection shared by all threads, serialized by the lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.executescript(SCHEMA)
+
         # Clean up old results on initialization
         self._cleanup_old_results()
 
@@ -45,91 +126,57 @@ class LLMMemory:
         """Save query results and return a reference ID.
 
         Args:
-            data: The data to save (will be JSON serialized)
+            data: The data to save (JSON serialized; bytes values are stored as BLOBs)
             result_type: Type of result (e.g., 'query', 'search', 'contacts')
             description: Human-readable description
 
         Returns:
             String ID that can be used to retrieve the result
         """
-        import time
-
         logger.info(f"[MEMORY_SAVE_START] Type: {result_type}, description: '{description}'")
 
-        # Data analysis
-        data_count = 0
-
-        if isinstance(data, list):
-            data_count = len(data)
-            # Estimate size for contacts with images
-            if data and isinstance(data[0], dict) and "profile_image" in data[0]:
-                total_image_size = sum(len(item.get("profile_image", b"")) for item in data)
-                logger.debug(
-                    f"[MEMORY_DATA_ANALYSIS] {data_count} contacts, {total_image_size/1024/1024:.1f}MB images"
-                )
-
-            # Check for binary data issues
-            binary_items = 0
-            for item in data[:10]:  # Sample first 10
-                if isinstance(item, dict) and "profile_image" in item:
-                    if not isinstance(item["profile_image"], bytes):
-                        logger.warning(
-                            f"[MEMORY_DATA_TYPE] profile_image is not bytes: {type(item['profile_image'])}"
-                        )
-                    else:
-                        binary_items += 1
-
-            logger.debug(
-                f"[MEMORY_BINARY_CHECK] {binary_items}/{min(10, len(data))} items have bytes profile_image"
-            )
+        data_count = len(data) if isinstance(data, list) else 0
 
         # Generate ID
-        timestamp = datetime.now().strftime("%H%M%S")
-        short_uuid = str(uuid.uuid4())[:8]
-        result_id = f"{result_type}_{timestamp}_{short_uuid}"
+        now = datetime.now()
+        result_id = f"{result_type}_{now.strftime('%H%M%S')}_{str(uuid.uuid4())[:8]}"
 
         logger.debug(f"[MEMORY_ID_GENERATED] {result_id}")
 
         try:
-            # Prepare metadata
-            metadata = {
-                "id": result_id,
-                "type": result_type,
-                "description": description or f"{result_type} result",
-                "created_at": datetime.now().isoformat(),
-                "data_count": data_count,
-                "data": data,
-            }
-
-            # JSON serialization attempt
-            logger.debug("[MEMORY_JSON_START] Attempting JSON serialization")
-            json_start = time.time()
-
-            result_file = self.base_dir / f"{result_id}.json"
-            with open(result_file, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=2, default=str)
-
-            json_time = time.time() - json_start
-            file_size = result_file.stat().st_size
+            save_start = time.time()
+            payload, blobs = _encode_payload(data)
+
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT INTO results (id, type, description, created_at, created_ts,"
+                    " data_count, payload) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        result_id,
+                        result_type,
+                        description or f"{result_type} result",
+                        now.isoformat(),
+                        now.timestamp(),
+                        data_count,
+                        payload,
+                    ),
+                )
+                self._conn.executemany(
+                    "INSERT INTO result_blobs (result_id, blob_index, data) VALUES (?, ?, ?)",
+                    [(result_id, index, blob) for index, blob in enumerate(blobs)],
+                )
 
+            save_time = time.time() - save_start
+            blob_size = sum(len(blob) for blob in blobs)
             logger.info(
-                f"[MEMORY_SAVE_SUCCESS] {result_id} saved in {json_time:.3f}s, file size: {file_size/1024/1024:.1f}MB"
+                f"[MEMORY_SAVE_SUCCESS] {result_id} saved in {save_time:.3f}s, payload:"
+                f" {len(payload)/1024:.1f}KB, {len(blobs)} blobs: {blob_size/1024/1024:.1f}MB"
             )
 
             return result_id
 
         except Exception as e:
             logger.error(f"[MEMORY_SAVE_ERROR] Failed to save {result_id}: {e}", exc_info=True)
-
-            # Additional debugging for JSON errors
-            if "not JSON serializable" in str(e):
-                logger.error("[MEMORY_JSON_ERROR] Analyzing non-serializable data...")
-                for i, item in enumerate(data[:5]):  # Sample first 5
-                    try:
-                        json.dumps(item, default=str)
-                    except Exception as item_error:
-                        logger.error(f"[MEMORY_JSON_ITEM_ERROR] Item {i}: {item_error}")
-
             raise
 
     def load_result(self, result_id: str) -> dict[str, Any] | None:
@@ -141,32 +188,39 @@ class LLMMemory:
         Returns:
             Dictionary with metadata and data, or None if not found
         """
-        import time
-
         logger.debug(f"[MEMORY_LOAD_START] Loading {result_id}")
 
-        result_file = self.base_dir / f"{result_id}.json"
-
-        if not result_file.exists():
-            logger.error(f"[MEMORY_LOAD_MISSING] File not found: {result_file}")
-            return None
-
-        file_size = result_file.stat().st_size
-        logger.debug(f"[MEMORY_LOAD_FILE] File size: {file_size/1024/1024:.1f}MB")
-
         try:
             load_start = time.time()
 
-            with open(result_file, encoding="utf-8") as f:
-                result = json.load(f)
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT type, description, created_at, data_count, payload"
+                    " FROM results WHERE id = ?",
+                    (result_id,),
+                ).fetchone()
+                if row is None:
+                    logger.error(f"[MEMORY_LOAD_MISSING] Result not found: {result_id}")
+                    return None
+                blobs = [
+                    blob
+                    for (blob,) in self._conn.execute(
+                        "SELECT data FROM result_blobs WHERE result_id = ? ORDER BY blob_index",
+                        (result_id,),
+                    )
+                ]
+
+            result_type, description, created_at, data_count, payload = row
+            result = {
+                "id": result_id,
+                "type": result_type,
+                "description": description,
+                "created_at": created_at,
+                "data_count": data_count,
+                "data": _decode_payload(payload, blobs),
+            }
 
             load_time = time.time() - load_start
-
-            # Calculate data count safely - use stored value or calculate for lists
-            data_count = result.get("data_count", 0)
-            if data_count == 0 and isinstance(result.get("data"), list):
-                data_count = len(result["data"])
-
             logger.info(
                 f"[MEMORY_LOAD_SUCCESS] {result_id} loaded in {load_time:.3f}s, {data_count} items"
             )
@@ -184,36 +238,28 @@ class LLMMemory:
             result_type: Optional filter by result type
 
         Returns:
-            List of result metadata (without full data)
+            List of result metadata (without full data), newest first
         """
-        results = []
-
-        for result_file in self.base_dir.glob("*.json"):
-            try:
-                with open(result_file, encoding="utf-8") as f:
-                    metadata = json.load(f)
-
-                # Filter by type if specified
-                if result_type and metadata.get("type") != result_type:
-                    continue
-
-                # Return metadata without full data for listing
-                summary = {
-                    "id": metadata.get("id"),
-                    "type": metadata.get("type"),
-                    "description": metadata.get("description"),
-                    "created_at": metadata.get("created_at"),
-                    "data_count": metadata.get("data_count"),
-                }
-                results.append(summary)
-
-            except Exception as e:
-                logger.warning(f"[LLM_MEMORY] Failed to read {result_file}: {e}")
-                continue
-
-        # Sort by creation time, newest first
-        results.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-        return results
+        query = "SELECT id, type, description, created_at, data_count FROM results"
+        params: tuple = ()
+        if result_type:
+            query += " WHERE type = ?"
+            params = (result_type,)
+        query += " ORDER BY created_ts DESC"
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        return [
+            {
+                "id": row[0],
+                "type": row[1],
+                "description": row[2],
+                "created_at": row[3],
+                "data_count": row[4],
+            }
+            for row in rows
+        ]
 
     def delete_result(self, result_id: str) -> bool:
         """Delete a stored result.
@@ -224,43 +270,39 @@ class LLMMemory:
         Returns:
             True if deleted successfully, False otherwise
         """
-        result_file = self.base_dir / f"{result_id}.json"
-
-        if not result_file.exists():
-            logger.warning(f"[LLM_MEMORY] Cannot delete, result not found: {result_id}")
-            return False
-
         try:
-            result_file.unlink()
-            logger.info(f"[LLM_MEMORY] Deleted result: {result_id}")
-            return True
+            with self._lock, self._conn:
+                deleted = self._conn.execute(
+                    "DELETE FROM results WHERE id = ?", (result_id,)
+                ).rowcount
 
         except Exception as e:
             logger.error(f"[LLM_MEMORY] Failed to delete result {result_id}: {e}")
             return False
 
+        if not deleted:
+            logger.warning(f"[LLM_MEMORY] Cannot delete, result not found: {result_id}")
+            return False
+
+        logger.info(f"[LLM_MEMORY] Deleted result: {result_id}")
+        return True
+
     def _cleanup_old_results(self) -> int:
         """Remove results older than max_age.
 
         Returns:
             Number of results cleaned up
         """
-        cleaned_count = 0
-        cutoff_time = datetime.now() - self.max_age
-
-        for result_file in self.base_dir.glob("*.json"):
-            try:
-                # Check file modification time
-                file_time = datetime.fromtimestamp(result_file.stat().st_mtime)
+        cutoff = (datetime.now() - self.max_age).timestamp()
 
-                if file_time < cutoff_time:
-                    result_file.unlink()
-                    cleaned_count += 1
-                    logger.debug(f"[LLM_MEMORY] Cleaned up old result: {result_file.name}")
-
-            except Exception as e:
-                logger.warning(f"[LLM_MEMORY] Failed to clean up {result_file}: {e}")
-                continue
+        try:
+            with self._lock, self._conn:
+                cleaned_count = self._conn.execute(
+                    "DELETE FROM results WHERE created_ts < ?", (cutoff,)
+                ).rowcount
+        except Exception as e:
+            logger.warning(f"[LLM_MEMORY] Failed to clean up old results: {e}")
+            return 0
 
         if cleaned_count > 0:
             logger.info(f"[LLM_MEMORY] Cleaned up {cleaned_count} old results")
@@ -273,22 +315,18 @@ class LLMMemory:
         Returns:
             Dictionary with counts and storage info
         """
-        results = self.list_results()
+        with self._lock:
+            counts = self._conn.execute(
+                "SELECT type, COUNT(*) FROM results GROUP BY type"
+            ).fetchall()
 
-        stats = {
-            "total_results": len(results),
+        return {
+            "total_results": sum(count for _, count in counts),
             "storage_path": str(self.base_dir),
             "max_age_hours": self.max_age.total_seconds() / 3600,
-            "types": {},
+            "types": dict(counts),
         }
 
-        # Count by type
-        for result in results:
-            result_type = result.get("type", "unknown")
-            stats["types"][result_type] = stats["types"].get(result_type, 0) + 1
-
-        return stats
-
 
 # Global instance for use by LLM tools
 llm_memory = LLMMemory()
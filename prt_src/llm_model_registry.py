@@ -13,6 +13,7 @@ from typing import Any
 import requests
 from lru import LRU
 
+from .llm_transport import get_transport
 from .logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -150,6 +151,7 @@ class OllamaModelRegistry:
             max_cache_size: Maximum number of models to cache (default: 100)
         """
         self.base_url = base_url.rstrip("/")
+        self.transport = get_transport(self.base_url)
         self.cache_ttl = cache_ttl
         self.max_cache_size = max_cache_size
         self._model_cache = LRU(max_cache_size)
@@ -171,7 +173,7 @@ class OllamaModelRegistry:
             True if Ollama API is reachable
         """
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=2)
+            response = self.transport.get("/api/tags", timeout=2)
             return response.status_code == 200
         except Exception as e:
             logger.debug(f"Ollama not available: {e}")
@@ -209,7 +211,7 @@ class OllamaModelRegistry:
         logger.info("Fetching model list from Ollama API...")
 
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self.transport.get("/api/tags", timeout=5)
             response.raise_for_status()
 
             data = response.json()
@@ -270,8 +272,8 @@ class OllamaModelRegistry:
         logger.debug(f"Fetching extended info for model: {model_name}")
 
         try:
-            response = requests.post(
-                f"{self.base_url}/api/show",
+            response = self.transport.post(
+                "/api/show",
                 json={"name": model_name},
                 timeout=10,
             )
@@ -10,6 +10,7 @@ import json
 import secrets
 import string
 from collections.abc import Callable
+from collections.abc import Generator
 from dataclasses import dataclass
 from typing import Any
 
@@ -19,6 +20,8 @@ from .api import PRTAPI
 from .config import LLMConfigManager
 from .llm_base import BaseLLM
 from .llm_memory import llm_memory
+from .llm_transport import TransportPolicy
+from .llm_transport import get_transport
 from .logging_config import get_logger
 from .schema_info import get_schema_for_llm
 
@@ -28,6 +31,8 @@ logger = get_logger(__name__)
 MAX_RESPONSE_SIZE_BYTES = 10 * 1024 * 1024  # 10MB - reasonable for LLM responses
 MAX_RESPONSE_SIZE_WARNING = 5 * 1024 * 1024  # 5MB - log warning for large responses
 ALLOWED_CONTENT_TYPES = ["application/json", "application/json; charset=utf-8"]
+# /api/chat with "stream": true answers with newline-delimited JSON chunks
+ALLOWED_STREAM_CONTENT_TYPES = ["application/x-ndjson", *ALLOWED_CONTENT_TYPES]
 
 
 @dataclass
@@ -43,6 +48,8 @@ class Tool:
 class OllamaLLM(BaseLLM):
     """Ollama LLM client with tool calling support."""
 
+    supports_streaming = True
+
     def __init__(
         self,
         api: PRTAPI,
@@ -63,6 +70,11 @@ class OllamaLLM(BaseLLM):
         self.model = config_manager.llm.model
         self.keep_alive = keep_alive if keep_alive is not None else config_manager.llm.keep_alive
         self.timeout = timeout if timeout is not None else config_manager.llm.timeout
+        self.transport = get_transport(
+            self.base_url, TransportPolicy.from_config(config_manager.llm)
+        )
+        # Ollama's prompt_eval_count/duration per request; a warm KV cache keeps these small
+        self.prompt_eval_metrics: list[dict[str, float]] = []
 
         # Apply Mistral-specific optimizations for tool calling
         if self._is_mistral_model():
@@ -119,9 +131,7 @@ class OllamaLLM(BaseLLM):
     async def health_check(self, timeout: float = 2.0) -> bool:
         """Quick health check to see if Ollama is responsive."""
         try:
-            response = await asyncio.to_thread(
-                requests.get, f"{self.base_url.replace('/v1', '')}/api/tags", timeout=timeout
-            )
+            response = await self.transport.aget("/api/tags", timeout=timeout)
             if response.status_code == 200:
                 await asyncio.to_thread(self._validate_and_parse_response, response, "health_check")
                 return True
@@ -134,9 +144,8 @@ class OllamaLLM(BaseLLM):
         """Preload the model into memory."""
         try:
             logger.info(f"[LLM] Preloading model {self.model} into memory...")
-            response = await asyncio.to_thread(
-                requests.post,
-                f"{self.base_url.replace('/v1', '')}/api/generate",
+            response = await self.transport.apost(
+                "/api/generate",
                 json={"model": self.model, "prompt": "", "keep_alive": self.keep_alive},
                 timeout=30,
             )
@@ -609,7 +618,7 @@ class OllamaLLM(BaseLLM):
                     contact["has_profile_image"] = True
                     contact.pop("profile_image", None)
                 else:
-                    contact["has_profile_image"] = False
+                    contact["has_profile_image"] = bool(contact.get("has_profile_image"))
 
             memory_id = llm_memory.save_result(clean_contacts, "contacts", desc)
             usage_info = f"Saved {len(clean_contacts)} contacts to memory {memory_id}. Use this memory_id with generate_directory tool to create visualization."
@@ -824,7 +833,8 @@ class OllamaLLM(BaseLLM):
     ) -> dict[str, Any]:
         """Wrapper for write operations that creates automatic backup."""
         try:
-            backup_info = self.api.auto_backup_before_operation(tool_name)
+            # Several writes in one turn share the backup taken for the turn
+            backup_info = self._turn_backup or self.api.auto_backup_before_operation(tool_name)
             backup_id = backup_info.get("backup_id", "unknown")
             result = tool_function(**kwargs)
             # Step 3: Determine success state based on result content
@@ -978,20 +988,6 @@ WORKFLOW:
 
 Remember: PRT is a "safe space" for relationship data. Be helpful, be safe, respect privacy."""
 
-    def _format_tool_calls(self) -> list[dict[str, Any]]:
-        """Format tools for Ollama native API."""
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "parameters": tool.parameters,
-                },
-            }
-            for tool in self.tools
-        ]
-
     # ============================================================
     # ABSTRACT METHOD IMPLEMENTATIONS FOR BaseLLM
     # ============================================================
@@ -1017,26 +1013,134 @@ Remember: PRT is a "safe space" for relationship data. Be helpful, be safe, resp
         request_data = {
             "model": self.model,
             "messages": messages,
-            "tools": self._format_tool_calls(),
+            "tools": self._tool_schemas(),
             "stream": False,
             "keep_alive": self.keep_alive,
             "options": {
                 "temperature": self.temperature,
             },
         }
-        # Remove /v1 suffix only if the URL ends with it to avoid corrupting domains like v1.example.com
-        base = self.base_url.rstrip("/").removesuffix("/v1")
-        url = f"{base}/api/chat"
-
         try:
-            response = requests.post(url, json=request_data, timeout=self.timeout)
+            response = self.transport.post("/api/chat", json=request_data, timeout=self.timeout)
             response.raise_for_status()
-            return self._validate_and_parse_response(response, "chat")
+            parsed = self._validate_and_parse_response(response, "chat")
+            self._record_prompt_eval(parsed)
+            return parsed
+        except requests.exceptions.Timeout as e:
+            raise TimeoutError(f"Request to Ollama timed out after {self.timeout} seconds.") from e
+        except requests.exceptions.RequestException as e:
+            raise RuntimeError(f"Error communicating with Ollama: {e}") from e
+
+    def _stream_message_with_tools(
+        self, messages: list[dict], tools: list[Tool]
+    ) -> Generator[str, None, dict]:
+        """Stream a message with tools from the Ollama API.
+
+        Ollama sends one JSON object per line. Content arrives as deltas in
+        ``message.content``; tool calls arrive complete in ``message.tool_calls``
+        of whichever chunk carries them, and the last chunk has ``done: true``.
+
+        Args:
+            messages: Message history
+            tools: Available tools
+
+        Yields:
+            Content deltas as they arrive
+
+        Returns:
+            The chunks merged into the shape of a non-streamed Ollama response
+        """
+        request_data = {
+            "model": self.model,
+            "messages": messages,
+            "tools": self._tool_schemas(),
+            "stream": True,
+            "keep_alive": self.keep_alive,
+            "options": {
+                "temperature": self.temperature,
+            },
+        }
+        try:
+            with self.transport.post(
+                "/api/chat", json=request_data, timeout=self.timeout, stream=True
+            ) as response:
+                response.raise_for_status()
+                content_type = response.headers.get("Content-Type", "").lower()
+                if not any(content_type.startswith(t) for t in ALLOWED_STREAM_CONTENT_TYPES):
+                    raise ValueError(
+                        f"Invalid Content-Type '{content_type}' for chat stream. "
+                        f"Expected NDJSON but got {content_type.split(';')[0]}"
+                    )
+                merged = yield from self._parse_chat_stream(response.iter_lines())
+                self._record_prompt_eval(merged)
+                return merged
         except requests.exceptions.Timeout as e:
             raise TimeoutError(f"Request to Ollama timed out after {self.timeout} seconds.") from e
         except requests.exceptions.RequestException as e:
             raise RuntimeError(f"Error communicating with Ollama: {e}") from e
 
+    def _record_prompt_eval(self, response: dict) -> None:
+        """Log how many prompt tokens Ollama had to evaluate for a request.
+
+        Args:
+            response: Parsed (or merged streamed) ``/api/chat`` response
+        """
+        tokens = response.get("prompt_eval_count")
+        if tokens is None:
+            return
+        seconds = response.get("prompt_eval_duration", 0) / 1e9
+        self.prompt_eval_metrics.append({"tokens": tokens, "seconds": seconds})
+        logger.info(f"[LLM] Prompt eval: {tokens} tokens in {seconds:.2f}s")
+
+    def _parse_chat_stream(self, lines) -> Generator[str, None, dict]:
+        """Parse NDJSON chunks from ``/api/chat``, yielding content deltas.
+
+        Args:
+            lines: Iterable of raw response lines
+
+        Yields:
+            Non-empty content deltas
+
+        Returns:
+            Merged response with the full content, all tool calls and the
+            statistics from the final chunk
+        """
+        content_parts = []
+        tool_calls = []
+        final: dict[str, Any] = {}
+        received = 0
+
+        for line in lines:
+            if not line:
+                continue
+            received += len(line)
+            if received > MAX_RESPONSE_SIZE_BYTES:
+                raise ValueError(
+                    f"Streamed response exceeds maximum {MAX_RESPONSE_SIZE_BYTES / 1024 / 1024:.0f}MB"
+                )
+            try:
+                chunk = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON chunk in chat stream: {e}") from e
+            if "error" in chunk:
+                raise RuntimeError(f"Ollama error: {chunk['error']}")
+
+            message_obj = chunk.get("message") or {}
+            delta = message_obj.get("content") or ""
+            if delta:
+                content_parts.append(delta)
+                yield delta
+            tool_calls.extend(message_obj.get("tool_calls") or [])
+
+            if chunk.get("done"):
+                final = chunk
+                break
+
+        message = {"role": "assistant", "content": "".join(content_parts)}
+        if tool_calls:
+            message["tool_calls"] = tool_calls
+        return {**final, "message": message}
+
     def _extract_tool_calls(self, response: dict) -> list[dict]:
         """Extract tool calls from Ollama response.
 
@@ -1135,7 +1239,7 @@ def start_ollama_chat(api: PRTAPI):
     console.print("=" * 50, style="blue")
 
     try:
-        test_response = requests.get(f"{llm.base_url}/models", timeout=5)
+        test_response = llm.transport.get("/api/tags", timeout=5)
         if test_response.status_code == 200:
             try:
                 llm._validate_and_parse_response(test_response, "connection_test")
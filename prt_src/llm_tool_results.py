@@ -0,0 +1,236 @@
+"""
+Token-budgeted serialization of LLM tool results
+
+Tool results are added to the conversation history and re-sent on every later
+turn, so a single ``list_all_contacts`` call on a large database could add
+megabytes of JSON to every prompt. ``ToolResultSerializer`` shapes each result
+before it enters the history:
+
+- field projection keeps only the fields the model needs per row
+- row limits and a per-tool token budget cap the size of what is sent
+- results that don't fit are stored in ``llm_memory`` and the model gets the
+  rows that fit, a summary and the memory ID to fetch the rest with
+
+Token counts are estimated at four characters per token, which is close
+enough for budgeting without loading a model tokenizer.
+"""
+
+import json
+import math
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+CHARS_PER_TOKEN = 4
+DEFAULT_TOKEN_BUDGET = 2000
+
+# Tokens reserved for the summary envelope around truncated rows
+ENVELOPE_TOKENS = 100
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens in a string.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Estimated token count
+    """
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+@dataclass
+class ResultShape:
+    """How a tool's result is shaped before it's sent to the model.
+
+    Attributes:
+        fields: Output key -> dotted path kept for each row; a path through a
+            list maps over it (``relationship_info.notes.title``). None keeps
+            rows unchanged.
+        max_rows: Maximum rows sent to the model
+        max_field_chars: Longer string values are truncated to this length
+        token_budget: Maximum estimated tokens sent for one call
+        rows_key: Key holding the rows when the result is a dict rather than
+            a list (e.g. ``contacts``)
+    """
+
+    fields: dict[str, str] | None = None
+    max_rows: int | None = None
+    max_field_chars: int | None = None
+    token_budget: int = DEFAULT_TOKEN_BUDGET
+    rows_key: str | None = None
+
+
+@dataclass
+class ShapedResult:
+    """A serialized tool result and what shaping saved."""
+
+    content: str
+    raw_tokens: int
+    sent_tokens: int
+    memory_id: str | None = None
+
+    @property
+    def saved_tokens(self) -> int:
+        return max(0, self.raw_tokens - self.sent_tokens)
+
+
+def _resolve(value: Any, path: list[str]) -> Any:
+    """Follow a dotted path, mapping over lists along the way."""
+    for i, key in enumerate(path):
+        if isinstance(value, list):
+            return [_resolve(item, path[i:]) for item in value]
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+class ToolResultSerializer:
+    """Serializes tool results for the conversation history within a token budget."""
+
+    def __init__(
+        self,
+        shapes: dict[str, ResultShape] | None = None,
+        memory=None,
+        default: Callable[[Any], Any] | None = None,
+    ):
+        """Initialize the serializer.
+
+        Args:
+            shapes: Result shape per tool name; other tools get the default shape
+            memory: LLMMemory used for overflowing results (defaults to the
+                global ``llm_memory``)
+            default: ``json.dumps`` fallback for values that aren't JSON types
+        """
+        self.shapes = shapes or {}
+        self._memory = memory
+        self.default = default or str
+
+    @property
+    def memory(self):
+        if self._memory is None:
+            from .llm_memory import llm_memory
+
+            self._memory = llm_memory
+        return self._memory
+
+    def _dumps(self, value: Any) -> str:
+        return json.dumps(value, default=self.default)
+
+    def serialize(self, tool_name: str, result: Any) -> ShapedResult:
+        """Serialize one tool result for the model.
+
+        Args:
+            tool_name: Name of the tool that produced the result
+            result: Raw tool result
+
+        Returns:
+            ShapedResult with the content to send and token accounting
+        """
+        shape = self.shapes.get(tool_name, ResultShape())
+        raw = self._dumps(result)
+        raw_tokens = estimate_tokens(raw)
+
+        rows = self._rows(result, shape)
+        if rows is None:
+            if raw_tokens <= shape.token_budget:
+                return ShapedResult(raw, raw_tokens, raw_tokens)
+            return self._overflow_summary(tool_name, result, raw, raw_tokens, shape)
+
+        projected = [self._project(row, shape) for row in rows]
+        limit = len(projected) if shape.max_rows is None else shape.max_rows
+        if len(projected) <= limit:
+            content = self._dumps(self._with_rows(result, shape, projected))
+            if estimate_tokens(content) <= shape.token_budget:
+                return ShapedResult(content, raw_tokens, estimate_tokens(content))
+
+        # Too many rows or tokens: send the rows that fit and park the rest in memory
+        budget_chars = (shape.token_budget - ENVELOPE_TOKENS) * CHARS_PER_TOKEN
+        kept, used = [], 2
+        for row in projected[:limit]:
+            size = len(self._dumps(row)) + 2
+            if used + size > budget_chars:
+                break
+            kept.append(row)
+            used += size
+
+        memory_id = self._store(tool_name, result, len(rows))
+        envelope = {
+            "summary": self._summary(tool_name, len(kept), len(rows), memory_id),
+            "total_rows": len(rows),
+            "returned_rows": len(kept),
+            "rows": kept,
+        }
+        if memory_id:
+            envelope["memory_id"] = memory_id
+        content = self._dumps(envelope)
+        return ShapedResult(content, raw_tokens, estimate_tokens(content), memory_id)
+
+    @staticmethod
+    def _rows(result: Any, shape: ResultShape) -> list | None:
+        if isinstance(result, list):
+            return result
+        if shape.rows_key and isinstance(result, dict):
+            rows = result.get(shape.rows_key)
+            if isinstance(rows, list):
+                return rows
+        return None
+
+    @staticmethod
+    def _with_rows(result: Any, shape: ResultShape, rows: list) -> Any:
+        if isinstance(result, list):
+            return rows
+        return {**result, shape.rows_key: rows}
+
+    def _project(self, row: Any, shape: ResultShape) -> Any:
+        if not isinstance(row, dict):
+            return row
+        if shape.fields is not None:
+            row = {key: _resolve(row, path.split(".")) for key, path in shape.fields.items()}
+        if shape.max_field_chars is not None:
+            row = {key: self._truncate(value, shape.max_field_chars) for key, value in row.items()}
+        return row
+
+    def _truncate(self, value: Any, max_chars: int) -> Any:
+        if isinstance(value, str) and len(value) > max_chars:
+            return value[:max_chars] + "..."
+        if isinstance(value, list):
+            return [self._truncate(item, max_chars) for item in value]
+        return value
+
+    def _overflow_summary(
+        self, tool_name: str, result: Any, raw: str, raw_tokens: int, shape: ResultShape
+    ) -> ShapedResult:
+        """Replace an oversized non-list result with a preview and memory reference."""
+        memory_id = self._store(tool_name, result, 0)
+        preview_chars = (shape.token_budget - ENVELOPE_TOKENS) * CHARS_PER_TOKEN
+        envelope = {
+            "summary": f"{tool_name} returned about {raw_tokens} tokens; showing a preview.",
+            "preview": raw[:preview_chars],
+        }
+        if memory_id:
+            envelope["memory_id"] = memory_id
+            envelope["summary"] += f" The full result is saved as memory {memory_id}."
+        content = self._dumps(envelope)
+        return ShapedResult(content, raw_tokens, estimate_tokens(content), memory_id)
+
+    def _store(self, tool_name: str, result: Any, row_count: int) -> str | None:
+        try:
+            description = f"Full {tool_name} result" + (f" ({row_count} rows)" if row_count else "")
+            return self.memory.save_result(result, tool_name, description)
+        except Exception as e:
+            logger.warning(f"[LLM] Could not save {tool_name} result to memory: {e}")
+            return None
+
+    @staticmethod
+    def _summary(tool_name: str, kept: int, total: int, memory_id: str | None) -> str:
+        summary = f"{tool_name} returned {total} rows; showing the first {kept}."
+        if memory_id:
+            summary += f" The full result is saved as memory {memory_id}."
+        return summary
@@ -0,0 +1,134 @@
+"""
+Scheduling of the tool calls from one LLM turn
+
+A model may return several tool calls at once. ``ToolScheduler`` splits them
+into batches in call order:
+
+- consecutive read-only calls form one batch that runs concurrently on a
+  bounded thread pool, each call inside its own read session
+- every other call (writes and provider-specific tools) runs alone, in order,
+  so reads after a write see its changes
+
+Results come back in the original call order together with each call's
+latency.
+"""
+
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+from typing import Any
+
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+
+
+@dataclass
+class ToolTiming:
+    """Latency of one tool call."""
+
+    name: str
+    seconds: float
+    parallel: bool
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"name": self.name, "seconds": self.seconds, "parallel": self.parallel}
+
+
+class ToolScheduler:
+    """Runs one turn's tool calls, concurrently where it is safe."""
+
+    def __init__(
+        self,
+        call_tool: Callable[[str, dict[str, Any]], Any],
+        read_tools: set[str],
+        read_session: Callable[[], AbstractContextManager] | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            call_tool: Runs one tool call and returns its result
+            read_tools: Names of tools that only read data
+            read_session: Opens a per-thread read session around a concurrent
+                call; without one, reads run one at a time
+            max_workers: Maximum concurrent read calls
+        """
+        self.call_tool = call_tool
+        self.read_tools = read_tools
+        self.read_session = read_session
+        self.max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+
+    def plan(self, tool_calls: list[dict]) -> list[tuple[list[int], bool]]:
+        """Group call indexes into batches that run one after another.
+
+        Args:
+            tool_calls: Standardized tool calls with ``name`` and ``arguments``
+
+        Returns:
+            ``(indexes, concurrent)`` pairs in call order; a concurrent batch
+            holds only read calls
+        """
+        batches: list[tuple[list[int], bool]] = []
+        for index, call in enumerate(tool_calls):
+            concurrent = self.read_session is not None and call["name"] in self.read_tools
+            if concurrent and batches and batches[-1][1]:
+                batches[-1][0].append(index)
+            else:
+                batches.append(([index], concurrent))
+        return batches
+
+    def run(self, tool_calls: list[dict]) -> tuple[list[Any], list[ToolTiming]]:
+        """Run all tool calls of a turn.
+
+        Args:
+            tool_calls: Standardized tool calls with ``name`` and ``arguments``
+
+        Returns:
+            Results and timings, both in the original call order
+        """
+        results: list[Any] = [None] * len(tool_calls)
+        timings: list[ToolTiming | None] = [None] * len(tool_calls)
+
+        batches = self.plan(tool_calls)
+        logger.debug(f"[LLM] Running {len(tool_calls)} tool calls in {len(batches)} batches")
+        for indexes, concurrent in batches:
+            if concurrent and len(indexes) > 1:
+                executor = self._get_executor()
+                futures = {i: executor.submit(self._timed_read, tool_calls[i]) for i in indexes}
+                for i, future in futures.items():
+                    results[i], seconds = future.result()
+                    timings[i] = ToolTiming(tool_calls[i]["name"], seconds, True)
+            else:
+                for i in indexes:
+                    results[i], seconds = self._timed(tool_calls[i])
+                    timings[i] = ToolTiming(tool_calls[i]["name"], seconds, False)
+
+        return results, timings
+
+    def _timed(self, call: dict) -> tuple[Any, float]:
+        started = time.perf_counter()
+        result = self.call_tool(call["name"], call.get("arguments", {}))
+        return result, time.perf_counter() - started
+
+    def _timed_read(self, call: dict) -> tuple[Any, float]:
+        with self.read_session():
+            return self._timed(call)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="llm-tool"
+            )
+        return self._executor
+
+    def shutdown(self) -> None:
+        """Stop the worker threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
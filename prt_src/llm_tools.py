@@ -10,10 +10,27 @@ from dataclasses import dataclass
 from typing import Any
 
 from prt_src.api import PRTAPI
+from prt_src.llm_tool_results import ResultShape
 from prt_src.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Contact rows sent to the model: identity plus tag names and note titles
+CONTACT_RESULT_SHAPE = ResultShape(
+    fields={
+        "id": "id",
+        "name": "name",
+        "email": "email",
+        "phone": "phone",
+        "tags": "relationship_info.tags",
+        "notes": "relationship_info.notes.title",
+    },
+    max_rows=100,
+    token_budget=3000,
+)
+
+NOTE_RESULT_SHAPE = ResultShape(max_rows=100, max_field_chars=280, token_budget=3000)
+
 
 @dataclass
 class Tool:
@@ -23,6 +40,7 @@ class Tool:
     description: str
     parameters: dict[str, Any]
     function: Callable
+    result_shape: ResultShape | None = None
 
 
 class LLMToolRegistry:
@@ -75,12 +93,14 @@ class LLMToolRegistry:
                     "required": [],
                 },
                 function=self.api.search_contacts,
+                result_shape=CONTACT_RESULT_SHAPE,
             ),
             Tool(
                 name="list_all_contacts",
                 description="Get a complete list of all contacts.",
                 parameters={"type": "object", "properties": {}},
                 function=self.api.list_all_contacts,
+                result_shape=CONTACT_RESULT_SHAPE,
             ),
             Tool(
                 name="list_all_tags",
@@ -93,6 +113,7 @@ class LLMToolRegistry:
                 description="Get a complete list of all notes.",
                 parameters={"type": "object", "properties": {}},
                 function=self.api.list_all_notes,
+                result_shape=NOTE_RESULT_SHAPE,
             ),
             Tool(
                 name="get_database_stats",
@@ -137,6 +158,7 @@ class LLMToolRegistry:
                     "required": ["query"],
                 },
                 function=self.api.search_notes,
+                result_shape=NOTE_RESULT_SHAPE,
             ),
             Tool(
                 name="get_contacts_by_tag",
@@ -147,6 +169,7 @@ class LLMToolRegistry:
                     "required": ["tag_name"],
                 },
                 function=self.api.get_contacts_by_tag,
+                result_shape=CONTACT_RESULT_SHAPE,
             ),
             Tool(
                 name="get_contacts_by_note",
@@ -157,6 +180,7 @@ class LLMToolRegistry:
                     "required": ["note_title"],
                 },
                 function=self.api.get_contacts_by_note,
+                result_shape=CONTACT_RESULT_SHAPE,
             ),
         ]
 
@@ -316,6 +340,10 @@ class LLMToolRegistry:
             ),
         ]
 
+    def get_read_tool_names(self) -> set[str]:
+        """Get set of tool names that only read data and are safe to run concurrently."""
+        return {tool.name for tool in self._create_read_tools()}
+
     @staticmethod
     def get_write_tool_names() -> set[str]:
         """Get set of tool names that perform write operations."""
@@ -334,6 +362,10 @@ class LLMToolRegistry:
             "execute_sql",  # Provider-specific implementation
         }
 
+    def get_result_shapes(self) -> dict[str, ResultShape]:
+        """Get the result shape of every enabled tool that declares one."""
+        return {tool.name: tool.result_shape for tool in self.get_all_tools() if tool.result_shape}
+
     def get_tool_by_name(self, tool_name: str) -> Tool | None:
         """Get tool by name from registry.
 
@@ -0,0 +1,197 @@
+"""
+Pooled HTTP transport for LLM providers
+
+Every Ollama request used to go through ``requests.get``/``requests.post``,
+which opens a new TCP connection per call. ``LLMTransport`` wraps one
+``requests.Session`` per provider base URL so connections are kept alive and
+reused, and keeps the retry, backoff and timeout policy in one place.
+
+``get_transport`` returns the shared transport for a base URL; OllamaLLM,
+the model registry and the health checks all use it. The async methods run the
+same pooled session in a worker thread, so async callers share its
+connections instead of opening their own.
+"""
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_MAX_RETRIES = 2
+DEFAULT_BACKOFF_FACTOR = 0.5
+DEFAULT_CONNECT_TIMEOUT = 5.0
+
+# Gateway errors are retried; other statuses are returned to the caller
+RETRY_STATUSES = (502, 503, 504)
+
+
+@dataclass(frozen=True)
+class TransportPolicy:
+    """Connection pool, retry and timeout settings for one transport.
+
+    Attributes:
+        pool_size: Maximum connections kept open to the provider
+        max_retries: Retries for failed connections and gateway errors
+        backoff_factor: Exponential backoff base between retries, in seconds
+        connect_timeout: Seconds allowed to establish a connection; the read
+            timeout is passed per request
+    """
+
+    pool_size: int = DEFAULT_POOL_SIZE
+    max_retries: int = DEFAULT_MAX_RETRIES
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR
+    connect_timeout: float = DEFAULT_CONNECT_TIMEOUT
+
+    @classmethod
+    def from_config(cls, llm_config) -> "TransportPolicy":
+        """Build a policy from an ``LLMConfig``.
+
+        Args:
+            llm_config: LLM connection configuration
+
+        Returns:
+            TransportPolicy with the configured pool and retry settings
+        """
+        return cls(
+            pool_size=getattr(llm_config, "pool_size", DEFAULT_POOL_SIZE),
+            max_retries=getattr(llm_config, "max_retries", DEFAULT_MAX_RETRIES),
+            connect_timeout=getattr(llm_config, "connect_timeout", DEFAULT_CONNECT_TIMEOUT),
+        )
+
+
+def normalize_base_url(base_url: str) -> str:
+    """Strip trailing slashes and the OpenAI-compatible ``/v1`` suffix.
+
+    Args:
+        base_url: Configured provider URL
+
+    Returns:
+        Root URL of the provider's native API
+    """
+    return base_url.rstrip("/").removesuffix("/v1")
+
+
+class LLMTransport:
+    """Keep-alive HTTP client for one provider base URL."""
+
+    def __init__(self, base_url: str, policy: TransportPolicy | None = None):
+        """Initialize the transport.
+
+        Args:
+            base_url: Provider URL; a ``/v1`` suffix is dropped
+            policy: Pool, retry and timeout settings
+        """
+        self.base_url = normalize_base_url(base_url)
+        self.policy = policy or TransportPolicy()
+        self.session = self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        retry = Retry(
+            total=self.policy.max_retries,
+            connect=self.policy.max_retries,
+            # A read failure may come after the model started generating, and
+            # replaying a long generation is worse than reporting the error
+            read=0,
+            status=self.policy.max_retries,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset({"GET", "POST"}),
+            backoff_factor=self.policy.backoff_factor,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=self.policy.pool_size, max_retries=retry
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def url(self, path: str) -> str:
+        """Return the absolute URL for an API path."""
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def _timeout(self, timeout: float | None) -> tuple[float, float | None]:
+        return (min(self.policy.connect_timeout, timeout or self.policy.connect_timeout), timeout)
+
+    def get(self, path: str, timeout: float | None = None, **kwargs: Any) -> requests.Response:
+        """Send a GET request over the pooled session.
+
+        Args:
+            path: API path, e.g. ``/api/tags``
+            timeout: Read timeout in seconds
+            **kwargs: Passed on to ``requests.Session.get``
+
+        Returns:
+            The response
+        """
+        return self.session.get(self.url(path), timeout=self._timeout(timeout), **kwargs)
+
+    def post(self, path: str, timeout: float | None = None, **kwargs: Any) -> requests.Response:
+        """Send a POST request over the pooled session.
+
+        Args:
+            path: API path, e.g. ``/api/chat``
+            timeout: Read timeout in seconds
+            **kwargs: Passed on to ``requests.Session.post`` (``json``, ``stream``...)
+
+        Returns:
+            The response
+        """
+        return self.session.post(self.url(path), timeout=self._timeout(timeout), **kwargs)
+
+    async def aget(self, path: str, timeout: float | None = None, **kwargs: Any):
+        """Async ``get`` that shares the pooled connections."""
+        return await asyncio.to_thread(self.get, path, timeout, **kwargs)
+
+    async def apost(self, path: str, timeout: float | None = None, **kwargs: Any):
+        """Async ``post`` that shares the pooled connections."""
+        return await asyncio.to_thread(self.post, path, timeout, **kwargs)
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.session.close()
+
+
+_transports: dict[str, LLMTransport] = {}
+_transports_lock = threading.Lock()
+
+
+def get_transport(base_url: str, policy: TransportPolicy | None = None) -> LLMTransport:
+    """Return the shared transport for a provider base URL.
+
+    Callers that pass no policy share whatever transport exists. A caller
+    with a different policy gets a fresh transport that replaces the shared
+    one; holders of the old transport keep using it until they drop it.
+
+    Args:
+        base_url: Provider URL
+        policy: Pool, retry and timeout settings
+
+    Returns:
+        The shared LLMTransport
+    """
+    key = normalize_base_url(base_url)
+    with _transports_lock:
+        transport = _transports.get(key)
+        if transport is None or (policy is not None and policy != transport.policy):
+            transport = LLMTransport(key, policy)
+            _transports[key] = transport
+            logger.debug(f"[LLM] Created HTTP transport for {key} ({transport.policy})")
+        return transport
+
+
+def close_transports() -> None:
+    """Close and forget every shared transport."""
+    with _transports_lock:
+        for transport in _transports.values():
+            transport.close()
+        _transports.clear()
@@ -19,11 +19,19 @@ from sqlalchemy import String
 from sqlalchemy import Table
 from sqlalchemy import Text
 from sqlalchemy import UniqueConstraint
+from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy.orm import column_property
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import deferred
 from sqlalchemy.orm import relationship
 
 Base = declarative_base()
 
+# Maximum number of bound parameters per IN (...) clause. SQLite builds before
+# 3.32 cap host parameters at 999, so batches stay comfortably below that.
+IN_CLAUSE_BATCH_SIZE = 500
+
 
 class Contact(Base):
     """Contact information from Google Contacts or other sources."""
@@ -36,7 +44,14 @@ class Contact(Base):
     last_name = Column(String(100))  # Last name for better contact management
     email = Column(String(255))
     phone = Column(String(50))
-    profile_image = Column(LargeBinary)  # Store profile image as binary data
+    # Profile image, by content hash, in the images table. Deferred so that
+    # loading a contact does not pull the BLOB; use profile_image_size or
+    # PRTAPI.get_profile_image.
+    profile_image_hash = Column(String(64), ForeignKey("images.hash"), index=True)
+    # Inline image from before the image store. Contacts whose image is in the
+    # store keep an empty BLOB here, so "profile_image IS NOT NULL" still
+    # selects the contacts that have a photo.
+    profile_image = deferred(Column(LargeBinary))
     profile_image_filename = Column(String(255))  # Original filename for reference
     profile_image_mime_type = Column(String(50))  # MIME type (e.g., 'image/jpeg')
     is_you = Column(Boolean, default=False)  # Special flag for the "You" contact
@@ -77,6 +92,52 @@ class Contact(Base):
         return f"<Contact(id={self.id}, name='{self.name}', email='{self.email}')>"
 
 
+class Image(Base):
+    """Original of a content-addressed image, stored once however many contacts use it."""
+
+    __tablename__ = "images"
+
+    hash = Column(String(64), primary_key=True)  # SHA-256 of the image bytes
+    mime_type = Column(String(50))
+    width = Column(Integer)  # NULL when Pillow can't read the image
+    height = Column(Integer)
+    byte_size = Column(Integer, nullable=False)
+    data = deferred(Column(LargeBinary, nullable=False))
+    created_at = Column(DateTime, default=lambda: datetime.now(UTC))
+
+    def __repr__(self):
+        return f"<Image(hash='{self.hash[:12]}', {self.width}x{self.height})>"
+
+
+class ImageThumbnail(Base):
+    """Downscaled JPEG copy of an image, generated when the image is stored."""
+
+    __tablename__ = "image_thumbnails"
+
+    image_hash = Column(String(64), ForeignKey("images.hash"), primary_key=True)
+    size = Column(Integer, primary_key=True)  # Bounding box edge in pixels
+    width = Column(Integer, nullable=False)
+    height = Column(Integer, nullable=False)
+    byte_size = Column(Integer, nullable=False)
+    data = deferred(Column(LargeBinary, nullable=False))
+
+    def __repr__(self):
+        return f"<ImageThumbnail(image_hash='{self.image_hash[:12]}', size={self.size})>"
+
+
+# Image size in bytes (NULL when there is no image), computed by SQLite in the
+# same SELECT that loads the contact so callers never need the BLOB itself.
+# Inline images are measured directly, stored ones looked up by hash.
+Contact.profile_image_size = column_property(
+    func.coalesce(
+        func.nullif(func.length(Contact.__table__.c.profile_image), 0),
+        select(Image.byte_size)
+        .where(Image.hash == Contact.__table__.c.profile_image_hash)
+        .scalar_subquery(),
+    )
+)
+
+
 class RelationshipType(Base):
     """Defines types of relationships between contacts (e.g., parent_of, friend_of)."""
 
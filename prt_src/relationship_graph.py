@@ -0,0 +1,290 @@
+"""
+In-memory relationship graph for PRT
+
+Loads the ``contact_relationships`` table once into compact CSR arrays
+(sorted node ids, row offsets and a flat neighbour array) so path, degree,
+mutual-connection and component queries run without a SQL round trip per
+visited contact. Relationship inserts and deletes are applied as a small
+delta overlay that is folded back into the arrays once it grows.
+"""
+
+import threading
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterable
+
+from sqlalchemy import select
+
+from .logging_config import get_logger
+from .models import ContactRelationship
+
+# Compact once the overlay holds this many touched contacts, or an eighth of
+# the base node count, whichever is larger.
+MIN_COMPACTION_THRESHOLD = 1024
+
+
+class RelationshipGraph:
+    """Undirected adjacency view of ``contact_relationships``.
+
+    Each relationship row contributes one edge in both directions, so
+    relationship direction and type are ignored, matching the SQL queries this
+    graph replaces. Parallel rows between the same two contacts are kept as
+    edge multiplicities so deleting one of them leaves the others intact.
+    """
+
+    def __init__(self):
+        self.logger = get_logger(__name__)
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._nodes = array("q")
+        self._offsets = array("q", [0])
+        self._neighbors = array("q")
+        self._delta: dict[int, dict[int, int]] = {}
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the graph currently mirrors the database."""
+        return self._loaded
+
+    def load(self, session) -> None:
+        """Build the adjacency arrays from every relationship row.
+
+        Args:
+            session: SQLAlchemy session bound to the PRT database
+        """
+        rows = session.execute(
+            select(ContactRelationship.from_contact_id, ContactRelationship.to_contact_id)
+        )
+        with self._lock:
+            self._build(rows)
+            self._loaded = True
+        self.logger.debug(
+            f"Loaded relationship graph: {len(self._nodes)} contacts, "
+            f"{len(self._neighbors) // 2} relationships"
+        )
+
+    def invalidate(self) -> None:
+        """Drop all graph state so the next query reloads from the database."""
+        with self._lock:
+            self._loaded = False
+            self._nodes = array("q")
+            self._offsets = array("q", [0])
+            self._neighbors = array("q")
+            self._delta = {}
+
+    def add_edge(self, from_id: int, to_id: int) -> None:
+        """Record a newly committed relationship row."""
+        self._apply_delta(from_id, to_id, 1)
+
+    def remove_edge(self, from_id: int, to_id: int) -> None:
+        """Record a deleted relationship row."""
+        self._apply_delta(from_id, to_id, -1)
+
+    def neighbors(self, contact_id: int) -> list[int]:
+        """Return the sorted, distinct contacts directly related to ``contact_id``."""
+        with self._lock:
+            base = self._base_neighbors(contact_id)
+            delta = self._delta.get(contact_id)
+            if not delta:
+                unique = []
+                for other in base:
+                    if not unique or unique[-1] != other:
+                        unique.append(other)
+                return unique
+
+            counts = Counter(base)
+            for other, change in delta.items():
+                counts[other] += change
+            return sorted(other for other, count in counts.items() if count > 0)
+
+    def shortest_path(self, from_id: int, to_id: int, max_depth: int = 6) -> list[int]:
+        """Find a shortest path with a bidirectional breadth-first search.
+
+        Args:
+            from_id: Starting contact ID
+            to_id: Target contact ID
+            max_depth: Maximum number of relationships on the path
+
+        Returns:
+            Contact IDs from ``from_id`` to ``to_id`` inclusive, or an empty list
+        """
+        if from_id == to_id:
+            return [from_id]
+
+        forward_parents: dict[int, int | None] = {from_id: None}
+        backward_parents: dict[int, int | None] = {to_id: None}
+        forward_frontier = [from_id]
+        backward_frontier = [to_id]
+        depth = 0
+
+        while forward_frontier and backward_frontier and depth < max_depth:
+            depth += 1
+            # Expand the smaller frontier to keep the search balanced
+            expand_forward = len(forward_frontier) <= len(backward_frontier)
+            if expand_forward:
+                frontier, parents, others = forward_frontier, forward_parents, backward_parents
+            else:
+                frontier, parents, others = backward_frontier, backward_parents, forward_parents
+
+            next_frontier = []
+            meeting = None
+            for current in frontier:
+                for other in self.neighbors(current):
+                    if other in parents:
+                        continue
+                    parents[other] = current
+                    if other in others:
+                        meeting = other
+                        break
+                    next_frontier.append(other)
+                if meeting is not None:
+                    break
+
+            if meeting is not None:
+                return self._join_paths(meeting, forward_parents, backward_parents)
+
+            if expand_forward:
+                forward_frontier = next_frontier
+            else:
+                backward_frontier = next_frontier
+
+        return []
+
+    def degrees(self, contact_id: int, degrees: int = 2) -> dict[int, list[tuple[int, int]]]:
+        """Group contacts by their degree of separation from ``contact_id``.
+
+        Args:
+            contact_id: Contact at the centre of the neighbourhood
+            degrees: How many hops to walk
+
+        Returns:
+            Mapping of degree to ``(contact_id, connected_through)`` pairs;
+            each contact appears once, at its smallest degree
+        """
+        visited = {contact_id}
+        levels: dict[int, list[tuple[int, int]]] = {}
+        frontier = [contact_id]
+
+        for degree in range(1, degrees + 1):
+            level = []
+            for current in frontier:
+                for other in self.neighbors(current):
+                    if other not in visited:
+                        visited.add(other)
+                        level.append((other, current))
+            if not level:
+                break
+            levels[degree] = level
+            frontier = [other for other, _through in level]
+
+        return levels
+
+    def mutual_connections(self, contact1_id: int, contact2_id: int) -> list[int]:
+        """Return contacts directly related to both contacts, sorted by ID."""
+        first = set(self.neighbors(contact1_id))
+        return [other for other in self.neighbors(contact2_id) if other in first]
+
+    def connected_components(self) -> list[list[int]]:
+        """Split every related contact into connected components.
+
+        Contacts without any relationship are not part of the graph and are
+        not returned.
+
+        Returns:
+            Components as sorted contact ID lists, largest component first
+        """
+        seen: set[int] = set()
+        components = []
+        for start in self._all_nodes():
+            if start in seen:
+                continue
+            seen.add(start)
+            component = [start]
+            stack = [start]
+            while stack:
+                for other in self.neighbors(stack.pop()):
+                    if other not in seen:
+                        seen.add(other)
+                        component.append(other)
+                        stack.append(other)
+            components.append(sorted(component))
+
+        components.sort(key=lambda c: (-len(c), c[0]))
+        return components
+
+    def _build(self, rows: Iterable[tuple[int, int]]) -> None:
+        """Replace the CSR arrays with the given undirected edge list."""
+        adjacency: dict[int, list[int]] = {}
+        for from_id, to_id in rows:
+            adjacency.setdefault(from_id, []).append(to_id)
+            adjacency.setdefault(to_id, []).append(from_id)
+
+        nodes = array("q", sorted(adjacency))
+        offsets = array("q", [0])
+        neighbors = array("q")
+        for node in nodes:
+            neighbors.extend(sorted(adjacency[node]))
+            offsets.append(len(neighbors))
+
+        self._nodes = nodes
+        self._offsets = offsets
+        self._neighbors = neighbors
+        self._delta = {}
+
+    def _base_neighbors(self, contact_id: int) -> array:
+        """Return the CSR slice for ``contact_id`` (with multiplicities)."""
+        index = bisect_left(self._nodes, contact_id)
+        if index == len(self._nodes) or self._nodes[index] != contact_id:
+            return array("q")
+        return self._neighbors[self._offsets[index] : self._offsets[index + 1]]
+
+    def _apply_delta(self, from_id: int, to_id: int, change: int) -> None:
+        with self._lock:
+            if not self._loaded:
+                return
+            for node, other in ((from_id, to_id), (to_id, from_id)):
+                node_delta = self._delta.setdefault(node, {})
+                node_delta[other] = node_delta.get(other, 0) + change
+                if node_delta[other] == 0:
+                    del node_delta[other]
+                if not node_delta:
+                    del self._delta[node]
+
+            if len(self._delta) > max(MIN_COMPACTION_THRESHOLD, len(self._nodes) // 8):
+                self._compact()
+
+    def _compact(self) -> None:
+        """Fold the delta overlay back into the CSR arrays."""
+        edges = []
+        for node in self._all_nodes():
+            counts = Counter(self._base_neighbors(node))
+            for other, change in self._delta.get(node, {}).items():
+                counts[other] += change
+            for other, count in counts.items():
+                # Emit each undirected edge once; self-loops are stored twice
+                if node < other or (node == other and count > 1):
+                    edges.extend([(node, other)] * (count if node != other else count // 2))
+        self._build(edges)
+
+    def _all_nodes(self) -> list[int]:
+        return sorted(set(self._nodes).union(self._delta))
+
+    @staticmethod
+    def _join_paths(
+        meeting: int,
+        forward_parents: dict[int, int | None],
+        backward_parents: dict[int, int | None],
+    ) -> list[int]:
+        path = []
+        node: int | None = meeting
+        while node is not None:
+            path.append(node)
+            node = forward_parents[node]
+        path.reverse()
+
+        node = backward_parents[meeting]
+        while node is not None:
+            path.append(node)
+            node = backward_parents[node]
+        return path
@@ -202,7 +202,12 @@ class SchemaInfoGenerator:
 
                 # Add special context for profile image columns
                 if col["name"] == "profile_image":
-                    col_desc += " - **CONTACT PHOTO/AVATAR** (50-500KB binary data)"
+                    col_desc += (
+                        " - **CONTACT PHOTO/AVATAR** (50-500KB binary data; empty when the"
+                        " photo is in the images table)"
+                    )
+                elif col["name"] == "profile_image_hash":
+                    col_desc += " - **PHOTO REFERENCE** (key of the photo in the images table)"
                 elif col["name"] == "profile_image_filename":
                     col_desc += " - **PHOTO FILENAME** (original image filename)"
                 elif col["name"] == "profile_image_mime_type":
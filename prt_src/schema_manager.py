@@ -20,7 +20,10 @@ console = Console()
 class SchemaManager:
     """Simple, safe database schema management."""
 
-    CURRENT_VERSION = 6
+    CURRENT_VERSION = 11
+
+    # Contacts whose images are moved per transaction by the v11 migration
+    IMAGE_MIGRATION_BATCH_SIZE = 200
 
     def __init__(self, db):
         """Initialize with database connection."""
@@ -440,6 +443,7 @@ class SchemaManager:
 
                 # executescript() committed everything, so refresh session state
                 self.db.session.expire_all()
+                self.db.invalidate_caches()
 
                 console.print("  ✓ Created FTS5 virtual tables", style="green")
                 console.print("  ✓ Added synchronization triggers", style="green")
@@ -543,6 +547,234 @@ class SchemaManager:
             self.db.session.rollback()
             raise RuntimeError(f"Failed to add TUI contact columns: {e}") from e
 
+    def apply_migration_v6_to_v7(self):
+        """Add indexes for reverse relationship and tag/note membership lookups."""
+        console.print("Adding lookup indexes...", style="blue")
+
+        indexes = [
+            # Incoming relationships; from_contact_id is covered by the unique constraint
+            "CREATE INDEX IF NOT EXISTS idx_contact_relationships_to"
+            " ON contact_relationships(to_contact_id, type_id)",
+            "CREATE INDEX IF NOT EXISTS idx_contact_relationships_type"
+            " ON contact_relationships(type_id)",
+            # The join tables' primary keys start with metadata_id, so lookups by
+            # tag or note scanned the whole table
+            "CREATE INDEX IF NOT EXISTS idx_metadata_tags_tag ON metadata_tags(tag_id, metadata_id)",
+            "CREATE INDEX IF NOT EXISTS idx_metadata_notes_note"
+            " ON metadata_notes(note_id, metadata_id)",
+            "CREATE INDEX IF NOT EXISTS idx_notes_title ON notes(title)",
+            # From migrations/005_add_performance_indexes.sql, which was never applied.
+            # The partial index is keyed on name so "contacts with images" reads only
+            # those rows, already in display order.
+            "CREATE INDEX IF NOT EXISTS idx_contacts_name ON contacts(name)",
+            "CREATE INDEX IF NOT EXISTS idx_contacts_profile_image_not_null"
+            " ON contacts(name) WHERE profile_image IS NOT NULL",
+        ]
+
+        try:
+            for statement in indexes:
+                self.db.session.execute(text(statement))
+            console.print(f"  ✓ Created {len(indexes)} indexes", style="green")
+
+            # Update schema version
+            self.db.session.execute(
+                text("UPDATE schema_version SET version = 7, updated_at = CURRENT_TIMESTAMP")
+            )
+
+            self.db.session.commit()
+            console.print("✅ Lookup indexes added successfully!", style="green bold")
+
+        except Exception as e:
+            self.db.session.rollback()
+            raise RuntimeError(f"Failed to add lookup indexes: {e}") from e
+
+    def apply_migration_v7_to_v8(self):
+        """Add the contact_degree summary table used by relationship analytics."""
+        console.print("Adding relationship degree summary...", style="blue")
+
+        try:
+            migration_path = Path(__file__).parent.parent / "migrations" / "add_contact_degree.sql"
+            if not migration_path.exists():
+                raise RuntimeError(f"Migration file not found: {migration_path}")
+
+            # The script defines triggers with BEGIN...END blocks, so it goes through
+            # executescript; the version update is appended to keep it atomic
+            sql_content = migration_path.read_text()
+            sql_content += (
+                "\nUPDATE schema_version SET version = 8, updated_at = CURRENT_TIMESTAMP;\n"
+            )
+
+            raw_connection = self.db.engine.raw_connection()
+            try:
+                cursor = raw_connection.cursor()
+                cursor.executescript(sql_content)
+                cursor.close()
+            finally:
+                raw_connection.close()
+
+            # executescript() committed everything, so refresh session state
+            self.db.session.expire_all()
+            self.db.invalidate_caches()
+
+            console.print("  ✓ Created contact_degree table", style="green")
+            console.print("  ✓ Added synchronization triggers", style="green")
+            console.print("✅ Relationship degree summary added successfully!", style="green bold")
+
+        except Exception as e:
+            self.db.session.rollback()
+            raise RuntimeError(f"Failed to add relationship degree summary: {e}") from e
+
+    def apply_migration_v8_to_v9(self):
+        """Add expression indexes on the contact match keys used by import de-duplication."""
+        from .core.components.dedup import EMAIL_KEY_SQL
+        from .core.components.dedup import NAME_KEY_SQL
+        from .core.components.dedup import PHONE_DIGITS_SQL
+
+        console.print("Adding contact match key indexes...", style="blue")
+
+        indexes = [
+            f"CREATE INDEX IF NOT EXISTS idx_contacts_email_key ON contacts({EMAIL_KEY_SQL})",
+            f"CREATE INDEX IF NOT EXISTS idx_contacts_phone_key ON contacts({PHONE_DIGITS_SQL})",
+            f"CREATE INDEX IF NOT EXISTS idx_contacts_name_key ON contacts({NAME_KEY_SQL})",
+        ]
+
+        try:
+            for statement in indexes:
+                self.db.session.execute(text(statement))
+            console.print(f"  ✓ Created {len(indexes)} indexes", style="green")
+
+            # Update schema version
+            self.db.session.execute(
+                text("UPDATE schema_version SET version = 9, updated_at = CURRENT_TIMESTAMP")
+            )
+
+            self.db.session.commit()
+            console.print("✅ Contact match key indexes added successfully!", style="green bold")
+
+        except Exception as e:
+            self.db.session.rollback()
+            raise RuntimeError(f"Failed to add contact match key indexes: {e}") from e
+
+    def apply_migration_v9_to_v10(self):
+        """Add the contact_sources table that makes re-imports incremental."""
+        console.print("Adding import source fingerprints...", style="blue")
+
+        try:
+            migration_path = Path(__file__).parent.parent / "migrations" / "add_contact_sources.sql"
+            if not migration_path.exists():
+                raise RuntimeError(f"Migration file not found: {migration_path}")
+
+            # The script defines a trigger, so it goes through executescript with
+            # the version update appended, as in apply_migration_v7_to_v8
+            sql_content = migration_path.read_text()
+            sql_content += (
+                "\nUPDATE schema_version SET version = 10, updated_at = CURRENT_TIMESTAMP;\n"
+            )
+
+            raw_connection = self.db.engine.raw_connection()
+            try:
+                cursor = raw_connection.cursor()
+                cursor.executescript(sql_content)
+                cursor.close()
+            finally:
+                raw_connection.close()
+
+            # executescript() committed everything, so refresh session state
+            self.db.session.expire_all()
+            self.db.invalidate_caches()
+
+            console.print("  ✓ Created contact_sources table", style="green")
+            console.print("✅ Import source fingerprints added successfully!", style="green bold")
+
+        except Exception as e:
+            self.db.session.rollback()
+            raise RuntimeError(f"Failed to add import source fingerprints: {e}") from e
+
+    def apply_migration_v10_to_v11(self):
+        """Move profile images out of the contacts table into the content-addressed image store."""
+        from .image_store import IMAGE_IN_STORE
+        from .image_store import ImageStore
+
+        console.print("Moving profile images to the image store...", style="blue")
+        session = self.db.session
+
+        try:
+            # The ORM may have created the column already
+            cursor = session.execute(text("PRAGMA table_info(contacts)"))
+            if "profile_image_hash" not in {row[1] for row in cursor.fetchall()}:
+                session.execute(
+                    text(
+                        "ALTER TABLE contacts ADD COLUMN profile_image_hash VARCHAR(64)"
+                        " REFERENCES images(hash)"
+                    )
+                )
+                console.print("  ✓ Added profile_image_hash column", style="green")
+            session.commit()
+
+            migration_path = Path(__file__).parent.parent / "migrations" / "add_image_store.sql"
+            if not migration_path.exists():
+                raise RuntimeError(f"Migration file not found: {migration_path}")
+
+            # The script defines triggers, so it goes through executescript
+            raw_connection = self.db.engine.raw_connection()
+            try:
+                cursor = raw_connection.cursor()
+                cursor.executescript(migration_path.read_text())
+                cursor.close()
+            finally:
+                raw_connection.close()
+            session.expire_all()
+            console.print("  ✓ Created image store tables", style="green")
+
+            # Move the BLOBs a batch per transaction, so only one batch is in
+            # memory and an interrupted migration resumes where it stopped
+            store = ImageStore(session)
+            moved = 0
+            while True:
+                rows = session.execute(
+                    text(
+                        "SELECT id, profile_image, profile_image_mime_type FROM contacts"
+                        " WHERE profile_image_hash IS NULL AND length(profile_image) > 0"
+                        " LIMIT :limit"
+                    ),
+                    {"limit": self.IMAGE_MIGRATION_BATCH_SIZE},
+                ).all()
+                if not rows:
+                    break
+                hashes = store.put_many([(row[1], row[2]) for row in rows])
+                session.execute(
+                    text(
+                        "UPDATE contacts SET profile_image_hash = :hash, profile_image = :marker"
+                        " WHERE id = :id"
+                    ),
+                    [
+                        {"id": row[0], "hash": image_hash, "marker": IMAGE_IN_STORE}
+                        for row, image_hash in zip(rows, hashes, strict=True)
+                    ],
+                )
+                session.commit()
+                moved += len(rows)
+            distinct = session.execute(text("SELECT COUNT(*) FROM images")).scalar()
+            console.print(f"  ✓ Moved {moved} profile images ({distinct} distinct)", style="green")
+
+            session.execute(
+                text("UPDATE schema_version SET version = 11, updated_at = CURRENT_TIMESTAMP")
+            )
+            session.commit()
+
+            if moved:
+                # Give the space the BLOBs took back, so the file and its backups shrink
+                session.execute(text("VACUUM"))
+                session.commit()
+                console.print("  ✓ Compacted database file", style="green")
+
+            self.db.invalidate_caches()
+            console.print("✅ Image store added successfully!", style="green bold")
+
+        except Exception as e:
+            session.rollback()
+            raise RuntimeError(f"Failed to add image store: {e}") from e
+
     def migrate_to_version(self, target_version: int, current_version: int):
         """Apply migrations to reach target version."""
         # Map of all migration paths
@@ -552,6 +784,45 @@ class SchemaManager:
             (3, 4): [self.apply_migration_v3_to_v4],
             (4, 5): [self.apply_migration_v4_to_v5],
             (5, 6): [self.apply_migration_v5_to_v6],
+            (6, 7): [self.apply_migration_v6_to_v7],
+            (6, 8): [
+                self.apply_migration_v6_to_v7,
+                self.apply_migration_v7_to_v8,
+            ],
+            (6, 9): [
+                self.apply_migration_v6_to_v7,
+                self.apply_migration_v7_to_v8,
+                self.apply_migration_v8_to_v9,
+            ],
+            (6, 10): [
+                self.apply_migration_v6_to_v7,
+                self.apply_migration_v7_to_v8,
+                self.apply_migration_v8_to_v9,
+                self.apply_migration_v9_to_v10,
+            ],
+            (6, 11): [
+                self.apply_migration_v6_to_v7,
+                self.apply_migration_v7_to_v8,
+                self.apply_migration_v8_to_v9,
+                self.apply_migration_v9_to_v10,
+                self.apply_migration_v10_to_v11,
+            ],
+            (7, 8): [self.apply_migration_v7_to_v8],
+            (7, 9): [
+                self.apply_migration_v7_to_v8,
+                self.apply_migration_v8_to_v9,
+            ],
+            (7, 10): [
+                self.apply_migration_v7_to_v8,
+                self.apply_migration_v8_to_v9,
+                self.apply_migration_v9_to_v10,
+            ],
+            (7, 11): [
+                self.apply_migration_v7_to_v8,
+                self.apply_migration_v8_to_v9,
+                self.apply_migration_v9_to_v10,
+                self.apply_migration_v10_to_v11,
+            ],
             (1, 3): [self.apply_migration_v1_to_v2, self.apply_migration_v2_to_v3],
             (1, 4): [
                 self.apply_migration_v1_to_v2,
@@ -571,6 +842,56 @@ class SchemaManager:
                 self.apply_migration_v4_to_v5,
                 self.apply_migration_v5_to_v6,
             ],
+            (1, 7): [
+                self.apply_migration_v1_to_v2,
+                self.apply_migration_v2_to_v3,
+                self.apply_migration_v3_to_v4,
+                self.apply_migration_v4_to_v5,
+                self.apply_migration_v5_to_v6,
+                self.apply_migration_v6_to_v7,
+            ],
+            (1, 8): [
+                self.apply_migration_v1_to_v2,
+                self.apply_migration_v2_to_v3,
+                self.apply_migration_v3_to_v4,
+                self.apply_migration_v4_to_v5,
+                self.apply_migration_v5_to_v6,
+                self.apply_migration_v6_to_v7,
+                self.apply_migration_v7_to_v8,
+            ],
+            (1, 9): [
+                self.apply_migration_v1_to_v2,
+                self.apply_migration_v2_to_v3,
+                self.apply_migration_v3_to_v4,
+                self.apply_migration_v4_to_v5,
+                self.apply_migration_v5_to_v6,
+                self.apply_migration_v6_to_v7,
+                self.apply_migration_v7_to_v8,
+                self.apply_migration_v8_to_v9,
+            ],
+            (1, 10): [
+                self.apply_migration_v1_to_v2,
+                self.apply_migration_v2_to_v3,
+                self.apply_migration_v3_to_v4,
+                self.apply_migration_v4_to_v5,
+                self.apply_migration_v5_to_v6,
+                self.apply_migration_v6_to_v7,
+                self.apply_migration_v7_to_v8,
+                self.apply_migration_v8_to_v9,
+                self.apply_migration_v9_to_v10,
+            ],
+            (1, 11): [
+                self.apply_migration_v1_to_v2,
+                self.apply_migration_v2_to_v3,
+                self.apply_migration_v3_to_v4,
+                self.apply_migration_v4_to_v5,
+                self.apply_migration_v5_to_v6,
+                self.apply_migration_v6_to_v7,
+                self.apply_migration_v7_to_v8,
+                self.apply_migration_v8_to_v9,
+                self.apply_migration_v9_to_v10,
+                self.apply_migration_v10_to_v11,
+            ],
             (2, 4): [self.apply_migration_v2_to_v3, self.apply_migration_v3_to_v4],
             (2, 5): [
                 self.apply_migration_v2_to_v3,
@@ -583,13 +904,176 @@ class SchemaManager:
                 self.apply_migration_v4_to_v5,
                 self.apply_migration_v5_to_v6,
             ],
+            (2, 7): [
+                self.apply_migration_v2_to_v3,
+                self.apply_migration_v3_to_v4,
+                self.apply_migration_v4_to_v5,
+                self.apply_migration_v5_to_v6,
+                self.apply_migration_v6_to_v7,
+            ],
+            (2, 8): [
+                self.apply_migration_v2_to_v3,
+                self.apply_migration_v3_to_v4,
+                self.apply_migration_v4_to_v5,
+                self.apply_migration_v5_to_v6,
+                self.apply_migration_v6_to_v7,
+                self.apply_migration_v7_to_v8,
+            ],
+            (2, 9): [
+                self.apply_migration_v2_to_v3,
+                self.apply_migration_v3_to_v4,
+                self.apply_migration_v4_to_v5,
+                self.apply_migration_v5_to_v6,
+                self.apply_migration_v6_to_v7,
+                self.apply_migration_v7_to_v8,
+                self.apply_migration_v8_to_v9,
+            ],
+            (2, 10): [
+                self.apply_migration_v2_to_v3,
+                self.apply_migration_v3_to_v4,
+                self.apply_migration_v4_to_v5,
+                self.apply_migration_v5_to_v6,
+                self.apply_migration_v6_to_v7,
+                self.apply_migration_v7_to_v8,
+                self.apply_migration_v8_to_v9,
+                self.apply_migration_v9_to_v10,
+            ],
+            (2, 11): [
+                self.apply_migration_v2_to_v3,
+                self.apply_migration_v3_to_v4,
+                self.apply_migration_v4_to_v5,
+                self.apply_migration_v5_to_v6,
+                self.apply_migration_v6_to_v7,
+                self.apply_migration_v7_to_v8,
+                self.apply_migration_v8_to_v9,
+                self.apply_migration_v9_to_v10,
+                self.apply_migration_v10_to_v11,
+            ],
             (3, 5): [self.apply_migration_v3_to_v4, self.apply_migration_v4_to_v5],
             (3, 6): [
                 self.apply_migration_v3_to_v4,
                 self.apply_migration_v4_to_v5,
                 self.apply_migration_v5_to_v6,
             ],
+            (3, 7): [
+                self.apply_migration_v3_to_v4,
+                self.apply_migration_v4_to_v5,
+                self.apply_migration_v5_to_v6,
+                self.apply_migration_v6_to_v7,
+            ],
+            (3, 8): [
+                self.apply_migration_v3_to_v4,
+                self.apply_migration_v4_to_v5,
+                self.apply_migration_v5_to_v6,
+                self.apply_migration_v6_to_v7,
+                self.apply_migration_v7_to_v8,
+            ],
+            (3, 9): [
+                self.apply_migration_v3_to_v4,
+                self.apply_migration_v4_to_v5,
+                self.apply_migration_v5_to_v6,
+                self.apply_migration_v6_to_v7,
+                self.apply_migration_v7_to_v8,
+                self.apply_migration_v8_to_v9,
+            ],
+            (3, 10): [
+                self.apply_migration_v3_to_v4,
+                self.apply_migration_v4_to_v5,
+                self.apply_migration_v5_to_v6,
+                self.apply_migration_v6_to_v7,
+                self.apply_migration_v7_to_v8,
+                self.apply_migration_v8_to_v9,
+                self.apply_migration_v9_to_v10,
+            ],
+            (3, 11): [
+                self.apply_migration_v3_to_v4,
+                self.apply_migration_v4_to_v5,
+                self.apply_migration_v5_to_v6,
+                self.apply_migration_v6_to_v7,
+                self.apply_migration_v7_to_v8,
+                self.apply_migration_v8_to_v9,
+                self.apply_migration_v9_to_v10,
+                self.apply_migration_v10_to_v11,
+            ],
             (4, 6): [self.apply_migration_v4_to_v5, self.apply_migration_v5_to_v6],
+            (4, 7): [
+                self.apply_migration_v4_to_v5,
+                self.apply_migration_v5_to_v6,
+                self.apply_migration_v6_to_v7,
+            ],
+            (4, 8): [
+                self.apply_migration_v4_to_v5,
+                self.apply_migration_v5_to_v6,
+                self.apply_migration_v6_to_v7,
+                self.apply_migration_v7_to_v8,
+            ],
+            (4, 9): [
+                self.apply_migration_v4_to_v5,
+                self.apply_migration_v5_to_v6,
+                self.apply_migration_v6_to_v7,
+                self.apply_migration_v7_to_v8,
+                self.apply_migration_v8_to_v9,
+            ],
+            (4, 10): [
+                self.apply_migration_v4_to_v5,
+                self.apply_migration_v5_to_v6,
+                self.apply_migration_v6_to_v7,
+                self.apply_migration_v7_to_v8,
+                self.apply_migration_v8_to_v9,
+                self.apply_migration_v9_to_v10,
+            ],
+            (4, 11): [
+                self.apply_migration_v4_to_v5,
+                self.apply_migration_v5_to_v6,
+                self.apply_migration_v6_to_v7,
+                self.apply_migration_v7_to_v8,
+                self.apply_migration_v8_to_v9,
+                self.apply_migration_v9_to_v10,
+                self.apply_migration_v10_to_v11,
+            ],
+            (5, 7): [self.apply_migration_v5_to_v6, self.apply_migration_v6_to_v7],
+            (5, 8): [
+                self.apply_migration_v5_to_v6,
+                self.apply_migration_v6_to_v7,
+                self.apply_migration_v7_to_v8,
+            ],
+            (5, 9): [
+                self.apply_migration_v5_to_v6,
+                self.apply_migration_v6_to_v7,
+                self.apply_migration_v7_to_v8,
+                self.apply_migration_v8_to_v9,
+            ],
+            (5, 10): [
+                self.apply_migration_v5_to_v6,
+                self.apply_migration_v6_to_v7,
+                self.apply_migration_v7_to_v8,
+                self.apply_migration_v8_to_v9,
+                self.apply_migration_v9_to_v10,
+            ],
+            (5, 11): [
+                self.apply_migration_v5_to_v6,
+                self.apply_migration_v6_to_v7,
+                self.apply_migration_v7_to_v8,
+                self.apply_migration_v8_to_v9,
+                self.apply_migration_v9_to_v10,
+                self.apply_migration_v10_to_v11,
+            ],
+            (8, 9): [self.apply_migration_v8_to_v9],
+            (8, 10): [
+                self.apply_migration_v8_to_v9,
+                self.apply_migration_v9_to_v10,
+            ],
+            (8, 11): [
+                self.apply_migration_v8_to_v9,
+                self.apply_migration_v9_to_v10,
+                self.apply_migration_v10_to_v11,
+            ],
+            (9, 10): [self.apply_migration_v9_to_v10],
+            (9, 11): [
+                self.apply_migration_v9_to_v10,
+                self.apply_migration_v10_to_v11,
+            ],
+            (10, 11): [self.apply_migration_v10_to_v11],
         }
 
         migration_path = migrations.get((current_version, target_version))
@@ -197,6 +197,8 @@ class PRTApp(App):
         # Otherwise let PRTAPI load its own config
         prt_api = PRTAPI(provided_config) if provided_config is not None else PRTAPI()
         self.data_service = DataService(prt_api)
+        # Warm the unified search cache without delaying startup
+        prt_api.start_search_warmup()
         self.notification_service = NotificationService(self)
 
         # Initialize LLM service using factory
@@ -274,10 +276,9 @@ class PRTApp(App):
             True if database has no contacts, False otherwise
         """
         try:
-            contacts = self.data_service.api.list_all_contacts()
-            has_contacts = len(contacts) > 0
-            logger.info(f"Database check: {len(contacts)} contacts found")
-            return not has_contacts
+            count = self.data_service.api.get_database_stats()["contacts"]
+            logger.info(f"Database check: {count} contacts found")
+            return count == 0
         except Exception as e:
             logger.warning(f"Error checking database: {e}")
             return True  # Show setup on error
@@ -338,6 +339,10 @@ class PRTApp(App):
         except Exception as e:
             logger.debug(f"Could not notify screen of mode change: {e}")
 
+    def on_unmount(self) -> None:
+        """Stop the data service's database thread."""
+        self.data_service.close()
+
     def action_quit(self) -> None:
         """Quit the application (only in navigation mode)."""
         if self.current_mode == AppMode.NAVIGATION:
@@ -1,7 +1,5 @@
 """Chat screen - LLM interaction interface."""
 
-import asyncio
-
 from textual import events
 from textual.app import ComposeResult
 from textual.binding import Binding
@@ -326,19 +324,24 @@ class ChatScreen(BaseScreen):
         self.bottom_nav.show_status("Sending message to LLM...")
 
         try:
-            # Call LLM chat (it's synchronous, so run in thread pool)
-            logger.info(f"[CHAT] Calling LLM via asyncio.to_thread, message length: {len(message)}")
-            response = await asyncio.to_thread(self.llm_service.chat, message)
-            logger.info(f"[CHAT] Received response from LLM, length: {len(response)}")
-
-            # Add to response buffer
-            self._add_to_response_buffer(f"\n> You: {message}\n\n{response}\n")
-
-            # Update display
-            self.chat_response_content.update(self.response_buffer)
+            # Stream the response: the blocking provider calls run in a worker
+            # thread and tokens are rendered as they arrive
+            logger.info(f"[CHAT] Streaming LLM response, message length: {len(message)}")
+            self._add_to_response_buffer(f"\n> You: {message}\n\n")
+            self._render_response()
+
+            response_length = 0
+            async for chunk in self.llm_service.stream_chat(message):
+                if response_length == 0:
+                    self.chat_loading.display = False
+                    self.chat_status_text.update("⏳ LLM: STREAMING │ Receiving response...")
+                response_length += len(chunk)
+                self._add_to_response_buffer(chunk)
+                self._render_response()
 
-            # Auto-scroll to bottom to show new response
-            self.chat_response.scroll_end(animate=False)
+            self._add_to_response_buffer("\n")
+            self._render_response()
+            logger.info(f"[CHAT] Received response from LLM, length: {response_length}")
 
             # Reset status - hide loading indicator
             self.chat_loading.display = False
@@ -375,6 +378,11 @@ class ChatScreen(BaseScreen):
         await self._send_message_to_llm(message)
         logger.info("[CHAT] Message sent successfully")
 
+    def _render_response(self) -> None:
+        """Show the response buffer and keep the newest text in view."""
+        self.chat_response_content.update(self.response_buffer)
+        self.chat_response.scroll_end(animate=False)
+
     def _add_to_response_buffer(self, text: str) -> None:
         """Add text to response buffer with 64KB limit.
 
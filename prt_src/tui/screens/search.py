@@ -16,9 +16,14 @@ from prt_src.tui.screens.base import BaseScreen
 from prt_src.tui.widgets import BottomNav
 from prt_src.tui.widgets import DropdownMenu
 from prt_src.tui.widgets import TopNav
+from prt_src.tui.widgets.contact_detail import PHOTO_COLUMNS
+from prt_src.tui.widgets.contact_detail import render_photo
 
 logger = get_logger(__name__)
 
+# Contacts shown per page when listing all contacts
+CONTACT_PAGE_SIZE = 50
+
 
 class SearchTextArea(TextArea):
     """Custom TextArea that intercepts Enter key to execute search instead of inserting newline.
@@ -96,6 +101,7 @@ class SearchScreen(BaseScreen):
         self.screen_title = "SEARCH"
         self.current_search_type = self.SEARCH_CONTACTS
         self._processing_enter = False  # Flag to prevent double-processing
+        self._contact_pages = None  # Paginator while listing all contacts
 
     def compose(self) -> ComposeResult:
         """Compose the search screen layout."""
@@ -132,6 +138,10 @@ class SearchScreen(BaseScreen):
             # Results display (scrollable container)
             with VerticalScroll(id=WidgetIDs.SEARCH_RESULTS) as self.results_display:
                 self.results_display.can_focus = True
+                # Profile photo, shown when a contact search finds one contact
+                self.contact_photo = Static("", id="search-contact-photo")
+                self.contact_photo.display = False
+                yield self.contact_photo
                 self.results_content = Static(
                     "Enter a search query and select a search type.",
                     id="search-results-content",
@@ -213,6 +223,11 @@ class SearchScreen(BaseScreen):
                 # Number keys only work in NAV mode (not EDIT) to allow phone number searches
                 self.action_select_search_type(key)
                 event.prevent_default()
+            elif self._contact_pages and key in ("left_square_bracket", "right_square_bracket"):
+                step = 1 if key == "right_square_bracket" else -1
+                page_number = self._contact_pages.current_page + step
+                self.run_worker(self._show_contact_page(page_number), exclusive=True)
+                event.prevent_default()
             elif self.dropdown.display:
                 # When menu is open, check for menu actions
                 action = self.dropdown.get_action(key)
@@ -269,6 +284,8 @@ class SearchScreen(BaseScreen):
     async def _async_execute_search(self) -> None:
         """Async method to execute search with current query and type."""
         query = self.search_input.text.strip()
+        self._contact_pages = None
+        self.contact_photo.display = False
 
         # Empty query = list all items of selected type
         if not query:
@@ -285,7 +302,12 @@ class SearchScreen(BaseScreen):
             if not query:
                 # Empty query - list all items
                 if self.current_search_type == self.SEARCH_CONTACTS:
-                    results = await self.data_service.list_all_contacts()
+                    # Page through contacts instead of loading them all
+                    self._contact_pages = await self.data_service.get_contact_paginator(
+                        CONTACT_PAGE_SIZE
+                    )
+                    await self._show_contact_page(1)
+                    return
                 elif self.current_search_type == self.SEARCH_TAGS:
                     results = await self.data_service.list_all_tags()
                 elif self.current_search_type == self.SEARCH_NOTES:
@@ -335,6 +357,8 @@ class SearchScreen(BaseScreen):
                 result_text = f"All {self.current_search_type.replace('_', ' ').title()} ({len(results)} total):\n\n"
             for item in results:
                 result_text += self._format_result_item(item) + "\n"
+            if self.current_search_type == self.SEARCH_CONTACTS and len(results) == 1:
+                await self._show_contact_photo(results[0])
             self.results_content.update(result_text)
             if query:
                 self.bottom_nav.show_status(f"Found {len(results)} results for '{query}'")
@@ -343,6 +367,55 @@ class SearchScreen(BaseScreen):
                     f"Showing all {len(results)} {self.current_search_type}"
                 )
 
+    async def _show_contact_page(self, page_number: int) -> None:
+        """Display one page of the all-contacts listing.
+
+        Args:
+            page_number: Page number (1-indexed); clamped to the available pages
+        """
+        page = None
+        if self._contact_pages:
+            page = await self.data_service.get_contact_page(self._contact_pages, page_number)
+        if page is None:
+            self._contact_pages = None
+            self.results_content.update("Operation failed: could not load contacts")
+            self.bottom_nav.show_status("Operation failed: could not load contacts")
+            return
+        if not page.items:
+            self.results_content.update(f"No {self.SEARCH_CONTACTS} found in database")
+            self.bottom_nav.show_status(f"No {self.SEARCH_CONTACTS} found")
+            return
+
+        result_text = (
+            f"All Contacts ({page.total_items} total, "
+            f"page {page.page_number} of {page.total_pages}):\n\n"
+        )
+        for item in page.items:
+            result_text += self._format_result_item(item) + "\n"
+        self.results_content.update(result_text)
+        self.results_display.scroll_home(animate=False)
+
+        first = (page.page_number - 1) * page.page_size + 1
+        status = f"Showing contacts {first}-{first + len(page.items) - 1} of {page.total_items}"
+        if page.total_pages > 1:
+            status += " ([ and ] change page)"
+        self.bottom_nav.show_status(status)
+
+    async def _show_contact_photo(self, contact: dict) -> None:
+        """Show a contact's profile photo above the results, if it has one.
+
+        Args:
+            contact: Contact dictionary from a search
+        """
+        if not contact.get("has_profile_image"):
+            return
+        # A PHOTO_COLUMNS pixel image is all the half-block rendering can show
+        photo = await self.data_service.get_contact_photo(contact["id"], PHOTO_COLUMNS)
+        rendered = render_photo(photo) if photo else None
+        if rendered is not None:
+            self.contact_photo.update(rendered)
+            self.contact_photo.display = True
+
     def _format_result_item(self, item: dict) -> str:
         """Format a single result item for display.
 
@@ -363,7 +363,9 @@ class SetupScreen(BaseScreen):
             )
 
             # Import
-            success, msg, info = await self._takeout_service.import_contacts(file_path)
+            success, msg, info = await self._takeout_service.import_contacts(
+                file_path, lambda status: self.app.call_from_thread(self._show_status, status)
+            )
 
             if success:
                 # Build detailed success summary
@@ -410,6 +412,10 @@ class SetupScreen(BaseScreen):
             percentage = (image_count / total * 100) if total > 0 else 0
             lines.append(f"  • With profile images: {image_count} ({percentage:.0f}%)")
 
+        # Add what the import changed, when it was synced against a previous one
+        if info.get("sync_summary"):
+            lines.append(f"  • Changes: {info['sync_summary']}")
+
         # Add deduplication info if available
         if info.get("duplicates_removed", 0) > 0:
             lines.append(f"  • De-duplicated: {info['duplicates_removed']} contacts")
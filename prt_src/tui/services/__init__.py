@@ -5,6 +5,7 @@ Composable services that can be injected into screens.
 
 from prt_src.tui.services.chat_context_manager import ChatContextManager
 from prt_src.tui.services.data import DataService
+from prt_src.tui.services.db_executor import DatabaseExecutor
 from prt_src.tui.services.fixture import FixtureService
 from prt_src.tui.services.google_takeout import GoogleTakeoutService
 from prt_src.tui.services.navigation import NavEntry
@@ -16,6 +17,7 @@ from prt_src.tui.services.selection_service import SelectionService
 __all__ = [
     "ChatContextManager",
     "DataService",
+    "DatabaseExecutor",
     "FixtureService",
     "GoogleTakeoutService",
     "NavEntry",
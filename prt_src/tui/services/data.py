@@ -1,12 +1,17 @@
 """Data service for PRT TUI screens.
 
-Wraps PRTAPI to provide data access for screens.
+Wraps PRTAPI to provide data access for screens. API calls run on the
+DatabaseExecutor thread so database work never blocks the event loop;
+searches and exports run on its reader threads in their own read sessions.
 """
 
+from collections.abc import Callable
 from typing import Any
 
 from prt_src.api import PRTAPI
+from prt_src.db import Database
 from prt_src.logging_config import get_logger
+from prt_src.tui.services.db_executor import DatabaseExecutor
 
 logger = get_logger(__name__)
 
@@ -18,13 +23,38 @@ class DataService:
     to access contacts, relationships, tags, and notes.
     """
 
-    def __init__(self, api: PRTAPI | None = None):
+    # Searches share this key so a new query supersedes the previous one
+    SEARCH_KEY = "search"
+
+    def __init__(self, api: PRTAPI | None = None, executor: DatabaseExecutor | None = None):
         """Initialize data service.
 
         Args:
             api: PRTAPI instance, or creates one if None
+            executor: Executor that runs API calls, or creates one if None
         """
         self.api = api or PRTAPI()
+        db = getattr(self.api, "db", None)
+        self.executor = executor or DatabaseExecutor(
+            read_session=db.read_session if isinstance(db, Database) else None
+        )
+
+    async def _call(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        supersede_key: str | None = None,
+        read_only: bool = False,
+        **kwargs: Any,
+    ) -> Any:
+        """Run a blocking API call on the database thread, or a reader thread if read-only."""
+        return await self.executor.run(
+            func, *args, supersede_key=supersede_key, read_only=read_only, **kwargs
+        )
+
+    def close(self) -> None:
+        """Stop the database thread without waiting for a running call."""
+        self.executor.shutdown(wait=False)
 
     # Contact operations
 
@@ -39,13 +69,43 @@ class DataService:
             List of contact dictionaries
         """
         try:
-            # Use paginated API method
-            page = (offset // limit) + 1  # Convert offset to 1-based page
-            return self.api.get_contacts_paginated(page, limit)
+            page = await self._call(self.api.get_contacts_page, limit, offset=offset)
+            return page["contacts"]
         except Exception as e:
             logger.error(f"Failed to get contacts: {e}")
             return []
 
+    async def get_contact_paginator(self, page_size: int = 20) -> Any:
+        """Get a paginator that loads contact pages from the database on demand.
+
+        Args:
+            page_size: Number of contacts per page
+
+        Returns:
+            PaginationSystem instance, or None on error
+        """
+        try:
+            return await self._call(self.api.create_contact_paginator, page_size)
+        except Exception as e:
+            logger.error(f"Failed to create contact paginator: {e}")
+            return None
+
+    async def get_contact_page(self, paginator: Any, page_number: int) -> Any:
+        """Load a page from a contact paginator, reading it from the database if needed.
+
+        Args:
+            paginator: PaginationSystem from ``get_contact_paginator``
+            page_number: Page number (1-indexed)
+
+        Returns:
+            Page instance, or None on error
+        """
+        try:
+            return await self._call(paginator.go_to_page, page_number, read_only=True)
+        except Exception as e:
+            logger.error(f"Failed to load contact page {page_number}: {e}")
+            return None
+
     async def get_contact(self, contact_id: int) -> dict | None:
         """Get a single contact by ID.
 
@@ -56,11 +116,27 @@ class DataService:
             Contact dictionary or None
         """
         try:
-            return self.api.get_contact(contact_id)
+            return await self._call(self.api.get_contact, contact_id)
         except Exception as e:
             logger.error(f"Failed to get contact {contact_id}: {e}")
             return None
 
+    async def get_contact_photo(self, contact_id: int, size: int) -> bytes | None:
+        """Get a contact's profile image at the smallest stored size covering ``size``.
+
+        Args:
+            contact_id: Contact ID
+            size: Pixels the photo will be displayed at along its longest edge
+
+        Returns:
+            Image bytes, or None if the contact has no image
+        """
+        try:
+            return await self._call(self.api.get_profile_image, contact_id, size, read_only=True)
+        except Exception as e:
+            logger.error(f"Failed to get photo for contact {contact_id}: {e}")
+            return None
+
     async def create_contact(self, data: dict) -> dict | None:
         """Create a new contact.
 
@@ -71,7 +147,8 @@ class DataService:
             Created contact or None
         """
         try:
-            return self.api.add_contact(
+            return await self._call(
+                self.api.add_contact,
                 first_name=data.get("first_name", ""),
                 last_name=data.get("last_name", ""),
                 email=data.get("email"),
@@ -92,7 +169,7 @@ class DataService:
             True if successful
         """
         try:
-            return self.api.update_contact(contact_id, **data)
+            return await self._call(self.api.update_contact, contact_id, **data)
         except Exception as e:
             logger.error(f"Failed to update contact {contact_id}: {e}")
             return False
@@ -107,7 +184,7 @@ class DataService:
             True if successful
         """
         try:
-            return self.api.delete_contact(contact_id)
+            return await self._call(self.api.delete_contact, contact_id)
         except Exception as e:
             logger.error(f"Failed to delete contact {contact_id}: {e}")
             return False
@@ -122,7 +199,9 @@ class DataService:
             List of matching contacts
         """
         try:
-            return self.api.search_contacts(query)
+            return await self._call(
+                self.api.search_contacts, query, supersede_key=self.SEARCH_KEY, read_only=True
+            )
         except Exception as e:
             logger.error(f"Failed to search contacts: {e}", exc_info=True)
             return []
@@ -137,7 +216,9 @@ class DataService:
             List of matching tags
         """
         try:
-            return self.api.search_tags(query)
+            return await self._call(
+                self.api.search_tags, query, supersede_key=self.SEARCH_KEY, read_only=True
+            )
         except Exception as e:
             logger.error(f"Failed to search tags: {e}", exc_info=True)
             return []
@@ -152,7 +233,9 @@ class DataService:
             List of matching notes
         """
         try:
-            return self.api.search_notes(query)
+            return await self._call(
+                self.api.search_notes, query, supersede_key=self.SEARCH_KEY, read_only=True
+            )
         except Exception as e:
             logger.error(f"Failed to search notes: {e}", exc_info=True)
             return []
@@ -167,7 +250,12 @@ class DataService:
             List of matching relationships
         """
         try:
-            return self.api.search_relationships(query)
+            return await self._call(
+                self.api.search_relationships,
+                query,
+                supersede_key=self.SEARCH_KEY,
+                read_only=True,
+            )
         except Exception as e:
             logger.error(f"Failed to search relationships: {e}", exc_info=True)
             return []
@@ -182,7 +270,12 @@ class DataService:
             List of matching relationship types
         """
         try:
-            return self.api.search_relationship_types(query)
+            return await self._call(
+                self.api.search_relationship_types,
+                query,
+                supersede_key=self.SEARCH_KEY,
+                read_only=True,
+            )
         except Exception as e:
             logger.error(f"Failed to search relationship types: {e}", exc_info=True)
             return []
@@ -194,7 +287,7 @@ class DataService:
             List of all contacts
         """
         try:
-            return self.api.list_all_contacts()
+            return await self._call(self.api.list_all_contacts)
         except Exception as e:
             logger.error(f"Failed to list all contacts: {e}", exc_info=True)
             return []
@@ -206,7 +299,7 @@ class DataService:
             List of all tags
         """
         try:
-            return self.api.list_all_tags()
+            return await self._call(self.api.list_all_tags)
         except Exception as e:
             logger.error(f"Failed to list all tags: {e}", exc_info=True)
             return []
@@ -218,7 +311,7 @@ class DataService:
             List of all notes
         """
         try:
-            return self.api.list_all_notes()
+            return await self._call(self.api.list_all_notes)
         except Exception as e:
             logger.error(f"Failed to list all notes: {e}", exc_info=True)
             return []
@@ -230,7 +323,7 @@ class DataService:
             List of all relationships
         """
         try:
-            return self.api.list_all_relationships()
+            return await self._call(self.api.list_all_relationships)
         except Exception as e:
             logger.error(f"Failed to list all relationships: {e}", exc_info=True)
             return []
@@ -242,7 +335,7 @@ class DataService:
             List of all relationship types
         """
         try:
-            return self.api.list_all_relationship_types()
+            return await self._call(self.api.list_all_relationship_types)
         except Exception as e:
             logger.error(f"Failed to list all relationship types: {e}", exc_info=True)
             return []
@@ -261,13 +354,13 @@ class DataService:
         try:
             if contact_id:
                 # Get relationships for a specific contact
-                contact = self.api.get_contact(contact_id)
+                contact = await self._call(self.api.get_contact, contact_id)
                 if contact:
-                    return self.api.get_contact_relationships(contact["name"])
+                    return await self._call(self.api.get_contact_relationships, contact["name"])
                 return []
             else:
                 # Get all relationships through API
-                return self.api.get_all_relationships()
+                return await self._call(self.api.get_all_relationships)
         except Exception as e:
             logger.error(f"Failed to get relationships: {e}")
             return []
@@ -286,7 +379,9 @@ class DataService:
             True if successful
         """
         try:
-            return self.api.add_relationship(from_contact, to_contact, relationship_type)
+            return await self._call(
+                self.api.add_relationship, from_contact, to_contact, relationship_type
+            )
         except Exception as e:
             logger.error(f"Failed to create relationship: {e}")
             return False
@@ -301,7 +396,7 @@ class DataService:
             True if successful
         """
         try:
-            result = self.api.delete_relationship_by_id(relationship_id)
+            result = await self._call(self.api.delete_relationship_by_id, relationship_id)
             return result.get("success", False)
         except Exception as e:
             logger.error(f"Failed to delete relationship: {e}")
@@ -316,7 +411,7 @@ class DataService:
             List of tag dictionaries
         """
         try:
-            return self.api.list_all_tags()
+            return await self._call(self.api.list_all_tags)
         except Exception as e:
             logger.error(f"Failed to get tags: {e}")
             return []
@@ -331,7 +426,7 @@ class DataService:
             Created tag dictionary or None
         """
         try:
-            return self.api.create_tag(name)
+            return await self._call(self.api.create_tag, name)
         except Exception as e:
             logger.error(f"Failed to create tag '{name}': {e}")
             return None
@@ -348,12 +443,12 @@ class DataService:
         """
         try:
             # Create new tag
-            new_tag = self.api.create_tag(new_name)
+            new_tag = await self._call(self.api.create_tag, new_name)
             if not new_tag:
                 return False
 
             # Get contacts with old tag and migrate them
-            contacts = self.api.get_contacts_by_tag(old_name)
+            contacts = await self._call(self.api.get_contacts_by_tag, old_name)
             for contact in contacts:
                 # Add new tag
                 await self.add_tag_to_contact(contact["id"], new_name)
@@ -361,7 +456,7 @@ class DataService:
                 await self.remove_tag_from_contact(contact["id"], old_name)
 
             # Delete old tag
-            return self.api.delete_tag(old_name)
+            return await self._call(self.api.delete_tag, old_name)
         except Exception as e:
             logger.error(f"Failed to update tag '{old_name}' to '{new_name}': {e}")
             return False
@@ -376,7 +471,7 @@ class DataService:
             True if successful
         """
         try:
-            return self.api.delete_tag(name)
+            return await self._call(self.api.delete_tag, name)
         except Exception as e:
             logger.error(f"Failed to delete tag '{name}': {e}")
             return False
@@ -392,7 +487,7 @@ class DataService:
             True if successful
         """
         try:
-            return self.api.remove_tag_from_contact(contact_id, tag_name)
+            return await self._call(self.api.remove_tag_from_contact, contact_id, tag_name)
         except Exception as e:
             logger.error(f"Failed to remove tag from contact {contact_id}: {e}")
             return False
@@ -408,7 +503,7 @@ class DataService:
             True if successful
         """
         try:
-            return self.api.tag_contact(contact_id, tag_name)
+            return await self._call(self.api.tag_contact, contact_id, tag_name)
         except Exception as e:
             logger.error(f"Failed to add tag to contact {contact_id}: {e}")
             return False
@@ -426,8 +521,8 @@ class DataService:
         """
         try:
             if contact_id:
-                return self.api.get_contact_notes(contact_id)
-            return self.api.get_all_notes()
+                return await self._call(self.api.get_contact_notes, contact_id)
+            return await self._call(self.api.get_all_notes)
         except Exception as e:
             logger.error(f"Failed to get notes: {e}")
             return []
@@ -446,12 +541,12 @@ class DataService:
             Created note dictionary or None
         """
         try:
-            note = self.api.add_note(title, content)
+            note = await self._call(self.api.add_note, title, content)
             if note and contact_id:
                 # Associate the newly created note with the contact
                 note_id = note.get("id")
                 if note_id:
-                    self.api.associate_note_with_contact(note_id, contact_id)
+                    await self._call(self.api.associate_note_with_contact, note_id, contact_id)
             return note
         except Exception as e:
             logger.error(f"Failed to create note: {e}")
@@ -470,7 +565,7 @@ class DataService:
         """
         try:
             # Update using API method
-            return self.api.update_note_by_id(note_id, title, content)
+            return await self._call(self.api.update_note_by_id, note_id, title, content)
         except Exception as e:
             logger.error(f"Failed to update note {note_id}: {e}")
             return False
@@ -486,7 +581,7 @@ class DataService:
         """
         try:
             # Delete using API method
-            return self.api.delete_note_by_id(note_id)
+            return await self._call(self.api.delete_note_by_id, note_id)
         except Exception as e:
             logger.error(f"Failed to delete note {note_id}: {e}")
             return False
@@ -508,7 +603,14 @@ class DataService:
         """
         try:
             # Use API method instead of direct core module access
-            return self.api.unified_search(query, entity_types, limit)
+            return await self._call(
+                self.api.unified_search,
+                query,
+                entity_types,
+                limit,
+                supersede_key=self.SEARCH_KEY,
+                read_only=True,
+            )
         except Exception as e:
             logger.error(f"Failed to perform unified search: {e}")
             return {
@@ -524,6 +626,18 @@ class DataService:
                 },
             }
 
+    async def get_search_stats(self) -> dict[str, Any]:
+        """Get unified search metrics such as cache hits and average search time.
+
+        Returns:
+            Search statistics dictionary, empty on error
+        """
+        try:
+            return await self._call(self.api.get_search_stats)
+        except Exception as e:
+            logger.error(f"Failed to get search stats: {e}")
+            return {}
+
     # Statistics
 
     async def get_stats(self) -> dict[str, int]:
@@ -534,10 +648,10 @@ class DataService:
         """
         try:
             return {
-                "contacts": len(self.api.list_all_contacts()),
-                "tags": len(self.api.get_all_tags()),
-                "notes": len(self.api.get_all_notes()),
-                "relationships": len(self.api.get_all_relationships()),
+                "contacts": len(await self._call(self.api.list_all_contacts)),
+                "tags": len(await self._call(self.api.get_all_tags)),
+                "notes": len(await self._call(self.api.get_all_notes)),
+                "relationships": len(await self._call(self.api.get_all_relationships)),
             }
         except Exception as e:
             logger.error(f"Failed to get stats: {e}")
@@ -552,11 +666,11 @@ class DataService:
             Dictionary with database statistics
         """
         try:
-            stats = self.api.get_database_stats()
+            stats = await self._call(self.api.get_database_stats)
 
             # Add additional stats
-            stats["tags"] = len(self.api.list_all_tags())
-            stats["notes"] = len(self.api.list_all_notes())
+            stats["tags"] = len(await self._call(self.api.list_all_tags))
+            stats["notes"] = len(await self._call(self.api.list_all_notes))
 
             return stats
         except Exception as e:
@@ -573,7 +687,7 @@ class DataService:
             import os
 
             # Get database path through API configuration
-            config = self.api.get_config()
+            config = await self._call(self.api.get_config)
             db_path = config.get("db_path")
             if db_path and os.path.exists(db_path):
                 return os.path.getsize(db_path)
@@ -589,7 +703,7 @@ class DataService:
             List of backup dictionaries
         """
         try:
-            return self.api.get_backup_history()
+            return await self._call(self.api.get_backup_history)
         except Exception as e:
             logger.error(f"Failed to get backup history: {e}")
             return []
@@ -606,7 +720,7 @@ class DataService:
         try:
             if comment is None:
                 comment = f"Manual backup - {self._get_timestamp()}"
-            return self.api.create_backup_with_comment(comment)
+            return await self._call(self.api.create_backup_with_comment, comment)
         except Exception as e:
             logger.error(f"Failed to create backup: {e}")
             return None
@@ -621,7 +735,7 @@ class DataService:
             True if successful
         """
         try:
-            return self.api.restore_from_backup(backup_id)
+            return await self._call(self.api.restore_from_backup, backup_id)
         except Exception as e:
             logger.error(f"Failed to restore backup {backup_id}: {e}")
             return False
@@ -648,11 +762,15 @@ class DataService:
 
             if format.lower() == "csv":
                 # Export relationships as CSV using API
-                data = self.api.export_relationships_data(format="csv")
+                data = await self._call(
+                    self.api.export_relationships_data, format="csv", read_only=True
+                )
                 filename = f"database_export_{timestamp}.csv"
             else:
                 # Export as JSON using API
-                data = self.api.export_relationships_data(format="json")
+                data = await self._call(
+                    self.api.export_relationships_data, format="json", read_only=True
+                )
                 filename = f"database_export_{timestamp}.json"
 
             export_path = export_dir / filename
@@ -674,7 +792,7 @@ class DataService:
         """
         try:
             # Use API method instead of direct database access
-            return self.api.vacuum_database()
+            return await self._call(self.api.vacuum_database)
         except Exception as e:
             logger.error(f"Failed to vacuum database: {e}")
             return False
@@ -711,7 +829,7 @@ class DataService:
         """
         try:
             # Check if relationship types already exist
-            existing_types = self.api.list_all_relationship_types()
+            existing_types = await self._call(self.api.list_all_relationship_types)
             if existing_types:
                 logger.info("Relationship types already exist, skipping seeding")
                 return True
@@ -814,7 +932,8 @@ class DataService:
             success_count = 0
             for rel_type in default_types:
                 try:
-                    success = self.api.create_relationship_type(
+                    success = await self._call(
+                        self.api.create_relationship_type,
                         type_key=rel_type["type_key"],
                         description=rel_type["description"],
                         inverse_key=rel_type["inverse_key"],
@@ -847,7 +966,7 @@ class DataService:
             List of relationship type dictionaries
         """
         try:
-            return self.api.list_all_relationship_types()
+            return await self._call(self.api.list_all_relationship_types)
         except Exception as e:
             logger.error(f"Failed to get relationship types: {e}")
             return []
@@ -871,7 +990,8 @@ class DataService:
             Created relationship type dictionary or None
         """
         try:
-            success = self.api.create_relationship_type(
+            success = await self._call(
+                self.api.create_relationship_type,
                 type_key=type_key,
                 description=description,
                 inverse_key=inverse_key,
@@ -929,12 +1049,13 @@ class DataService:
                 is_symmetrical = bool(current_type.get("is_symmetrical", False))
 
             # Delete old type
-            delete_success = self.api.delete_relationship_type(type_key)
+            delete_success = await self._call(self.api.delete_relationship_type, type_key)
             if not delete_success:
                 return False
 
             # Create new type
-            create_success = self.api.create_relationship_type(
+            create_success = await self._call(
+                self.api.create_relationship_type,
                 type_key=type_key,
                 description=description,
                 inverse_key=inverse_key,
@@ -956,7 +1077,7 @@ class DataService:
             True if successful
         """
         try:
-            return self.api.delete_relationship_type(type_key)
+            return await self._call(self.api.delete_relationship_type, type_key)
         except Exception as e:
             logger.error(f"Failed to delete relationship type '{type_key}': {e}")
             return False
@@ -1020,7 +1141,9 @@ class DataService:
                     logger.warning(f"Invalid end_date format: {end_date}")
 
             # Create the relationship using API method
-            return self.api.add_relationship(from_contact_id, to_contact_id, type_key)
+            return await self._call(
+                self.api.add_relationship, from_contact_id, to_contact_id, type_key
+            )
 
         except Exception as e:
             logger.error(f"Failed to create relationship with details: {e}")
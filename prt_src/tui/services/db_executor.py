@@ -0,0 +1,137 @@
+"""Database executor for PRT TUI services.
+
+Runs blocking PRTAPI calls on one dedicated worker thread so SQLite work never
+blocks the Textual event loop. Read-only calls can instead run on a small pool
+of reader threads, each in its own short-lived read session.
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager
+from typing import Any
+
+from prt_src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class DatabaseExecutor:
+    """Single worker thread that owns the shared database session for the TUI.
+
+    The SQLAlchemy session behind PRTAPI is not thread-safe, so every call is
+    serialized onto the same thread. Given a ``read_session`` factory,
+    read-only calls run on reader threads instead, each with its own session,
+    so searches and exports don't queue behind writes. Callers await ``run()``
+    from the event loop. Calls sharing a ``supersede_key`` replace each other:
+    starting a new search cancels an older one that hasn't started yet, and an
+    older one that is already running has its result discarded.
+    """
+
+    def __init__(
+        self,
+        name: str = "prt-db",
+        read_session: Callable[[], AbstractContextManager] | None = None,
+        max_readers: int = 2,
+    ):
+        """Initialize the executor.
+
+        Args:
+            name: Thread name prefix for the worker thread
+            read_session: Opens a per-thread read session around a read-only
+                call; without one, every call runs on the worker thread
+            max_readers: Maximum concurrent read-only calls
+        """
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=name)
+        self._read_session = read_session
+        self._readers = (
+            ThreadPoolExecutor(max_workers=max_readers, thread_name_prefix=f"{name}-read")
+            if read_session is not None
+            else None
+        )
+        self._lock = threading.Lock()
+        self._latest: dict[str, Future] = {}
+
+    async def run(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        supersede_key: str | None = None,
+        read_only: bool = False,
+        **kwargs: Any,
+    ) -> Any:
+        """Run ``func`` on the database thread and await its result.
+
+        Args:
+            func: Blocking callable to run
+            *args: Positional arguments for ``func``
+            supersede_key: Optional key; a newer call with the same key
+                supersedes this one
+            read_only: Whether ``func`` only reads; such calls run on a
+                reader thread when the executor has a read session factory
+            **kwargs: Keyword arguments for ``func``
+
+        Returns:
+            Whatever ``func`` returns
+
+        Raises:
+            asyncio.CancelledError: If the call was superseded or cancelled
+        """
+        label = getattr(func, "__name__", repr(func))
+        submitted = time.perf_counter()
+
+        def call() -> Any:
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                finished = time.perf_counter()
+                logger.debug(
+                    f"[DB] {label} took {(finished - started) * 1000:.1f}ms "
+                    f"(queued {(started - submitted) * 1000:.1f}ms)"
+                )
+
+        if read_only and self._readers is not None:
+            future = self._readers.submit(self._call_in_read_session, call)
+        else:
+            future = self._executor.submit(call)
+
+        if supersede_key is not None:
+            with self._lock:
+                previous = self._latest.get(supersede_key)
+                self._latest[supersede_key] = future
+            if previous is not None and previous.cancel():
+                logger.debug(f"[DB] Cancelled superseded '{supersede_key}' request")
+
+        try:
+            result = await asyncio.wrap_future(future)
+        finally:
+            superseded = False
+            if supersede_key is not None:
+                with self._lock:
+                    if self._latest.get(supersede_key) is future:
+                        del self._latest[supersede_key]
+                    else:
+                        superseded = True
+
+        if superseded:
+            logger.debug(f"[DB] Discarded result of superseded '{supersede_key}' request")
+            raise asyncio.CancelledError(f"Superseded {supersede_key} request")
+        return result
+
+    def _call_in_read_session(self, call: Callable[[], Any]) -> Any:
+        with self._read_session():
+            return call()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads, cancelling calls that haven't started.
+
+        Args:
+            wait: Whether to block until the running calls finish
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+        if self._readers is not None:
+            self._readers.shutdown(wait=wait, cancel_futures=True)
@@ -96,6 +96,8 @@ class FixtureService:
                 self.db.session.query(Contact).delete()
                 self.db.session.query(RelationshipType).delete()
                 self.db.session.commit()
+                # Bulk deletes bypass the ORM hooks that keep cached state current
+                self.db.invalidate_caches()
                 # Remove all objects from identity map to prevent conflicts on reload
                 self.db.session.expunge_all()
                 self.logger.debug("[FIXTURE] All tables cleared and session identity map flushed")
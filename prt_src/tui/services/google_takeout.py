@@ -4,12 +4,14 @@ Provides async interface for Google Takeout contact import functionality.
 """
 
 import asyncio
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
 from prt_src.google_takeout import GoogleTakeoutParser
 from prt_src.google_takeout import find_takeout_files
 from prt_src.google_takeout import parse_takeout_contacts
+from prt_src.import_sync import SOURCE_GOOGLE_TAKEOUT
 from prt_src.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -180,11 +182,16 @@ class GoogleTakeoutService:
                 "sample_contacts": [],
             }
 
-    async def import_contacts(self, file_path: Path) -> tuple[bool, str, dict[str, Any] | None]:
+    async def import_contacts(
+        self, file_path: Path, progress: Callable[[str], None] | None = None
+    ) -> tuple[bool, str, dict[str, Any] | None]:
         """Import contacts from a Google Takeout file.
 
         Args:
             file_path: Path to the takeout zip file
+            progress: Optional callback receiving status lines while parsing
+                and syncing. Called from worker threads, so TUI callers
+                should hand the message to ``App.call_from_thread``.
 
         Returns:
             Tuple of (success, message, info_dict)
@@ -207,8 +214,11 @@ class GoogleTakeoutService:
             parse_start = time.time()
             self.logger.debug("[TAKEOUT] Starting contact parsing...")
 
+            report = self._progress_reporter(progress)
             loop = asyncio.get_event_loop()
-            contacts, info = await loop.run_in_executor(None, parse_takeout_contacts, file_path)
+            contacts, info = await loop.run_in_executor(
+                None, parse_takeout_contacts, file_path, report
+            )
 
             parse_elapsed = time.time() - parse_start
             self.logger.info(
@@ -229,19 +239,26 @@ class GoogleTakeoutService:
                 self.logger.warning(f"[TAKEOUT] {msg}", extra={"info": info})
                 return False, msg, info
 
-            # Insert contacts into database
+            # Write only the contacts that are new or changed since the last import
             insert_start = time.time()
-            self.logger.debug(f"[TAKEOUT] Starting database insert of {len(contacts)} contacts...")
-
-            success = await loop.run_in_executor(None, self.api.insert_contacts, contacts)
+            self.logger.debug(f"[TAKEOUT] Starting database sync of {len(contacts)} contacts...")
+
+            summary = await loop.run_in_executor(
+                None,
+                self.api.sync_contacts,
+                SOURCE_GOOGLE_TAKEOUT,
+                contacts,
+                GoogleTakeoutParser(file_path).load_profile_images,
+                report,
+            )
 
             insert_elapsed = time.time() - insert_start
             total_elapsed = time.time() - start_time
 
-            if success:
-                msg = f"Successfully imported {len(contacts)} contacts"
+            if summary is not None:
+                msg = f"Successfully imported {len(contacts)} contacts ({summary.describe()})"
                 self.logger.info(
-                    f"[TAKEOUT] Import successful: {len(contacts)} contacts in {total_elapsed:.2f}s "
+                    f"[TAKEOUT] Import successful: {summary.describe()} in {total_elapsed:.2f}s "
                     f"(parse: {parse_elapsed:.2f}s, insert: {insert_elapsed:.2f}s)"
                 )
                 # Add timing info to result
@@ -249,6 +266,10 @@ class GoogleTakeoutService:
                 info["insert_time"] = insert_elapsed
                 info["total_time"] = total_elapsed
                 info["source_file"] = str(file_path)
+                info["sync_summary"] = summary.describe()
+                info["added"] = summary.added
+                info["updated"] = summary.updated
+                info["unchanged"] = summary.unchanged
                 return True, msg, info
             else:
                 msg = "Failed to import contacts to database"
@@ -268,6 +289,21 @@ class GoogleTakeoutService:
             )
             return False, error_msg, None
 
+    def _progress_reporter(self, progress: Callable[[str], None] | None):
+        """Turn a status-line callback into a takeout progress callback."""
+        if progress is None:
+            return None
+
+        def report(stage: str, done: int, total: int) -> None:
+            if stage == "parse":
+                progress(f"📖 Parsed {done:,} contacts...")
+            elif stage == "sync":
+                progress(f"💾 Wrote {done:,} of {total:,} new or changed contacts...")
+            else:
+                progress(f"💾 Imported {done:,} of {total:,} contacts...")
+
+        return report
+
     def get_search_instructions(self) -> str:
         """Get instructions for where to place takeout files.
 
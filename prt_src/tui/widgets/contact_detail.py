@@ -5,8 +5,12 @@ field-level editing and validation support.
 """
 
 import contextlib
+import io
 from collections.abc import Callable
 
+from PIL import Image
+from rich.style import Style
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.containers import Horizontal
 from textual.containers import Vertical
@@ -20,6 +24,38 @@ from textual.widgets import TextArea
 from prt_src.tui.types import AppMode
 from prt_src.tui.widgets.base import ModeAwareWidget
 
+# Width of the photo in character cells. Each cell shows two pixels stacked,
+# so a square photo needs a thumbnail this many pixels across.
+PHOTO_COLUMNS = 16
+
+
+def render_photo(data: bytes, columns: int = PHOTO_COLUMNS) -> Text | None:
+    """Render an image with half-block characters, two pixel rows per line.
+
+    Args:
+        data: Encoded image bytes, e.g. from ``PRTAPI.get_profile_image(id, PHOTO_COLUMNS)``
+        columns: Width in character cells
+
+    Returns:
+        The rendered photo, or None if the image can't be decoded
+    """
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            image.thumbnail((columns, columns))
+            pixels = image.convert("RGB")
+    except (OSError, ValueError):
+        return None
+
+    width, height = pixels.size
+    text = Text()
+    for y in range(0, height - 1, 2):
+        for x in range(width):
+            top = "rgb({},{},{})".format(*pixels.getpixel((x, y)))
+            bottom = "rgb({},{},{})".format(*pixels.getpixel((x, y + 1)))
+            text.append("▀", Style(color=top, bgcolor=bottom))
+        text.append("\n")
+    return text
+
 
 class FieldEditor(Static):
     """An editable field in the contact detail view."""
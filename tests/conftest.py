@@ -5,11 +5,14 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
+from prt_src.api import PRTAPI  # noqa: E402
 from prt_src.config import LLMConfigManager  # noqa: E402
 from prt_src.db import create_database  # noqa: E402
+from prt_src.llm_transport import close_transports  # noqa: E402
 from tests.fixtures import setup_test_database  # noqa: E402
 from tests.mocks.mock_llm_memory import TestMemoryContext  # noqa: E402
 from tests.mocks.mock_llm_memory import create_test_memory  # noqa: E402
+from tests.mocks.stub_ollama_server import StubOllamaServer  # noqa: E402
 
 # Configure pytest-asyncio
 pytest_plugins = ("pytest_asyncio",)
@@ -33,6 +36,38 @@ def test_db_empty(tmp_path):
     return db
 
 
+def _api_for(db):
+    return PRTAPI({"db_path": str(db.path), "db_encrypted": False})
+
+
+@pytest.fixture
+def api(test_db):
+    """PRTAPI over the sample test database (its own connection to the same file)."""
+    db, _fixtures = test_db
+    return _api_for(db)
+
+
+@pytest.fixture
+def empty_api(test_db_empty):
+    """PRTAPI over the empty test database."""
+    return _api_for(test_db_empty)
+
+
+@pytest.fixture
+def fts_db(test_db):
+    """Sample database with the FTS5 migration applied."""
+    db, fixtures = test_db
+    migration = Path(__file__).parent.parent / "migrations" / "add_fts5_support.sql"
+    raw_connection = db.engine.raw_connection()
+    try:
+        raw_connection.cursor().executescript(migration.read_text())
+    finally:
+        raw_connection.close()
+    db.session.expire_all()
+    db.invalidate_caches()
+    return db, fixtures
+
+
 @pytest.fixture
 def sample_config(tmp_path):
     """Create sample configuration for tests."""
@@ -192,6 +227,21 @@ def llm_config():
     return LLMConfigManager(config_dict=test_config)
 
 
+@pytest.fixture(autouse=True)
+def isolated_llm_transports():
+    """Give every test its own pooled LLM transports (they are shared per base URL)."""
+    yield
+    close_transports()
+
+
+@pytest.fixture
+def ollama_stub_server():
+    """Local Ollama-compatible HTTP server that counts the connections it accepts."""
+    server = StubOllamaServer().start()
+    yield server
+    server.stop()
+
+
 @pytest.fixture
 def llm_config_dict():
     """Create a test configuration dictionary for tests that need to pass config directly."""
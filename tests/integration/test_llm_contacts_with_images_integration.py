@@ -40,11 +40,11 @@ def test_api_get_contacts_with_images_performance(test_db):
 
     # Check that all returned contacts have images
     for contact in contacts:
-        assert (
-            contact["profile_image"] is not None
-        ), f"Contact {contact['name']} missing profile_image"
-        assert isinstance(contact["profile_image"], bytes), "Profile image should be bytes"
-        assert len(contact["profile_image"]) > 0, "Profile image should not be empty"
+        assert contact["has_profile_image"], f"Contact {contact['name']} missing profile_image"
+        assert "profile_image" not in contact, "Image bytes should be loaded on demand"
+        image = api.get_profile_image(contact["id"])
+        assert isinstance(image, bytes), "Profile image should be bytes"
+        assert len(image) == contact["profile_image_size"] > 0, "Profile image should not be empty"
 
     # Performance check - should be fast with index
     assert query_time < 1.0, f"Query took {query_time:.3f}s, expected < 1.0s with index"
@@ -364,18 +364,17 @@ def test_fixture_data_validation_for_images(test_db):
 
     # Validate image data integrity
     for contact in contacts_with_images:
-        assert (
-            "profile_image" in contact
-        ), f"Contact {contact.get('name', 'Unknown')} missing profile_image key"
-        assert (
-            contact["profile_image"] is not None
-        ), f"Contact {contact.get('name', 'Unknown')} has null profile_image"
+        assert contact.get(
+            "has_profile_image"
+        ), f"Contact {contact.get('name', 'Unknown')} missing has_profile_image flag"
+        image = api.get_profile_image(contact["id"])
+        assert image is not None, f"Contact {contact.get('name', 'Unknown')} has null profile_image"
         assert isinstance(
-            contact["profile_image"], bytes
+            image, bytes
         ), f"Contact {contact.get('name', 'Unknown')} profile_image is not bytes"
         assert (
-            len(contact["profile_image"]) > 100
-        ), f"Contact {contact.get('name', 'Unknown')} profile_image seems too small: {len(contact['profile_image'])} bytes"
+            len(image) > 100
+        ), f"Contact {contact.get('name', 'Unknown')} profile_image seems too small: {len(image)} bytes"
 
     print(
         f"✓ Fixture validation passed - {len(contacts_with_images)} contacts have valid profile images"
@@ -169,7 +169,7 @@ class TestLLMNetworkValidation:
         """Test health_check uses validation."""
         with (
             patch.object(self.llm, "_validate_and_parse_response") as mock_validate,
-            patch("requests.get") as mock_get,
+            patch("requests.Session.get") as mock_get,
         ):
             mock_response = Mock()
             mock_response.status_code = 200  # Add missing status code
@@ -186,7 +186,7 @@ class TestLLMNetworkValidation:
         """Test health_check when validation fails."""
         with (
             patch.object(self.llm, "_validate_and_parse_response") as mock_validate,
-            patch("requests.get") as mock_get,
+            patch("requests.Session.get") as mock_get,
         ):
             mock_response = Mock()
             mock_response.status_code = 200  # Add missing status code
@@ -204,7 +204,7 @@ class TestLLMNetworkValidation:
         """Test preload_model uses validation."""
         with (
             patch.object(self.llm, "_validate_and_parse_response") as mock_validate,
-            patch("requests.post") as mock_post,
+            patch("requests.Session.post") as mock_post,
         ):
             mock_response = Mock()
             mock_response.status_code = 200  # Add missing status code
@@ -221,7 +221,7 @@ class TestLLMNetworkValidation:
         """Test preload_model when validation fails."""
         with (
             patch.object(self.llm, "_validate_and_parse_response") as mock_validate,
-            patch("requests.post") as mock_post,
+            patch("requests.Session.post") as mock_post,
         ):
             mock_response = Mock()
             mock_response.status_code = 200  # Add missing status code
@@ -238,7 +238,7 @@ class TestLLMNetworkValidation:
         """Test chat method uses validation for main response."""
         with (
             patch.object(self.llm, "_validate_and_parse_response") as mock_validate,
-            patch("requests.post") as mock_post,
+            patch("requests.Session.post") as mock_post,
         ):
             mock_response = Mock()
             mock_response.status_code = 200  # Add missing status code
@@ -255,7 +255,7 @@ class TestLLMNetworkValidation:
         """Test chat method when main response validation fails."""
         with (
             patch.object(self.llm, "_validate_and_parse_response") as mock_validate,
-            patch("requests.post") as mock_post,
+            patch("requests.Session.post") as mock_post,
         ):
             mock_response = Mock()
             mock_response.status_code = 200  # Add missing status code
@@ -38,7 +38,7 @@ class TestMistralToolCalling:
         api = PRTAPI(config)
 
         # Mock Ollama API responses for testing
-        with patch("requests.post"):
+        with patch("requests.Session.post"):
             llm = OllamaLLM(api=api, config_manager=mistral_config_manager)
             return llm
 
@@ -102,7 +102,7 @@ class TestMistralToolCalling:
             }
         }
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             # First call returns tool call, second call returns final response
             mock_post.side_effect = [
                 MagicMock(
@@ -157,7 +157,7 @@ class TestMistralToolCalling:
             }
         }
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.side_effect = [
                 MagicMock(
                     status_code=200,
@@ -203,7 +203,7 @@ class TestMistralToolCalling:
             }
         }
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.side_effect = [
                 MagicMock(
                     status_code=200,
@@ -250,7 +250,7 @@ class TestMistralToolCalling:
             }
         }
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.side_effect = [
                 MagicMock(
                     status_code=200,
@@ -279,7 +279,7 @@ class TestMistralToolCalling:
             }
         }
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.return_value = MagicMock(
                 status_code=200,
                 headers={"Content-Type": "application/json"},
@@ -302,7 +302,7 @@ class TestMistralModelConfigurationIntegration:
         config_manager.llm.model = "gpt-oss:20b"  # Not Mistral
         config_manager.llm.temperature = 0.7
 
-        with patch("requests.post"):
+        with patch("requests.Session.post"):
             llm = OllamaLLM(api=PRTAPI(), config_manager=config_manager)
 
             # Should keep original temperature
@@ -315,7 +315,7 @@ class TestMistralModelConfigurationIntegration:
         config_manager.llm.model = "mistral:7b-instruct"
         config_manager.llm.temperature = 0.2  # Already optimal
 
-        with patch("requests.post"):
+        with patch("requests.Session.post"):
             llm = OllamaLLM(api=PRTAPI(), config_manager=config_manager)
 
             # Should keep the lower temperature
@@ -327,7 +327,7 @@ class TestMistralModelConfigurationIntegration:
         config_manager = LLMConfigManager()
         config_manager.llm.model = "mistral:7b-instruct"
 
-        with patch("requests.post"):
+        with patch("requests.Session.post"):
             llm = OllamaLLM(api=PRTAPI(), config_manager=config_manager)
 
             # Test tool call format
@@ -358,7 +358,7 @@ class TestMistralModelConfigurationIntegration:
             config_manager = LLMConfigManager()
             config_manager.llm.model = model_name
 
-            with patch("requests.post"):
+            with patch("requests.Session.post"):
                 llm = OllamaLLM(api=PRTAPI(), config_manager=config_manager)
                 assert llm._is_mistral_model() is True
 
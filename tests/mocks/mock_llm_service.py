@@ -382,6 +382,12 @@ class MockOllamaLLM:
 
         return response
 
+    async def stream_chat(self, message: str):
+        """Yield the ``chat`` response word by word, like a streaming model."""
+        response = self.chat(message)
+        for word in re.split(r"(?<=\s)", response):
+            yield word
+
     async def health_check(self, timeout: float = 2.0) -> bool:
         """Always return True for testing."""
         logger.debug("MockOllamaLLM health check - always returns True")
@@ -0,0 +1,153 @@
+"""Local HTTP server that answers like Ollama, for transport tests and benchmarks.
+
+It speaks HTTP/1.1 with keep-alive and counts the TCP connections it accepts,
+so tests can check that clients reuse connections. ``/api/chat`` simulates
+Ollama's KV cache: only the part of the prompt after the longest prefix shared
+with the previous request (plus its reply) is counted as evaluated.
+"""
+
+import json
+import math
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+
+class _StubOllamaHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without this, delayed ACKs
+    # add ~40ms to every keep-alive response
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        self.server.stub.record_connection()
+
+    def log_message(self, format, *args):  # noqa: A002 - BaseHTTPRequestHandler signature
+        pass
+
+    def _send_json(self, payload, content_type="application/json"):
+        body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length", 0))
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def do_GET(self):
+        stub = self.server.stub
+        stub.record_request(self.path)
+        if self.path == "/api/tags":
+            self._send_json({"models": [{"name": stub.model, "size": 1024}]})
+        else:
+            self.send_error(404)
+
+    def do_POST(self):
+        stub = self.server.stub
+        stub.record_request(self.path)
+        request = self._read_json()
+        if self.path == "/api/chat":
+            stats = stub.evaluate_prompt(request)
+            if request.get("stream"):
+                chunks = [
+                    {"message": {"role": "assistant", "content": word + " "}, "done": False}
+                    for word in stub.reply.split(" ")
+                ]
+                chunks.append(
+                    {"message": {"role": "assistant", "content": ""}, "done": True, **stats}
+                )
+                body = b"".join(json.dumps(c).encode() + b"\n" for c in chunks)
+                stub.remember_reply(stub.reply + " ")
+                self._send_json(body, "application/x-ndjson")
+            else:
+                stub.remember_reply(stub.reply)
+                self._send_json({"message": {"role": "assistant", "content": stub.reply}, **stats})
+        elif self.path in ("/api/generate", "/api/show"):
+            self._send_json({"model": stub.model, "done": True})
+        else:
+            self.send_error(404)
+
+
+class StubOllamaServer:
+    """Threaded stub of the Ollama API on an ephemeral localhost port."""
+
+    # Reported evaluation cost per uncached prompt token
+    PROMPT_EVAL_NS_PER_TOKEN = 1_000_000
+
+    def __init__(self, model: str = "stub:latest", reply: str = "Hello from the stub"):
+        self.model = model
+        self.reply = reply
+        self.connections = 0
+        self.requests: list[str] = []
+        self.prompt_evals: list[int] = []
+        self._kv_cache = ""
+        self._last_prompt = ""
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _StubOllamaHandler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def record_connection(self) -> None:
+        with self._lock:
+            self.connections += 1
+
+    def record_request(self, path: str) -> None:
+        with self._lock:
+            self.requests.append(path)
+
+    @staticmethod
+    def _render(tools, messages) -> str:
+        lines = [json.dumps(tools, sort_keys=True)]
+        lines += [json.dumps(message, sort_keys=True) for message in messages]
+        return "\n".join(lines)
+
+    def evaluate_prompt(self, request: dict) -> dict:
+        """Count the prompt tokens not covered by the cached prefix."""
+        prompt = self._render(request.get("tools"), request.get("messages", []))
+        shared = 0
+        for cached_char, char in zip(self._kv_cache, prompt, strict=False):
+            if cached_char != char:
+                break
+            shared += 1
+        tokens = math.ceil((len(prompt) - shared) / 4)
+        with self._lock:
+            self.prompt_evals.append(tokens)
+            self._last_prompt = prompt
+        return {
+            "prompt_eval_count": tokens,
+            "prompt_eval_duration": tokens * self.PROMPT_EVAL_NS_PER_TOKEN,
+        }
+
+    def remember_reply(self, content: str) -> None:
+        """Extend the KV cache with the reply, as the model's context would be."""
+        reply = json.dumps({"content": content, "role": "assistant"}, sort_keys=True)
+        with self._lock:
+            self._kv_cache = f"{self._last_prompt}\n{reply}"
+
+    def start(self) -> "StubOllamaServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join(timeout=5)
+
+
+def measure_requests(send, count: int) -> float:
+    """Return the mean seconds per call of ``send()`` over ``count`` calls."""
+    started = time.perf_counter()
+    for _ in range(count):
+        send()
+    return (time.perf_counter() - started) / count
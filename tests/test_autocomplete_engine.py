@@ -14,6 +14,8 @@ from prt_src.core.components.autocomplete import AutocompleteContext
 from prt_src.core.components.autocomplete import AutocompleteEngine
 from prt_src.core.components.autocomplete import Suggestion
 from prt_src.core.components.autocomplete import SuggestionSource
+from prt_src.core.components.fuzzy_index import TrigramIndex
+from prt_src.core.components.fuzzy_index import fuzzy_score
 
 
 class TestAutocompleteEngine:
@@ -440,3 +442,78 @@ class TestAutocompleteConfig:
         assert john_suggestion.entity_id == 1
         assert hasattr(john_suggestion, "metadata")
         assert john_suggestion.metadata.get("email") == "john@example.com"
+
+
+class TestTrigramIndex:
+    """Test the trigram index behind item suggestions."""
+
+    def test_score_semantics(self):
+        """Exact, prefix, substring and transposition scores are fixed tiers."""
+        assert fuzzy_score("john", "john") == 1.0
+        assert fuzzy_score("joh", "john doe") == 0.95
+        assert fuzzy_score("doe", "john doe") == 0.85
+        assert fuzzy_score("jhon", "john doe") == 0.75
+        assert fuzzy_score("xris", "christopher") == pytest.approx(0.6)
+
+    def test_transpositions_share_trigram_keys(self):
+        """Adjacent transpositions are still found through the index."""
+        index = TrigramIndex()
+        index.add(1, "john doe")
+        index.add(2, "mary major")
+
+        assert index.similar("jhon") == [1]
+        assert index.containing("doe") == {1}
+        assert index.containing("oe") == {1}
+
+    def test_incremental_updates(self):
+        """Added, updated and removed items are reflected without a rebuild."""
+        engine = AutocompleteEngine(enable_fuzzy=True)
+        engine.set_items([{"id": 1, "name": "John Doe"}])
+
+        engine.add_item({"id": 2, "name": "Bartholomew Quill"})
+        assert [s.entity_id for s in engine.get_suggestions("bartholomew")] == [2]
+
+        engine.update_item({"id": 2, "name": "Barnaby Quill"})
+        assert engine.get_suggestions("bartholomew") == []
+        assert [s.text for s in engine.get_suggestions("barnaby")] == ["Barnaby Quill"]
+
+        engine.remove_item(1)
+        assert engine.get_suggestions("john") == []
+
+
+@pytest.mark.performance
+class TestFuzzyAutocompleteBenchmark:
+    """Benchmark typo-tolerant autocomplete over 10k names."""
+
+    FIRST = ["James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda"]
+    LAST = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis"]
+
+    def test_fuzzy_keystrokes_on_10k_names(self):
+        """Each keystroke of a typo'd query stays fast and finds the intended name."""
+        import time
+
+        names = [
+            {"id": i, "name": f"{self.FIRST[i % 8]} {self.LAST[(i // 8) % 8]}-{i:05d}"}
+            for i in range(10_000)
+        ]
+        engine = AutocompleteEngine(enable_fuzzy=True, max_suggestions=10)
+
+        start = time.perf_counter()
+        engine.set_items(names)
+        build_time = time.perf_counter() - start
+
+        query = "jonh jones-04"  # transposed "john"
+        timings = []
+        for end in range(3, len(query) + 1):
+            start = time.perf_counter()
+            suggestions = engine.get_suggestions(query[:end])
+            timings.append(time.perf_counter() - start)
+
+        print(
+            f"\n10k names: build {build_time * 1000:.0f}ms, "
+            f"worst keystroke {max(timings) * 1000:.1f}ms, "
+            f"mean {sum(timings) / len(timings) * 1000:.1f}ms"
+        )
+        assert build_time < 5.0
+        assert max(timings) < 0.25
+        assert suggestions[0].text.startswith("John Jones-04")
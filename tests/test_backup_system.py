@@ -1,6 +1,12 @@
 """Tests for enhanced backup system with metadata tracking."""
 
+import json
+import os
+import shutil
+import sqlite3
+import threading
 import time
+from contextlib import closing
 from pathlib import Path
 
 import pytest
@@ -8,6 +14,7 @@ from sqlalchemy import text
 
 from prt_src.api import PRTAPI
 from prt_src.db import Database
+from prt_src.db import snapshot_database
 from prt_src.models import BackupMetadata
 from prt_src.models import Contact
 
@@ -444,3 +451,154 @@ class TestAPIBackupFeatures:
 
         assert auto_count == 2
         assert manual_count == 1
+
+
+class TestOnlineBackup:
+    """Test snapshots taken with SQLite's online backup API."""
+
+    def test_snapshot_excludes_uncommitted_writes(self, test_db, tmp_path):
+        """A write transaction in progress never shows up in the snapshot."""
+        writer = sqlite3.connect(test_db.path)
+        writer.execute("BEGIN IMMEDIATE")
+        writer.execute("INSERT INTO contacts (name) VALUES ('Uncommitted')")
+        try:
+            snapshot_database(test_db.path, tmp_path / "snapshot.db")
+        finally:
+            writer.rollback()
+            writer.close()
+
+        with closing(sqlite3.connect(tmp_path / "snapshot.db")) as conn:
+            names = {name for (name,) in conn.execute("SELECT name FROM contacts")}
+        assert names == {"Alice Smith", "Bob Jones"}
+
+    def test_snapshot_copies_in_steps(self, test_db, tmp_path):
+        """Small steps report progress and still produce an intact copy."""
+        remaining = []
+        snapshot_database(
+            test_db.path,
+            tmp_path / "snapshot.db",
+            pages=1,
+            progress=lambda status, left, total: remaining.append(left),
+        )
+
+        assert len(remaining) > 1
+        assert remaining[-1] == 0
+        with closing(sqlite3.connect(tmp_path / "snapshot.db")) as conn:
+            assert conn.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+
+
+class TestDeduplicatedBackups:
+    """Test automatic backups kept in the deduplicated chunk store."""
+
+    @pytest.fixture
+    def image_db(self, test_db):
+        test_db.dedup_auto_backups = True
+        for i in range(20):
+            test_db.session.add(Contact(name=f"Image {i}", profile_image=os.urandom(64 * 1024)))
+        test_db.session.commit()
+        return test_db
+
+    def test_unchanged_database_costs_a_fraction(self, image_db):
+        """A second auto-backup of unchanged images only stores what changed."""
+        first = image_db.create_backup_with_metadata(comment="First", is_auto=True)
+        second = image_db.create_backup_with_metadata(comment="Second", is_auto=True)
+        manual = image_db.create_backup_with_metadata(comment="Manual", is_auto=False)
+
+        assert first["path"].endswith(".manifest")
+        assert first["stored_size"] > first["size"] / 2
+        assert second["stored_size"] < first["stored_size"] / 5
+        assert manual["path"].endswith(".db")
+        assert all(backup["exists"] for backup in image_db.list_backups())
+
+    def test_restore_from_manifest(self, image_db):
+        """A stored backup restores byte-for-byte, images included."""
+        images = {c.name: c.profile_image for c in image_db.session.query(Contact)}
+        backup = image_db.create_backup_with_metadata(comment="Before delete", is_auto=True)
+
+        image_db.session.query(Contact).delete()
+        image_db.session.commit()
+        assert image_db.restore_backup(backup["id"]) is True
+
+        restored = {c.name: c.profile_image for c in image_db.session.query(Contact)}
+        assert restored == images
+
+    def test_cleanup_drops_unreferenced_chunks(self, image_db):
+        """Chunks only used by deleted auto-backups are removed."""
+        image_db.create_backup_with_metadata(comment="Old", is_auto=True)
+        image_db.session.query(Contact).filter(Contact.name == "Image 0").one().profile_image = (
+            os.urandom(64 * 1024)
+        )
+        image_db.session.commit()
+        kept = image_db.create_backup_with_metadata(comment="New", is_auto=True)
+        objects_dir = image_db.backup_store.objects_dir
+        before = {p.name for p in objects_dir.glob("*/*")}
+
+        image_db.cleanup_old_auto_backups(keep_count=1)
+
+        after = {p.name for p in objects_dir.glob("*/*")}
+        assert after < before
+        assert after == set(json.loads(Path(kept["path"]).read_text())["chunks"])
+        assert image_db.restore_backup(kept["id"]) is True
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+def test_backup_benchmark_on_large_database(tmp_path):
+    """Benchmark: file copy vs online backup vs deduplicated store on an image-heavy database.
+
+    The size defaults to 500 MB and can be changed with PRT_BACKUP_BENCHMARK_MB.
+    """
+    from prt_src.schema_manager import SchemaManager
+
+    size_mb = int(os.environ.get("PRT_BACKUP_BENCHMARK_MB", "500"))
+    db = Database(tmp_path / "bench.db")
+    db.connect()
+    db.initialize()
+    SchemaManager(db).apply_migration_v3_to_v4()
+    db.dedup_auto_backups = True
+
+    image_size = 256 * 1024
+    for batch in range(size_mb * 4 // 100):
+        db.session.add_all(
+            Contact(name=f"Contact {batch}-{i}", profile_image=os.urandom(image_size))
+            for i in range(100)
+        )
+        db.session.commit()
+    db_size = db.path.stat().st_size
+
+    started = time.perf_counter()
+    shutil.copy2(db.path, tmp_path / "copy.db")
+    copy_time = time.perf_counter() - started
+
+    # Readers keep going while the online backup copies in steps
+    read_latencies = []
+    snapshot_thread = threading.Thread(
+        target=snapshot_database, args=(db.path, tmp_path / "online.db")
+    )
+    started = time.perf_counter()
+    snapshot_thread.start()
+    with closing(sqlite3.connect(db.path)) as reader:
+        while snapshot_thread.is_alive():
+            read_started = time.perf_counter()
+            reader.execute("SELECT COUNT(*) FROM contacts").fetchone()
+            read_latencies.append(time.perf_counter() - read_started)
+    snapshot_thread.join()
+    online_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    first = db.create_backup_with_metadata(comment="First", is_auto=True)
+    first_time = time.perf_counter() - started
+    started = time.perf_counter()
+    second = db.create_backup_with_metadata(comment="Second", is_auto=True)
+    second_time = time.perf_counter() - started
+
+    mb = 1024 * 1024
+    print(
+        f"\n{db_size / mb:.0f}MB database:"
+        f"\n  file copy:      {copy_time:.2f}s, {db_size / mb:.0f}MB"
+        f"\n  online backup:  {online_time:.2f}s, {db_size / mb:.0f}MB,"
+        f" max concurrent read {max(read_latencies, default=0) * 1000:.1f}ms"
+        f"\n  dedup, first:   {first_time:.2f}s, {first['stored_size'] / mb:.1f}MB stored"
+        f"\n  dedup, repeat:  {second_time:.2f}s, {second['stored_size'] / mb:.2f}MB stored"
+    )
+    assert second["stored_size"] < db_size / 100
@@ -0,0 +1,149 @@
+"""
+Tests for the bulk contact insert path.
+
+Large imports write contacts and their metadata rows with multi-row inserts in
+one transaction instead of an ORM flush per contact; the result has to match
+the per-row path, including caches, change listeners and the FTS index.
+"""
+
+import time
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import text
+
+from prt_src import db as db_module
+from prt_src.db import Database
+from prt_src.fts_index import check_fts_consistency
+from prt_src.models import Contact
+from prt_src.models import ContactMetadata
+
+
+def _parsed_contacts(count, start=0):
+    return [
+        {
+            "first": f"Bulk{i}",
+            "last": "Importer",
+            "emails": [f"bulk{i}@example.com", f"other{i}@example.com"],
+            "phones": [f"+1 555 {i:07d}"] if i % 2 else [],
+            "profile_image": b"img" if i % 3 == 0 else None,
+            "profile_image_filename": "bulk.jpg" if i % 3 == 0 else None,
+            "profile_image_mime_type": "image/jpeg" if i % 3 == 0 else None,
+        }
+        for i in range(start, start + count)
+    ]
+
+
+def _imported_rows(db):
+    return db.session.execute(
+        text(
+            "SELECT c.name, c.email, c.phone, c.profile_image, c.profile_image_filename,"
+            " c.created_at IS NOT NULL, m.id IS NOT NULL"
+            " FROM contacts c LEFT JOIN contact_metadata m ON m.contact_id = c.id"
+            " WHERE c.name LIKE 'Bulk%' ORDER BY c.id"
+        )
+    ).all()
+
+
+def _fts_trigger_exists(db):
+    return db.session.execute(
+        text("SELECT COUNT(*) FROM sqlite_master WHERE name = 'contacts_fts_insert'")
+    ).scalar()
+
+
+@pytest.mark.unit
+def test_bulk_and_per_row_paths_write_the_same_rows(tmp_path):
+    """Both paths store the same contact columns and one metadata row per contact."""
+    contacts = _parsed_contacts(30)
+    results = []
+    for name, threshold in (("row", 10**9), ("bulk", 1)):
+        db = Database(tmp_path / f"{name}.db")
+        db.connect()
+        db.initialize()
+        with patch.object(db_module, "BULK_INSERT_THRESHOLD", threshold):
+            db.insert_contacts(contacts)
+        results.append(_imported_rows(db))
+
+    assert results[0] == results[1]
+    assert len(results[1]) == 30
+    assert results[1][1][:3] == ("Bulk1 Importer", "bulk1@example.com", "+1 555 0000001")
+
+
+@pytest.mark.unit
+def test_bulk_insert_updates_caches_and_listeners(test_db):
+    """The contact count, data version and change listeners see the new contacts."""
+    db, fixtures = test_db
+    before = db.count_contacts()
+    version = db.data_version
+    notified = []
+    db.add_change_listener(notified.append)
+
+    ids = db.bulk_insert_contacts(_parsed_contacts(25), chunk_size=10)
+
+    assert db.count_contacts() == before + 25
+    assert db.data_version > version
+    assert notified == [set(ids)]
+    assert [c.name for c in db.session.query(Contact).filter(Contact.id.in_(ids[:2]))] == [
+        "Bulk0 Importer",
+        "Bulk1 Importer",
+    ]
+    assert (
+        db.session.query(ContactMetadata).filter(ContactMetadata.contact_id.in_(ids)).count() == 25
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("defer", [False, True])
+def test_bulk_insert_keeps_search_index_current(fts_db, defer):
+    """New contacts are searchable whether the FTS trigger runs per row or is deferred."""
+    db, _fixtures = fts_db
+
+    db.bulk_insert_contacts(_parsed_contacts(40), chunk_size=15, defer_search_index=defer)
+
+    assert _fts_trigger_exists(db) == 1
+    assert check_fts_consistency(db.session)["consistent"]
+    found = db.session.execute(
+        text("SELECT COUNT(*) FROM contacts_fts WHERE contacts_fts MATCH 'importer'")
+    ).scalar()
+    assert found == 40
+
+
+@pytest.mark.unit
+def test_failed_bulk_insert_rolls_back(fts_db):
+    """A failure part-way leaves no contacts behind and restores the FTS trigger."""
+    db, fixtures = fts_db
+    before = db.count_contacts()
+
+    with patch.object(db_module, "refresh_fts_rows", side_effect=RuntimeError("index failed")):
+        with pytest.raises(RuntimeError):
+            db.bulk_insert_contacts(_parsed_contacts(20), defer_search_index=True)
+
+    assert db.session.query(Contact).count() == before
+    assert _fts_trigger_exists(db) == 1
+
+
+def _time_insert(db_path, contacts, threshold):
+    db = Database(db_path)
+    db.connect()
+    db.initialize()
+    started = time.perf_counter()
+    with patch.object(db_module, "BULK_INSERT_THRESHOLD", threshold):
+        db.insert_contacts(contacts)
+    elapsed = time.perf_counter() - started
+    assert db.count_contacts() == len(contacts)
+    return elapsed
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize(
+    "count", [10_000, pytest.param(100_000, marks=pytest.mark.slow)], ids=["10k", "100k"]
+)
+def test_bulk_insert_benchmark(tmp_path, count):
+    """Benchmark: per-row ORM inserts vs the bulk path."""
+    contacts = _parsed_contacts(count)
+
+    per_row = _time_insert(tmp_path / "row.db", contacts, threshold=10**9)
+    bulk = _time_insert(tmp_path / "bulk.db", contacts, threshold=1)
+
+    print(f"\n{count:,} contacts: per-row {per_row:.2f}s, bulk {bulk:.2f}s")
+    assert bulk < per_row
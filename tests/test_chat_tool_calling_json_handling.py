@@ -39,6 +39,9 @@ class TestToolCallingJSONHandling:
             mock_config.llm.keep_alive = "30m"
             mock_config.llm.timeout = 300
             mock_config.llm.temperature = 0.7
+            mock_config.llm.pool_size = 4
+            mock_config.llm.max_retries = 2
+            mock_config.llm.connect_timeout = 5.0
             mock_config.tools.disabled_tools = []
             mock_config_mgr.return_value = mock_config
 
@@ -85,7 +88,7 @@ class TestToolCallingJSONHandling:
             }
         )
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.side_effect = [mock_response, mock_final_response]
 
             # Test that tool calling works with string arguments
@@ -139,7 +142,7 @@ class TestToolCallingJSONHandling:
             }
         )
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.side_effect = [mock_response, mock_final_response]
 
             # Test that tool calling works with dict arguments
@@ -189,7 +192,7 @@ class TestToolCallingJSONHandling:
             }
         )
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.side_effect = [mock_response, mock_final_response]
 
             # Test that malformed JSON is handled gracefully
@@ -242,7 +245,7 @@ class TestToolCallingJSONHandling:
             }
         )
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.side_effect = [mock_response, mock_final_response]
 
             # Test that unexpected argument types are handled gracefully
@@ -291,7 +294,7 @@ class TestToolCallingJSONHandling:
             }
         )
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.side_effect = [mock_response, mock_final_response]
 
             # Test that empty arguments work correctly
@@ -351,7 +354,7 @@ class TestToolCallingJSONHandling:
             }
         )
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.side_effect = [mock_response, mock_final_response]
 
             # Test that mixed argument types work correctly
@@ -383,6 +386,9 @@ class TestChatScreenToolCalling:
             mock_config.llm.keep_alive = "30m"
             mock_config.llm.timeout = 300
             mock_config.llm.temperature = 0.7
+            mock_config.llm.pool_size = 4
+            mock_config.llm.max_retries = 2
+            mock_config.llm.connect_timeout = 5.0
             mock_config.tools.disabled_tools = []
             mock_config_mgr.return_value = mock_config
 
@@ -390,7 +396,7 @@ class TestChatScreenToolCalling:
 
             # Test that database queries can be processed
             # (This would actually call Ollama if running, so we mock it)
-            with patch("requests.post") as mock_post:
+            with patch("requests.Session.post") as mock_post:
                 mock_response = Mock()
                 mock_response.raise_for_status.return_value = None
                 mock_response.headers = {"Content-Type": "application/json"}
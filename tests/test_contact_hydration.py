@@ -0,0 +1,111 @@
+"""
+Tests for batched contact hydration in the PRT API layer.
+
+Contact-returning API methods load tags and notes for a whole result set with
+set-based queries, so the number of statements must not grow with the number
+of contacts returned.
+"""
+
+import pytest
+
+from prt_src.db import IN_CLAUSE_BATCH_SIZE
+
+
+def _add_tagged_contacts(api, count, start=0):
+    contacts = [
+        {"first": f"Person{start + i:04d}", "last": "Bulk", "emails": [f"p{start + i}@x.com"]}
+        for i in range(count)
+    ]
+    api.db.insert_contacts(contacts)
+    for contact_id, _name, _email in api.db.list_contacts():
+        info = api.db.get_relationship_info(contact_id)
+        if not info["tags"]:
+            api.db.add_relationship_tag(contact_id, "bulk")
+            api.db.add_relationship_note(contact_id, "Bulk note", "Imported in bulk")
+
+
+@pytest.mark.unit
+def test_bulk_relationship_info_matches_single_lookup(test_db):
+    """Bulk lookup returns the same tags and notes as per-contact lookups."""
+    db, fixtures = test_db
+    contact_ids = [c.id for c in fixtures["contacts"].values()]
+
+    bulk = db.get_relationship_info_bulk(contact_ids)
+
+    assert set(bulk) == set(contact_ids)
+    for contact_id in contact_ids:
+        single = db.get_relationship_info(contact_id)
+        assert sorted(bulk[contact_id]["tags"]) == sorted(single["tags"])
+        assert bulk[contact_id]["notes"] == single["notes"]
+
+
+@pytest.mark.unit
+def test_bulk_relationship_info_handles_missing_and_duplicate_ids(test_db):
+    """Unknown IDs get empty info and duplicate IDs are collapsed."""
+    db, fixtures = test_db
+    contact_id = fixtures["contacts"]["John Doe"].id
+
+    info = db.get_relationship_info_bulk([contact_id, contact_id, 999999])
+
+    assert set(info) == {contact_id, 999999}
+    assert info[999999] == {"tags": [], "notes": []}
+    assert "friend" in info[contact_id]["tags"]
+
+
+@pytest.mark.unit
+def test_list_all_contacts_query_count_is_constant(empty_api):
+    """Listing contacts runs the same number of queries for 5 or 50 contacts."""
+    api = empty_api
+
+    _add_tagged_contacts(api, 5)
+    api.db.reset_query_count()
+    small = api.list_all_contacts()
+    small_queries = api.db.reset_query_count()
+
+    _add_tagged_contacts(api, 45, start=5)
+    api.db.reset_query_count()
+    large = api.list_all_contacts()
+    large_queries = api.db.reset_query_count()
+
+    assert len(small) == 5
+    assert len(large) == 50
+    assert small_queries == large_queries
+    assert all(c["relationship_info"]["tags"] == ["bulk"] for c in large)
+    assert all(c["relationship_info"]["notes"][0]["title"] == "Bulk note" for c in large)
+
+
+@pytest.mark.unit
+def test_search_and_tag_lookup_query_count_is_constant(empty_api):
+    """Search and tag membership queries don't issue per-contact lookups."""
+    api = empty_api
+    _add_tagged_contacts(api, 30)
+
+    api.db.reset_query_count()
+    searched = api.search_contacts("Bulk")
+    search_queries = api.db.reset_query_count()
+
+    api.db.reset_query_count()
+    tagged = api.get_contacts_by_tag("bulk")
+    tag_queries = api.db.reset_query_count()
+
+    assert len(searched) == 30
+    assert len(tagged) == 30
+    assert search_queries <= 3
+    assert tag_queries <= 3
+    assert [c["name"] for c in tagged] == sorted(c["name"] for c in tagged)
+
+
+@pytest.mark.unit
+def test_bulk_relationship_info_batches_large_id_lists(test_db):
+    """ID lists larger than one IN batch are split and still fully answered."""
+    db, fixtures = test_db
+    john_id = fixtures["contacts"]["John Doe"].id
+    contact_ids = [john_id] + list(range(100000, 100000 + IN_CLAUSE_BATCH_SIZE + 10))
+
+    db.reset_query_count()
+    info = db.get_relationship_info_bulk(contact_ids)
+    queries = db.reset_query_count()
+
+    assert len(info) == len(contact_ids)
+    assert "friend" in info[john_id]["tags"]
+    assert queries == 4  # tags + notes for each of the two batches
@@ -0,0 +1,107 @@
+"""
+Tests for SQL-level contact pagination with keyset cursors.
+"""
+
+import pytest
+
+
+@pytest.fixture
+def paged_api(empty_api):
+    """API over a database with 25 contacts, including duplicate names."""
+    api = empty_api
+    contacts = [{"first": f"Person{i:02d}", "last": "Page"} for i in range(22)]
+    contacts += [{"first": "Same", "last": "Name"} for _ in range(3)]
+    api.db.insert_contacts(contacts)
+    return api
+
+
+def _expected_order(api):
+    return [(c["name"], c["id"]) for c in api.list_all_contacts()]
+
+
+@pytest.mark.unit
+def test_cursor_walk_returns_every_contact_once_in_order(paged_api):
+    """Following next_cursor visits all contacts in (name, id) order."""
+    seen = []
+    cursor = None
+    while True:
+        page = paged_api.get_contacts_page(4, cursor=cursor)
+        seen.extend((c["name"], c["id"]) for c in page["contacts"])
+        assert page["total"] == 25
+        if not page["has_next"]:
+            assert page["next_cursor"] is None
+            break
+        cursor = page["next_cursor"]
+
+    assert seen == sorted(_expected_order(paged_api))
+    assert len(seen) == 25
+
+
+@pytest.mark.unit
+def test_offset_page_matches_cursor_page(paged_api):
+    """Jumping by offset returns the same rows as walking with cursors."""
+    first = paged_api.get_contacts_page(10)
+    second = paged_api.get_contacts_page(10, cursor=first["next_cursor"])
+
+    by_offset = paged_api.get_contacts_page(10, offset=10)
+    assert [c["id"] for c in by_offset["contacts"]] == [c["id"] for c in second["contacts"]]
+    assert paged_api.get_contacts_paginated(2, 10) == second["contacts"]
+
+
+@pytest.mark.unit
+def test_page_query_count_does_not_depend_on_depth(paged_api):
+    """Deep cursor pages run the same queries as the first page."""
+    first = paged_api.get_contacts_page(5)
+
+    paged_api.db.reset_query_count()
+    paged_api.get_contacts_page(5, cursor=first["next_cursor"])
+    second_queries = paged_api.db.reset_query_count()
+
+    third = paged_api.get_contacts_page(5, cursor=first["next_cursor"])
+    paged_api.db.reset_query_count()
+    paged_api.get_contacts_page(5, cursor=third["next_cursor"])
+    later_queries = paged_api.db.reset_query_count()
+
+    assert second_queries == later_queries
+
+
+@pytest.mark.unit
+def test_contact_count_is_cached_and_invalidated(paged_api):
+    """The total comes from a cached COUNT(*) that resets on insert/delete."""
+    assert paged_api.db.count_contacts() == 25
+
+    paged_api.db.reset_query_count()
+    assert paged_api.db.count_contacts() == 25
+    assert paged_api.db.reset_query_count() == 0
+
+    created = paged_api.add_contact("New", "Person")
+    assert paged_api.get_contacts_page(5)["total"] == 26
+
+    paged_api.delete_contact(created["id"])
+    assert paged_api.get_contacts_page(5)["total"] == 25
+
+
+@pytest.mark.unit
+def test_invalid_cursor_raises_value_error(paged_api):
+    """Malformed cursors are rejected with ValueError."""
+    with pytest.raises(ValueError):
+        paged_api.get_contacts_page(5, cursor="not-a-cursor")
+
+
+@pytest.mark.unit
+def test_contact_paginator_loads_pages_lazily(paged_api):
+    """The paginator pages through the database via the keyset provider."""
+    paginator = paged_api.create_contact_paginator(page_size=10)
+
+    assert paginator.total_items == 25
+    assert paginator.total_pages == 3
+
+    names = []
+    page = paginator.get_page(1)
+    names.extend(c["name"] for c in page.items)
+    while page.has_next:
+        page = paginator.next_page()
+        names.extend(c["name"] for c in page.items)
+
+    assert names == [name for name, _id in sorted(_expected_order(paged_api))]
+    assert paginator.get_page(3).items == page.items
@@ -61,7 +61,7 @@ def test_contacts_with_images_vs_full_scan_performance(test_db):
     # Test naive approach (full scan)
     start_time = time.time()
     all_contacts = api.list_all_contacts()
-    naive_contacts = [c for c in all_contacts if c.get("profile_image")]
+    naive_contacts = [c for c in all_contacts if c.get("has_profile_image")]
     naive_time = time.time() - start_time
 
     # Verify same results
@@ -26,6 +26,18 @@ def mock_api():
         {"id": 5, "name": "Eve Adams", "email": "eve@example.com", "phone": "555-0005"},
     ]
 
+    def get_contacts_page(limit, cursor=None, offset=0):
+        contacts = api.list_all_contacts.return_value
+        page = contacts[offset : offset + limit]
+        return {
+            "contacts": page,
+            "next_cursor": None,
+            "has_next": offset + limit < len(contacts),
+            "total": len(contacts),
+        }
+
+    api.get_contacts_page.side_effect = get_contacts_page
+
     # Mock search results
     api.search_contacts.return_value = [
         {"id": 1, "name": "Alice Smith", "email": "alice@example.com"},
@@ -96,6 +108,15 @@ def mock_api():
         }
     ]
 
+    # Mock grouped tag and note membership
+    api.db.data_version = 1
+    api.get_contacts_grouped_by_tag.return_value = {
+        1: [{"id": 1, "name": "Alice Smith", "email": "alice@example.com", "phone": None}]
+    }
+    api.get_contacts_grouped_by_note.return_value = {
+        1: [{"id": 2, "name": "Bob Jones", "email": "bob@example.com", "phone": None}]
+    }
+
     # Mock metadata
     api.db.get_contact_metadata.return_value = {
         "tags": [{"id": 1, "name": "family"}],
@@ -327,6 +348,33 @@ class TestSearchOperations:
             assert "relationship_type" in contact
             assert contact["relationship_type"] == "mother"
 
+    def test_search_by_tag_uses_grouped_query_and_reverse_index(self, mock_api):
+        """Tag members come from one grouped lookup, then from the cache."""
+        ops = SearchOperations(mock_api)
+
+        results = ops.search_by_tag("family")
+        assert [c["id"] for c in results] == [1]
+        assert results[0]["tag"] == "family"
+
+        # Second lookup is served from the reverse tag index
+        assert ops.search_by_tag("family") == results
+        mock_api.get_contacts_grouped_by_tag.assert_called_once_with([1])
+
+        # A data change invalidates the index
+        mock_api.db.data_version = 2
+        ops.search_by_tag("family")
+        assert mock_api.get_contacts_grouped_by_tag.call_count == 2
+
+    def test_search_by_note_attaches_grouped_contacts(self, mock_api):
+        """Each matching note lists its contacts from one grouped lookup."""
+        ops = SearchOperations(mock_api)
+
+        results = ops.search_by_note("Meeting")
+
+        assert results[0]["contact_count"] == 1
+        assert results[0]["associated_contacts"][0]["name"] == "Bob Jones"
+        mock_api.get_contacts_grouped_by_note.assert_called_once_with([1])
+
     def test_search_empty_query(self, mock_api):
         """Handles empty string gracefully."""
         ops = SearchOperations(mock_api)
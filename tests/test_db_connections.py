@@ -0,0 +1,178 @@
+"""
+Tests for Database connection settings and read sessions.
+
+Every connection the engine opens gets the configured pragmas, and read
+sessions run next to an open write transaction without waiting for it.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from sqlalchemy import text
+
+from prt_src.db import Database
+from prt_src.db import SQLiteSettings
+from prt_src.models import Contact
+from prt_src.tui.services.data import DataService
+
+
+def _pragma(session, name):
+    return session.execute(text(f"PRAGMA {name}")).scalar()
+
+
+@pytest.mark.unit
+def test_pragmas_apply_to_every_connection(test_db):
+    """The main session and read sessions on other threads share the same settings."""
+    db, _fixtures = test_db
+    seen = {}
+
+    def read():
+        with db.read_session() as session:
+            seen["reader"] = {
+                name: _pragma(session, name)
+                for name in ("journal_mode", "synchronous", "temp_store", "cache_size")
+            }
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    reader.join()
+
+    expected = {"journal_mode": "wal", "synchronous": 1, "temp_store": 2, "cache_size": -65536}
+    assert {name: _pragma(db.session, name) for name in expected} == expected
+    assert seen["reader"] == expected
+    assert _pragma(db.session, "mmap_size") == 256 * 1024 * 1024
+
+
+@pytest.mark.unit
+def test_settings_from_config_override_defaults(tmp_path):
+    """The ``sqlite`` config section overrides individual pragmas; unknown keys are ignored."""
+    settings = SQLiteSettings.from_config(
+        {"sqlite": {"foreign_keys": True, "synchronous": "FULL", "unknown": 1}}
+    )
+    db = Database(tmp_path / "settings.db", settings)
+    db.connect()
+
+    assert settings.journal_mode == "WAL"
+    assert _pragma(db.session, "foreign_keys") == 1
+    assert _pragma(db.session, "synchronous") == 2
+    assert SQLiteSettings.from_config({}) == SQLiteSettings()
+
+
+@pytest.mark.unit
+def test_read_session_does_not_wait_for_open_write(test_db):
+    """A reader sees the last committed data while a write transaction is open."""
+    db, fixtures = test_db
+    committed = len(fixtures["contacts"])
+    db.session.add(Contact(name="Pending Writer"))
+    db.session.flush()  # Holds the write lock until commit
+    counts = []
+
+    def read():
+        started = time.perf_counter()
+        with db.read_session() as session:
+            counts.append(session.query(Contact).count())
+        counts.append(time.perf_counter() - started)
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    reader.join(timeout=5)
+    db.session.commit()
+
+    assert counts[0] == committed
+    assert counts[1] < 1.0
+    with db.read_session() as session:
+        assert session.query(Contact).count() == committed + 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_data_service_searches_use_reader_sessions(api):
+    """Searches run on reader threads with their own session; writes stay on the worker."""
+    service = DataService(api)
+    seen = []
+
+    def record(func):
+        def wrapper(*args, **kwargs):
+            seen.append((threading.current_thread().name, api.db.session is api.db._session))
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    api.search_contacts = record(api.search_contacts)
+    api.create_tag = record(api.create_tag)
+    try:
+        results, _tag = await asyncio.gather(
+            service.search_contacts("John"), service.create_tag("reader-test")
+        )
+    finally:
+        service.close()
+
+    assert "John Doe" in [c["name"] for c in results]
+    (search_thread, search_shared), (write_thread, write_shared) = seen
+    assert search_thread.startswith("prt-db-read") and not search_shared
+    assert not write_thread.startswith("prt-db-read") and write_shared
+
+
+def _contention(db_path, settings, seconds=1.0, readers=3):
+    """Run one writer and several readers for ``seconds``; return throughput and latency."""
+    db = Database(db_path, settings)
+    db.connect()
+    db.initialize()
+    db.session.add_all(Contact(name=f"Seed {i}", email=f"seed{i}@example.com") for i in range(2000))
+    db.session.commit()
+
+    stop = threading.Event()
+    writes = 0
+    latencies: list[float] = []
+    lock = threading.Lock()
+
+    def write():
+        nonlocal writes
+        while not stop.is_set():
+            with db.read_session() as session:  # A private session on this thread
+                session.add(Contact(name=f"Writer {writes}"))
+                session.commit()
+            writes += 1
+
+    def read():
+        while not stop.is_set():
+            started = time.perf_counter()
+            with db.read_session() as session:
+                session.query(Contact).filter(Contact.name.like("Seed 1%")).count()
+            with lock:
+                latencies.append(time.perf_counter() - started)
+
+    threads = [threading.Thread(target=write)]
+    threads += [threading.Thread(target=read) for _ in range(readers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    db.engine.dispose()
+
+    latencies.sort()
+    return {
+        "writes_per_s": writes / seconds,
+        "reads_per_s": len(latencies) / seconds,
+        "p99_read_ms": latencies[int(len(latencies) * 0.99)] * 1000,
+    }
+
+
+@pytest.mark.performance
+def test_read_write_contention_benchmark(tmp_path):
+    """Benchmark: concurrent readers and a committing writer, rollback journal vs WAL."""
+    rollback = _contention(
+        tmp_path / "rollback.db", SQLiteSettings(journal_mode="DELETE", synchronous="FULL")
+    )
+    wal = _contention(tmp_path / "wal.db", SQLiteSettings())
+
+    for label, result in (("rollback journal", rollback), ("WAL", wal)):
+        print(
+            f"\n{label}: {result['writes_per_s']:.0f} commits/s,"
+            f" {result['reads_per_s']:.0f} reads/s, p99 read {result['p99_read_ms']:.1f}ms"
+        )
+    assert wal["writes_per_s"] > rollback["writes_per_s"]
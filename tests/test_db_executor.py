@@ -0,0 +1,122 @@
+"""
+Tests for the TUI database executor.
+
+DataService runs every PRTAPI call on a single worker thread so blocking
+SQLite work never runs on the Textual event loop.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from prt_src.tui.services.data import DataService
+from prt_src.tui.services.db_executor import DatabaseExecutor
+
+
+@pytest.fixture
+def executor():
+    executor = DatabaseExecutor()
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_calls_run_on_one_worker_thread(executor):
+    """Every call runs on the same thread, which isn't the event loop thread."""
+    loop_thread = threading.get_ident()
+
+    thread_ids = await asyncio.gather(*(executor.run(threading.get_ident) for _ in range(5)))
+
+    assert len(set(thread_ids)) == 1
+    assert thread_ids[0] != loop_thread
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_event_loop_stays_responsive_during_slow_call(executor):
+    """The loop keeps running other tasks while a call blocks the worker."""
+    release = threading.Event()
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while not release.is_set():
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    tick_task = asyncio.create_task(ticker())
+    call = asyncio.create_task(executor.run(release.wait, 5))
+    await asyncio.sleep(0.1)
+    release.set()
+
+    assert await call is True
+    await tick_task
+    assert ticks >= 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_superseded_requests_are_cancelled(executor):
+    """A newer call with the same key cancels queued and discards running ones."""
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow(value):
+        started.set()
+        release.wait(5)
+        return value
+
+    running = asyncio.create_task(executor.run(slow, "running", supersede_key="search"))
+    await asyncio.to_thread(started.wait, 5)
+    queued = asyncio.create_task(executor.run(slow, "queued", supersede_key="search"))
+    await asyncio.sleep(0)
+    latest = asyncio.create_task(executor.run(slow, "latest", supersede_key="search"))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await latest == "latest"
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+    with pytest.raises(asyncio.CancelledError):
+        await running
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_exceptions_propagate_to_caller(executor):
+    """Errors raised on the worker thread surface in the awaiting coroutine."""
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        await executor.run(fail)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_data_service_queries_run_off_the_event_loop(api, test_db):
+    """DataService API calls execute on the executor's thread."""
+    _db, fixtures = test_db
+    service = DataService(api)
+    loop_thread = threading.get_ident()
+    seen_threads = []
+
+    original = api.search_contacts
+
+    def recording_search(query):
+        seen_threads.append(threading.get_ident())
+        return original(query)
+
+    api.search_contacts = recording_search
+    try:
+        results = await service.search_contacts("John Doe")
+        contacts = await service.list_all_contacts()
+    finally:
+        service.close()
+
+    assert [c["name"] for c in results] == ["John Doe"]
+    assert len(contacts) == len(fixtures["contacts"])
+    assert seen_threads and seen_threads[0] != loop_thread
@@ -70,9 +70,9 @@ class TestFTS5Migration:
     version 4, then test the actual migration to version 5 with real FTS5 table creation.
     """
 
-    def test_current_version_is_6(self, schema_manager):
-        """Verify CURRENT_VERSION is set to 6."""
-        assert schema_manager.CURRENT_VERSION == 6
+    def test_current_version_is_11(self, schema_manager):
+        """Verify CURRENT_VERSION is set to 11."""
+        assert schema_manager.CURRENT_VERSION == 11
 
     def test_migration_file_not_found(self, schema_manager, mock_db):
         """Verify proper error when migration file is missing."""
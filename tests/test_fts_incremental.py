@@ -0,0 +1,152 @@
+"""
+Tests for incremental FTS5 maintenance.
+
+ORM writes queue the contact, note and tag IDs they touch and only those FTS
+rows are re-indexed when the transaction commits. The consistency checker
+compares the FTS tables with the base tables row by row.
+"""
+
+import pytest
+from sqlalchemy import text
+
+from prt_src.core.search_index.indexer import SearchIndexer
+from prt_src.models import Contact
+from prt_src.models import Note
+from prt_src.models import Tag
+
+
+def _fts_row(db, table, id_column, entity_id):
+    return db.session.execute(
+        text(f"SELECT * FROM {table} WHERE {id_column} = :id"), {"id": entity_id}
+    ).fetchone()
+
+
+def _consistency(db):
+    return SearchIndexer(db).check_consistency()
+
+
+@pytest.mark.unit
+def test_migrated_index_starts_consistent(fts_db):
+    """The migration's initial population matches the base tables."""
+    db, fixtures = fts_db
+
+    report = _consistency(db)
+
+    assert report["consistent"] is True
+    assert report["contacts"]["base_rows"] == len(fixtures["contacts"])
+    assert report["contacts"]["indexed_rows"] == len(fixtures["contacts"])
+
+
+@pytest.mark.unit
+def test_note_links_and_edits_reach_the_index(fts_db):
+    """Attaching and editing a note updates both the contact and note rows."""
+    db, fixtures = fts_db
+    john_id = fixtures["contacts"]["John Doe"].id
+
+    db.add_relationship_note(john_id, "Kayak trip", "Paddled the fjord")
+    note = db.session.query(Note).filter_by(title="Kayak trip").one()
+    assert "fjord" in _fts_row(db, "contacts_fts", "contact_id", john_id).notes
+    assert "John Doe" in _fts_row(db, "notes_fts", "note_id", note.id).contact_names
+
+    note.content = "Paddled the lagoon"
+    db.session.commit()
+    assert "lagoon" in _fts_row(db, "contacts_fts", "contact_id", john_id).notes
+
+    contact = db.session.get(Contact, john_id)
+    contact.name = "Jonathan Doe"
+    db.session.commit()
+    assert "Jonathan Doe" in _fts_row(db, "notes_fts", "note_id", note.id).contact_names
+    assert _consistency(db)["consistent"] is True
+
+
+@pytest.mark.unit
+def test_unlinks_and_deletes_reach_the_index(fts_db):
+    """Removing tags, deleting notes and deleting contacts leave no stale rows."""
+    db, fixtures = fts_db
+    john = db.session.get(Contact, fixtures["contacts"]["John Doe"].id)
+    metadata = john.metadata_rel
+    tag = metadata.tags[0]
+
+    metadata.tags.remove(tag)
+    db.session.commit()
+    assert _consistency(db)["tags"]["stale"] == []
+
+    for note in list(metadata.notes):
+        db.session.delete(note)
+    db.session.commit()
+    assert _fts_row(db, "contacts_fts", "contact_id", john.id).notes == ""
+
+    db.session.delete(john)
+    db.session.commit()
+    assert _fts_row(db, "contacts_fts", "contact_id", john.id) is None
+    assert _consistency(db)["consistent"] is True
+
+
+@pytest.mark.unit
+def test_only_touched_rows_are_rewritten(fts_db):
+    """A commit re-indexes the changed rows, not the whole table."""
+    db, fixtures = fts_db
+    jane_id = fixtures["contacts"]["Jane Smith"].id
+    before = {
+        row.contact_id: row.rowid
+        for row in db.session.execute(text("SELECT rowid, contact_id FROM contacts_fts"))
+    }
+
+    db.session.get(Contact, jane_id).email = "jane@new.example"
+    db.session.commit()
+
+    after = {
+        row.contact_id: row.rowid
+        for row in db.session.execute(text("SELECT rowid, contact_id FROM contacts_fts"))
+    }
+    changed = {cid for cid in after if after[cid] != before.get(cid)}
+    assert changed == {jane_id}
+
+
+@pytest.mark.unit
+def test_rolled_back_writes_do_not_touch_the_index(fts_db):
+    """Changes flushed and then rolled back are never re-indexed."""
+    db, _fixtures = fts_db
+    db.session.add(Tag(name="ephemeral"))
+    db.session.flush()
+    db.session.rollback()
+
+    assert db.session.info.get("search_index_changes") is None
+    assert _consistency(db)["consistent"] is True
+
+
+@pytest.mark.unit
+def test_consistency_check_finds_and_repairs_drift(fts_db):
+    """Raw SQL drift is reported per entity and repaired row by row."""
+    db, fixtures = fts_db
+    jane_id = fixtures["contacts"]["Jane Smith"].id
+    tag_id = db.session.query(Tag.id).first()[0]
+    db.session.execute(
+        text("UPDATE contacts_fts SET email = 'wrong' WHERE contact_id = :id"), {"id": jane_id}
+    )
+    db.session.execute(text("DELETE FROM tags_fts WHERE tag_id = :id"), {"id": tag_id})
+    db.session.execute(text("INSERT INTO notes_fts (note_id, title) VALUES (999999, 'ghost')"))
+    db.session.commit()
+    indexer = SearchIndexer(db)
+
+    report = indexer.check_consistency()
+    assert report["consistent"] is False
+    assert report["contacts"]["stale"] == [jane_id]
+    assert report["tags"]["missing"] == [tag_id]
+    assert report["notes"]["orphaned"] == [999999]
+
+    repaired = indexer.check_consistency(repair=True)
+    assert repaired["repaired"] == 3
+    assert indexer.check_consistency()["consistent"] is True
+
+
+@pytest.mark.unit
+def test_without_fts_tables_writes_skip_indexing(test_db):
+    """Databases without the FTS migration commit normally."""
+    db, fixtures = test_db
+
+    db.session.get(Contact, fixtures["contacts"]["John Doe"].id).email = "john@new.example"
+    db.session.commit()
+
+    assert db._fts_available is False
+    assert SearchIndexer(db).check_consistency() == {"fts_available": False, "consistent": False}
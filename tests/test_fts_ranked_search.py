@@ -0,0 +1,83 @@
+"""
+Tests for globally ranked FTS search across contacts, notes and tags.
+"""
+
+import pytest
+
+from prt_src.core.search_index.indexer import EntityType
+from prt_src.core.search_index.indexer import SearchIndexer
+
+
+@pytest.fixture
+def ranked_db(fts_db):
+    """FTS database with 30 contacts, 5 notes and one tag mentioning 'orchid'."""
+    db, _fixtures = fts_db
+    db.insert_contacts([{"first": f"Orchid{i:02d}", "last": "Grower"} for i in range(30)])
+    for i in range(5):
+        db.add_note(f"Orchid care {i}", "Water the orchid weekly " * (i + 1))
+    db.add_tag("orchid")
+    return db
+
+
+def _keys(results):
+    return [(r.entity_type, r.entity_id) for r in results]
+
+
+@pytest.mark.unit
+def test_scores_are_normalized_per_table(ranked_db):
+    """Each table's best match scores 1.0 and every score lies in (0, 1]."""
+    results = SearchIndexer(ranked_db).search("orchid", limit=100)
+
+    assert len(results) == 36
+    assert all(0 < r.relevance_score <= 1.0 for r in results)
+    for entity_type in (EntityType.CONTACT, EntityType.NOTE, EntityType.TAG):
+        best = max(r.relevance_score for r in results if r.entity_type == entity_type)
+        assert best == pytest.approx(1.0)
+    scores = [r.relevance_score for r in results]
+    assert scores == sorted(scores, reverse=True)
+
+
+@pytest.mark.unit
+def test_cursor_pages_match_one_large_page(ranked_db):
+    """Walking the continuation tokens yields the full ranking exactly once."""
+    indexer = SearchIndexer(ranked_db)
+    everything = _keys(indexer.search("orchid", limit=100))
+
+    walked = []
+    cursor = None
+    while True:
+        page = indexer.search_page("orchid", limit=7, cursor=cursor)
+        walked.extend(_keys(page["results"]))
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert walked == everything
+    assert _keys(indexer.search("orchid", limit=7, offset=28)) == everything[28:35]
+
+
+@pytest.mark.unit
+def test_page_runs_one_ranking_statement(ranked_db):
+    """A page costs the ranking query plus one hydration query per entity type."""
+    indexer = SearchIndexer(ranked_db)
+    indexer.check_fts_available()
+
+    ranked_db.reset_query_count()
+    indexer.search_page("orchid", limit=5, offset=30)
+    assert ranked_db.reset_query_count() <= 4
+
+    ranked_db.reset_query_count()
+    indexer.search_page("orchid", entity_types=[EntityType.CONTACT], limit=5)
+    assert ranked_db.reset_query_count() == 2
+
+
+@pytest.mark.unit
+def test_cursor_is_bound_to_its_query(ranked_db):
+    """A continuation token can't be replayed against a different search."""
+    indexer = SearchIndexer(ranked_db)
+    cursor = indexer.search_page("orchid", limit=5)["next_cursor"]
+
+    with pytest.raises(ValueError):
+        indexer.search_page("grower", limit=5, cursor=cursor)
+    with pytest.raises(ValueError):
+        indexer.search_page("orchid", limit=5, cursor="not-a-cursor")
@@ -0,0 +1,168 @@
+"""
+Tests for the streaming Google Takeout import.
+
+Cards are read from the zip lazily and parsed in chunks, in this process or on
+worker processes; images are matched by filename and only the matched ones
+are read, batch by batch, while the contacts are inserted.
+"""
+
+import time
+import zipfile
+from unittest.mock import patch
+
+import pytest
+
+from prt_src import google_takeout
+from prt_src.google_takeout import GoogleTakeoutParser
+from prt_src.google_takeout import insert_takeout_contacts
+from prt_src.google_takeout import parse_takeout_contacts
+
+
+def _vcard(i: int) -> str:
+    return (
+        "BEGIN:VCARD\r\nVERSION:3.0\r\n"
+        f"FN:Person{i} Test\r\nN:Test;Person{i};;;\r\n"
+        f"EMAIL;TYPE=INTERNET:person{i}@example.com\r\n"
+        f"TEL;TYPE=CELL:+1 555 {i:07d}\r\n"
+        "END:VCARD\r\n"
+    )
+
+
+def _build_takeout(path, count, with_images=(), unmatched_images=0, per_file=None):
+    """Write a takeout zip with ``count`` cards split over vcf files, plus images."""
+    per_file = per_file or count
+    with zipfile.ZipFile(path, "w") as zf:
+        for start in range(0, count, per_file):
+            cards = "".join(_vcard(i) for i in range(start, min(start + per_file, count)))
+            zf.writestr(f"Takeout/Contacts/All Contacts/part{start}.vcf", cards)
+        for i in with_images:
+            zf.writestr(f"Takeout/Contacts/All Contacts/Person{i} Test.jpg", b"jpg-%d" % i)
+        for i in range(unmatched_images):
+            zf.writestr(f"Takeout/Contacts/All Contacts/Stranger{i}.png", b"png")
+    return path
+
+
+@pytest.mark.unit
+def test_worker_parse_matches_inline_parse(tmp_path, monkeypatch):
+    """Parsing on worker processes gives the same contacts, in the same order."""
+    monkeypatch.setattr(google_takeout, "PARSE_CHUNK_SIZE", 10)
+    zip_path = _build_takeout(tmp_path / "takeout.zip", 45, per_file=20)
+
+    inline, _ = GoogleTakeoutParser(zip_path, workers=1).extract_contacts_and_images()
+    parallel, _ = GoogleTakeoutParser(zip_path, workers=2).extract_contacts_and_images()
+
+    assert len(inline) == 45
+    assert parallel == inline
+    assert inline[7]["first"] == "Person7"
+    assert inline[7]["emails"] == ["person7@example.com"]
+
+
+@pytest.mark.unit
+def test_only_matched_images_are_read(tmp_path):
+    """Images are matched by filename; bytes are read for matched contacts only."""
+    zip_path = _build_takeout(tmp_path / "takeout.zip", 5, with_images=(1, 3), unmatched_images=4)
+    contacts, info = parse_takeout_contacts(zip_path)
+
+    assert info["image_count"] == 6
+    assert info["contacts_with_images"] == 2
+    assert all(c["profile_image"] is None for c in contacts)
+
+    read = []
+    original_read = zipfile.ZipFile.read
+
+    def tracking_read(self, name, *args, **kwargs):
+        read.append(name)
+        return original_read(self, name, *args, **kwargs)
+
+    inserted = {}
+
+    def insert(batch):
+        inserted.update((c["first"], c["profile_image"]) for c in batch)
+        return True
+
+    with patch.object(zipfile.ZipFile, "read", tracking_read):
+        assert insert_takeout_contacts(zip_path, contacts, insert)
+
+    assert sorted(read) == [
+        "Takeout/Contacts/All Contacts/Person1 Test.jpg",
+        "Takeout/Contacts/All Contacts/Person3 Test.jpg",
+    ]
+    assert inserted["Person1"] == b"jpg-1"
+    assert inserted["Person0"] is None
+    assert all("profile_image_member" not in c for c in contacts)
+
+
+@pytest.mark.unit
+def test_insert_batches_and_reports_progress(tmp_path):
+    """Contacts are inserted in batches, with progress after each one."""
+    zip_path = _build_takeout(tmp_path / "takeout.zip", 12, with_images=(10,))
+    contacts, _info = parse_takeout_contacts(zip_path)
+    batches = []
+    progress = []
+
+    def insert(batch):
+        batches.append([c["first"] for c in batch])
+        return True
+
+    ok = insert_takeout_contacts(
+        zip_path, contacts, insert, lambda *call: progress.append(call), batch_size=5
+    )
+
+    assert ok
+    assert [len(b) for b in batches] == [5, 5, 2]
+    assert progress == [("insert", 5, 12), ("insert", 10, 12), ("insert", 12, 12)]
+    # Image bytes are dropped once their batch is stored
+    assert all(c["profile_image"] is None for c in contacts)
+
+
+@pytest.mark.unit
+def test_insert_stops_at_failed_batch(tmp_path):
+    """A failed batch stops the import and is reported."""
+    zip_path = _build_takeout(tmp_path / "takeout.zip", 6)
+    contacts, _info = parse_takeout_contacts(zip_path)
+    calls = []
+
+    ok = insert_takeout_contacts(
+        zip_path, contacts, lambda batch: calls.append(batch) and False, batch_size=2
+    )
+
+    assert not ok
+    assert len(calls) == 1
+
+
+@pytest.mark.unit
+def test_parse_progress_and_duplicates(tmp_path):
+    """Parse progress is reported per chunk; duplicate cards merge and keep the image."""
+    zip_path = tmp_path / "takeout.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("Takeout/Contacts/a.vcf", _vcard(1) + _vcard(2))
+        zf.writestr("Takeout/Contacts/b.vcf", _vcard(1))
+        zf.writestr("Takeout/Contacts/Person1 Test.jpg", b"jpg")
+    progress = []
+
+    contacts, info = parse_takeout_contacts(zip_path, lambda *call: progress.append(call))
+
+    assert info["raw_contact_count"] == 3
+    assert info["contact_count"] == 2
+    assert info["contacts_with_images"] == 1
+    assert progress[-1] == ("parse", 3, 0)
+    person1 = next(c for c in contacts if c["first"] == "Person1")
+    assert person1["profile_image_member"] == "Takeout/Contacts/Person1 Test.jpg"
+
+
+@pytest.mark.performance
+def test_takeout_parse_benchmark(tmp_path):
+    """Benchmark: inline vs worker-process parsing of a large takeout."""
+    zip_path = _build_takeout(tmp_path / "large.zip", 6000, per_file=1500)
+
+    timings = {}
+    for workers in (1, max(2, google_takeout.DEFAULT_PARSE_WORKERS)):
+        started = time.perf_counter()
+        contacts, _ = GoogleTakeoutParser(zip_path, workers=workers).extract_contacts_and_images()
+        timings[workers] = time.perf_counter() - started
+        assert len(contacts) == 6000
+
+    print(
+        "\n"
+        + ", ".join(f"{workers} worker(s): {seconds:.2f}s" for workers, seconds in timings.items())
+    )
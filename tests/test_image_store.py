@@ -0,0 +1,204 @@
+"""
+Tests for the content-addressed profile image store.
+
+Images are stored once per distinct content with pre-generated thumbnails,
+contacts reference them by hash, readers get the smallest variant that covers
+the size they display, and the v11 migration moves inline BLOBs into the store.
+"""
+
+import io
+import os
+import time
+
+import pytest
+from PIL import Image
+from sqlalchemy import text
+
+from prt_src.cli_modules.services.images import EXPORT_IMAGE_SIZE
+from prt_src.cli_modules.services.images import export_profile_images_from_results
+from prt_src.image_store import IMAGE_IN_STORE
+from prt_src.image_store import ImageStore
+from prt_src.image_store import content_hash
+from prt_src.image_store import make_thumbnails
+from prt_src.models import Contact
+from prt_src.schema_manager import SchemaManager
+from prt_src.tui.widgets.contact_detail import PHOTO_COLUMNS
+
+
+def _png(width, height, color=(200, 40, 40, 128)):
+    buffer = io.BytesIO()
+    Image.new("RGBA", (width, height), color).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def _parsed(first, image=None):
+    return {
+        "first": first,
+        "last": "Photo",
+        "emails": [f"{first.lower()}@example.com"],
+        "phones": [],
+        "profile_image": image,
+        "profile_image_filename": f"{first}.png" if image else None,
+        "profile_image_mime_type": "image/png" if image else None,
+    }
+
+
+def _migrated(db):
+    manager = SchemaManager(db)
+    manager.create_schema_version_table()
+    manager.apply_migration_v10_to_v11()
+    return manager
+
+
+@pytest.mark.unit
+def test_thumbnails_only_downscale():
+    """Thumbnails are JPEGs within their box, made only for sizes below the original."""
+    dimensions, thumbnails = make_thumbnails(_png(300, 150))
+
+    assert dimensions == (300, 150)
+    assert [(t.size, t.width, t.height) for t in thumbnails] == [(64, 64, 32), (256, 256, 128)]
+    assert Image.open(io.BytesIO(thumbnails[0].data)).format == "JPEG"
+    assert make_thumbnails(_png(50, 50)) == ((50, 50), [])
+    assert make_thumbnails(b"not an image") == (None, [])
+
+
+@pytest.mark.unit
+def test_store_keeps_one_copy_and_serves_smallest_adequate_size(test_db):
+    db, _fixtures = test_db
+    store = ImageStore(db.session)
+    photo = _png(300, 300)
+
+    hashes = store.put_many([(photo, "image/png"), (_png(20, 20), None), (photo, "image/png")])
+    db.session.commit()
+
+    assert hashes[0] == hashes[2] == content_hash(photo)
+    assert db.session.execute(text("SELECT COUNT(*) FROM images")).scalar() == 2
+    assert store.put(photo) == hashes[0]
+    sizes = {size: Image.open(io.BytesIO(store.get(hashes[0], size))).size for size in (16, 64)}
+    assert sizes == {16: (64, 64), 64: (64, 64)}
+    assert Image.open(io.BytesIO(store.get(hashes[0], 100))).size == (256, 256)
+    assert store.get(hashes[0], 400) == store.get(hashes[0]) == photo
+    assert b"".join(store.iter_chunks(hashes[0], 100, size=100)) == store.get(hashes[0], 100)
+    assert store.get("0" * 64) is None
+
+
+@pytest.mark.unit
+def test_imported_contacts_reference_shared_image(test_db):
+    """Imports store images by hash, leaving an empty marker in the contact row."""
+    db, _fixtures = test_db
+    photo = _png(300, 300)
+
+    db.insert_contacts([_parsed("Ann", photo), _parsed("Bob", photo), _parsed("Cy")])
+
+    rows = db.session.execute(
+        text(
+            "SELECT name, profile_image, profile_image_hash FROM contacts"
+            " WHERE name LIKE '% Photo' ORDER BY name"
+        )
+    ).all()
+    assert rows == [
+        ("Ann Photo", IMAGE_IN_STORE, content_hash(photo)),
+        ("Bob Photo", IMAGE_IN_STORE, content_hash(photo)),
+        ("Cy Photo", None, None),
+    ]
+    ann = db.session.query(Contact).filter(Contact.name == "Ann Photo").one()
+    assert ann.profile_image_size == len(photo)
+    assert db.get_profile_image(ann.id) == photo
+    assert len(db.get_profile_image(ann.id, PHOTO_COLUMNS)) < len(photo)
+
+
+@pytest.mark.unit
+def test_migration_moves_inline_images(test_db):
+    """The v11 migration moves every inline BLOB into the store, once."""
+    db, fixtures = test_db
+    john = fixtures["contacts"]["John Doe"]
+    original = john.profile_image
+    with_images = db.session.execute(
+        text("SELECT COUNT(*) FROM contacts WHERE profile_image IS NOT NULL")
+    ).scalar()
+
+    manager = _migrated(db)
+
+    assert manager.get_schema_version() == 11
+    moved = db.session.execute(
+        text(
+            "SELECT COUNT(*) FROM contacts WHERE profile_image IS NOT NULL"
+            " AND length(profile_image) = 0 AND profile_image_hash IS NOT NULL"
+        )
+    ).scalar()
+    assert moved == with_images > 0
+    assert db.get_profile_image(john.id) == original
+    assert b"".join(db.iter_profile_image(john.id, chunk_size=500)) == original
+
+    manager.apply_migration_v10_to_v11()
+    assert db.get_profile_image(john.id) == original
+
+
+@pytest.mark.unit
+def test_unused_images_are_dropped(test_db):
+    """Replacing or deleting the last contact using an image drops it and its thumbnails."""
+    db, _fixtures = test_db
+    _migrated(db)
+    first, second = _png(300, 300), _png(300, 300, (0, 0, 255, 255))
+    db.insert_contacts([_parsed("Ann", first), _parsed("Bob", first)])
+    ann, bob = (
+        db.session.query(Contact).filter(Contact.name == name).one()
+        for name in ("Ann Photo", "Bob Photo")
+    )
+
+    def stored():
+        hashes = db.session.execute(text("SELECT hash FROM images")).scalars()
+        return set(hashes) & {content_hash(first), content_hash(second)}
+
+    db.bulk_update_contacts({ann.id: _parsed("Ann", second)})
+    assert stored() == {content_hash(first), content_hash(second)}
+
+    db.session.delete(bob)
+    db.session.commit()
+    assert stored() == {content_hash(second)}
+    assert (
+        db.session.execute(
+            text("SELECT COUNT(*) FROM image_thumbnails WHERE image_hash = :h"),
+            {"h": content_hash(first)},
+        ).scalar()
+        == 0
+    )
+
+
+@pytest.mark.unit
+def test_export_uses_thumbnail(api, test_db, tmp_path):
+    """Directory export reads the smallest thumbnail covering its display size."""
+    db, _fixtures = test_db
+    photo = _png(600, 600)
+    db.insert_contacts([_parsed("Ann", photo)])
+    ann = next(c for c in api.search_contacts("Ann Photo") if c["name"] == "Ann Photo")
+
+    assert export_profile_images_from_results([ann], tmp_path, "now", api=api) == 1
+    exported = (tmp_path / "profile_images" / f"{ann['id']}.jpg").read_bytes()
+    assert exported == api.get_profile_image(ann["id"], EXPORT_IMAGE_SIZE)
+    assert Image.open(io.BytesIO(exported)).size == (256, 256)
+
+
+@pytest.mark.performance
+def test_contact_scan_benchmark(test_db):
+    """Benchmark: full contacts scans with inline images vs images in the store."""
+    db, _fixtures = test_db
+    # Incompressible stand-ins for photos; Pillow skips them, so this measures the scan
+    db.session.execute(
+        text("INSERT INTO contacts (name, profile_image) VALUES (:name, :image)"),
+        [{"name": f"Scan {i}", "image": os.urandom(48 * 1024)} for i in range(1000)],
+    )
+    db.session.commit()
+
+    def scan():
+        started = time.perf_counter()
+        for _ in range(3):
+            db.session.execute(text("SELECT * FROM contacts")).all()
+        return time.perf_counter() - started
+
+    inline = scan()
+    _migrated(db)
+    stored = scan()
+
+    print(f"\n1,000 contacts with 48KB images: inline {inline:.3f}s, image store {stored:.3f}s")
+    assert stored < inline
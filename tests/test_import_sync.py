@@ -0,0 +1,227 @@
+"""
+Tests for incremental contact imports.
+
+Each import records per-contact content and image fingerprints in
+``contact_sources``; importing the same source again only writes the contacts
+that are new or changed, and an unchanged re-import reads no image bytes.
+"""
+
+import time
+
+import pytest
+from sqlalchemy import text
+
+from prt_src.google_takeout import parse_vcard
+from prt_src.import_sync import SOURCE_GOOGLE_TAKEOUT
+from prt_src.import_sync import content_hash
+from prt_src.import_sync import sync_contacts
+from prt_src.models import Contact
+from prt_src.schema_manager import SchemaManager
+
+
+def _contacts(count, start=0, images=()):
+    contacts = []
+    for i in range(start, start + count):
+        contact = {
+            "first": f"Sync{i}",
+            "last": "Person",
+            "emails": [f"sync{i}@example.com"],
+            "phones": [f"+1 555 {i:07d}"],
+            "uid": f"uid-{i}",
+        }
+        if i in images:
+            contact["profile_image_member"] = f"Sync{i} Person.jpg"
+            contact["profile_image_filename"] = f"Sync{i} Person.jpg"
+            contact["profile_image_mime_type"] = "image/jpeg"
+            contact["profile_image_fingerprint"] = f"zip-crc32:{i:08x}:3"
+        contacts.append(contact)
+    return contacts
+
+
+class _ImageLoader:
+    """Stands in for ``GoogleTakeoutParser.load_profile_images`` and records reads."""
+
+    def __init__(self):
+        self.read = []
+
+    def __call__(self, contacts):
+        for contact in contacts:
+            member = contact.pop("profile_image_member", None)
+            if member:
+                self.read.append(member)
+                contact["profile_image"] = member.encode()
+
+
+def _stored(db, name):
+    db.session.expire_all()
+    return db.session.query(Contact).filter(Contact.name == name).one()
+
+
+@pytest.fixture
+def sync_db(test_db):
+    """Sample database with the contact_sources table."""
+    db, fixtures = test_db
+    manager = SchemaManager(db)
+    manager.create_schema_version_table()
+    manager.apply_migration_v9_to_v10()
+    return db, fixtures
+
+
+@pytest.mark.unit
+def test_reimport_skips_unchanged_contacts(sync_db):
+    """A second import of the same contacts writes nothing and reads no images."""
+    db, _fixtures = sync_db
+    before = db.count_contacts()
+    loader = _ImageLoader()
+
+    first = sync_contacts(db, SOURCE_GOOGLE_TAKEOUT, _contacts(20, images={3}), loader)
+
+    assert (first.added, first.updated, first.unchanged, first.images_updated) == (20, 0, 0, 1)
+    assert db.count_contacts() == before + 20
+    assert db.get_profile_image(_stored(db, "Sync3 Person").id) == b"Sync3 Person.jpg"
+
+    loader.read.clear()
+    version = db.data_version
+    second = sync_contacts(db, SOURCE_GOOGLE_TAKEOUT, _contacts(20, images={3}), loader)
+
+    assert second.describe() == "0 added, 0 updated, 20 unchanged"
+    assert loader.read == []
+    assert db.data_version == version
+    assert db.count_contacts() == before + 20
+
+
+@pytest.mark.unit
+def test_reimport_updates_changed_contacts(sync_db):
+    """Changed content updates the contact in place; a changed image is re-read."""
+    db, _fixtures = sync_db
+    sync_contacts(db, SOURCE_GOOGLE_TAKEOUT, _contacts(5, images={1, 2}), _ImageLoader())
+    original_id = _stored(db, "Sync0 Person").id
+
+    contacts = _contacts(6, images={1, 2})
+    contacts[0]["emails"] = ["renamed@example.com"]
+    contacts[2]["profile_image_fingerprint"] = "zip-crc32:ffffffff:3"
+    loader = _ImageLoader()
+
+    summary = sync_contacts(db, SOURCE_GOOGLE_TAKEOUT, contacts, loader)
+
+    assert (summary.added, summary.updated, summary.unchanged) == (1, 2, 3)
+    assert summary.images_updated == 1
+    assert loader.read == ["Sync2 Person.jpg"]
+    updated = _stored(db, "Sync0 Person")
+    assert (updated.id, updated.email) == (original_id, "renamed@example.com")
+    # A content-only update keeps the stored image
+    assert db.get_profile_image(_stored(db, "Sync1 Person").id) == b"Sync1 Person.jpg"
+
+
+@pytest.mark.unit
+def test_deleted_contact_is_imported_again(sync_db):
+    """Deleting a contact drops its fingerprint, so the next import restores it."""
+    db, _fixtures = sync_db
+    sync_contacts(db, SOURCE_GOOGLE_TAKEOUT, _contacts(3))
+    db.session.delete(_stored(db, "Sync1 Person"))
+    db.session.commit()
+
+    summary = sync_contacts(db, SOURCE_GOOGLE_TAKEOUT, _contacts(3))
+
+    assert (summary.added, summary.unchanged) == (1, 2)
+    assert _stored(db, "Sync1 Person").email == "sync1@example.com"
+
+
+@pytest.mark.unit
+def test_untracked_contacts_are_linked_not_duplicated(sync_db):
+    """Contacts from an import made before tracking are adopted by email or phone."""
+    db, _fixtures = sync_db
+    db.insert_contacts(_contacts(4))
+    before = db.count_contacts()
+
+    summary = sync_contacts(db, SOURCE_GOOGLE_TAKEOUT, _contacts(5))
+
+    assert (summary.added, summary.linked, summary.updated) == (1, 4, 0)
+    assert db.count_contacts() == before + 1
+    assert sync_contacts(db, SOURCE_GOOGLE_TAKEOUT, _contacts(5)).unchanged == 5
+
+
+@pytest.mark.unit
+def test_content_hash_ignores_list_order():
+    """Reordering emails or phones in the source is not a change."""
+    contact = _contacts(1)[0]
+    reordered = dict(contact, emails=["b@example.com", "a@example.com"])
+    contact["emails"] = ["a@example.com", "b@example.com"]
+
+    assert content_hash(contact) == content_hash(reordered)
+
+
+@pytest.mark.unit
+def test_reimport_without_uid_ignores_email_order(sync_db):
+    """A contact without a UID is recognized however the source orders its emails."""
+    db, _fixtures = sync_db
+    contact = _contacts(1)[0]
+    del contact["uid"]
+    contact["emails"] = ["b.sync@example.com", "a.sync@example.com"]
+    reordered = dict(contact, emails=["a.sync@example.com", "b.sync@example.com"])
+    before = db.count_contacts()
+
+    sync_contacts(db, SOURCE_GOOGLE_TAKEOUT, [contact])
+    summary = sync_contacts(db, SOURCE_GOOGLE_TAKEOUT, [reordered])
+
+    assert (summary.added, summary.unchanged) == (0, 1)
+    assert db.count_contacts() == before + 1
+
+
+@pytest.mark.unit
+def test_parse_vcard_keeps_source_order():
+    card = (
+        "BEGIN:VCARD\r\nVERSION:3.0\r\nFN:Order Person\r\nN:Person;Order;;;\r\n"
+        "EMAIL:z@example.com\r\nEMAIL:a@example.com\r\nEMAIL:z@example.com\r\n"
+        "TEL:+1 555 0002\r\nTEL:+1 555 0001\r\nEND:VCARD\r\n"
+    )
+
+    contact = parse_vcard(card)
+
+    assert contact["emails"] == ["z@example.com", "a@example.com"]
+    assert contact["phones"] == ["+1 555 0002", "+1 555 0001"]
+
+
+@pytest.mark.unit
+def test_sync_without_source_table_inserts_everything(test_db):
+    """Before the v10 migration an import falls back to plain inserts."""
+    db, _fixtures = test_db
+    before = db.count_contacts()
+
+    summary = sync_contacts(db, SOURCE_GOOGLE_TAKEOUT, _contacts(3))
+
+    assert not summary.tracked
+    assert summary.added == 3
+    assert db.count_contacts() == before + 3
+
+
+@pytest.mark.unit
+def test_migration_v9_to_v10_bumps_version(test_db):
+    db, _fixtures = test_db
+    manager = SchemaManager(db)
+    manager.create_schema_version_table()
+    manager.apply_migration_v9_to_v10()
+
+    assert manager.get_schema_version() == 10
+    assert db.session.execute(text("SELECT COUNT(*) FROM contact_sources")).scalar() == 0
+
+
+@pytest.mark.performance
+def test_unchanged_resync_benchmark(sync_db):
+    """Benchmark: re-importing an unchanged 10k-contact source vs the first import."""
+    db, _fixtures = sync_db
+    images = set(range(0, 10_000, 4))
+
+    started = time.perf_counter()
+    sync_contacts(db, SOURCE_GOOGLE_TAKEOUT, _contacts(10_000, images=images), _ImageLoader())
+    first = time.perf_counter() - started
+
+    loader = _ImageLoader()
+    started = time.perf_counter()
+    summary = sync_contacts(db, SOURCE_GOOGLE_TAKEOUT, _contacts(10_000, images=images), loader)
+    resync = time.perf_counter() - started
+
+    print(f"\n10,000 contacts: first import {first:.2f}s, unchanged re-import {resync:.2f}s")
+    assert summary.unchanged == 10_000
+    assert loader.read == []
+    assert resync < first
@@ -0,0 +1,131 @@
+"""
+Tests for the lookup-index migration and the index advisor.
+
+The advisor explains the catalogued hot queries; on an up-to-date schema none
+of them scans a whole table, and dropping an index shows up as a flagged query.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import text
+from typer.testing import CliRunner
+
+from prt_src.cli import app
+from prt_src.index_advisor import HotQuery
+from prt_src.index_advisor import advise
+from prt_src.index_advisor import explain
+from prt_src.index_advisor import full_table_scans
+from prt_src.schema_manager import SchemaManager
+
+LOOKUP_INDEXES = [
+    "idx_contact_relationships_to",
+    "idx_contact_relationships_type",
+    "idx_metadata_tags_tag",
+    "idx_metadata_notes_note",
+    "idx_notes_title",
+    "idx_contacts_name",
+    "idx_contacts_profile_image_not_null",
+]
+
+
+@pytest.fixture
+def indexed_db(test_db):
+    """Sample database with the lookup-index migration applied."""
+    db, fixtures = test_db
+    manager = SchemaManager(db)
+    manager.create_schema_version_table()
+    manager.apply_migration_v6_to_v7()
+    return db, fixtures
+
+
+def _drop_lookup_indexes(db):
+    for name in LOOKUP_INDEXES:
+        db.session.execute(text(f"DROP INDEX IF EXISTS {name}"))
+    db.session.commit()
+
+
+def _flagged(db):
+    return {report.name for report in advise(db.session) if report.flagged}
+
+
+@pytest.mark.unit
+def test_hot_queries_use_indexes(indexed_db):
+    """After the migration no hot query does an unexpected full scan."""
+    db, _fixtures = indexed_db
+
+    reports = advise(db.session)
+
+    assert [r.name for r in reports if r.flagged] == []
+    plans = {r.name: " ".join(r.plan) for r in reports}
+    assert "idx_contact_relationships_to" in plans["relationships_to_contact"]
+    assert "idx_metadata_tags_tag" in plans["contacts_grouped_by_tag_ids"]
+    assert "idx_metadata_notes_note" in plans["contacts_grouped_by_note_ids"]
+
+
+@pytest.mark.unit
+def test_missing_indexes_are_flagged(test_db):
+    """Without the lookup indexes the reverse and join-table lookups scan."""
+    db, _fixtures = test_db
+
+    flagged = _flagged(db)
+
+    assert {
+        "relationships_to_contact",
+        "relationships_of_type",
+        "contacts_grouped_by_tag_ids",
+        "contacts_grouped_by_note_ids",
+        "contacts_page_first",
+        "contacts_with_images",
+    } <= flagged
+    assert "relationships_from_contact" not in flagged
+
+
+@pytest.mark.unit
+def test_migration_v6_to_v7_creates_indexes(test_db):
+    """The migration creates every lookup index and bumps the schema version."""
+    db, _fixtures = test_db
+    manager = SchemaManager(db)
+    manager.create_schema_version_table()
+    db.session.execute(text("UPDATE schema_version SET version = 6"))
+    db.session.commit()
+
+    manager.migrate_to_version(7, 6)
+
+    indexes = {
+        row[0]
+        for row in db.session.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'"))
+    }
+    assert set(LOOKUP_INDEXES) <= indexes
+    assert manager.get_schema_version() == 7
+    assert _flagged(db) == set()
+
+
+@pytest.mark.unit
+def test_scans_through_an_unexpected_index_are_flagged(indexed_db):
+    """A full index scan counts as a scan unless the catalogue expects that index."""
+    db, _fixtures = indexed_db
+    sql = "SELECT id FROM contacts ORDER BY name LIMIT 5"
+    plan = explain(db.session, sql)
+
+    assert full_table_scans(plan) == [("contacts", "idx_contacts_name")]
+    expected = HotQuery("page", sql, allowed_scans={"contacts": "idx_contacts_name"})
+    other = HotQuery("page", sql, allowed_scans={"contacts": "idx_other"})
+    assert [r.flagged for r in advise(db.session, [expected, other])] == [False, True]
+
+
+@pytest.mark.unit
+def test_index_advisor_command_exit_code(indexed_db):
+    """The command exits non-zero when a hot query scans a whole table."""
+    db, _fixtures = indexed_db
+    runner = CliRunner()
+    config = {"db_path": str(db.path)}
+
+    with patch("prt_src.cli_modules.commands.database.load_config", return_value=config):
+        clean = runner.invoke(app, ["index-advisor"])
+        _drop_lookup_indexes(db)
+        flagged = runner.invoke(app, ["index-advisor"])
+
+    assert clean.exit_code == 0, clean.output
+    assert flagged.exit_code == 1
+    assert "relationships_to_contact: full scan of contact_relationships" in flagged.output
@@ -66,11 +66,10 @@ def test_get_contacts_with_images_api(test_db):
 
     # Check that all returned contacts have images
     for contact in contacts:
-        assert (
-            contact["profile_image"] is not None
-        ), f"Contact {contact['name']} missing profile_image"
-        assert isinstance(contact["profile_image"], bytes), "Profile image should be bytes"
-        assert len(contact["profile_image"]) > 0, "Profile image should not be empty"
+        assert contact["has_profile_image"], f"Contact {contact['name']} missing profile_image"
+        image = api.get_profile_image(contact["id"])
+        assert isinstance(image, bytes), "Profile image should be bytes"
+        assert len(image) > 0, "Profile image should not be empty"
 
     # Performance check - should be fast with index
     expected_max_time = 1.0
@@ -0,0 +1,92 @@
+"""
+Tests for the cached system prompt and tool schemas.
+
+The stub Ollama server reports prompt-eval token counts the way Ollama's KV
+cache would, so a byte-identical prefix between turns shows up as a small
+second-turn evaluation.
+"""
+
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import pytest
+
+from prt_src.llm_ollama import OllamaLLM
+
+
+@pytest.fixture
+def stub_llm(ollama_stub_server, llm_config):
+    llm_config.llm.base_url = ollama_stub_server.url
+    return OllamaLLM(Mock(), config_manager=llm_config)
+
+
+@pytest.mark.unit
+def test_prompt_and_tools_are_rendered_once(stub_llm):
+    """Repeated turns reuse the same rendered prompt and tool list objects."""
+    generator = stub_llm.prompt_generator
+    with (
+        patch.object(
+            generator, "create_system_prompt", wraps=generator.create_system_prompt
+        ) as create_prompt,
+        patch.object(
+            stub_llm, "_format_tool_calls", wraps=stub_llm._format_tool_calls
+        ) as format_tools,
+    ):
+        for message in ("one", "two", "three"):
+            stub_llm.chat(message)
+
+    assert create_prompt.call_count == 1
+    assert format_tools.call_count == 1
+    assert stub_llm._tool_schemas() is stub_llm._tool_schemas()
+
+
+@pytest.mark.unit
+def test_later_turns_only_evaluate_the_new_suffix(stub_llm, ollama_stub_server):
+    """The prefix is byte-identical between turns, so the KV cache covers it."""
+    stub_llm.chat("Hello")
+    list(stub_llm.chat_stream("And again"))
+
+    first, second = ollama_stub_server.prompt_evals
+    assert second < first / 20
+    assert [m["tokens"] for m in stub_llm.prompt_eval_metrics] == [first, second]
+
+
+@pytest.mark.unit
+def test_cache_key_changes_rebuild_the_prompt(stub_llm, ollama_stub_server):
+    """Disabling a tool or switching models renders a new prompt and tool list."""
+    stub_llm.chat("Hello")
+    prompt = stub_llm._system_prompt()
+
+    stub_llm.set_disabled_tools({"list_all_tags"})
+    stub_llm.chat("Hello again")
+    assert "list_all_tags" not in [t["function"]["name"] for t in stub_llm._tool_schemas()]
+    assert stub_llm._system_prompt() != prompt
+    # The tool list changed, so the cached prefix no longer applies
+    assert ollama_stub_server.prompt_evals[1] > ollama_stub_server.prompt_evals[0] / 2
+
+    stub_llm.model = "mistral:7b-instruct"
+    assert "MISTRAL" in stub_llm._system_prompt()
+
+
+@pytest.mark.performance
+def test_prompt_eval_time_across_turns(stub_llm, ollama_stub_server):
+    """Benchmark: simulated prompt-eval time with a stable prefix vs a re-rendered one."""
+    for turn in range(5):
+        stub_llm.chat(f"turn {turn}")
+    # The first turn is a cold start either way
+    cached = sum(m["seconds"] for m in stub_llm.prompt_eval_metrics[1:])
+
+    stub_llm.clear_history()
+    stub_llm.prompt_eval_metrics.clear()
+    # A prompt that differs on every turn defeats the KV cache
+    render = stub_llm.prompt_generator.create_system_prompt
+    counter = iter(range(1000))
+    with patch.object(
+        stub_llm, "_system_prompt", side_effect=lambda: f"turn {next(counter)}\n{render()}"
+    ):
+        for turn in range(5):
+            stub_llm.chat(f"turn {turn}")
+    uncached = sum(m["seconds"] for m in stub_llm.prompt_eval_metrics[1:])
+
+    print(f"\nprompt eval, turns 2-5: stable prefix {cached:.3f}s, changing {uncached:.3f}s")
+    assert cached < uncached / 10
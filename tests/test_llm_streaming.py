@@ -0,0 +1,107 @@
+"""
+Tests for streamed chat responses.
+
+OllamaLLM posts to ``/api/chat`` with ``"stream": true`` and parses the NDJSON
+chunks; BaseLLM exposes the deltas through ``chat_stream`` and the async
+``stream_chat`` generator the TUI chat screen consumes.
+"""
+
+import json
+from unittest.mock import MagicMock
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import pytest
+
+from prt_src.llm_ollama import OllamaLLM
+
+
+def _stream_response(chunks):
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.headers = {"Content-Type": "application/x-ndjson"}
+    response.iter_lines.return_value = [json.dumps(chunk).encode() for chunk in chunks]
+    return response
+
+
+def _content_chunks(*deltas):
+    chunks = [{"message": {"role": "assistant", "content": d}, "done": False} for d in deltas]
+    chunks.append({"message": {"role": "assistant", "content": ""}, "done": True, "eval_count": 3})
+    return chunks
+
+
+@pytest.mark.unit
+@patch("requests.Session.post")
+def test_chat_stream_yields_deltas_and_records_history(mock_post, llm_config):
+    """Content deltas are yielded in order and the joined text enters the history."""
+    llm = OllamaLLM(Mock(), config_manager=llm_config)
+    mock_post.return_value = _stream_response(_content_chunks("Hel", "lo ", "there"))
+
+    chunks = list(llm.chat_stream("Hi"))
+
+    assert chunks == ["Hel", "lo ", "there"]
+    assert llm.conversation_history[-1] == {"role": "assistant", "content": "Hello there"}
+    assert mock_post.call_args.kwargs["json"]["stream"] is True
+    assert mock_post.call_args.kwargs["stream"] is True
+    assert llm.last_stream_metrics["time_to_first_token"] >= 0
+
+
+@pytest.mark.unit
+@patch("requests.Session.post")
+def test_tool_calls_in_streamed_chunks_are_executed(mock_post, llm_config):
+    """A tool call arriving in a delta runs before the final answer is streamed."""
+    api = Mock()
+    api.search_contacts.return_value = [{"id": 1, "name": "Ada"}]
+    llm = OllamaLLM(api, config_manager=llm_config)
+    tool_turn = [
+        {
+            "message": {
+                "role": "assistant",
+                "content": "",
+                "tool_calls": [
+                    {"function": {"name": "search_contacts", "arguments": {"query": "Ada"}}}
+                ],
+            },
+            "done": False,
+        },
+        {"message": {"role": "assistant", "content": ""}, "done": True},
+    ]
+    mock_post.side_effect = [
+        _stream_response(tool_turn),
+        _stream_response(_content_chunks("Found ", "Ada")),
+    ]
+
+    chunks = list(llm.chat_stream("find Ada"))
+
+    assert "".join(chunks) == "Found Ada"
+    api.search_contacts.assert_called_once_with(query="Ada")
+    assert [m["role"] for m in llm.conversation_history] == [
+        "user",
+        "assistant",
+        "tool",
+        "assistant",
+    ]
+
+
+@pytest.mark.unit
+@patch("requests.Session.post")
+def test_stream_errors_are_reported_as_text(mock_post, llm_config):
+    """An error chunk ends the stream with the same message ``chat`` would return."""
+    llm = OllamaLLM(Mock(), config_manager=llm_config)
+    mock_post.return_value = _stream_response([{"error": "model not found"}])
+
+    chunks = list(llm.chat_stream("Hi"))
+
+    assert chunks == ["Error: Ollama error: model not found"]
+
+
+@pytest.mark.unit
+@patch("requests.Session.post")
+async def test_stream_chat_async_generator(mock_post, llm_config):
+    """The async generator hands the worker thread's chunks to the event loop."""
+    llm = OllamaLLM(Mock(), config_manager=llm_config)
+    mock_post.return_value = _stream_response(_content_chunks("one ", "two"))
+
+    chunks = [chunk async for chunk in llm.stream_chat("count")]
+
+    assert chunks == ["one ", "two"]
@@ -0,0 +1,101 @@
+"""
+Tests for token-budgeted tool result serialization.
+"""
+
+import json
+
+import pytest
+
+from prt_src.llm_ollama import OllamaLLM
+from prt_src.llm_tool_results import ResultShape
+from prt_src.llm_tool_results import ToolResultSerializer
+from prt_src.llm_tool_results import estimate_tokens
+from prt_src.llm_tools import CONTACT_RESULT_SHAPE
+
+
+def _contact(i, note_chars=40):
+    return {
+        "id": i,
+        "name": f"Contact {i}",
+        "email": f"contact{i}@example.com",
+        "phone": "555-0100",
+        "has_profile_image": False,
+        "profile_image_size": None,
+        "relationship_info": {
+            "tags": ["friend"],
+            "notes": [{"title": f"Note {i}", "content": "x" * note_chars}],
+        },
+    }
+
+
+@pytest.mark.unit
+def test_small_results_are_projected(mock_llm_memory):
+    """Rows keep only the projected fields; list paths map over nested lists."""
+    serializer = ToolResultSerializer({"list_all_contacts": CONTACT_RESULT_SHAPE}, mock_llm_memory)
+
+    shaped = serializer.serialize("list_all_contacts", [_contact(1), _contact(2)])
+
+    rows = json.loads(shaped.content)
+    assert rows[0] == {
+        "id": 1,
+        "name": "Contact 1",
+        "email": "contact1@example.com",
+        "phone": "555-0100",
+        "tags": ["friend"],
+        "notes": ["Note 1"],
+    }
+    assert shaped.memory_id is None
+    assert shaped.saved_tokens > 0
+
+
+@pytest.mark.unit
+def test_overflowing_results_go_to_memory(mock_llm_memory):
+    """Results over the row limit or budget send a summary plus a memory reference."""
+    shape = ResultShape(fields=CONTACT_RESULT_SHAPE.fields, max_rows=100, token_budget=1000)
+    serializer = ToolResultSerializer({"search_contacts": shape}, mock_llm_memory)
+    contacts = [_contact(i, note_chars=2000) for i in range(500)]
+
+    shaped = serializer.serialize("search_contacts", contacts)
+
+    envelope = json.loads(shaped.content)
+    assert envelope["total_rows"] == 500
+    assert 0 < envelope["returned_rows"] == len(envelope["rows"]) < 100
+    assert envelope["memory_id"] == shaped.memory_id
+    assert shaped.memory_id in envelope["summary"]
+    assert shaped.sent_tokens <= 1000
+    assert shaped.raw_tokens > 100 * shaped.sent_tokens
+    assert len(mock_llm_memory.load_result(shaped.memory_id)["data"]) == 500
+
+
+@pytest.mark.unit
+def test_large_non_list_results_get_a_preview(mock_llm_memory):
+    """Oversized results without rows are replaced by a preview and memory reference."""
+    serializer = ToolResultSerializer(memory=mock_llm_memory)
+    schema = {"tables": {f"table_{i}": "column " * 50 for i in range(200)}}
+
+    shaped = serializer.serialize("get_database_schema", schema)
+
+    envelope = json.loads(shaped.content)
+    assert envelope["memory_id"] == shaped.memory_id
+    assert envelope["preview"].startswith('{"tables"')
+    assert estimate_tokens(shaped.content) <= 2000
+
+
+@pytest.mark.unit
+def test_chat_history_records_tokens_saved_per_turn(api, test_db, llm_config, mock_llm_memory):
+    """Tool results enter the history shaped, and each turn's savings are recorded."""
+    _db, fixtures = test_db
+    llm = OllamaLLM(api, config_manager=llm_config)
+    llm.result_serializer._memory = mock_llm_memory
+    result = api.list_all_contacts()
+
+    llm._add_tool_results_to_history(
+        [{"id": "call_1", "name": "list_all_contacts", "arguments": {}}],
+        [{"tool_call_id": "call_1", "name": "list_all_contacts", "result": result}],
+    )
+
+    rows = json.loads(llm.conversation_history[-1]["content"])
+    assert len(rows) == len(fixtures["contacts"])
+    assert "relationship_info" not in rows[0]
+    usage = llm.tool_token_savings[-1]
+    assert usage["saved_tokens"] == usage["raw_tokens"] - usage["sent_tokens"] > 0
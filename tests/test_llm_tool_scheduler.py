@@ -0,0 +1,117 @@
+"""
+Tests for scheduling the tool calls of one LLM turn.
+
+Consecutive read-only calls run concurrently in their own read sessions,
+writes run one at a time and share one auto-backup, and results keep the
+order the model asked for.
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from prt_src.llm_ollama import OllamaLLM
+from prt_src.llm_tool_scheduler import ToolScheduler
+
+READS = {"search_contacts", "list_all_tags", "get_database_stats"}
+
+
+def _calls(*names):
+    return [{"id": str(i), "name": name, "arguments": {}} for i, name in enumerate(names)]
+
+
+@pytest.mark.unit
+def test_writes_split_reads_into_ordered_batches():
+    """Reads batch up until a write; the write runs alone."""
+    scheduler = ToolScheduler(Mock(), READS, read_session=Mock())
+
+    batches = scheduler.plan(
+        _calls("search_contacts", "list_all_tags", "create_tag", "get_database_stats")
+    )
+
+    assert batches == [([0, 1], True), ([2], False), ([3], True)]
+    assert ToolScheduler(Mock(), READS).plan(_calls("search_contacts", "list_all_tags")) == [
+        ([0], False),
+        ([1], False),
+    ]
+
+
+@pytest.mark.unit
+def test_read_batches_run_concurrently_in_call_order():
+    """Slow reads overlap on the pool and results come back in call order."""
+    sessions = []
+
+    def read_session():
+        sessions.append(threading.current_thread().name)
+        return Mock(__enter__=Mock(), __exit__=Mock(return_value=False))
+
+    def slow_tool(name, arguments):
+        time.sleep(0.2)
+        return name
+
+    scheduler = ToolScheduler(slow_tool, READS, read_session=read_session)
+    calls = _calls("search_contacts", "list_all_tags", "get_database_stats")
+
+    started = time.perf_counter()
+    results, timings = scheduler.run(calls)
+    elapsed = time.perf_counter() - started
+    scheduler.shutdown()
+
+    assert results == ["search_contacts", "list_all_tags", "get_database_stats"]
+    assert elapsed < 0.5
+    assert all(timing.parallel and timing.seconds >= 0.2 for timing in timings)
+    assert all(name.startswith("llm-tool") for name in sessions)
+
+
+@pytest.mark.unit
+def test_chat_tools_use_read_sessions_and_see_earlier_writes(api, test_db, llm_config):
+    """Concurrent reads use worker sessions; a read after a write sees the write."""
+    _db, fixtures = test_db
+    llm = OllamaLLM(api, config_manager=llm_config)
+    john_id = fixtures["contacts"]["John Doe"].id
+    calls = [
+        {"name": "search_contacts", "arguments": {"query": "John"}},
+        {"name": "get_database_stats", "arguments": {}},
+        {"name": "create_tag", "arguments": {"name": "scheduler-tag"}},
+        {"name": "get_contacts_by_tag", "arguments": {"tag_name": "friend"}},
+        {"name": "search_tags", "arguments": {"query": "scheduler-tag"}},
+    ]
+
+    results = llm._execute_tool_calls(calls)
+
+    assert [r["name"] for r in results] == [c["name"] for c in calls]
+    assert john_id in [c["id"] for c in results[0]["result"]]
+    assert results[1]["result"]["contacts"] == len(fixtures["contacts"])
+    assert [t["name"] for t in results[4]["result"]] == ["scheduler-tag"]
+    assert [t["parallel"] for t in llm.get_debug_info()["tool_timings"]] == [
+        True,
+        True,
+        False,
+        True,
+        True,
+    ]
+
+
+@pytest.mark.unit
+def test_writes_in_one_turn_share_one_backup(llm_config):
+    """Several writes take a single auto-backup; a lone write keeps its own."""
+    api = Mock()
+    api.auto_backup_before_operation.return_value = {"backup_id": 7}
+    api.create_tag.return_value = {"id": 1}
+    llm = OllamaLLM(api, config_manager=llm_config)
+
+    results = llm._execute_tool_calls(
+        [
+            {"name": "create_tag", "arguments": {"name": "a"}},
+            {"name": "search_contacts", "arguments": {"query": ""}},
+            {"name": "create_tag", "arguments": {"name": "b"}},
+        ]
+    )
+
+    api.auto_backup_before_operation.assert_called_once_with("create_tag, create_tag")
+    assert [r["result"].get("backup_id") for r in results if r["name"] == "create_tag"] == [7, 7]
+
+    llm._execute_tool_calls([{"name": "create_tag", "arguments": {"name": "c"}}])
+    api.auto_backup_before_operation.assert_called_with("create_tag")
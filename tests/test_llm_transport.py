@@ -0,0 +1,87 @@
+"""
+Tests for the pooled LLM HTTP transport.
+
+These run against a local stub of the Ollama API, so connection reuse and
+request latency can be measured without a model.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from prt_src.llm_model_registry import OllamaModelRegistry
+from prt_src.llm_ollama import OllamaLLM
+from prt_src.llm_transport import LLMTransport
+from prt_src.llm_transport import TransportPolicy
+from prt_src.llm_transport import get_transport
+from tests.mocks.stub_ollama_server import measure_requests
+
+
+@pytest.fixture
+def stub_llm(ollama_stub_server, llm_config):
+    llm_config.llm.base_url = ollama_stub_server.url
+    return OllamaLLM(Mock(), config_manager=llm_config)
+
+
+@pytest.mark.unit
+def test_transport_is_shared_per_base_url():
+    """Callers for the same provider share one transport; ``/v1`` is ignored."""
+    transport = get_transport("http://localhost:11434/v1")
+
+    assert get_transport("http://localhost:11434/") is transport
+    assert get_transport("http://localhost:11435") is not transport
+    assert (
+        get_transport("http://localhost:11434", TransportPolicy(pool_size=8)).policy.pool_size == 8
+    )
+
+
+@pytest.mark.unit
+def test_llm_registry_and_health_checks_reuse_one_connection(stub_llm, ollama_stub_server):
+    """Chats, streams, health checks and model listing all ride one keep-alive connection."""
+    registry = OllamaModelRegistry(ollama_stub_server.url)
+
+    assert stub_llm.chat("Hi") == "Hello from the stub"
+    assert "".join(stub_llm.chat_stream("Hi")).strip() == "Hello from the stub"
+    assert registry.is_available()
+    assert [m.name for m in registry.list_models()] == ["stub:latest"]
+
+    assert registry.transport is stub_llm.transport
+    assert len(ollama_stub_server.requests) == 4
+    assert ollama_stub_server.connections == 1
+
+
+@pytest.mark.unit
+async def test_async_health_check_uses_the_pool(stub_llm, ollama_stub_server):
+    """The async client shares the pooled connections with sync callers."""
+    assert await stub_llm.health_check()
+    assert await stub_llm.preload_model()
+    stub_llm.chat("Hi")
+
+    assert ollama_stub_server.connections == 1
+
+
+@pytest.mark.unit
+def test_connection_errors_are_retried_then_raised():
+    """Refused connections are retried per the policy before surfacing."""
+    transport = LLMTransport("http://127.0.0.1:9", TransportPolicy(max_retries=1, backoff_factor=0))
+
+    with pytest.raises(requests.exceptions.ConnectionError) as excinfo:
+        transport.get("/api/tags", timeout=1)
+
+    assert "Max retries exceeded" in str(excinfo.value)
+
+
+@pytest.mark.performance
+def test_pooled_requests_beat_fresh_connections(ollama_stub_server):
+    """Benchmark: keep-alive requests against one new connection per request."""
+    transport = get_transport(ollama_stub_server.url)
+    url = transport.url("/api/tags")
+
+    fresh = measure_requests(lambda: requests.get(url, timeout=5), 200)
+    connections_before = ollama_stub_server.connections
+    pooled = measure_requests(lambda: transport.get("/api/tags", timeout=5), 200)
+
+    print(f"\nfresh: {fresh * 1000:.2f}ms/request, pooled: {pooled * 1000:.2f}ms/request")
+    assert ollama_stub_server.connections - connections_before == 1
+    assert pooled < fresh
@@ -119,7 +119,7 @@ class TestOllamaLLM:
         assert "save_contacts_with_images" in tool_names
         assert "list_memory" in tool_names
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_chat_without_tool_calls(self, mock_post, llm_config):
         """Test chat without tool calls."""
         mock_api = Mock()
@@ -141,7 +141,7 @@ class TestOllamaLLM:
         assert result == "Hello! How can I help you today?"
         assert len(llm.conversation_history) == 2  # user + assistant
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_chat_with_tool_calls(self, mock_post, llm_config):
         """Test chat with tool calls."""
         mock_api = Mock()
@@ -187,7 +187,7 @@ class TestOllamaLLM:
         assert "John Doe" in result or "Error" in result
         assert mock_post.call_count == 2  # Two API calls (tool call + final response)
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_chat_connection_error(self, mock_post, llm_config):
         """Test chat with connection error."""
         import requests
@@ -0,0 +1,79 @@
+"""
+Tests for lazy profile image loading.
+
+Contact dicts returned by the API carry only ``has_profile_image`` and the
+image size; the bytes are fetched on demand by the consumers that render them.
+"""
+
+import pytest
+
+from prt_src.cli_modules.services.export import clean_results_for_json
+from prt_src.cli_modules.services.images import export_profile_images_from_results
+from prt_src.models import Contact
+
+
+@pytest.mark.unit
+def test_contact_dicts_do_not_include_image_bytes(api, test_db):
+    """List results flag images and report their size without the BLOB."""
+    db, fixtures = test_db
+
+    contacts = api.list_all_contacts()
+    john = next(c for c in contacts if c["name"] == "John Doe")
+
+    assert all("profile_image" not in c for c in contacts)
+    assert john["has_profile_image"] is True
+    assert john["profile_image_size"] == len(fixtures["contacts"]["John Doe"].profile_image)
+
+
+@pytest.mark.unit
+def test_profile_image_column_is_deferred(test_db):
+    """Loading a Contact row doesn't select the image column."""
+    db, _fixtures = test_db
+    db.session.expunge_all()
+
+    contact = db.session.query(Contact).filter(Contact.name == "John Doe").one()
+
+    assert "profile_image" not in contact.__dict__
+    assert contact.profile_image_size > 0
+
+
+@pytest.mark.unit
+def test_get_and_iter_profile_image_return_same_bytes(api, test_db):
+    """The accessor and the chunked stream both return the stored image."""
+    db, fixtures = test_db
+    john = fixtures["contacts"]["John Doe"]
+    expected = john.profile_image
+
+    assert api.get_profile_image(john.id) == expected
+    chunks = list(api.iter_profile_image(john.id, chunk_size=100))
+    assert b"".join(chunks) == expected
+    assert all(len(chunk) <= 100 for chunk in chunks)
+
+
+@pytest.mark.unit
+def test_profile_image_accessors_handle_missing_image(api, test_db):
+    """Contacts without images yield nothing from the accessors."""
+    db, _fixtures = test_db
+    contact = api.add_contact("No", "Image")
+
+    assert contact["has_profile_image"] is False
+    assert api.get_profile_image(contact["id"]) is None
+    assert list(api.iter_profile_image(contact["id"])) == []
+    assert api.get_profile_image(999999) is None
+
+
+@pytest.mark.unit
+def test_export_streams_images_through_api(api, test_db, tmp_path):
+    """Image export fetches bytes on demand for API contact dicts."""
+    db, fixtures = test_db
+    results = api.search_contacts("John Doe")
+
+    exported = export_profile_images_from_results(results, tmp_path, "now", api=api)
+    cleaned = clean_results_for_json(results)
+
+    john_id = fixtures["contacts"]["John Doe"].id
+    assert exported == 1
+    assert (tmp_path / "profile_images" / f"{john_id}.jpg").read_bytes() == (
+        fixtures["contacts"]["John Doe"].profile_image
+    )
+    assert cleaned[0]["exported_image_path"] == f"profile_images/{john_id}.jpg"
@@ -0,0 +1,183 @@
+"""
+Tests for relationship analytics and the contact_degree summary table.
+
+Analytics read per-contact relationship counts from the summary table when
+the schema has it and from one aggregate query otherwise; triggers keep the
+table in step with every insert, update and delete.
+"""
+
+import time
+from collections import Counter
+
+import pytest
+from sqlalchemy import text
+
+from prt_src.db import CONTACT_DEGREE_SQL
+from prt_src.db import Database
+from prt_src.models import Contact
+from prt_src.models import ContactRelationship
+from prt_src.schema_manager import SchemaManager
+
+
+def _apply_degree_migration(db):
+    manager = SchemaManager(db)
+    manager.create_schema_version_table()
+    manager.apply_migration_v7_to_v8()
+
+
+def _expected_degrees(db):
+    """Count relationships per existing contact the slow, obvious way."""
+    contact_ids = {c.id for c in db.session.query(Contact)}
+    degrees = Counter()
+    for rel in db.session.query(ContactRelationship):
+        ends = {rel.from_contact_id, rel.to_contact_id}
+        degrees.update(end for end in ends if end in contact_ids)
+    return dict(degrees)
+
+
+def _stored_degrees(db):
+    return dict(db.session.execute(text("SELECT contact_id, degree FROM contact_degree")).all())
+
+
+@pytest.fixture
+def degree_db(test_db):
+    """Sample database with the contact_degree migration applied."""
+    db, fixtures = test_db
+    _apply_degree_migration(db)
+    return db, fixtures
+
+
+@pytest.mark.unit
+def test_summary_table_and_aggregate_agree(test_db):
+    """Analytics are identical with and without the summary table."""
+    db, fixtures = test_db
+    without_table = db.get_relationship_analytics()
+
+    _apply_degree_migration(db)
+    with_table = db.get_relationship_analytics()
+
+    assert with_table == without_table
+    assert with_table["total_contacts"] == len(fixtures["contacts"])
+    assert with_table["total_relationships"] == len(fixtures["contact_relationships"])
+    degrees = _expected_degrees(db)
+    assert with_table["isolated_contacts"] == len(fixtures["contacts"]) - len(degrees)
+    top = with_table["most_connected"][0]
+    assert top["relationship_count"] == max(degrees.values())
+    assert [c["relationship_count"] for c in with_table["most_connected"]] == sorted(
+        (c["relationship_count"] for c in with_table["most_connected"]), reverse=True
+    )
+
+
+@pytest.mark.unit
+def test_triggers_keep_degrees_current(degree_db):
+    """Inserts, updates, self-relationships and contact deletes all update the table."""
+    db, fixtures = degree_db
+    contacts = fixtures["contacts"]
+    friend = fixtures["relationship_types"]["friend"]
+    assert _stored_degrees(db) == _expected_degrees(db)
+
+    a, b, c = (contacts[name] for name in ("John Doe", "Jane Smith", "Bob Wilson"))
+    rel = ContactRelationship(from_contact_id=a.id, to_contact_id=c.id, type_id=friend.id)
+    db.session.add(rel)
+    db.session.add(ContactRelationship(from_contact_id=b.id, to_contact_id=b.id, type_id=friend.id))
+    db.session.commit()
+    assert _stored_degrees(db) == _expected_degrees(db)
+
+    rel.to_contact_id = b.id
+    db.session.commit()
+    assert _stored_degrees(db) == _expected_degrees(db)
+
+    db.session.delete(rel)
+    db.session.delete(c)
+    db.session.commit()
+    assert _stored_degrees(db) == _expected_degrees(db)
+    assert c.id not in _stored_degrees(db)
+
+
+@pytest.mark.unit
+def test_raw_sql_writes_update_degrees(degree_db):
+    """Writes that bypass the ORM go through the triggers too."""
+    db, fixtures = degree_db
+    john = fixtures["contacts"]["John Doe"]
+
+    db.session.execute(
+        text("DELETE FROM contact_relationships WHERE :id IN (from_contact_id, to_contact_id)"),
+        {"id": john.id},
+    )
+    db.session.commit()
+
+    assert john.id not in _stored_degrees(db)
+    assert _stored_degrees(db) == _expected_degrees(db)
+
+
+@pytest.mark.unit
+def test_isolated_contacts_fill_short_rankings(degree_db):
+    """With fewer connected contacts than requested, isolated ones follow with zero."""
+    db, fixtures = degree_db
+
+    ranking = db.get_relationship_analytics(top_n=len(fixtures["contacts"]))["most_connected"]
+
+    assert len(ranking) == len(fixtures["contacts"])
+    assert ranking[-1]["relationship_count"] == 0
+    assert len({c["id"] for c in ranking}) == len(ranking)
+
+
+def _build_network(db_path, contacts, relationships):
+    db = Database(db_path)
+    db.connect()
+    db.initialize()
+    _apply_degree_migration(db)
+    db.session.execute(
+        text(
+            "INSERT INTO relationship_types (id, type_key, is_symmetrical) VALUES (1, 'friend', 1)"
+        )
+    )
+    db.session.execute(
+        text("INSERT INTO contacts (id, name) VALUES (:id, :name)"),
+        [{"id": i, "name": f"Contact {i}"} for i in range(1, contacts + 1)],
+    )
+    db.session.execute(
+        text(
+            "INSERT INTO contact_relationships (from_contact_id, to_contact_id, type_id)"
+            " VALUES (:a, :b, 1)"
+        ),
+        [
+            {"a": i % contacts + 1, "b": (i * 7 + i // contacts) % contacts + 1}
+            for i in range(relationships)
+        ],
+    )
+    db.session.commit()
+    db.invalidate_caches()
+    return db
+
+
+@pytest.mark.performance
+def test_analytics_benchmark(tmp_path):
+    """Benchmark: OR-join analytics vs the summary table vs the UNION ALL aggregate."""
+    db = _build_network(tmp_path / "network.db", contacts=2000, relationships=8000)
+    or_join = """
+        SELECT c.id, COUNT(r.id) AS n FROM contacts c
+        LEFT JOIN contact_relationships r
+          ON c.id = r.from_contact_id OR c.id = r.to_contact_id
+        GROUP BY c.id ORDER BY n DESC LIMIT 10
+    """
+
+    def timed(func):
+        started = time.perf_counter()
+        result = func()
+        return result, time.perf_counter() - started
+
+    _, or_seconds = timed(lambda: db.session.execute(text(or_join)).all())
+    table, table_seconds = timed(db.get_relationship_analytics)
+    db.session.execute(text("DROP TABLE contact_degree"))
+    db.invalidate_caches()
+    aggregate, aggregate_seconds = timed(db.get_relationship_analytics)
+    db.session.rollback()
+
+    print(
+        f"\nOR join: {or_seconds * 1000:.1f}ms, summary table: {table_seconds * 1000:.1f}ms,"
+        f" UNION ALL aggregate: {aggregate_seconds * 1000:.1f}ms"
+    )
+    assert table == aggregate
+    assert table_seconds < or_seconds
+    assert db.session.execute(text(f"SELECT COUNT(*) FROM ({CONTACT_DEGREE_SQL})")).scalar() > 0
@@ -0,0 +1,181 @@
+"""
+Tests for the in-memory relationship graph.
+
+The graph answers path, degree, mutual-connection and component queries from
+CSR arrays loaded once from ``contact_relationships``; the Database methods
+must return the same answers as their SQL fallbacks.
+"""
+
+import pytest
+
+from prt_src.models import ContactRelationship
+from prt_src.relationship_graph import RelationshipGraph
+
+
+@pytest.fixture
+def chain_db(test_db_empty):
+    """Database with a friend chain A-B-C-D-E, a triangle B-F-C and a separate pair G-H."""
+    db = test_db_empty
+    names = ["A", "B", "C", "D", "E", "F", "G", "H"]
+    db.insert_contacts([{"first": name, "last": "Graph"} for name in names])
+    ids = {name.split()[0]: contact_id for contact_id, name, _email in db.list_contacts()}
+
+    db.create_relationship_type("friend", "Friend of", "friend", is_symmetrical=True)
+    db.create_relationship_type("mentor", "Mentor of", "mentee")
+    db.create_relationship_type("mentee", "Mentee of", "mentor")
+    db.session.commit()
+
+    for left, right in [("A", "B"), ("B", "C"), ("C", "D"), ("D", "E"), ("G", "H")]:
+        db.create_contact_relationship(ids[left], ids[right], "friend")
+    db.create_contact_relationship(ids["B"], ids["F"], "mentor")
+    db.create_contact_relationship(ids["F"], ids["C"], "friend")
+    return db, ids
+
+
+def _graph_and_sql(db, method, *args):
+    db.invalidate_relationship_graph()
+    sql = getattr(db, f"_{method}_sql")(*args)
+    graph = getattr(db, method)(*args)
+    assert db.relationship_graph.loaded
+    return graph, sql
+
+
+@pytest.mark.unit
+def test_graph_matches_sql_for_paths_degrees_and_mutuals(chain_db):
+    """Graph-backed queries return the same results as the SQL fallback."""
+    db, ids = chain_db
+
+    path, sql_path = _graph_and_sql(db, "find_relationship_path", ids["A"], ids["E"], 6)
+    assert path == sql_path == [ids["A"], ids["B"], ids["C"], ids["D"], ids["E"]]
+
+    degrees, sql_degrees = _graph_and_sql(db, "get_network_degrees", ids["A"], 3)
+    assert degrees == sql_degrees
+    assert [c["id"] for c in degrees["degree_2"]] == sorted([ids["C"], ids["F"]])
+    assert [c["id"] for c in degrees["degree_3"]] == [ids["D"]]
+
+    mutual, sql_mutual = _graph_and_sql(db, "find_mutual_connections", ids["B"], ids["C"])
+    assert mutual == sql_mutual
+    assert [c["id"] for c in mutual] == [ids["F"]]
+
+
+@pytest.mark.unit
+def test_path_respects_max_depth_and_disconnected_contacts(chain_db):
+    """Paths longer than max_depth and paths across components are not found."""
+    db, ids = chain_db
+
+    assert db.find_relationship_path(ids["A"], ids["E"], max_depth=3) == []
+    assert len(db.find_relationship_path(ids["A"], ids["E"], max_depth=4)) == 5
+    assert db.find_relationship_path(ids["A"], ids["G"]) == []
+    assert db.find_relationship_path(ids["A"], ids["A"]) == [ids["A"]]
+
+
+@pytest.mark.unit
+def test_path_queries_do_not_scale_with_visited_nodes(chain_db):
+    """Once loaded, path and mutual lookups run without SQL statements."""
+    db, ids = chain_db
+    db.find_relationship_path(ids["A"], ids["B"])
+
+    db.reset_query_count()
+    db.find_relationship_path(ids["A"], ids["E"])
+    db.find_mutual_connections(ids["A"], ids["C"])
+    assert db.reset_query_count() == 1  # only the contact lookup for the (empty) mutual list
+
+
+@pytest.mark.unit
+def test_connected_components(chain_db):
+    """Components group contacts reachable from each other, largest first."""
+    db, ids = chain_db
+
+    components = db.get_connected_components()
+
+    assert components == [
+        sorted(ids[n] for n in "ABCDEF"),
+        sorted([ids["G"], ids["H"]]),
+    ]
+
+
+@pytest.mark.unit
+def test_graph_tracks_committed_inserts_and_deletes(chain_db):
+    """Relationship writes update the loaded graph without a reload."""
+    db, ids = chain_db
+    assert db.find_relationship_path(ids["E"], ids["G"]) == []
+
+    db.create_contact_relationship(ids["E"], ids["G"], "friend")
+    assert db.relationship_graph.loaded
+    assert db.find_relationship_path(ids["E"], ids["H"]) == [ids["E"], ids["G"], ids["H"]]
+
+    db.delete_contact_relationship(ids["E"], ids["G"], "friend")
+    assert db.find_relationship_path(ids["E"], ids["H"]) == []
+
+    # Removing one of two parallel edges keeps B and F connected
+    db.delete_contact_relationship(ids["B"], ids["F"], "mentor")
+    assert db.relationship_graph.neighbors(ids["B"]) == sorted([ids["A"], ids["C"]])
+    db.create_contact_relationship(ids["B"], ids["F"], "friend")
+    db.create_contact_relationship(ids["B"], ids["F"], "mentor")
+    db.delete_contact_relationship(ids["B"], ids["F"], "friend")
+    assert ids["F"] in db.relationship_graph.neighbors(ids["B"])
+
+
+@pytest.mark.unit
+def test_graph_ignores_rolled_back_changes(chain_db):
+    """Flushed but rolled-back relationships never reach the graph."""
+    db, ids = chain_db
+    db.find_relationship_path(ids["A"], ids["B"])
+    friend_id = db.session.query(ContactRelationship).first().type_id
+
+    db.session.add(
+        ContactRelationship(from_contact_id=ids["E"], to_contact_id=ids["G"], type_id=friend_id)
+    )
+    db.session.flush()
+    db.session.rollback()
+
+    assert db.find_relationship_path(ids["E"], ids["G"]) == []
+
+
+@pytest.mark.unit
+def test_graph_reloads_after_contact_delete_and_raw_sql(chain_db):
+    """Cascaded contact deletes are tracked; raw SQL writes force a reload."""
+    db, ids = chain_db
+    db.find_relationship_path(ids["A"], ids["B"])
+
+    from prt_src.models import Contact
+
+    db.session.delete(db.session.get(Contact, ids["C"]))
+    db.session.commit()
+    assert db.find_relationship_path(ids["A"], ids["E"]) == []
+
+    db.session.execute(
+        ContactRelationship.__table__.insert().values(
+            from_contact_id=ids["B"], to_contact_id=ids["D"], type_id=1
+        )
+    )
+    db.session.commit()
+    db.invalidate_relationship_graph()
+    assert db.find_relationship_path(ids["A"], ids["E"]) == [
+        ids["A"],
+        ids["B"],
+        ids["D"],
+        ids["E"],
+    ]
+
+
+@pytest.mark.unit
+def test_graph_compaction_preserves_edges():
+    """Folding the delta overlay into the CSR arrays keeps multiplicities."""
+    graph = RelationshipGraph()
+    graph._build([(1, 2), (1, 2), (2, 3), (4, 4)])
+    graph._loaded = True
+
+    graph.remove_edge(1, 2)
+    graph.add_edge(3, 5)
+    graph._compact()
+
+    assert graph._delta == {}
+    assert graph.neighbors(1) == [2]
+    assert graph.neighbors(3) == [2, 5]
+    assert graph.neighbors(4) == [4]
+
+    graph.remove_edge(1, 2)
+    assert graph.neighbors(1) == []
+    assert graph.shortest_path(1, 5) == []
+    assert graph.shortest_path(2, 5) == [2, 3, 5]
@@ -0,0 +1,107 @@
+"""
+Tests for the long-lived unified search engine owned by PRTAPI.
+"""
+
+import pytest
+
+from prt_src.models import Contact
+
+
+def _cached_contact_names(api):
+    return {c.name for c in api.search_engine.contact_cache._all_contacts.values()}
+
+
+@pytest.fixture
+def warm_api(api, test_db):
+    _db, fixtures = test_db
+    api.start_search_warmup().join(timeout=10)
+    return api, fixtures
+
+
+@pytest.mark.unit
+def test_search_engine_is_reused_across_searches(warm_api):
+    """Every unified search goes through the same engine instance."""
+    api, _fixtures = warm_api
+    engine = api.search_engine
+
+    api.unified_search("John")
+    api.unified_search("Jane")
+
+    assert api.search_engine is engine
+    assert api.get_search_stats()["metrics"]["total_searches"] == 2
+
+
+@pytest.mark.unit
+def test_warmup_loads_all_contacts_with_tags(warm_api):
+    """The background warm-up fills the cache from one bulk query."""
+    api, fixtures = warm_api
+
+    cache_stats = api.get_search_stats()["cache"]
+    john = api.search_engine.contact_cache.get_contact(fixtures["contacts"]["John Doe"].id)
+
+    assert cache_stats["total_contacts"] == len(fixtures["contacts"])
+    assert cache_stats["last_warm"] is not None
+    assert "friend" in john.tags
+
+
+@pytest.mark.unit
+def test_warm_cache_serves_contact_searches(warm_api):
+    """Searches hit the warm cache and the hit shows up in the metrics."""
+    api, _fixtures = warm_api
+
+    result = api.unified_search("John Doe", entity_types=["contacts"])
+    stats = api.get_search_stats()
+
+    assert result["stats"]["cache_used"] is True
+    assert "cache" in result["stats"]["sources"]
+    assert stats["metrics"]["cache_hits"] == 1
+    assert stats["metrics"]["avg_search_time"] > 0
+
+
+@pytest.mark.unit
+def test_contact_writes_refresh_the_cache(warm_api):
+    """Inserts, updates, tag changes and deletes are reflected in the next search."""
+    api, fixtures = warm_api
+
+    created = api.add_contact("Zelda", "Cachetest")
+    api.unified_search("Zelda")
+    assert "Zelda Cachetest" in _cached_contact_names(api)
+
+    john_id = fixtures["contacts"]["John Doe"].id
+    api.update_contact(john_id, name="Johnny Renamed")
+    api.tag_contact(john_id, "cachetag")
+    api.unified_search("Johnny")
+    cached_john = api.search_engine.contact_cache.get_contact(john_id)
+    assert cached_john.name == "Johnny Renamed"
+    assert "cachetag" in cached_john.tags
+
+    api.delete_contact(created["id"])
+    api.unified_search("Zelda")
+    assert "Zelda Cachetest" not in _cached_contact_names(api)
+
+
+@pytest.mark.unit
+def test_raw_sql_write_reloads_the_cache(warm_api):
+    """Writes that bypass the ORM trigger a full cache reload."""
+    api, _fixtures = warm_api
+
+    api.execute_sql(
+        "INSERT INTO contacts (name, first_name, last_name) VALUES ('Raw Insert', 'Raw', 'Insert')",
+        confirm=True,
+    )
+    api.unified_search("Raw")
+
+    assert "Raw Insert" in _cached_contact_names(api)
+
+
+@pytest.mark.unit
+def test_rolled_back_writes_do_not_touch_the_cache(warm_api):
+    """Only committed writes mark contacts stale."""
+    api, fixtures = warm_api
+    john = api.db.session.get(Contact, fixtures["contacts"]["John Doe"].id)
+
+    john.name = "Never Committed"
+    api.db.session.flush()
+    api.db.session.rollback()
+
+    assert api.search_engine._stale_contact_ids == set()
@@ -70,42 +70,59 @@ class TestSearchIndexer:
         assert "(" not in query
         assert ")" not in query
 
+    def _mock_queries(self, mock_db, ranked_rows, *hydration_rows):
+        """Serve the ranking query, then one hydration query per entity type."""
+        responses = [ranked_rows, *hydration_rows]
+        calls = []
+
+        def mock_execute(sql, params=None):
+            calls.append(params)
+            mock_result = MagicMock()
+            mock_result.fetchall.return_value = responses[len(calls) - 1]
+            return mock_result
+
+        mock_db.session.execute = mock_execute
+        return calls
+
     def test_search_contacts(self, indexer, mock_db):
         """Test searching contacts with FTS."""
         # Mock FTS available
         indexer._fts_available = True
 
-        # Mock search results
-        mock_results = [
-            (1, "Alice Smith", "alice@example.com", "555-0001", -0.5, "<b>Alice</b> Smith", None),
-            (
-                2,
-                "Alice Johnson",
-                "alicej@example.com",
-                "555-0002",
-                -0.3,
-                "<b>Alice</b> Johnson",
-                None,
-            ),
-        ]
-        mock_db.session.execute.return_value.fetchall.return_value = mock_results
+        # Mock ranked matches, then the hydrated contact rows
+        self._mock_queries(
+            mock_db,
+            [(0, 1, 1.0), (0, 2, 0.6)],
+            [
+                (
+                    2,
+                    "Alice Johnson",
+                    "alicej@example.com",
+                    "555-0002",
+                    "<b>Alice</b> Johnson",
+                    None,
+                ),
+                (1, "Alice Smith", "alice@example.com", "555-0001", "<b>Alice</b> Smith", None),
+            ],
+        )
 
         results = indexer.search("alice", [EntityType.CONTACT])
 
         assert len(results) == 2
         assert results[0].entity_type == EntityType.CONTACT
         assert results[0].title == "Alice Smith"
-        assert results[0].relevance_score == 0.5
+        assert results[0].relevance_score == 1.0
         assert "name" in results[0].matched_fields
 
     def test_search_notes(self, indexer, mock_db):
         """Test searching notes with FTS."""
         indexer._fts_available = True
 
-        mock_results = [
-            (1, "Meeting Notes", "Discussed project", -0.7, "<b>Meeting</b> Notes", None),
-        ]
-        mock_db.session.execute.return_value.fetchall.return_value = mock_results
+        self._mock_queries(
+            mock_db,
+            [(1, 1, 1.0)],
+            [(1, "Meeting Notes", "Discussed project", "<b>Meeting</b> Notes", None)],
+        )
 
         results = indexer.search("meeting", [EntityType.NOTE])
 
@@ -118,10 +135,7 @@ class TestSearchIndexer:
         """Test searching tags with FTS."""
         indexer._fts_available = True
 
-        mock_results = [
-            (1, "family", "Family members", -0.4, "<b>family</b>", 5),
-        ]
-        mock_db.session.execute.return_value.fetchall.return_value = mock_results
+        self._mock_queries(mock_db, [(2, 1, 1.0)], [(1, "family", "<b>family</b>", 5)])
 
         results = indexer.search("family", [EntityType.TAG])
 
@@ -134,30 +148,14 @@ class TestSearchIndexer:
         """Test searching across all entity types."""
         indexer._fts_available = True
 
-        # Mock different results for each entity type
-        call_count = 0
-
-        def mock_execute(sql, params=None):
-            nonlocal call_count
-            mock_result = MagicMock()
-
-            if call_count == 0:  # Contacts search
-                mock_result.fetchall.return_value = [
-                    (1, "Test Contact", "test@example.com", "555-0001", -0.5, "<b>Test</b>", None)
-                ]
-            elif call_count == 1:  # Notes search
-                mock_result.fetchall.return_value = [
-                    (1, "Test Note", "Content", -0.3, "<b>Test</b>", None)
-                ]
-            else:  # Tags search
-                mock_result.fetchall.return_value = [
-                    (1, "test_tag", "Description", -0.2, "<b>test</b>", 3)
-                ]
-
-            call_count += 1
-            return mock_result
-
-        mock_db.session.execute = mock_execute
+        # One ranked list across all types, then one hydration query per type
+        self._mock_queries(
+            mock_db,
+            [(0, 1, 1.0), (1, 1, 1.0), (2, 1, 1.0)],
+            [(1, "Test Contact", "test@example.com", "555-0001", "<b>Test</b>", None)],
+            [(1, "Test Note", "Content", "<b>Test</b>", None)],
+            [(1, "test_tag", "<b>test</b>", 3)],
+        )
 
         results = indexer.search("test")
 
@@ -168,41 +166,41 @@ class TestSearchIndexer:
         assert EntityType.TAG in entity_types
 
     def test_search_with_ranking(self, indexer, mock_db):
-        """Test search results are ranked by relevance."""
+        """Test search results keep the order ranked in SQL."""
         indexer._fts_available = True
 
-        # Create results with different relevance scores
-        mock_results = [
-            (1, "Result 1", None, None, -0.2, None, None),
-            (2, "Result 2", None, None, -0.8, None, None),
-            (3, "Result 3", None, None, -0.5, None, None),
-        ]
-        mock_db.session.execute.return_value.fetchall.return_value = mock_results
+        # Hydration rows come back unordered
+        self._mock_queries(
+            mock_db,
+            [(0, 2, 1.0), (0, 3, 0.625), (0, 1, 0.25)],
+            [(i, f"Result {i}", None, None, None, None) for i in (1, 2, 3)],
+        )
 
         results = indexer.search("test", [EntityType.CONTACT], rank_by_relevance=True)
 
         # Results should be sorted by relevance (highest first)
-        assert results[0].relevance_score == 0.8
-        assert results[1].relevance_score == 0.5
-        assert results[2].relevance_score == 0.2
+        assert [r.entity_id for r in results] == [2, 3, 1]
+        assert results[0].relevance_score == 1.0
+        assert results[1].relevance_score == 0.625
+        assert results[2].relevance_score == 0.25
 
     def test_search_with_pagination(self, indexer, mock_db):
-        """Test search pagination."""
+        """Test search pagination is pushed into SQL."""
         indexer._fts_available = True
 
-        # Create 5 results
-        mock_results = [(i, f"Result {i}", None, None, -0.5, None, None) for i in range(1, 6)]
-        mock_db.session.execute.return_value.fetchall.return_value = mock_results
+        # The ranking query returns one extra row to signal a next page
+        calls = self._mock_queries(
+            mock_db,
+            [(0, 3, 0.5), (0, 4, 0.5), (0, 5, 0.5)],
+            [(i, f"Result {i}", None, None, None, None) for i in (3, 4)],
+        )
 
-        # Get first page
-        results = indexer.search("test", [EntityType.CONTACT], limit=2, offset=0)
-        assert len(results) == 2
-        assert results[0].entity_id == 1
+        page = indexer.search_page("test", [EntityType.CONTACT], limit=2, offset=2)
 
-        # Get second page
-        results = indexer.search("test", [EntityType.CONTACT], limit=2, offset=2)
-        assert len(results) == 2
-        assert results[0].entity_id == 3
+        assert calls[0]["limit"] == 3
+        assert calls[0]["offset"] == 2
+        assert [r.entity_id for r in page["results"]] == [3, 4]
+        assert page["next_cursor"] is not None
 
     def test_fallback_search(self, indexer, mock_db):
         """Test fallback search when FTS is not available."""
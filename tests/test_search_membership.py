@@ -0,0 +1,86 @@
+"""
+Tests for set-based tag and note membership queries in SearchOperations.
+"""
+
+import pytest
+
+from prt_src.core.search import SearchOperations
+from prt_src.core.search_cache import ContactSearchCache
+
+
+@pytest.fixture
+def tagged_api(empty_api):
+    """API over 20 contacts: even ones tagged 'even', every contact sharing one note."""
+    api = empty_api
+    api.db.insert_contacts([{"first": f"Member{i:02d}", "last": "Set"} for i in range(20)])
+    for contact_id, _name, _email in api.db.list_contacts():
+        if contact_id % 2 == 0:
+            api.db.add_relationship_tag(contact_id, "even")
+        api.db.add_relationship_tag(contact_id, "all")
+        api.db.add_relationship_note(contact_id, "Shared", "Everyone has this note")
+    return api
+
+
+@pytest.mark.unit
+def test_grouped_queries_return_members_by_key(tagged_api):
+    """Tag and note grouping returns every requested key, ordered by name."""
+    tags = {t["name"]: t["id"] for t in tagged_api.list_all_tags()}
+
+    grouped = tagged_api.get_contacts_grouped_by_tag([tags["even"], tags["all"], 999999])
+
+    assert len(grouped[tags["all"]]) == 20
+    assert all(c["id"] % 2 == 0 for c in grouped[tags["even"]])
+    assert grouped[999999] == []
+    names = [c["name"] for c in grouped[tags["all"]]]
+    assert names == sorted(names)
+
+
+@pytest.mark.unit
+def test_search_by_tag_uses_constant_queries(tagged_api):
+    """Tag search runs a fixed number of statements regardless of contact count."""
+    ops = SearchOperations(tagged_api)
+
+    tagged_api.db.reset_query_count()
+    results = ops.search_by_tag("even")
+    queries = tagged_api.db.reset_query_count()
+
+    assert len(results) == 10
+    assert all(r["tag"] == "even" for r in results)
+    assert queries <= 4
+
+
+@pytest.mark.unit
+def test_search_by_note_groups_contacts_in_one_pass(tagged_api):
+    """Note search attaches contacts without per-note contact scans."""
+    tagged_api.db.add_note("Other", "Shared words but no contacts")
+    ops = SearchOperations(tagged_api)
+
+    tagged_api.db.reset_query_count()
+    results = ops.search_by_note("Shared")
+    queries = tagged_api.db.reset_query_count()
+
+    by_title = {r["note"]["title"]: r for r in results}
+    assert by_title["Shared"]["contact_count"] == 20
+    assert by_title["Other"]["associated_contacts"] == []
+    assert queries <= 4
+
+
+@pytest.mark.unit
+def test_repeated_tag_filter_is_served_from_reverse_index(tagged_api):
+    """A repeated tag filter runs no SQL until tags change."""
+    cache = ContactSearchCache()
+    ops = SearchOperations(tagged_api, cache=cache)
+    first = ops.search_by_tag("even")
+
+    tagged_api.db.reset_query_count()
+    second = ops.search_by_tag("EVEN")
+    assert tagged_api.db.reset_query_count() == 0
+    assert second == first
+    assert cache.get_stats()["tag_index_hits"] == 1
+
+    # Tagging another contact invalidates the index
+    odd_id = next(c["id"] for c in tagged_api.list_all_contacts() if c["id"] % 2)
+    tagged_api.db.add_relationship_tag(odd_id, "even")
+    third = ops.search_by_tag("even")
+    assert len(third) == 11
+    assert odd_id in {c["id"] for c in third}
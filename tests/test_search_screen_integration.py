@@ -10,12 +10,16 @@ Tests the Search screen with real database operations for all 5 search types:
 Uses Textual Pilot for headless testing.
 """
 
+from unittest.mock import patch
+
 import pytest
 
 from prt_src.api import PRTAPI
 from prt_src.tui.screens.search import SearchScreen
 from prt_src.tui.services.data import DataService
 from prt_src.tui.services.navigation import NavigationService
+from prt_src.tui.types import AppMode
+from prt_src.tui.widgets.contact_detail import PHOTO_COLUMNS
 
 
 def create_test_services(db):
@@ -208,6 +212,63 @@ async def test_search_empty_returns_all_contacts(test_db, pilot_screen):
         assert f"({contact_count}" in results_text or f"{contact_count} total" in results_text
 
 
+@pytest.mark.integration
+async def test_all_contacts_listing_is_paged(test_db, pilot_screen):
+    """Listing all contacts loads one page at a time; [ and ] change page in NAV mode."""
+    db, fixtures = test_db
+    services = create_test_services(db)
+    total = len(fixtures["contacts"])
+
+    with patch("prt_src.tui.screens.search.CONTACT_PAGE_SIZE", 2):
+        async with pilot_screen(SearchScreen, **services) as pilot:
+            await pilot.click("#btn-contacts")
+            await pilot.pause(1.0)
+
+            results_content = pilot.app.screen.query_one("#search-results-content")
+            first_page = str(results_content.content)
+            assert f"({total} total, page 1 of {(total + 1) // 2})" in first_page
+            assert first_page.count("• ") == 2
+
+            pilot.app.current_mode = AppMode.NAVIGATION
+            pilot.app.screen.results_display.focus()
+            await pilot.press("right_square_bracket")
+            await pilot.pause(0.5)
+
+            second_page = str(results_content.content)
+            assert "page 2 of" in second_page
+            assert set(second_page.splitlines()[2:]).isdisjoint(first_page.splitlines()[2:])
+
+
+@pytest.mark.integration
+async def test_single_contact_result_shows_photo_thumbnail(test_db, pilot_screen):
+    """A contact search with one match shows its photo, fetched at PHOTO_COLUMNS pixels."""
+    db, fixtures = test_db
+    services = create_test_services(db)
+    data_service = services["data_service"]
+    john_id = fixtures["contacts"]["John Doe"].id
+
+    with patch.object(
+        data_service, "get_contact_photo", wraps=data_service.get_contact_photo
+    ) as get_photo:
+        async with pilot_screen(SearchScreen, **services) as pilot:
+            photo = pilot.app.screen.query_one("#search-contact-photo")
+            search_input = pilot.app.screen.query_one("#search-input")
+            search_input.focus()
+            await pilot.press(*"John Doe")
+            await pilot.click("#btn-contacts")
+            await pilot.pause(1.0)
+
+            get_photo.assert_called_once_with(john_id, PHOTO_COLUMNS)
+            assert photo.display
+            assert "▀" in str(photo.content)
+
+            search_input.clear()
+            await pilot.click("#btn-contacts")
+            await pilot.pause(1.0)
+
+            assert not photo.display
+
+
 @pytest.mark.integration
 async def test_search_empty_returns_all_tags(test_db, pilot_screen):
     """Test that empty query returns all tags."""
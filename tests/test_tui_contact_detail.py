@@ -3,9 +3,16 @@
 Lightweight TDD approach for contact detail display and editing.
 """
 
+import io
+
+from PIL import Image
+from rich.console import Console
+
 from prt_src.tui.app import AppMode
+from prt_src.tui.widgets.contact_detail import PHOTO_COLUMNS
 from prt_src.tui.widgets.contact_detail import ContactDetailView
 from prt_src.tui.widgets.contact_detail import FieldEditor
+from prt_src.tui.widgets.contact_detail import render_photo
 
 
 class TestContactDetailView:
@@ -127,3 +134,32 @@ class TestFieldEditor:
         # Valid value
         editor.set_value("valid@example.com")
         assert editor.is_valid()
+
+
+class TestRenderPhoto:
+    """Test the half-block photo rendering."""
+
+    @staticmethod
+    def _image(width, height, mode="RGB", color=(255, 0, 0)):
+        buffer = io.BytesIO()
+        Image.new(mode, (width, height), color).save(buffer, "PNG")
+        return buffer.getvalue()
+
+    def test_render_photo_two_pixel_rows_per_line(self):
+        """A square photo fills PHOTO_COLUMNS cells across and half as many lines."""
+        rendered = render_photo(self._image(64, 64))
+
+        assert rendered.plain.splitlines() == ["▀" * PHOTO_COLUMNS] * (PHOTO_COLUMNS // 2)
+        style = rendered.get_style_at_offset(Console(), 0)
+        assert style.color.triplet == (255, 0, 0)
+        assert style.bgcolor.triplet == (255, 0, 0)
+
+    def test_render_photo_keeps_aspect_ratio(self):
+        """A wide photo is scaled to fit the columns without being stretched."""
+        rendered = render_photo(self._image(64, 32, "RGBA", (0, 0, 255, 255)), columns=8)
+
+        assert rendered.plain.splitlines() == ["▀" * 8] * 2
+
+    def test_render_photo_undecodable(self):
+        """Data Pillow can't decode renders nothing."""
+        assert render_photo(b"not an image") is None
@@ -6,6 +6,8 @@ from unittest.mock import patch
 
 import pytest
 
+from prt_src.import_sync import SOURCE_GOOGLE_TAKEOUT
+from prt_src.import_sync import SyncSummary
 from prt_src.tui.services.google_takeout import GoogleTakeoutService
 
 
@@ -160,14 +162,22 @@ class TestGoogleTakeoutService:
 
         with patch("prt_src.tui.services.google_takeout.parse_takeout_contacts") as mock_parse:
             mock_parse.return_value = (mock_contacts, mock_info)
-            mock_api.insert_contacts.return_value = True
+            mock_api.sync_contacts.return_value = SyncSummary(
+                source=SOURCE_GOOGLE_TAKEOUT, added=1, unchanged=1
+            )
 
             success, message, info = await service.import_contacts(zip_file)
 
             assert success is True
             assert "imported 2 contacts" in message.lower()
+            assert "1 added, 0 updated, 1 unchanged" in message
             assert info == mock_info
-            mock_api.insert_contacts.assert_called_once_with(mock_contacts)
+            assert info["added"] == 1
+            mock_api.sync_contacts.assert_called_once()
+            assert mock_api.sync_contacts.call_args.args[:2] == (
+                SOURCE_GOOGLE_TAKEOUT,
+                mock_contacts,
+            )
 
     async def test_import_contacts_fails_on_parse_error(self, service, mock_api, tmp_path):
         """Test import fails when parsing returns error."""
@@ -181,7 +191,7 @@ class TestGoogleTakeoutService:
 
             assert success is False
             assert "error" in message.lower()
-            mock_api.insert_contacts.assert_not_called()
+            mock_api.sync_contacts.assert_not_called()
 
     async def test_import_contacts_fails_when_no_contacts_found(self, service, mock_api, tmp_path):
         """Test import fails when no contacts in file."""
@@ -195,10 +205,10 @@ class TestGoogleTakeoutService:
 
             assert success is False
             assert "no contacts" in message.lower()
-            mock_api.insert_contacts.assert_not_called()
+            mock_api.sync_contacts.assert_not_called()
 
     async def test_import_contacts_fails_on_database_error(self, service, mock_api, tmp_path):
-        """Test import fails when database insert fails."""
+        """Test import fails when the database sync fails."""
         zip_file = tmp_path / "takeout.zip"
         zip_file.touch()
 
@@ -207,7 +217,7 @@ class TestGoogleTakeoutService:
 
         with patch("prt_src.tui.services.google_takeout.parse_takeout_contacts") as mock_parse:
             mock_parse.return_value = (mock_contacts, mock_info)
-            mock_api.insert_contacts.return_value = False
+            mock_api.sync_contacts.return_value = None
 
             success, message, info = await service.import_contacts(zip_file)
 
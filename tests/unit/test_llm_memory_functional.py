@@ -5,11 +5,13 @@ Tests memory operations independently with focus on data integrity,
 serialization/deserialization, and cleanup mechanisms.
 """
 
+import sqlite3
 import tempfile
 import time
 from datetime import datetime
 from datetime import timedelta
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -148,10 +150,11 @@ def test_memory_corrupted_data_recovery(memory_instance, temp_memory_dir):
     loaded = memory_instance.load_result(memory_id)
     assert loaded is not None
 
-    # Corrupt the file
-    result_file = memory_instance.base_dir / f"{memory_id}.json"
-    with open(result_file, "w") as f:
-        f.write("invalid json content {")
+    # Corrupt the stored payload
+    with sqlite3.connect(memory_instance.db_path) as conn:
+        conn.execute(
+            "UPDATE results SET payload = ? WHERE id = ?", (b"invalid json content {", memory_id)
+        )
 
     # Should return None gracefully
     corrupted_loaded = memory_instance.load_result(memory_id)
@@ -211,14 +214,13 @@ def test_memory_cleanup_mechanisms(memory_instance):
         memory_id = memory_instance.save_result({"old_data": i}, "cleanup", f"old data {i}")
         old_ids.append(memory_id)
 
-    # Manually age the files by modifying their timestamps
-    import os
-
+    # Manually age the results by moving their creation time back
     cutoff_time = datetime.now() - timedelta(hours=2)  # 2 hours ago
-    for memory_id in old_ids:
-        result_file = memory_instance.base_dir / f"{memory_id}.json"
-        old_timestamp = cutoff_time.timestamp()
-        os.utime(result_file, (old_timestamp, old_timestamp))
+    with sqlite3.connect(memory_instance.db_path) as conn:
+        conn.executemany(
+            "UPDATE results SET created_ts = ? WHERE id = ?",
+            [(cutoff_time.timestamp(), memory_id) for memory_id in old_ids],
+        )
 
     # Save some "new" data
     for i in range(2):
@@ -366,24 +368,57 @@ def test_memory_cleanup_no_persistent_files(memory_instance):
         memory_id = memory_instance.save_result({"test": f"data_{i}"}, "cleanup_test", f"test {i}")
         memory_ids.append(memory_id)
 
-    # Verify files exist
-    for memory_id in memory_ids:
-        result_file = memory_instance.base_dir / f"{memory_id}.json"
-        assert result_file.exists()
+    # Verify results are stored
+    assert {r["id"] for r in memory_instance.list_results()} == set(memory_ids)
 
     # Delete all results
     for memory_id in memory_ids:
         deleted = memory_instance.delete_result(memory_id)
         assert deleted is True
 
-    # Verify files are gone
+    # Verify results are gone
     for memory_id in memory_ids:
-        result_file = memory_instance.base_dir / f"{memory_id}.json"
-        assert not result_file.exists()
+        assert memory_instance.load_result(memory_id) is None
+
+    # Verify the store is empty, blobs included
+    assert memory_instance.list_results() == []
+    with sqlite3.connect(memory_instance.db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM result_blobs").fetchone()[0] == 0
+    assert list(memory_instance.base_dir.glob("*.json")) == []
+
+
+@pytest.mark.unit
+def test_memory_bytes_round_trip_as_blobs(memory_instance):
+    """Bytes values come back as bytes and are stored outside the JSON payload."""
+    image = bytes(range(256)) * 40
+    contacts = [{"id": i, "name": f"Contact {i}", "profile_image": image} for i in range(20)]
+
+    memory_id = memory_instance.save_result(contacts, "contacts", "contacts with images")
+    loaded = memory_instance.load_result(memory_id)
+
+    assert loaded["data"] == contacts
+    with sqlite3.connect(memory_instance.db_path) as conn:
+        payload_size = conn.execute(
+            "SELECT LENGTH(payload) FROM results WHERE id = ?", (memory_id,)
+        ).fetchone()[0]
+        blob_count = conn.execute("SELECT COUNT(*) FROM result_blobs").fetchone()[0]
+    assert payload_size < len(image)
+    assert blob_count == 20
+
+
+@pytest.mark.unit
+def test_memory_listing_does_not_decode_payloads(memory_instance):
+    """list_results and get_stats read only the metadata table."""
+    for i in range(5):
+        memory_instance.save_result([{"item": j} for j in range(100)], "listing", f"batch {i}")
+
+    with patch("prt_src.llm_memory._decode_payload") as decode:
+        results = memory_instance.list_results(result_type="listing")
+        stats = memory_instance.get_stats()
 
-    # Verify directory is empty (except for .gitkeep or similar)
-    remaining_files = list(memory_instance.base_dir.glob("*.json"))
-    assert len(remaining_files) == 0, f"Unexpected files remain: {remaining_files}"
+    decode.assert_not_called()
+    assert [r["data_count"] for r in results] == [100] * 5
+    assert stats["types"] == {"listing": 5}
 
 
 if __name__ == "__main__":
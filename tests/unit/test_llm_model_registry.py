@@ -146,7 +146,7 @@ class TestModelInfo:
 class TestOllamaModelRegistryAvailability:
     """Test the is_available() method."""
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_is_available_success(self, mock_get):
         """Test is_available returns True when Ollama responds."""
         mock_response = Mock()
@@ -156,9 +156,9 @@ class TestOllamaModelRegistryAvailability:
         registry = OllamaModelRegistry()
         assert registry.is_available() is True
 
-        mock_get.assert_called_once_with("http://localhost:11434/api/tags", timeout=2)
+        mock_get.assert_called_once_with("http://localhost:11434/api/tags", timeout=(2, 2))
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_is_available_connection_error(self, mock_get):
         """Test is_available returns False on connection error."""
         mock_get.side_effect = requests.ConnectionError("Connection refused")
@@ -166,7 +166,7 @@ class TestOllamaModelRegistryAvailability:
         registry = OllamaModelRegistry()
         assert registry.is_available() is False
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_is_available_timeout(self, mock_get):
         """Test is_available returns False on timeout."""
         mock_get.side_effect = requests.Timeout("Request timed out")
@@ -174,7 +174,7 @@ class TestOllamaModelRegistryAvailability:
         registry = OllamaModelRegistry()
         assert registry.is_available() is False
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_is_available_non_200_status(self, mock_get):
         """Test is_available returns False on non-200 status."""
         mock_response = Mock()
@@ -208,7 +208,7 @@ class TestOllamaModelRegistryListModels:
             ]
         }
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_list_models_success(self, mock_get, mock_models_response):
         """Test successful model listing."""
         mock_response = Mock()
@@ -225,7 +225,7 @@ class TestOllamaModelRegistryListModels:
         assert models[1].name == "gpt-oss:20b"
         assert models[1].friendly_name == "gpt-oss-20b"
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_list_models_caching(self, mock_get, mock_models_response):
         """Test that list_models caches results."""
         mock_response = Mock()
@@ -246,7 +246,7 @@ class TestOllamaModelRegistryListModels:
         # Should only have made one HTTP request
         assert mock_get.call_count == 1
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_list_models_cache_expiry(self, mock_get, mock_models_response):
         """Test that cache expires after TTL."""
         mock_response = Mock()
@@ -270,7 +270,7 @@ class TestOllamaModelRegistryListModels:
         # Should have made two HTTP requests
         assert mock_get.call_count == 2
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_list_models_force_refresh(self, mock_get, mock_models_response):
         """Test force refresh bypasses cache."""
         mock_response = Mock()
@@ -291,7 +291,7 @@ class TestOllamaModelRegistryListModels:
         # Should have made two HTTP requests
         assert mock_get.call_count == 2
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_list_models_connection_error(self, mock_get):
         """Test list_models returns empty list on connection error."""
         mock_get.side_effect = requests.ConnectionError("Connection refused")
@@ -301,7 +301,7 @@ class TestOllamaModelRegistryListModels:
 
         assert models == []
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_list_models_timeout(self, mock_get):
         """Test list_models returns empty list on timeout."""
         mock_get.side_effect = requests.Timeout("Request timed out")
@@ -311,7 +311,7 @@ class TestOllamaModelRegistryListModels:
 
         assert models == []
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_list_models_invalid_json(self, mock_get):
         """Test list_models handles invalid JSON gracefully."""
         mock_response = Mock()
@@ -338,7 +338,7 @@ class TestOllamaModelRegistryGetModelInfo:
             "details": {"family": "llama", "parameter_size": "8B", "quantization_level": "Q4_K_M"},
         }
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_get_model_info_success(self, mock_post, mock_show_response):
         """Test successful model info retrieval."""
         mock_response = Mock()
@@ -353,7 +353,7 @@ class TestOllamaModelRegistryGetModelInfo:
         assert info.name == "llama3:8b"
         assert "llama3:8b" in registry._model_cache
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_get_model_info_caching(self, mock_post, mock_show_response):
         """Test that get_model_info caches results."""
         mock_response = Mock()
@@ -374,7 +374,7 @@ class TestOllamaModelRegistryGetModelInfo:
         # Should only have made one HTTP request
         assert mock_post.call_count == 1
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_get_model_info_force_refresh(self, mock_post, mock_show_response):
         """Test force refresh bypasses cache."""
         mock_response = Mock()
@@ -395,7 +395,7 @@ class TestOllamaModelRegistryGetModelInfo:
         # Should have made two HTTP requests
         assert mock_post.call_count == 2
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_get_model_info_404_error(self, mock_post):
         """Test get_model_info returns None on 404."""
         mock_response = Mock()
@@ -412,7 +412,7 @@ class TestOllamaModelRegistryGetModelInfo:
 
         assert info is None
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_get_model_info_connection_error(self, mock_post):
         """Test get_model_info returns None on connection error."""
         mock_post.side_effect = requests.ConnectionError("Connection refused")
@@ -422,7 +422,7 @@ class TestOllamaModelRegistryGetModelInfo:
 
         assert info is None
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_get_model_info_http_error(self, mock_post):
         """Test get_model_info returns None on HTTP error."""
         mock_response = Mock()
@@ -567,7 +567,7 @@ class TestOllamaModelRegistryCacheBehavior:
         registry = OllamaModelRegistry()
         assert registry._is_cache_valid() is False
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_cache_population(self, mock_get):
         """Test cache gets populated after list_models call."""
         mock_response = Mock()
@@ -584,7 +584,7 @@ class TestOllamaModelRegistryCacheBehavior:
         assert "llama3:8b" in registry._model_cache
         assert registry._cache_timestamp is not None
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_cache_force_refresh_clears_timestamp(self, mock_get):
         """Test force refresh updates cache timestamp."""
         # Mock a successful API response
@@ -623,7 +623,7 @@ class TestOllamaModelRegistryErrorHandling:
         registry = OllamaModelRegistry(base_url="http://localhost:11434/")
         assert registry.base_url == "http://localhost:11434"
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_malformed_models_response(self, mock_get):
         """Test handling of malformed models API response."""
         mock_response = Mock()
@@ -636,7 +636,7 @@ class TestOllamaModelRegistryErrorHandling:
 
         assert models == []
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_missing_models_field(self, mock_get):
         """Test handling of response missing 'models' field."""
         mock_response = Mock()
@@ -664,7 +664,7 @@ class TestOllamaModelRegistryErrorHandling:
     @patch("prt_src.llm_model_registry.logger")
     def test_logging_on_errors(self, mock_logger):
         """Test that errors are properly logged."""
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.side_effect = requests.ConnectionError("Connection failed")
 
             registry = OllamaModelRegistry()